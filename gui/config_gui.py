@@ -6,10 +6,30 @@ Konfigurasi untuk GUI Simulator Sistem Bilangan
 
 File ini berisi konfigurasi untuk GUI, termasuk tema, warna, dan pengaturan lainnya.
 
+Konstanta di modul ini adalah nilai default. File override pengguna (JSON atau
+TOML) digabung dengan default, divalidasi sekali, lalu dibekukan menjadi
+snapshot KonfigurasiBeku. PengelolaKonfigurasi memuat ulang snapshot saat file
+override berubah, sehingga batas konkurensi, batas waktu, dan batas riwayat
+dapat diatur tanpa restart.
+
 Penulis: Kelompok 1
 Tanggal: 5/9/2025
 """
 
+import json
+import os
+import threading
+import time
+from collections.abc import Mapping
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
 # Konfigurasi Tema dan Warna - Modern Minimalis
 THEME_CONFIG = {
     # Light Theme
@@ -275,9 +295,14 @@ LAYOUT_CONFIG = {
 
 # Konfigurasi Performance
 PERFORMANCE_CONFIG = {
-    'max_concurrent_operations': 5,
+    'max_concurrent_operations': 5,  # Operasi latar GUI (konversi/aritmatika, uji CRC) sekaligus
+    # Tidak dipakai: cache konverter (mesin basis, format digit) tidak dibatasi
+    # karena jumlah entrinya kecil dan tetap. Tetap diterima agar file override
+    # lama yang memuatnya tidak ditolak.
     'cache_size': 1000,
     'auto_save_interval': 300,  # 5 menit
+    'history_batch_rows': 100,  # Simpan riwayat setiap 100 baris
+    'history_db_path': os.path.join(os.path.expanduser('~'), '.simulator_sistem_bilangan', 'riwayat.db'),
     'max_memory_usage': 100,    # MB
 }
 
@@ -288,24 +313,261 @@ DARK_MODE_CONFIG = {
     'toggle_hotkey': '<Control-d>',  # Hotkey for toggle
 }
 
+# Semua section konfigurasi default, dibangun sekali saat modul dimuat
+CONFIG_SECTIONS = {
+    'theme': THEME_CONFIG,
+    'font': FONT_CONFIG,
+    'window': WINDOW_CONFIG,
+    'tab': TAB_CONFIG,
+    'number_system': NUMBER_SYSTEM_CONFIG,
+    'error_type': ERROR_TYPE_CONFIG,
+    'arithmetic': ARITHMETIC_OPERATIONS,
+    'message': MESSAGE_CONFIG,
+    'validation': VALIDATION_CONFIG,
+    'demo': DEMO_CONFIG,
+    'layout': LAYOUT_CONFIG,
+    'performance': PERFORMANCE_CONFIG,
+    'dark_mode': DARK_MODE_CONFIG
+}
+
+# File override pengguna: path dari environment variable, atau config.toml /
+# config.json di folder data aplikasi (folder yang sama dengan riwayat.db)
+CONFIG_ENV_VAR = 'SIMULATOR_CONFIG'
+USER_CONFIG_DIR = os.path.join(os.path.expanduser('~'), '.simulator_sistem_bilangan')
+
+# Nilai batas yang harus bilangan bulat positif
+POSITIVE_LIMITS = {
+    'validation': ('max_input_length', 'max_history_entries', 'max_display_history',
+                   'timeout_seconds'),
+    'performance': ('max_concurrent_operations', 'cache_size', 'auto_save_interval',
+                    'history_batch_rows', 'max_memory_usage'),
+}
+
+
+class KonfigurasiBeku(Mapping):
+    """
+    Snapshot konfigurasi yang tidak dapat diubah.
+
+    Section dan key dapat dibaca sebagai item (konfig['performance']['cache_size'])
+    maupun atribut (konfig.performance.cache_size). Dict bersarang ikut dibekukan
+    dan list menjadi tuple.
+    """
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data):
+        object.__setattr__(self, '_data', {
+            key: KonfigurasiBeku(value) if isinstance(value, Mapping)
+            else tuple(value) if isinstance(value, list) else value
+            for key, value in data.items()
+        })
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getattr__(self, key):
+        if key.startswith('_'):
+            raise AttributeError(key)
+        try:
+            return self._data[key]
+        except KeyError:
+            raise AttributeError(f"Key '{key}' tidak ditemukan di konfigurasi") from None
+
+    def __setattr__(self, key, value):
+        raise AttributeError("Konfigurasi tidak dapat diubah")
+
+    def __delattr__(self, key):
+        raise AttributeError("Konfigurasi tidak dapat diubah")
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._data!r})"
+
+    def ke_dict(self):
+        """Salinan dict biasa (bersarang) dari snapshot"""
+        return {key: value.ke_dict() if isinstance(value, KonfigurasiBeku) else value
+                for key, value in self._data.items()}
+
+
+def path_config_pengguna():
+    """Path file override pengguna yang dipantau (file boleh belum ada)"""
+    path = os.environ.get(CONFIG_ENV_VAR)
+    if path:
+        return path
+    for nama in ('config.toml', 'config.json'):
+        path = os.path.join(USER_CONFIG_DIR, nama)
+        if os.path.exists(path):
+            return path
+    return os.path.join(USER_CONFIG_DIR, 'config.json')
+
+
+def load_override(path):
+    """
+    Membaca file override JSON atau TOML (menurut ekstensi file).
+
+    Returns:
+        dict: {section: {key: nilai}}
+    """
+    if path.lower().endswith('.toml'):
+        if tomllib is None:
+            raise ValueError("Membaca TOML membutuhkan Python 3.11+ atau paket tomli")
+        with open(path, 'rb') as berkas:
+            data = tomllib.load(berkas)
+    else:
+        with open(path, encoding='utf-8') as berkas:
+            data = json.load(berkas)
+    if not isinstance(data, dict):
+        raise ValueError("File konfigurasi harus berisi objek/tabel section")
+    return data
+
+
+def _gabung_override(default, override, lokasi, errors):
+    """Menimpa dict default dengan override; key asing dan tipe berbeda dicatat ke errors"""
+    hasil = dict(default)
+    for key, value in override.items():
+        nama = f"{lokasi}.{key}"
+        if key not in default:
+            errors.append(f"Key '{nama}' tidak dikenal")
+        elif isinstance(default[key], dict):
+            if isinstance(value, dict):
+                hasil[key] = _gabung_override(default[key], value, nama, errors)
+            else:
+                errors.append(f"'{nama}' harus berupa section")
+        else:
+            if isinstance(default[key], tuple) and isinstance(value, list):
+                value = tuple(value)
+            tipe = type(default[key])
+            cocok = type(value) is tipe or (tipe is float and type(value) is int)
+            if not cocok:
+                errors.append(f"'{nama}' harus bertipe {tipe.__name__}")
+            else:
+                hasil[key] = value
+    return hasil
+
+
+def compile_config(override=None):
+    """
+    Menggabungkan default dengan override, memvalidasi sekali, lalu membekukannya.
+
+    Args:
+        override (dict, optional): {section: {key: nilai}} dari file pengguna
+
+    Returns:
+        KonfigurasiBeku: Snapshot konfigurasi
+
+    Raises:
+        ValueError: Jika override atau hasil gabungan tidak valid
+    """
+    errors = []
+    gabungan = _gabung_override(CONFIG_SECTIONS, override or {}, 'config', errors)
+    if errors:
+        raise ValueError(f"Konfigurasi tidak valid: {'; '.join(errors)}")
+    validate_config(gabungan)
+    return KonfigurasiBeku(gabungan)
+
+
+class PengelolaKonfigurasi:
+    """
+    Memegang snapshot konfigurasi aktif dan memuat ulang file override saat
+    waktu modifikasinya berubah, tanpa restart.
+
+    File override yang tidak valid tidak mengganti snapshot aktif; pesannya
+    disimpan di galat_terakhir sampai file diubah lagi.
+    """
+
+    def __init__(self, path=None, interval_cek=1.0):
+        """
+        Args:
+            path (str, optional): File override (default: path_config_pengguna())
+            interval_cek (float): Jeda minimal antar pemeriksaan mtime (detik)
+        """
+        self.path = path if path is not None else path_config_pengguna()
+        self.interval_cek = interval_cek
+        self.galat_terakhir = None
+        self._kunci = threading.Lock()
+        self._pemantau = []
+        self._cek_terakhir = time.monotonic()
+        self._versi_file = None
+        self._snapshot = compile_config()
+        self.muat_ulang(paksa=True)
+
+    def _versi(self):
+        """(mtime_ns, ukuran) file override, atau None jika file tidak ada"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def snapshot(self):
+        """Snapshot aktif; file diperiksa ulang paling sering tiap interval_cek detik"""
+        sekarang = time.monotonic()
+        if sekarang - self._cek_terakhir >= self.interval_cek:
+            self._cek_terakhir = sekarang
+            self.muat_ulang()
+        return self._snapshot
+
+    def muat_ulang(self, paksa=False):
+        """
+        Memuat ulang file override jika berubah (atau selalu jika paksa).
+
+        Returns:
+            bool: True jika snapshot aktif diganti
+        """
+        with self._kunci:
+            versi = self._versi()
+            if versi == self._versi_file and not paksa:
+                return False
+            self._versi_file = versi
+            try:
+                override = load_override(self.path) if versi is not None else None
+                snapshot = compile_config(override)
+            except (OSError, ValueError) as e:
+                self.galat_terakhir = f"{self.path}: {e}"
+                return False
+            self.galat_terakhir = None
+            if snapshot == self._snapshot:
+                return False
+            self._snapshot = snapshot
+            pemantau = list(self._pemantau)
+        for callback in pemantau:
+            callback(snapshot)
+        return True
+
+    def pantau(self, callback):
+        """Mendaftarkan callback(snapshot) yang dipanggil setiap snapshot diganti"""
+        with self._kunci:
+            self._pemantau.append(callback)
+
+
+_pengelola = None
+_kunci_pengelola = threading.Lock()
+
+
+def get_pengelola():
+    """Pengelola konfigurasi bersama untuk aplikasi (dibuat saat pertama dipakai)"""
+    global _pengelola
+    if _pengelola is None:
+        with _kunci_pengelola:
+            if _pengelola is None:
+                _pengelola = PengelolaKonfigurasi()
+    return _pengelola
+
+
+def get_snapshot():
+    """Snapshot konfigurasi aktif, termasuk override pengguna"""
+    return get_pengelola().snapshot()
+
+
 # Fungsi untuk mendapatkan konfigurasi
 def get_config(section, key=None, theme='light'):
-    """Mendapatkan konfigurasi berdasarkan section dan key"""
-    configs = {
-        'theme': THEME_CONFIG,
-        'font': FONT_CONFIG,
-        'window': WINDOW_CONFIG,
-        'tab': TAB_CONFIG,
-        'number_system': NUMBER_SYSTEM_CONFIG,
-        'error_type': ERROR_TYPE_CONFIG,
-        'arithmetic': ARITHMETIC_OPERATIONS,
-        'message': MESSAGE_CONFIG,
-        'validation': VALIDATION_CONFIG,
-        'demo': DEMO_CONFIG,
-        'layout': LAYOUT_CONFIG,
-        'performance': PERFORMANCE_CONFIG,
-        'dark_mode': DARK_MODE_CONFIG
-    }
+    """Mendapatkan konfigurasi berdasarkan section dan key dari snapshot aktif"""
+    configs = get_snapshot()
     
     if section not in configs:
         raise ValueError(f"Section '{section}' tidak ditemukan")
@@ -314,10 +576,11 @@ def get_config(section, key=None, theme='light'):
         return configs[section]
     
     # Special handling for theme colors
-    if section == 'theme' and key in THEME_CONFIG.get(theme, {}):
-        return THEME_CONFIG[theme][key]
-    elif section == 'theme' and key in THEME_CONFIG['light']:
-        return THEME_CONFIG['light'][key]  # Fallback to light theme
+    themes = configs['theme']
+    if section == 'theme' and key in themes.get(theme, {}):
+        return themes[theme][key]
+    elif section == 'theme' and key in themes['light']:
+        return themes['light'][key]  # Fallback to light theme
     
     if key not in configs[section]:
         raise ValueError(f"Key '{key}' tidak ditemukan di section '{section}'")
@@ -326,19 +589,31 @@ def get_config(section, key=None, theme='light'):
 
 def get_theme_colors(theme='light'):
     """Mendapatkan semua warna untuk tema tertentu"""
-    return THEME_CONFIG.get(theme, THEME_CONFIG['light'])
+    themes = get_snapshot()['theme']
+    return themes.get(theme, themes['light'])
 
 # Fungsi untuk validasi konfigurasi
-def validate_config():
-    """Memvalidasi semua konfigurasi"""
+def validate_config(configs=None):
+    """
+    Memvalidasi semua konfigurasi
+
+    Args:
+        configs (Mapping, optional): Section konfigurasi yang divalidasi
+            (default: konfigurasi bawaan modul)
+    """
+    if configs is None:
+        configs = CONFIG_SECTIONS
+    theme_config = configs['theme']
+    font_config = configs['font']
+    window_config = configs['window']
     errors = []
     
     # Validasi tema - check both light and dark themes
     required_colors = ['primary_color', 'secondary_color', 'background_color', 'text_primary']
     for theme in ['light', 'dark']:
-        if theme in THEME_CONFIG:
+        if theme in theme_config:
             for color in required_colors:
-                if color not in THEME_CONFIG[theme]:
+                if color not in theme_config[theme]:
                     errors.append(f"Warna '{color}' tidak ditemukan di THEME_CONFIG['{theme}']")
         else:
             errors.append(f"Tema '{theme}' tidak ditemukan di THEME_CONFIG")
@@ -346,13 +621,23 @@ def validate_config():
     # Validasi font
     required_fonts = ['title_font', 'subtitle_font', 'body_font']
     for font in required_fonts:
-        if font not in FONT_CONFIG:
+        if font not in font_config:
             errors.append(f"Font '{font}' tidak ditemukan di FONT_CONFIG")
     
     # Validasi window
-    if WINDOW_CONFIG['min_width'] <= 0 or WINDOW_CONFIG['min_height'] <= 0:
+    if window_config['min_width'] <= 0 or window_config['min_height'] <= 0:
         errors.append("Ukuran window minimum harus lebih dari 0")
     
+    # Validasi batas cache, konkurensi, dan riwayat
+    for section, keys in POSITIVE_LIMITS.items():
+        for key in keys:
+            value = configs[section][key]
+            if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+                errors.append(f"'{section}.{key}' harus bilangan bulat positif")
+    validation = configs['validation']
+    if validation['max_display_history'] > validation['max_history_entries']:
+        errors.append("max_display_history tidak boleh melebihi max_history_entries")
+    
     if errors:
         raise ValueError(f"Konfigurasi tidak valid: {'; '.join(errors)}")
     
@@ -364,6 +649,12 @@ if __name__ == "__main__":
         validate_config()
         print("✅ Konfigurasi valid")
         
+        pengelola = get_pengelola()
+        if pengelola.galat_terakhir:
+            print(f"⚠️ Override diabaikan: {pengelola.galat_terakhir}")
+        else:
+            print(f"📄 Override: {pengelola.path}")
+        
         # Test beberapa konfigurasi
         print(f"Tema primary color: {get_config('theme', 'primary_color')}")
         print(f"Font title: {get_config('font', 'title_font')}")
@@ -22,22 +22,91 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 from tkinter.font import Font
 import threading
+import queue
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from main_logic import KonverterSistemBilangan, SistemBilangan, JenisKesalahan
+from main_logic.riwayat_sqlite import RiwayatSQLite
+from main_logic.progres import TokenPembatalan, OperasiDibatalkan
+from main_logic.batas_waktu import PelaksanaBatasWaktu
+from config_gui import get_pengelola
 
 
 class GUISimulatorSistemBilangan:
     """Kelas utama untuk GUI Simulator Sistem Bilangan"""
     
-    def __init__(self):
-        """Inisialisasi GUI"""
-        self.konverter = KonverterSistemBilangan()
+    def __init__(self, pengelola_konfigurasi=None):
+        """
+        Inisialisasi GUI
+        
+        Args:
+            pengelola_konfigurasi (PengelolaKonfigurasi, optional): Sumber konfigurasi
+                (default: pengelola bersama dari config_gui.get_pengelola())
+        """
+        self.pengelola_konfigurasi = pengelola_konfigurasi or get_pengelola()
+        self.konfigurasi = self.pengelola_konfigurasi.snapshot()
+        self.konverter = KonverterSistemBilangan(
+            riwayat_persisten=self.buka_riwayat_persisten(),
+            batas_riwayat=self.konfigurasi.validation.max_history_entries
+        )
+        # Operasi yang diperkirakan mahal dijalankan di proses yang dapat dimatikan
+        self.pelaksana = PelaksanaBatasWaktu(self.konverter,
+                                             self.konfigurasi.validation.timeout_seconds)
+        self.token_crc = None
+        self._antrian_crc = queue.Queue()
+        self._jadwal_crc = None
+        # Konversi dan aritmatika berjalan di thread latar agar window tetap responsif
+        self.token_operasi = None
+        self._antrian_operasi = queue.Queue()
+        self._jadwal_operasi = None
+        self._tampilkan_operasi = None
+        # Jumlah operasi latar (konversi/aritmatika dan uji CRC) yang sedang berjalan,
+        # dibatasi performance.max_concurrent_operations
+        self.operasi_aktif = 0
         self.root = tk.Tk()
         self.setup_window()
         self.create_widgets()
         self.setup_styles()
+        self._jadwal_konfigurasi = self.root.after(self.interval_cek_konfigurasi(),
+                                                   self.periksa_konfigurasi)
+        
+    def buka_riwayat_persisten(self):
+        """Membuka riwayat persisten SQLite, atau None jika tidak tersedia"""
+        try:
+            performance = self.konfigurasi.performance
+            riwayat = RiwayatSQLite(
+                performance.history_db_path,
+                interval_simpan=performance.auto_save_interval,
+                ambang_baris=performance.history_batch_rows
+            )
+        except Exception as e:
+            print(f"Riwayat persisten tidak tersedia: {e}")
+            return None
+        
+        return riwayat
+    
+    def interval_cek_konfigurasi(self):
+        """Jeda pemeriksaan file konfigurasi dalam milidetik"""
+        return max(int(self.pengelola_konfigurasi.interval_cek * 1000), 100)
+    
+    def periksa_konfigurasi(self):
+        """Memeriksa file konfigurasi secara berkala dan menerapkan perubahan"""
+        konfigurasi = self.pengelola_konfigurasi.snapshot()
+        if konfigurasi is not self.konfigurasi:
+            self.terapkan_konfigurasi(konfigurasi)
+        self._jadwal_konfigurasi = self.root.after(self.interval_cek_konfigurasi(),
+                                                   self.periksa_konfigurasi)
+    
+    def terapkan_konfigurasi(self, konfigurasi):
+        """Menerapkan snapshot konfigurasi baru tanpa restart"""
+        self.konfigurasi = konfigurasi
+        self.konverter.riwayat_konversi.atur_batas(konfigurasi.validation.max_history_entries)
+        self.pelaksana.batas_detik = konfigurasi.validation.timeout_seconds
+        # Lokasi basis data baru berlaku setelah aplikasi dibuka ulang
+        if self.konverter.riwayat_persisten is not None:
+            self.konverter.riwayat_persisten.interval_simpan = konfigurasi.performance.auto_save_interval
+            self.konverter.riwayat_persisten.ambang_baris = konfigurasi.performance.history_batch_rows
         
     def setup_window(self):
         """Mengatur window utama"""
@@ -55,6 +124,15 @@ class GUISimulatorSistemBilangan:
         self.root.grid_rowconfigure(0, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
         
+        # Simpan riwayat tertunda saat window ditutup
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # Muat riwayat dari sesi sebelumnya
+        if self.konverter.riwayat_persisten is not None:
+            self.konverter.riwayat_konversi.extend(
+                self.konverter.riwayat_persisten.terakhir(self.konfigurasi.validation.max_history_entries)
+            )
+        
     def setup_styles(self):
         """Mengatur style untuk GUI"""
         style = ttk.Style()
@@ -154,8 +232,11 @@ class GUISimulatorSistemBilangan:
         to_combo.grid(row=2, column=1, sticky='w', padx=(10, 0), pady=5)
         
         # Tombol konversi
-        convert_btn = ttk.Button(input_frame, text="🔄 Konversi", command=self.perform_conversion)
-        convert_btn.grid(row=3, column=0, columnspan=2, pady=10)
+        self.convert_btn = ttk.Button(input_frame, text="🔄 Konversi", command=self.perform_conversion)
+        self.convert_btn.grid(row=3, column=0, pady=10)
+        self.convert_cancel_btn = ttk.Button(input_frame, text="⏹️ Batal", command=self.cancel_operation,
+                                             state='disabled')
+        self.convert_cancel_btn.grid(row=3, column=1, sticky='w', padx=(10, 0), pady=10)
         
         # Output section
         output_frame = ttk.LabelFrame(main_frame, text="Hasil Konversi", padding=10)
@@ -208,7 +289,11 @@ class GUISimulatorSistemBilangan:
         ttk.Entry(input_frame, textvariable=self.value2_var, width=20).grid(row=3, column=1, sticky='w', padx=(10, 0), pady=5)
         
         # Tombol hitung
-        ttk.Button(input_frame, text="🧮 Hitung", command=self.perform_arithmetic).grid(row=4, column=0, columnspan=2, pady=10)
+        self.arithmetic_btn = ttk.Button(input_frame, text="🧮 Hitung", command=self.perform_arithmetic)
+        self.arithmetic_btn.grid(row=4, column=0, pady=10)
+        self.arithmetic_cancel_btn = ttk.Button(input_frame, text="⏹️ Batal", command=self.cancel_operation,
+                                                state='disabled')
+        self.arithmetic_cancel_btn.grid(row=4, column=1, sticky='w', padx=(10, 0), pady=10)
         
         # Output section
         output_frame = ttk.LabelFrame(main_frame, text="Hasil Operasi", padding=10)
@@ -260,6 +345,25 @@ class GUISimulatorSistemBilangan:
         self.error_result_text = scrolledtext.ScrolledText(output_frame, height=8, width=60, wrap=tk.WORD)
         self.error_result_text.pack(fill='both', expand=True)
         
+        # Uji laju deteksi CRC (operasi panjang di thread latar)
+        crc_frame = ttk.LabelFrame(main_frame, text="Uji Laju Deteksi CRC", padding=10)
+        crc_frame.pack(fill='x', pady=(20, 0))
+        
+        ttk.Label(crc_frame, text="Sampel per Jenis:", style='Subtitle.TLabel').grid(row=0, column=0, sticky='w', pady=5)
+        self.crc_samples_var = tk.StringVar(value="10000")
+        ttk.Entry(crc_frame, textvariable=self.crc_samples_var, width=10).grid(row=0, column=1, sticky='w', padx=(10, 0), pady=5)
+        
+        self.crc_start_btn = ttk.Button(crc_frame, text="▶️ Mulai Uji", command=self.start_crc_test)
+        self.crc_start_btn.grid(row=0, column=2, padx=(10, 0), pady=5)
+        self.crc_cancel_btn = ttk.Button(crc_frame, text="⏹️ Batal", command=self.cancel_crc_test, state='disabled')
+        self.crc_cancel_btn.grid(row=0, column=3, padx=(10, 0), pady=5)
+        
+        self.crc_progress = ttk.Progressbar(crc_frame, mode='determinate', maximum=1.0)
+        self.crc_progress.grid(row=1, column=0, columnspan=4, sticky='ew', pady=5)
+        self.crc_status_var = tk.StringVar(value="Siap")
+        ttk.Label(crc_frame, textvariable=self.crc_status_var).grid(row=2, column=0, columnspan=4, sticky='w')
+        crc_frame.columnconfigure(3, weight=1)
+        
     def create_error_detection_tab(self):
         """Membuat tab deteksi kesalahan"""
         tab_frame = ttk.Frame(self.notebook)
@@ -434,23 +538,40 @@ class GUISimulatorSistemBilangan:
                 messagebox.showerror("Error", f"Input '{input_value}' tidak valid untuk sistem {from_system}!")
                 return
                 
-            # Lakukan konversi
+            # Lakukan konversi di thread latar (dengan batas waktu untuk input sangat besar)
+            if not self.izinkan_operasi_latar():
+                return
             to_system_enum = SistemBilangan(to_system)
-            result = self.konverter.konversi(input_value, from_system_enum, to_system_enum)
-            
-            # Tampilkan hasil
             self.result_text.delete('1.0', tk.END)
-            self.result_text.insert('1.0', f"🔄 HASIL KONVERSI:\n")
-            self.result_text.insert(tk.END, f"   {from_system.capitalize()}: {input_value}\n")
-            self.result_text.insert(tk.END, f"   {to_system.capitalize()}: {result}\n")
-            
-            # Tampilkan nilai desimal sebagai referensi
-            decimal_value = self.konverter.ke_desimal(input_value, from_system_enum)
-            self.result_text.insert(tk.END, f"   Nilai desimal: {decimal_value}\n")
+            self.result_text.insert('1.0', "⏳ Mengkonversi...\n")
+            self.start_operation(
+                lambda token: self.pelaksana.konversi(input_value, from_system_enum, to_system_enum,
+                                                      token=token),
+                lambda result: self.show_conversion_result(input_value, from_system, to_system, result))
             
         except Exception as e:
             messagebox.showerror("Error", f"Terjadi kesalahan: {str(e)}")
             
+    def show_conversion_result(self, input_value, from_system, to_system, result):
+        """Menampilkan hasil konversi dari thread latar"""
+        self.result_text.delete('1.0', tk.END)
+        if result.get('dibatalkan'):
+            # Dibatalkan pengguna sendiri, bukan kesalahan
+            self.result_text.insert('1.0', "⏹️ KONVERSI DIBATALKAN\n")
+            return
+        if not result['berhasil']:
+            judul = "Batas Waktu" if result.get('waktu_habis') else "Error"
+            messagebox.showerror(judul, result['error'])
+            return
+        
+        # Tampilkan hasil
+        self.result_text.insert('1.0', f"🔄 HASIL KONVERSI:\n")
+        self.result_text.insert(tk.END, f"   {from_system.capitalize()}: {input_value}\n")
+        self.result_text.insert(tk.END, f"   {to_system.capitalize()}: {result['hasil']}\n")
+        
+        # Tampilkan nilai desimal sebagai referensi
+        self.result_text.insert(tk.END, f"   Nilai desimal: {result['nilai_desimal']}\n")
+            
     def show_full_conversion_table(self):
         """Menampilkan tabel konversi lengkap"""
         try:
@@ -505,25 +626,105 @@ class GUISimulatorSistemBilangan:
                 messagebox.showerror("Error", f"Nilai kedua '{value2}' tidak valid untuk sistem {system}!")
                 return
                 
-            # Lakukan operasi
-            result = self.konverter.operasi_aritmatika(value1, value2, operation, system_enum)
-            
-            # Tampilkan hasil
+            # Lakukan operasi di thread latar
+            if not self.izinkan_operasi_latar():
+                return
             self.arithmetic_result_text.delete('1.0', tk.END)
-            
-            if result['berhasil']:
-                self.arithmetic_result_text.insert('1.0', f"🧮 HASIL OPERASI ARITMATIKA:\n")
-                self.arithmetic_result_text.insert(tk.END, f"   Operasi: {result['operasi']}\n")
-                self.arithmetic_result_text.insert(tk.END, f"   Sistem: {result['sistem']}\n")
-                self.arithmetic_result_text.insert(tk.END, f"   Hasil ({system}): {result['hasil_sistem']}\n")
-                self.arithmetic_result_text.insert(tk.END, f"   Hasil (desimal): {result['hasil_desimal']}\n")
-            else:
-                self.arithmetic_result_text.insert('1.0', f"❌ ERROR:\n")
-                self.arithmetic_result_text.insert(tk.END, f"   {result['error']}\n")
+            self.arithmetic_result_text.insert('1.0', "⏳ Menghitung...\n")
+            self.start_operation(
+                lambda token: self.pelaksana.operasi_aritmatika(value1, value2, operation, system_enum,
+                                                                token=token),
+                lambda result: self.show_arithmetic_result(system, result))
                 
         except Exception as e:
             messagebox.showerror("Error", f"Terjadi kesalahan: {str(e)}")
             
+    def show_arithmetic_result(self, system, result):
+        """Menampilkan hasil operasi aritmatika dari thread latar"""
+        self.arithmetic_result_text.delete('1.0', tk.END)
+        
+        if result['berhasil']:
+            self.arithmetic_result_text.insert('1.0', f"🧮 HASIL OPERASI ARITMATIKA:\n")
+            self.arithmetic_result_text.insert(tk.END, f"   Operasi: {result['operasi']}\n")
+            self.arithmetic_result_text.insert(tk.END, f"   Sistem: {result['sistem']}\n")
+            self.arithmetic_result_text.insert(tk.END, f"   Hasil ({system}): {result['hasil_sistem']}\n")
+            self.arithmetic_result_text.insert(tk.END, f"   Hasil (desimal): {result['hasil_desimal']}\n")
+        else:
+            if result.get('dibatalkan'):
+                judul = "⏹️ DIBATALKAN"
+            elif result.get('waktu_habis'):
+                judul = "⏱️ BATAS WAKTU HABIS"
+            else:
+                judul = "❌ ERROR"
+            self.arithmetic_result_text.insert('1.0', f"{judul}:\n")
+            self.arithmetic_result_text.insert(tk.END, f"   {result['error']}\n")
+            
+    def izinkan_operasi_latar(self):
+        """
+        Memeriksa batas performance.max_concurrent_operations sebelum operasi latar dimulai
+        
+        Batas dibaca dari snapshot aktif sehingga perubahan file konfigurasi
+        langsung berlaku untuk operasi berikutnya.
+        """
+        batas = self.konfigurasi.performance.max_concurrent_operations
+        if self.operasi_aktif >= batas:
+            messagebox.showwarning("Peringatan", f"Maksimal {batas} operasi berjalan bersamaan. "
+                                                 "Tunggu operasi lain selesai atau batalkan.")
+            return False
+        return True
+        
+    def start_operation(self, fungsi, tampilkan):
+        """
+        Menjalankan fungsi(token) di thread latar lalu tampilkan(hasil) di thread utama
+        
+        Hanya satu konversi/operasi berjalan pada satu waktu; tombolnya
+        dinonaktifkan dan tombol batal diaktifkan sampai hasil tiba.
+        """
+        self.operasi_aktif += 1
+        self.token_operasi = TokenPembatalan()
+        self._tampilkan_operasi = tampilkan
+        for tombol in (self.convert_btn, self.arithmetic_btn):
+            tombol.config(state='disabled')
+        for tombol in (self.convert_cancel_btn, self.arithmetic_cancel_btn):
+            tombol.config(state='normal')
+        
+        antrian, token = self._antrian_operasi, self.token_operasi
+        
+        def pekerja():
+            # Widget Tk hanya disentuh dari thread utama; pekerja cukup mengisi antrian
+            try:
+                antrian.put(('selesai', fungsi(token)))
+            except Exception as e:
+                antrian.put(('error', e))
+        
+        threading.Thread(target=pekerja, daemon=True).start()
+        self._jadwal_operasi = self.root.after(100, self.poll_operation)
+        
+    def cancel_operation(self):
+        """Meminta konversi/operasi yang sedang berjalan berhenti"""
+        if self.token_operasi is not None:
+            self.token_operasi.batalkan()
+        
+    def poll_operation(self):
+        """Memeriksa apakah thread konversi/operasi sudah mengirim hasil"""
+        self._jadwal_operasi = None
+        try:
+            jenis, isi = self._antrian_operasi.get_nowait()
+        except queue.Empty:
+            self._jadwal_operasi = self.root.after(100, self.poll_operation)
+            return
+        
+        self.operasi_aktif -= 1
+        self.token_operasi = None
+        for tombol in (self.convert_btn, self.arithmetic_btn):
+            tombol.config(state='normal')
+        for tombol in (self.convert_cancel_btn, self.arithmetic_cancel_btn):
+            tombol.config(state='disabled')
+        if jenis == 'error':
+            messagebox.showerror("Error", f"Terjadi kesalahan: {str(isi)}")
+            return
+        self._tampilkan_operasi(isi)
+            
     def simulate_error(self):
         """Mensimulasikan kesalahan"""
         try:
@@ -571,6 +772,88 @@ class GUISimulatorSistemBilangan:
         except Exception as e:
             messagebox.showerror("Error", f"Terjadi kesalahan: {str(e)}")
             
+    def start_crc_test(self):
+        """Menjalankan uji laju deteksi CRC di thread latar"""
+        try:
+            jumlah_sampel = int(self.crc_samples_var.get())
+            if jumlah_sampel <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Jumlah sampel harus bilangan bulat positif!")
+            return
+        if not self.izinkan_operasi_latar():
+            return
+        
+        self.operasi_aktif += 1
+        self.token_crc = TokenPembatalan()
+        self.crc_start_btn.config(state='disabled')
+        self.crc_cancel_btn.config(state='normal')
+        self.crc_progress['value'] = 0
+        self.crc_status_var.set("Menjalankan uji...")
+        
+        antrian, token = self._antrian_crc, self.token_crc
+        
+        def pekerja():
+            # Widget Tk hanya disentuh dari thread utama; pekerja cukup mengisi antrian
+            try:
+                hasil = self.konverter.ukur_laju_deteksi_crc(
+                    jumlah_sampel, progres=lambda peristiwa: antrian.put(('progres', peristiwa)),
+                    token=token)
+                antrian.put(('selesai', hasil))
+            except OperasiDibatalkan:
+                antrian.put(('batal', None))
+            except Exception as e:
+                antrian.put(('error', e))
+        
+        threading.Thread(target=pekerja, daemon=True).start()
+        self._jadwal_crc = self.root.after(100, self.poll_crc_test)
+        
+    def cancel_crc_test(self):
+        """Meminta uji laju deteksi CRC berhenti"""
+        if self.token_crc is not None:
+            self.token_crc.batalkan()
+            self.crc_status_var.set("Membatalkan...")
+        
+    def poll_crc_test(self):
+        """Memproses pesan dari thread uji CRC"""
+        self._jadwal_crc = None
+        while True:
+            try:
+                jenis, isi = self._antrian_crc.get_nowait()
+            except queue.Empty:
+                break
+            if jenis == 'progres':
+                self.crc_progress['value'] = isi.fraksi or 0
+                self.crc_status_var.set(f"{isi.selesai:,}/{isi.total:,} sampel ({isi.detik:.1f} s)")
+                continue
+            self.finish_crc_test(jenis, isi)
+            return
+        self._jadwal_crc = self.root.after(100, self.poll_crc_test)
+        
+    def finish_crc_test(self, jenis, isi):
+        """Menampilkan hasil uji CRC dan mengembalikan tombol"""
+        self.operasi_aktif -= 1
+        self.token_crc = None
+        self.crc_start_btn.config(state='normal')
+        self.crc_cancel_btn.config(state='disabled')
+        if jenis == 'batal':
+            self.crc_status_var.set("Uji dibatalkan")
+            return
+        if jenis == 'error':
+            self.crc_status_var.set("Uji gagal")
+            messagebox.showerror("Error", f"Terjadi kesalahan: {str(isi)}")
+            return
+        
+        self.crc_progress['value'] = 1.0
+        self.crc_status_var.set("Uji selesai")
+        self.error_result_text.delete('1.0', tk.END)
+        self.error_result_text.insert('1.0', f"📡 LAJU DETEKSI CRC-32:\n")
+        for nama, statistik in isi.items():
+            laju = statistik['laju_deteksi']
+            teks_laju = f"{laju:.2%}" if laju is not None else "-"
+            self.error_result_text.insert(tk.END, f"   {nama}: {teks_laju} "
+                                                  f"({statistik['terdeteksi']}/{statistik['berubah']} terdeteksi)\n")
+            
     def detect_error(self):
         """Mendeteksi kesalahan dalam konversi"""
         try:
@@ -631,7 +914,8 @@ class GUISimulatorSistemBilangan:
         self.history_text.insert('1.0', f"📜 RIWAYAT KONVERSI (Total: {len(self.konverter.riwayat_konversi)})\n")
         self.history_text.insert(tk.END, "=" * 60 + "\n")
         
-        for i, entry in enumerate(self.konverter.riwayat_konversi[-20:], 1):  # Tampilkan 20 terakhir
+        jumlah_tampil = self.konfigurasi.validation.max_display_history
+        for i, entry in enumerate(self.konverter.riwayat_konversi[-jumlah_tampil:], 1):
             self.history_text.insert(tk.END, f"{i:2d}. {entry['nilai_asal']} ({entry['sistem_asal']}) → "
                                           f"{entry['hasil']} ({entry['sistem_tujuan']}) "
                                           f"[desimal: {entry['nilai_desimal']}]\n")
@@ -640,8 +924,25 @@ class GUISimulatorSistemBilangan:
         """Hapus riwayat konversi"""
         if messagebox.askyesno("Konfirmasi", "Apakah Anda yakin ingin menghapus semua riwayat konversi?"):
             self.konverter.riwayat_konversi.clear()
+            if self.konverter.riwayat_persisten is not None:
+                self.konverter.riwayat_persisten.hapus_semua()
             self.refresh_history()
             
+    def on_close(self):
+        """Menyimpan riwayat persisten lalu menutup aplikasi"""
+        self.root.after_cancel(self._jadwal_konfigurasi)
+        if self.token_crc is not None:
+            self.token_crc.batalkan()
+        if self._jadwal_crc is not None:
+            self.root.after_cancel(self._jadwal_crc)
+        if self.token_operasi is not None:
+            self.token_operasi.batalkan()
+        if self._jadwal_operasi is not None:
+            self.root.after_cancel(self._jadwal_operasi)
+        if self.konverter.riwayat_persisten is not None:
+            self.konverter.riwayat_persisten.tutup()
+        self.root.destroy()
+            
     def run(self):
         """Menjalankan aplikasi GUI"""
         self.root.mainloop()
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Penjumlahan dan Pengurangan Aliran untuk Operand File Sangat Besar
+==================================================================
+
+operasi_aritmatika() mem-parse kedua operand menjadi int, sehingga numeral
+berukuran gigabyte tidak dapat dijumlahkan. Modul ini menjumlahkan atau
+mengurangkan numeral biner, oktal, atau heksadesimal per potongan bit, dari
+potongan paling tidak signifikan ke paling signifikan, dengan carry (atau
+borrow) dibawa dari satu potongan ke potongan berikutnya. Operand dibaca
+lewat mmap dan memori yang dipakai sebesar satu potongan.
+
+Karena digit hasil dihasilkan dari kanan, file hasil dialokasikan dulu
+sepanjang jumlah digit maksimum lalu diisi dari belakang. Nol di depan
+(dari carry yang tidak terjadi atau operand yang diawali nol) dibuang
+setelahnya dengan menggeser isi file per blok. Hasil dapat ditulis dalam
+basis pangkat dua lain (misal operand heksadesimal, hasil biner).
+
+Pengurangan yang hasilnya negatif dan digit tidak valid ditolak sebelum
+apa pun ditulis: seluruh digit kedua operand diperiksa lebih dulu, lalu
+kedua operand dibandingkan dari digit paling signifikan, dan perbandingan
+berhenti di potongan pertama yang berbeda. File hasil ditulis ke file
+sementara dan baru menggantikan file tujuan setelah operasi selesai.
+
+Penggunaan:
+    python aritmatika_aliran.py a.hex + b.hex -o hasil.hex
+    python aritmatika_aliran.py a.hex - b.hex -o hasil.bin --ke biner
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import argparse
+import sys
+from contextlib import ExitStack
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+try:
+    from .operasi_bitwise import (OperandDigit, Buffer, BIT_PER_DIGIT, KODE_FORMAT,
+                                  UKURAN_POTONG_BIT, _Susunan, _keluaran_atomik, _peta_berkas)
+    from .progres import (PelacakProgres, TokenPembatalan, OperasiDibatalkan,
+                          BilahProgresTeks, tangkap_ctrl_c)
+except ImportError:
+    from operasi_bitwise import (OperandDigit, Buffer, BIT_PER_DIGIT, KODE_FORMAT,
+                                 UKURAN_POTONG_BIT, _Susunan, _keluaran_atomik, _peta_berkas)
+    from progres import (PelacakProgres, TokenPembatalan, OperasiDibatalkan,
+                         BilahProgresTeks, tangkap_ctrl_c)
+
+OPERASI_ALIRAN = ('+', '-')
+
+# Byte per blok saat membuang nol di depan file hasil
+UKURAN_BLOK_SALIN = 1 << 20
+
+
+def bandingkan_operand(operand1: OperandDigit, operand2: OperandDigit,
+                       ukuran_potong: int = UKURAN_POTONG_BIT) -> int:
+    """
+    Membandingkan nilai dua numeral per potongan dari bit paling signifikan
+
+    Returns:
+        int: -1, 0, atau 1 (seperti nilai1 dibanding nilai2)
+    """
+    lebar = max(operand1.panjang_bit, operand2.panjang_bit)
+    kiri = _Susunan.dari(operand1).sesuaikan(lebar)
+    kanan = _Susunan.dari(operand2).sesuaikan(lebar)
+    for awal in range(0, lebar, ukuran_potong):
+        akhir = min(awal + ukuran_potong, lebar)
+        a, b = kiri.baca(awal, akhir), kanan.baca(awal, akhir)
+        if a != b:
+            return -1 if a < b else 1
+    return 0
+
+
+def _buang_nol_depan(keluaran: BinaryIO, jumlah_digit: int) -> int:
+    """Menggeser digit di keluaran ke awal tanpa nol di depan; mengembalikan jumlah digit"""
+    keluaran.seek(0)
+    nol = 0
+    while nol < jumlah_digit - 1:
+        blok = keluaran.read(min(UKURAN_BLOK_SALIN, jumlah_digit - 1 - nol))
+        sisa = len(blok.lstrip(b'0'))
+        nol += len(blok) - sisa
+        if sisa:
+            break
+    if nol:
+        for posisi in range(nol, jumlah_digit, UKURAN_BLOK_SALIN):
+            keluaran.seek(posisi)
+            blok = keluaran.read(min(UKURAN_BLOK_SALIN, jumlah_digit - posisi))
+            keluaran.seek(posisi - nol)
+            keluaran.write(blok)
+        keluaran.truncate(jumlah_digit - nol)
+    return jumlah_digit - nol
+
+
+def _siapkan_operand(data1: Buffer, operasi: str, data2: Buffer, basis: int = 16,
+                     basis_tujuan: Optional[int] = None,
+                     ukuran_potong: int = UKURAN_POTONG_BIT
+                     ) -> Tuple[OperandDigit, OperandDigit, int, int]:
+    """
+    Memvalidasi argumen dan seluruh digit, serta menolak hasil negatif
+
+    Returns:
+        Tuple: (operand1, operand2, basis tujuan, ukuran potongan yang dibulatkan)
+    """
+    if operasi not in OPERASI_ALIRAN:
+        raise ValueError(f"Operasi aliran '{operasi}' tidak dikenal "
+                         f"(pilihan: {', '.join(OPERASI_ALIRAN)})")
+    basis_tujuan = basis_tujuan or basis
+    if basis_tujuan not in BIT_PER_DIGIT:
+        raise ValueError(f"Basis {basis_tujuan} tidak dapat ditulis per potongan (harus 2, 8, atau 16)")
+    if ukuran_potong <= 0:
+        raise ValueError("Ukuran potongan harus positif")
+    operand1, operand2 = OperandDigit(data1, basis), OperandDigit(data2, basis)
+    operand1.validasi()
+    operand2.validasi()
+
+    k = BIT_PER_DIGIT[basis_tujuan]
+    # Batas potongan dihitung dari kanan, jadi kelipatan k menjaga batas digit tujuan
+    ukuran_potong = -(-ukuran_potong // k) * k
+    if operasi == '-' and bandingkan_operand(operand1, operand2, ukuran_potong) < 0:
+        raise ValueError("Hasil negatif tidak didukung dalam program ini")
+    return operand1, operand2, basis_tujuan, ukuran_potong
+
+
+def _tulis_hasil(operand1: OperandDigit, operasi: str, operand2: OperandDigit,
+                 basis_tujuan: int, ukuran_potong: int, keluaran: BinaryIO,
+                 progres=None, token: Optional[TokenPembatalan] = None) -> Dict:
+    """Menulis digit hasil operand yang sudah divalidasi _siapkan_operand"""
+    # Satu bit ekstra untuk carry penjumlahan
+    lebar = max(operand1.panjang_bit, operand2.panjang_bit) + (operasi == '+')
+    kiri = _Susunan.dari(operand1).sesuaikan(lebar)
+    kanan = _Susunan.dari(operand2).sesuaikan(lebar)
+    k = BIT_PER_DIGIT[basis_tujuan]
+    jumlah_digit = -(-lebar // k)
+    kode = KODE_FORMAT[basis_tujuan]
+
+    keluaran.seek(0)
+    keluaran.truncate(jumlah_digit)
+    pelacak = PelacakProgres('aritmatika_aliran', lebar, progres, token)
+    bawaan = 0
+    posisi_digit = jumlah_digit
+    for akhir in range(lebar, 0, -ukuran_potong):
+        awal = max(akhir - ukuran_potong, 0)
+        bit = akhir - awal
+        a, b = kiri.baca(awal, akhir), kanan.baca(awal, akhir)
+        if operasi == '+':
+            nilai = a + b + bawaan
+            bawaan = nilai >> bit
+            nilai &= (1 << bit) - 1
+        else:
+            nilai = a - b - bawaan
+            bawaan = int(nilai < 0)
+            nilai += bawaan << bit
+        digit = format(nilai, f'0{-(-bit // k)}{kode}').encode('ascii')
+        posisi_digit -= len(digit)
+        keluaran.seek(posisi_digit)
+        keluaran.write(digit)
+        pelacak.maju(bit)
+    pelacak.tuntas()
+
+    return {'bit_hasil': lebar, 'digit': _buang_nol_depan(keluaran, jumlah_digit),
+            'basis': basis_tujuan}
+
+
+def aritmatika_buffer(data1: Buffer, operasi: str, data2: Buffer, keluaran: BinaryIO,
+                      basis: int = 16, basis_tujuan: Optional[int] = None,
+                      ukuran_potong: int = UKURAN_POTONG_BIT, progres=None,
+                      token: Optional[TokenPembatalan] = None) -> Dict:
+    """
+    Penjumlahan atau pengurangan dua numeral per potongan, hasil ditulis ke keluaran
+
+    Args:
+        data1 (Buffer): Numeral pertama (bytes atau mmap)
+        operasi (str): '+' atau '-'
+        data2 (Buffer): Numeral kedua
+        keluaran (BinaryIO): Tujuan digit hasil; harus dapat di-seek dan di-truncate
+        basis (int): Basis kedua numeral (2, 8, atau 16)
+        basis_tujuan (int, optional): Basis hasil, 2, 8, atau 16 (default sama dengan basis)
+        ukuran_potong (int): Bit per potongan (dibulatkan ke kelipatan bit per digit tujuan)
+        progres (callable, optional): Callback PeristiwaProgres, dalam bit hasil
+        token (TokenPembatalan, optional): Token pembatalan, diperiksa tiap potongan
+
+    Returns:
+        Dict: 'bit_hasil' (lebar yang diproses), 'digit', dan 'basis'
+
+    Raises:
+        ValueError: Jika operasi/basis tidak didukung, digit tidak valid,
+            atau hasil pengurangan negatif (keluaran belum disentuh)
+    """
+    operand1, operand2, basis_tujuan, ukuran_potong = _siapkan_operand(
+        data1, operasi, data2, basis, basis_tujuan, ukuran_potong)
+    return _tulis_hasil(operand1, operasi, operand2, basis_tujuan, ukuran_potong,
+                        keluaran, progres, token)
+
+
+def aritmatika_berkas(path1: str, operasi: str, path2: str, path_keluaran: str,
+                      progres=None, token: Optional[TokenPembatalan] = None, **opsi) -> Dict:
+    """
+    Penjumlahan atau pengurangan numeral di file (dibuka lewat mmap), hasil ditulis ke file
+
+    Opsi sama dengan aritmatika_buffer (basis, basis_tujuan, ukuran_potong,
+    progres, token). Operand divalidasi sebelum file hasil dibuka, dan file
+    hasil diganti hanya jika operasi selesai.
+
+    Returns:
+        Dict: Ringkasan aritmatika_buffer ditambah 'path'
+
+    Raises:
+        ValueError: Jika file hasil sama dengan file operand, atau lihat aritmatika_buffer
+    """
+    with ExitStack() as tumpukan:
+        data1 = _peta_berkas(tumpukan, path1)
+        data2 = _peta_berkas(tumpukan, path2)
+        operand1, operand2, basis_tujuan, ukuran_potong = _siapkan_operand(
+            data1, operasi, data2, **opsi)
+        keluaran = tumpukan.enter_context(_keluaran_atomik(path_keluaran, path1, path2))
+        ringkasan = _tulis_hasil(operand1, operasi, operand2, basis_tujuan, ukuran_potong,
+                                 keluaran, progres, token)
+    ringkasan['path'] = path_keluaran
+    return ringkasan
+
+
+_NAMA_BASIS = {'biner': 2, 'oktal': 8, 'heksadesimal': 16}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Penjumlahan/pengurangan numeral file sangat besar")
+    parser.add_argument('operand1', help="File numeral pertama")
+    parser.add_argument('operasi', choices=OPERASI_ALIRAN)
+    parser.add_argument('operand2', help="File numeral kedua")
+    parser.add_argument('-o', '--keluaran', required=True, help="File hasil")
+    parser.add_argument('--basis', choices=_NAMA_BASIS, default='heksadesimal')
+    parser.add_argument('--ke', choices=_NAMA_BASIS, help="Basis hasil (default: sama)")
+    parser.add_argument('--tanpa-progres', action='store_true',
+                        help="Jangan tampilkan bilah progres di stderr")
+    args = parser.parse_args(argv)
+
+    bilah = None if args.tanpa_progres or not sys.stderr.isatty() else BilahProgresTeks()
+    try:
+        with tangkap_ctrl_c(TokenPembatalan()) as token:
+            ringkasan = aritmatika_berkas(args.operand1, args.operasi, args.operand2, args.keluaran,
+                                          basis=_NAMA_BASIS[args.basis],
+                                          basis_tujuan=_NAMA_BASIS[args.ke] if args.ke else None,
+                                          progres=bilah, token=token)
+    except OperasiDibatalkan:
+        if bilah is not None:
+            bilah.akhiri()
+        print("⚠️  Operasi dibatalkan", file=sys.stderr)
+        return 130
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(f"{ringkasan['digit']:,} digit ditulis ke {ringkasan['path']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Aritmatika Register Lebar Tetap dengan Flag Overflow/Underflow
+==============================================================
+
+Modul ini mensimulasikan aritmatika register 8/16/32/64 bit, bertanda
+(komplemen dua) maupun tidak bertanda, seperti perilaku prosesor:
+hasil yang tidak muat dibungkus (wraparound) atau dijenuhkan (saturasi),
+disertai flag carry, overflow, dan underflow.
+
+Definisi flag:
+- overflow: hasil matematis lebih besar dari nilai maksimum register
+- underflow: hasil matematis lebih kecil dari nilai minimum register
+- carry: + dan - memakai carry/borrow dari bit teratas pada pola bit;
+  * dan ** sama dengan (overflow atau underflow); / dan % selalu False
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+from enum import Enum
+from typing import Dict, Tuple
+
+try:
+    from .dukungan_numpy import np, pastikan_numpy
+except ImportError:
+    from dukungan_numpy import np, pastikan_numpy
+
+
+OPERASI_DIDUKUNG = ('+', '-', '*', '/', '%', '**')
+OPERASI_BATCH = ('+', '-', '*', '/', '%')
+LEBAR_REGISTER = (8, 16, 32, 64)
+BATAS_EKSPONEN = 20
+
+
+class ModeLuapan(Enum):
+    """Perilaku register saat hasil tidak muat"""
+    WRAP = "wrap"
+    SATURASI = "saturasi"
+
+
+def hitung_operasi(des1: int, des2: int, operasi: str, bertanda: bool = False) -> int:
+    """
+    Menghitung operasi aritmatika pada dua nilai desimal
+
+    Pada mode bertanda, pembagian dan modulo mengikuti semantik register
+    (pembulatan ke arah nol, sisa bertanda sama dengan pembilang).
+
+    Args:
+        des1 (int): Operand pertama
+        des2 (int): Operand kedua
+        operasi (str): Jenis operasi (+, -, *, /, %, **)
+        bertanda (bool): Gunakan semantik pembagian bertanda
+
+    Returns:
+        int: Hasil operasi
+    """
+    if operasi == '+':
+        return des1 + des2
+    elif operasi == '-':
+        return des1 - des2
+    elif operasi == '*':
+        return des1 * des2
+    elif operasi == '/':
+        if des2 == 0:
+            raise ValueError("Pembagian dengan nol tidak diperbolehkan")
+        if bertanda:
+            hasil_bagi = abs(des1) // abs(des2)
+            return -hasil_bagi if (des1 < 0) != (des2 < 0) else hasil_bagi
+        return des1 // des2  # Pembagian integer
+    elif operasi == '%':
+        if des2 == 0:
+            raise ValueError("Modulo dengan nol tidak diperbolehkan")
+        if bertanda:
+            sisa = abs(des1) % abs(des2)
+            return -sisa if des1 < 0 else sisa
+        return des1 % des2
+    elif operasi == '**':
+        if des2 > BATAS_EKSPONEN:  # Batasi eksponen untuk mencegah hasil yang terlalu besar
+            raise ValueError(f"Eksponen terlalu besar (maksimal {BATAS_EKSPONEN})")
+        if des2 < 0:
+            raise ValueError("Eksponen negatif tidak didukung")
+        return des1 ** des2
+
+    raise ValueError(f"Operasi '{operasi}' tidak didukung")
+
+
+class RegisterLebarTetap:
+    """Register lebar tetap dengan mode wrap atau saturasi"""
+
+    def __init__(self, lebar: int = 8, bertanda: bool = False,
+                 mode: ModeLuapan = ModeLuapan.WRAP):
+        """
+        Inisialisasi register
+
+        Args:
+            lebar (int): Jumlah bit (8, 16, 32, atau 64)
+            bertanda (bool): True untuk komplemen dua
+            mode (ModeLuapan): Wrap atau saturasi
+        """
+        if lebar not in LEBAR_REGISTER:
+            raise ValueError(f"Lebar register harus salah satu dari {LEBAR_REGISTER}")
+
+        self.lebar = lebar
+        self.bertanda = bertanda
+        self.mode = mode
+        self.mask = (1 << lebar) - 1
+        self.minimum = -(1 << (lebar - 1)) if bertanda else 0
+        self.maksimum = (1 << (lebar - 1)) - 1 if bertanda else self.mask
+
+    @property
+    def nama(self) -> str:
+        """Nama tipe register, misal 'int8 wrap'"""
+        return f"{'int' if self.bertanda else 'uint'}{self.lebar} {self.mode.value}"
+
+    def _cek_rentang(self, nilai: int):
+        """Memastikan operand muat di register"""
+        if not self.minimum <= nilai <= self.maksimum:
+            raise ValueError(f"Operand {nilai} di luar rentang {self.nama.split()[0]} "
+                             f"[{self.minimum}, {self.maksimum}]")
+
+    def dari_pola(self, pola: int) -> int:
+        """Membaca pola bit sebagai nilai register"""
+        pola &= self.mask
+        if self.bertanda and pola > self.maksimum:
+            return pola - (1 << self.lebar)
+        return pola
+
+    def hitung(self, a: int, b: int, operasi: str) -> Dict:
+        """
+        Menghitung operasi pada register
+
+        Args:
+            a (int): Operand pertama (dalam rentang register)
+            b (int): Operand kedua (dalam rentang register)
+            operasi (str): Jenis operasi (+, -, *, /, %, **)
+
+        Returns:
+            Dict: 'hasil' (nilai register), 'pola' (pola bit), 'hasil_tepat'
+                (hasil matematis), dan flag 'carry', 'overflow', 'underflow'
+        """
+        self._cek_rentang(a)
+        self._cek_rentang(b)
+
+        tepat = hitung_operasi(a, b, operasi, bertanda=self.bertanda)
+        overflow = tepat > self.maksimum
+        underflow = tepat < self.minimum
+
+        if operasi == '+':
+            carry = ((a & self.mask) + (b & self.mask)) > self.mask
+        elif operasi == '-':
+            carry = (a & self.mask) < (b & self.mask)
+        elif operasi in ('*', '**'):
+            carry = overflow or underflow
+        else:
+            carry = False
+
+        if self.mode == ModeLuapan.SATURASI:
+            hasil = min(max(tepat, self.minimum), self.maksimum)
+        else:
+            hasil = self.dari_pola(tepat)
+
+        return {
+            'hasil': hasil,
+            'pola': hasil & self.mask,
+            'hasil_tepat': tepat,
+            'carry': carry,
+            'overflow': overflow,
+            'underflow': underflow
+        }
+
+    # ===== MODE BATCH (NUMPY) =====
+
+    def _dtype(self):
+        """Dtype NumPy untuk register ini"""
+        return np.dtype(f"{'int' if self.bertanda else 'uint'}{self.lebar}")
+
+    def _siapkan_operand(self, nilai):
+        """Mengubah operand ke int64/uint64 setelah memeriksa rentang"""
+        nilai = np.asarray(nilai)
+        if nilai.dtype.kind not in 'iu':
+            raise ValueError("Operand batch harus berupa array integer")
+        if nilai.size:
+            self._cek_rentang(int(nilai.min()))
+            self._cek_rentang(int(nilai.max()))
+        return nilai.astype(np.int64 if self.bertanda else np.uint64)
+
+    def batch_hitung(self, a, b, operasi: str) -> Dict:
+        """
+        Menghitung operasi pada array operand secara tervektorisasi
+
+        Register sampai 32 bit dihitung tepat di int64/uint64 lalu dibungkus
+        atau dijenuhkan; register 64 bit memakai aritmatika modulo 2^64 dan
+        mendeteksi luapan dengan pemeriksaan bit tanda dan perkalian 128 bit.
+
+        Args:
+            a (np.ndarray): Operand pertama
+            b (np.ndarray): Operand kedua (bentuk sama atau dapat di-broadcast)
+            operasi (str): +, -, *, /, atau % (** tidak didukung di mode batch)
+
+        Returns:
+            Dict: 'hasil' (array dtype register), 'carry', 'overflow',
+                'underflow' (array bool), dan 'jumlah' (jumlah per flag)
+        """
+        pastikan_numpy("aritmatika lebar tetap batch")
+        if operasi not in OPERASI_BATCH:
+            raise ValueError(f"Operasi '{operasi}' tidak didukung di mode batch")
+
+        a = self._siapkan_operand(a)
+        b = self._siapkan_operand(b)
+        if operasi in ('/', '%') and not b.all():
+            raise ValueError("Pembagian dengan nol tidak diperbolehkan")
+
+        with np.errstate(over='ignore'):
+            if self.lebar < 64:
+                hasil, carry, overflow, underflow = self._batch_kecil(a, b, operasi)
+            elif self.bertanda:
+                hasil, carry, overflow, underflow = self._batch_64_bertanda(a, b, operasi)
+            else:
+                hasil, carry, overflow, underflow = self._batch_64_tak_bertanda(a, b, operasi)
+
+        carry = np.broadcast_to(carry, hasil.shape)
+        overflow = np.broadcast_to(overflow, hasil.shape)
+        underflow = np.broadcast_to(underflow, hasil.shape)
+        return {
+            'hasil': hasil,
+            'carry': carry,
+            'overflow': overflow,
+            'underflow': underflow,
+            'jumlah': {
+                'operasi': int(hasil.size),
+                'carry': int(np.count_nonzero(carry)),
+                'overflow': int(np.count_nonzero(overflow)),
+                'underflow': int(np.count_nonzero(underflow))
+            }
+        }
+
+    def _batch_kecil(self, a, b, operasi: str) -> Tuple:
+        """Register 8-32 bit: hasil tepat muat di int64 (atau uint64)"""
+        a = a.astype(np.int64)
+        b = b.astype(np.int64)
+        mask = np.int64(self.mask)
+
+        if operasi == '+':
+            tepat = a + b
+            carry = ((a & mask) + (b & mask)) > mask
+        elif operasi == '-':
+            tepat = a - b
+            carry = (a & mask) < (b & mask)
+        elif operasi == '*':
+            if not self.bertanda and self.lebar == 32:
+                tepat = a.astype(np.uint64) * b.astype(np.uint64)  # < 2^64, tepat
+            else:
+                tepat = a * b
+            carry = None
+        elif operasi == '/':
+            tepat = (a - np.fmod(a, b)) // b if self.bertanda else a // b
+            carry = False
+        else:
+            tepat = np.fmod(a, b) if self.bertanda else a % b
+            carry = False
+
+        overflow = tepat > self.maksimum
+        underflow = tepat < self.minimum
+        if carry is None:
+            carry = overflow | underflow
+
+        if self.mode == ModeLuapan.SATURASI:
+            hasil = np.clip(tepat, self.minimum, self.maksimum).astype(self._dtype())
+        else:
+            pola = tepat & tepat.dtype.type(self.mask)
+            hasil = pola.astype(np.dtype(f'uint{self.lebar}')).view(self._dtype())
+        return hasil, carry, overflow, underflow
+
+    def _batch_64_tak_bertanda(self, a, b, operasi: str) -> Tuple:
+        """Register uint64: deteksi luapan tanpa tipe yang lebih lebar"""
+        maks = np.uint64(self.maksimum)
+        overflow = underflow = False
+
+        if operasi == '+':
+            hasil = a + b
+            overflow = carry = hasil < a
+            saturasi = maks
+        elif operasi == '-':
+            hasil = a - b
+            underflow = carry = a < b
+            saturasi = np.uint64(0)
+        elif operasi == '*':
+            tinggi, hasil = _kali_128(a, b)
+            overflow = carry = tinggi != 0
+            saturasi = maks
+        else:
+            hasil = a // b if operasi == '/' else a % b
+            carry = False
+            saturasi = None
+
+        if self.mode == ModeLuapan.SATURASI and saturasi is not None:
+            hasil = np.where(overflow | underflow, saturasi, hasil)
+        return hasil.astype(np.uint64), carry, overflow, underflow
+
+    def _batch_64_bertanda(self, a, b, operasi: str) -> Tuple:
+        """Register int64: deteksi luapan lewat bit tanda dan perkalian 128 bit"""
+        pola_a = a.view(np.uint64)
+        pola_b = b.view(np.uint64)
+        carry = False
+
+        if operasi == '+':
+            pola = pola_a + pola_b
+            hasil = pola.view(np.int64)
+            overflow = (a >= 0) & (b >= 0) & (hasil < 0)
+            underflow = (a < 0) & (b < 0) & (hasil >= 0)
+            carry = pola < pola_a
+        elif operasi == '-':
+            hasil = (pola_a - pola_b).view(np.int64)
+            overflow = (a >= 0) & (b < 0) & (hasil < 0)
+            underflow = (a < 0) & (b >= 0) & (hasil >= 0)
+            carry = pola_a < pola_b
+        elif operasi == '*':
+            besaran_a = np.where(a < 0, ~pola_a + np.uint64(1), pola_a)
+            besaran_b = np.where(b < 0, ~pola_b + np.uint64(1), pola_b)
+            tinggi, rendah = _kali_128(besaran_a, besaran_b)
+            negatif = (a < 0) != (b < 0)
+            overflow = ~negatif & ((tinggi != 0) | (rendah > np.uint64(self.maksimum)))
+            underflow = negatif & ((tinggi != 0) | (rendah > np.uint64(-self.minimum)))
+            hasil = (pola_a * pola_b).view(np.int64)
+            carry = overflow | underflow
+        else:
+            # Satu-satunya luapan: minimum / -1
+            overflow = (a == self.minimum) & (b == -1)
+            underflow = False
+            pembagi = np.where(overflow, 1, b)
+            sisa = np.fmod(a, pembagi)
+            hasil = (a - sisa) // pembagi if operasi == '/' else sisa
+            if operasi == '%':
+                overflow = False
+
+        if self.mode == ModeLuapan.SATURASI:
+            hasil = np.where(overflow, np.int64(self.maksimum),
+                             np.where(underflow, np.int64(self.minimum), hasil))
+        return hasil.astype(np.int64), carry, overflow, underflow
+
+
+def _kali_128(a, b) -> Tuple:
+    """Perkalian uint64 × uint64 → (64 bit tinggi, 64 bit rendah) lewat limb 32 bit"""
+    m32 = np.uint64(0xFFFFFFFF)
+    s32 = np.uint64(32)
+    a0, a1 = a & m32, a >> s32
+    b0, b1 = b & m32, b >> s32
+    p00, p01, p10, p11 = a0 * b0, a0 * b1, a1 * b0, a1 * b1
+    tengah = (p00 >> s32) + (p01 & m32) + (p10 & m32)
+    rendah = (p00 & m32) | ((tengah & m32) << s32)
+    tinggi = p11 + (p01 >> s32) + (p10 >> s32) + (tengah >> s32)
+    return tinggi, rendah
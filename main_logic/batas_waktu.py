@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pelaksana Operasi Berbatas Waktu
+================================
+
+Operasi aritmatika dan konversi pada operand sangat besar (misal '**' atau
+'*' pada numeral heksadesimal jutaan digit) dapat berjalan puluhan detik.
+Pemanggilan int() dan perkalian di C tidak dapat dihentikan dari thread,
+sehingga operasi yang diperkirakan mahal dijalankan di proses pekerja yang
+dapat dimatikan saat batas waktunya habis.
+
+Perkiraan biaya dihitung dari panjang numeral tanpa mem-parse nilainya:
+jumlah bit operand dan perkiraan jumlah bit hasil. Operasi di bawah
+ambang dijalankan langsung di proses ini (tanpa biaya membuat proses).
+
+Jika batas waktu habis atau token pembatalan dibatalkan, pekerja dimatikan
+dan hasil terstruktur dikembalikan dengan berhasil=False dan waktu_habis=True
+(batas waktu) atau dibatalkan=True (token), sehingga pemanggil dapat
+membedakan pembatalan oleh pengguna dari batas waktu.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import math
+import multiprocessing
+import time
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    from .number_system_simulator import KonverterSistemBilangan, SistemBilangan, DESKRIPTOR_SISTEM
+    from .aritmatika_lebar_tetap import BATAS_EKSPONEN
+    from .representasi_bertanda import RepresentasiBertanda
+    from .hasil import HasilOperasi, HasilKonversi
+    from .progres import TokenPembatalan
+except ImportError:
+    from number_system_simulator import KonverterSistemBilangan, SistemBilangan, DESKRIPTOR_SISTEM
+    from aritmatika_lebar_tetap import BATAS_EKSPONEN
+    from representasi_bertanda import RepresentasiBertanda
+    from hasil import HasilOperasi, HasilKonversi
+    from progres import TokenPembatalan
+
+# Sama dengan VALIDATION_CONFIG['timeout_seconds'] di config_gui.py
+BATAS_DETIK_DEFAULT = 30.0
+# Perkiraan bit operand/hasil mulai dari mana operasi dijalankan di proses
+# pekerja; di bawahnya operasi selesai dalam puluhan milidetik
+AMBANG_BIT_DEFAULT = 1 << 20
+# Jeda pemeriksaan token pembatalan selama menunggu pekerja (detik)
+_INTERVAL_TUNGGU = 0.1
+
+
+def _bit_numeral(nilai: str, sistem: SistemBilangan) -> int:
+    """Perkiraan jumlah bit numeral dari panjang string"""
+    return math.ceil(len(nilai.strip()) * math.log2(DESKRIPTOR_SISTEM[sistem]['base']))
+
+
+def perkiraan_bit_operasi(nilai1: str, nilai2: str, operasi: str, sistem: SistemBilangan) -> int:
+    """
+    Perkiraan jumlah bit terbesar (operand atau hasil) sebuah operasi aritmatika
+
+    Args:
+        nilai1 (str): Nilai pertama
+        nilai2 (str): Nilai kedua
+        operasi (str): Jenis operasi (+, -, *, /, %, **)
+        sistem (SistemBilangan): Sistem bilangan operand
+
+    Returns:
+        int: Perkiraan jumlah bit
+    """
+    bit1 = _bit_numeral(nilai1, sistem)
+    bit2 = _bit_numeral(nilai2, sistem)
+    if operasi == '*':
+        return bit1 + bit2
+    if operasi == '**':
+        # Eksponen dibatasi BATAS_EKSPONEN; eksponen yang lebih panjang dari
+        # batas itu akan ditolak sebelum dihitung
+        return max(bit1 * BATAS_EKSPONEN, bit2)
+    return max(bit1, bit2)
+
+
+def _status_gagal(status: str) -> Dict[str, Optional[bool]]:
+    """Field hasil untuk status _jalankan yang gagal ('error', 'waktu_habis', 'dibatalkan')"""
+    return {'waktu_habis': True if status == 'waktu_habis' else None,
+            'dibatalkan': True if status == 'dibatalkan' else None}
+
+
+def _pekerja(koneksi, nama: str, argumen: Tuple):
+    """Dijalankan di proses pekerja: menghitung lalu mengirim ('ok', hasil) atau ('error', pesan)"""
+    try:
+        konverter = KonverterSistemBilangan()
+        if nama == 'operasi':
+            hasil = konverter.operasi_aritmatika(*argumen)
+        else:
+            nilai, sistem_asal, sistem_tujuan = argumen
+            nilai_desimal = konverter.ke_desimal(nilai, sistem_asal)
+            hasil = (konverter.dari_desimal(nilai_desimal, sistem_tujuan), nilai_desimal)
+        koneksi.send(('ok', hasil))
+    except Exception as e:
+        koneksi.send(('error', str(e)))
+    finally:
+        koneksi.close()
+
+
+class PelaksanaBatasWaktu:
+    """Menjalankan operasi konverter dengan batas waktu di proses pekerja yang dapat dimatikan"""
+
+    def __init__(self, konverter: KonverterSistemBilangan,
+                 batas_detik: float = BATAS_DETIK_DEFAULT,
+                 ambang_bit: int = AMBANG_BIT_DEFAULT):
+        """
+        Args:
+            konverter (KonverterSistemBilangan): Konverter untuk operasi murah dan riwayat
+            batas_detik (float): Batas waktu per operasi di proses pekerja
+            ambang_bit (int): Perkiraan bit mulai dari mana proses pekerja dipakai
+        """
+        if batas_detik <= 0 or ambang_bit <= 0:
+            raise ValueError("Batas waktu dan ambang bit harus positif")
+        self.konverter = konverter
+        self.batas_detik = batas_detik
+        self.ambang_bit = ambang_bit
+
+    def _jalankan(self, nama: str, argumen: Tuple,
+                  token: Optional[TokenPembatalan]) -> Tuple[str, Any]:
+        """
+        Menjalankan _pekerja di proses baru dan menunggu paling lama batas_detik
+
+        Returns:
+            Tuple[str, Any]: ('ok', hasil), ('error', pesan), ('waktu_habis', pesan),
+                atau ('dibatalkan', pesan)
+        """
+        induk, anak = multiprocessing.Pipe(duplex=False)
+        proses = multiprocessing.Process(target=_pekerja, args=(anak, nama, argumen), daemon=True)
+        proses.start()
+        anak.close()
+        tenggat = time.monotonic() + self.batas_detik
+        try:
+            while True:
+                sisa = tenggat - time.monotonic()
+                if sisa <= 0:
+                    return 'waktu_habis', f"Operasi melebihi batas waktu {self.batas_detik:g} detik"
+                if token is not None and token.dibatalkan:
+                    return 'dibatalkan', "Operasi dibatalkan"
+                if induk.poll(min(sisa, _INTERVAL_TUNGGU)):
+                    try:
+                        return induk.recv()
+                    except EOFError:
+                        return 'error', f"Proses pekerja berhenti tidak normal (kode {proses.exitcode})"
+        finally:
+            if proses.is_alive():
+                proses.terminate()
+            proses.join()
+            induk.close()
+
+    def operasi_aritmatika(self, nilai1: str, nilai2: str, operasi: str,
+                           sistem: SistemBilangan,
+                           representasi: Optional[RepresentasiBertanda] = None,
+                           lebar: int = 8, bias: Optional[int] = None,
+                           token: Optional[TokenPembatalan] = None) -> Dict:
+        """
+        Seperti KonverterSistemBilangan.operasi_aritmatika, dengan batas waktu
+
+        Mode bertanda selalu dijalankan langsung karena operandnya sudah
+        dibatasi lebar register.
+
+        Returns:
+            Dict: Hasil operasi; saat batas waktu habis atau dibatalkan berisi
+                berhasil=False, 'error', dan waktu_habis=True atau dibatalkan=True
+        """
+        if (representasi is not None
+                or perkiraan_bit_operasi(nilai1, nilai2, operasi, sistem) < self.ambang_bit):
+            return self.konverter.operasi_aritmatika(nilai1, nilai2, operasi, sistem,
+                                                     representasi, lebar, bias)
+
+        status, isi = self._jalankan('operasi', (nilai1, nilai2, operasi, sistem), token)
+        if status == 'ok':
+            return isi
+        return HasilOperasi(berhasil=False, error=isi, operasi=f"{nilai1} {operasi} {nilai2}",
+                            sistem=sistem.value, **_status_gagal(status)).to_dict()
+
+    def konversi(self, nilai: str, sistem_asal: SistemBilangan, sistem_tujuan: SistemBilangan,
+                 token: Optional[TokenPembatalan] = None) -> Dict:
+        """
+        Seperti KonverterSistemBilangan.konversi, dengan batas waktu dan hasil terstruktur
+
+        Konversi yang berhasil dicatat ke riwayat konverter seperti biasa.
+
+        Returns:
+            Dict: 'berhasil', lalu 'hasil' dan 'nilai_desimal', atau 'error'
+                (dan waktu_habis=True jika batas waktu habis, atau dibatalkan=True)
+        """
+        mulai = time.perf_counter()
+        if _bit_numeral(nilai, sistem_asal) < self.ambang_bit:
+            try:
+                nilai_desimal = self.konverter.ke_desimal(nilai, sistem_asal)
+                hasil = self.konverter.dari_desimal(nilai_desimal, sistem_tujuan)
+            except ValueError as e:
+                return HasilKonversi(berhasil=False, error=str(e)).to_dict()
+        else:
+            status, isi = self._jalankan('konversi', (nilai, sistem_asal, sistem_tujuan), token)
+            if status != 'ok':
+                return HasilKonversi(berhasil=False, error=isi, **_status_gagal(status)).to_dict()
+            hasil, nilai_desimal = isi
+
+        self.konverter.catat_konversi(nilai, sistem_asal, sistem_tujuan, hasil, nilai_desimal,
+                                      time.perf_counter() - mulai)
+        return HasilKonversi(berhasil=True, hasil=hasil, nilai_desimal=nilai_desimal).to_dict()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark Kontensi Konverter Bersama
+====================================
+
+Mengukur throughput satu KonverterSistemBilangan yang dipakai bersama oleh
+1..N thread. Setiap thread menjalankan campuran konversi (menulis riwayat)
+dan simulasi kesalahan (memakai RNG) dalam jumlah yang sama, sehingga
+throughput ideal naik linear terhadap jumlah thread.
+
+Pada build CPython dengan GIL, kerja murni Python tidak berjalan paralel
+sehingga throughput diharapkan datar; yang diuji adalah tidak adanya
+penurunan akibat kontensi. Pada build free-threaded (python3.13t ke atas)
+throughput seharusnya naik mendekati jumlah inti CPU.
+
+Opsi --pembanding menjalankan ulang benchmark dengan riwayat list biasa
+yang dilindungi satu kunci global, untuk melihat biaya kontensi kunci.
+
+Penggunaan:
+    python benchmark_konkurensi.py --thread 1 2 4 8 --operasi 20000
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+try:
+    from .number_system_simulator import KonverterSistemBilangan, SistemBilangan, JenisKesalahan
+except ImportError:
+    from number_system_simulator import KonverterSistemBilangan, SistemBilangan, JenisKesalahan
+
+
+class _RiwayatBerkunci(list):
+    """List riwayat dengan satu kunci global (pembanding naif)"""
+
+    def __init__(self):
+        super().__init__()
+        self._kunci = threading.Lock()
+
+    def append(self, entri):
+        with self._kunci:
+            super().append(entri)
+
+
+def gil_aktif() -> bool:
+    """True jika interpreter berjalan dengan GIL"""
+    cek = getattr(sys, '_is_gil_enabled', None)
+    return True if cek is None else cek()
+
+
+def _beban(konverter: KonverterSistemBilangan, jumlah_operasi: int, indeks_thread: int):
+    """Campuran konversi dan simulasi kesalahan"""
+    for i in range(jumlah_operasi):
+        nilai = format(i * 7919 + indeks_thread, 'b')
+        if i % 4 == 3:
+            konverter.simulasi_kesalahan(nilai, SistemBilangan.BINER, JenisKesalahan.BIT_FLIP)
+        else:
+            konverter.konversi(nilai, SistemBilangan.BINER, SistemBilangan.HEKSADESIMAL)
+
+
+def ukur_throughput(jumlah_thread: int, operasi_per_thread: int,
+                    pembanding: bool = False, seed: Optional[int] = 0) -> Dict:
+    """
+    Menjalankan beban pada satu konverter bersama dengan sejumlah thread
+
+    Args:
+        jumlah_thread (int): Jumlah thread pekerja
+        operasi_per_thread (int): Operasi yang dijalankan setiap thread
+        pembanding (bool): Pakai riwayat list berkunci global, bukan RiwayatTerbagi
+        seed (int, optional): Seed konverter
+
+    Returns:
+        Dict: 'thread', 'operasi', 'waktu', 'throughput' (operasi/detik),
+            dan 'riwayat' (jumlah entri riwayat setelah selesai)
+    """
+    if jumlah_thread <= 0 or operasi_per_thread <= 0:
+        raise ValueError("Jumlah thread dan operasi harus positif")
+
+    konverter = KonverterSistemBilangan(seed=seed)
+    if pembanding:
+        konverter.riwayat_konversi = _RiwayatBerkunci()
+
+    # Semua thread mulai bersamaan; waktu diukur oleh thread utama
+    penghalang = threading.Barrier(jumlah_thread + 1)
+
+    def pekerja(indeks):
+        penghalang.wait()
+        _beban(konverter, operasi_per_thread, indeks)
+
+    daftar_thread = [threading.Thread(target=pekerja, args=(i,)) for i in range(jumlah_thread)]
+    for thread in daftar_thread:
+        thread.start()
+    penghalang.wait()
+    mulai = time.perf_counter()
+    for thread in daftar_thread:
+        thread.join()
+    waktu = time.perf_counter() - mulai
+
+    total = jumlah_thread * operasi_per_thread
+    return {
+        'thread': jumlah_thread,
+        'operasi': total,
+        'waktu': waktu,
+        'throughput': total / waktu if waktu > 0 else float('inf'),
+        'riwayat': len(konverter.riwayat_konversi)
+    }
+
+
+def jalankan_benchmark(daftar_jumlah_thread: List[int], operasi_per_thread: int,
+                       pembanding: bool = False) -> List[Dict]:
+    """
+    Mengukur throughput untuk setiap jumlah thread
+
+    Returns:
+        List[Dict]: Hasil ukur_throughput ditambah 'percepatan' relatif
+            terhadap jumlah thread pertama
+    """
+    hasil = [ukur_throughput(n, operasi_per_thread, pembanding) for n in daftar_jumlah_thread]
+    dasar = hasil[0]['throughput']
+    for baris in hasil:
+        baris['percepatan'] = baris['throughput'] / dasar
+    return hasil
+
+
+def _cetak(judul: str, hasil: List[Dict]):
+    print(f"\n{judul}")
+    print(f"{'Thread':>6} {'Operasi':>10} {'Waktu (s)':>10} {'Operasi/s':>12} {'Percepatan':>11}")
+    for baris in hasil:
+        print(f"{baris['thread']:>6} {baris['operasi']:>10} {baris['waktu']:>10.3f} "
+              f"{baris['throughput']:>12.0f} {baris['percepatan']:>10.2f}x")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark kontensi konverter bersama")
+    parser.add_argument('--thread', type=int, nargs='+', default=[1, 2, 4, 8],
+                        help="Daftar jumlah thread (default: 1 2 4 8)")
+    parser.add_argument('--operasi', type=int, default=20000,
+                        help="Operasi per thread (default: 20000)")
+    parser.add_argument('--pembanding', action='store_true',
+                        help="Juga ukur riwayat list dengan satu kunci global")
+    args = parser.parse_args(argv)
+
+    try:
+        print(f"Python {sys.version.split()[0]}, GIL {'aktif' if gil_aktif() else 'nonaktif'}, "
+              f"{os.cpu_count()} CPU")
+        _cetak("Riwayat terbagi per thread",
+               jalankan_benchmark(args.thread, args.operasi))
+        if args.pembanding:
+            _cetak("Pembanding: list dengan kunci global",
+                   jalankan_benchmark(args.thread, args.operasi, pembanding=True))
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
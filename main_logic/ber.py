@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pengukuran Bit Error Rate (BER) untuk Payload Besar
+===================================================
+
+Modul ini membandingkan payload referensi dengan payload yang diterima
+lalu menghitung BER dan histogram kesalahan per posisi bit dalam frame.
+
+Fitur:
+- Pemrosesan per potongan lewat XOR dan popcount, memori tetap terbatas
+  untuk capture berukuran gigabyte
+- File biner mentah dibaca lewat mmap
+- File teks (biner/oktal/desimal/heksadesimal) diparse dengan parser
+  SistemBilangan
+- Payload terima dapat dibangkitkan dari referensi lewat simulator kanal
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import argparse
+import mmap
+import os
+import re
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+try:
+    from .number_system_simulator import SistemBilangan, MESIN_SISTEM
+    from .konversi_buffer import ke_int_buffer
+    from .kanal import Kanal, KanalBSC, KanalGilbertElliott
+    from .dukungan_numpy import np
+    from .progres import (PelacakProgres, TokenPembatalan, OperasiDibatalkan,
+                          BilahProgresTeks, tangkap_ctrl_c)
+except ImportError:
+    from number_system_simulator import SistemBilangan, MESIN_SISTEM
+    from konversi_buffer import ke_int_buffer
+    from kanal import Kanal, KanalBSC, KanalGilbertElliott
+    from dukungan_numpy import np
+    from progres import (PelacakProgres, TokenPembatalan, OperasiDibatalkan,
+                         BilahProgresTeks, tangkap_ctrl_c)
+
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+UKURAN_POTONG_DEFAULT = 1 << 22  # 4 MB per potongan
+FORMAT_MENTAH = 'mentah'
+FORMAT_INPUT = [FORMAT_MENTAH] + [sistem.value for sistem in SistemBilangan]
+
+_SPASI = b' \t\r\n\x0b\x0c'
+_BYTE_BUKAN_NOL = re.compile(rb'[^\x00]')
+
+if hasattr(int, 'bit_count'):
+    _popcount = int.bit_count
+else:  # Python < 3.10
+    def _popcount(nilai: int) -> int:
+        return bin(nilai).count('1')
+
+if np is not None:
+    _URUTAN_BIT = np.arange(8, dtype=np.int64)
+
+
+# ===== SUMBER PAYLOAD =====
+
+def baca_biner(path: str, ukuran_potong: int = UKURAN_POTONG_DEFAULT) -> Iterator[bytes]:
+    """
+    Membaca file biner mentah per potongan lewat mmap
+
+    Args:
+        path (str): Lokasi file
+        ukuran_potong (int): Jumlah byte per potongan
+
+    Yields:
+        bytes: Potongan payload
+    """
+    with open(path, 'rb') as berkas:
+        if os.fstat(berkas.fileno()).st_size == 0:
+            return
+        with mmap.mmap(berkas.fileno(), 0, access=mmap.ACCESS_READ) as peta:
+            for awal in range(0, len(peta), ukuran_potong):
+                yield peta[awal:awal + ukuran_potong]
+
+
+def baca_teks(path: str, sistem: SistemBilangan,
+              ukuran_potong: int = UKURAN_POTONG_DEFAULT) -> Iterator[bytes]:
+    """
+    Membaca file teks berisi numeral sebagai payload biner
+
+    Untuk sistem berbasis pangkat dua, teks diparse per kelompok digit yang
+    pas dengan batas byte, sehingga file besar dibaca bertahap. Whitespace
+    diabaikan. Desimal tidak dapat dipotong dan dibaca sekaligus, dengan
+    panjang payload minimum yang memuat nilainya.
+
+    Args:
+        path (str): Lokasi file teks
+        sistem (SistemBilangan): Sistem bilangan isi file
+        ukuran_potong (int): Jumlah karakter per pembacaan
+
+    Yields:
+        bytes: Potongan payload
+    """
+    mesin = MESIN_SISTEM[sistem]
+
+    if not mesin.bit_per_digit:
+        with open(path, 'rb') as berkas:
+            teks = berkas.read().translate(None, _SPASI)
+        if teks:
+            nilai = ke_int_buffer(teks, mesin)
+            yield nilai.to_bytes(max(1, -(-nilai.bit_length() // 8)), 'big')
+        return
+
+    # Kelompok digit terkecil yang tepat mengisi sejumlah byte utuh
+    bit = mesin.bit_per_digit
+    digit_per_kelompok = 8 // _fpb(8, bit)
+    byte_per_kelompok = digit_per_kelompok * bit // 8
+    ukuran_potong = max(digit_per_kelompok, ukuran_potong - ukuran_potong % digit_per_kelompok)
+
+    sisa = b''
+    with open(path, 'rb') as berkas:
+        while True:
+            data = berkas.read(ukuran_potong)
+            if not data:
+                break
+            teks = sisa + data.translate(None, _SPASI)
+            batas = len(teks) - len(teks) % digit_per_kelompok
+            teks, sisa = teks[:batas], teks[batas:]
+            if teks:
+                jumlah_byte = batas // digit_per_kelompok * byte_per_kelompok
+                yield ke_int_buffer(teks, mesin).to_bytes(jumlah_byte, 'big')
+
+    if sisa:
+        raise ValueError(f"Jumlah digit {sistem.value} tidak membentuk byte utuh "
+                         f"(kelebihan {len(sisa)} digit)")
+
+
+def _fpb(a: int, b: int) -> int:
+    """Faktor persekutuan terbesar"""
+    while b:
+        a, b = b, a % b
+    return a
+
+
+def baca_payload(path: str, format_input: str = FORMAT_MENTAH,
+                 ukuran_potong: int = UKURAN_POTONG_DEFAULT) -> Iterator[bytes]:
+    """
+    Membaca payload dari file mentah atau teks
+
+    Args:
+        path (str): Lokasi file
+        format_input (str): 'mentah' atau nama SistemBilangan
+        ukuran_potong (int): Ukuran potongan
+
+    Yields:
+        bytes: Potongan payload
+    """
+    if format_input == FORMAT_MENTAH:
+        return baca_biner(path, ukuran_potong)
+    return baca_teks(path, SistemBilangan(format_input), ukuran_potong)
+
+
+def lewat_kanal(potongan: Iterable[Buffer], kanal: Kanal, seed=None) -> Iterator[bytes]:
+    """
+    Mengirim potongan payload melalui simulator kanal
+
+    Generator acak yang sama dipakai untuk semua potongan; keadaan kanal
+    Gilbert–Elliott dimulai ulang dari distribusi stasioner di setiap potongan.
+
+    Args:
+        potongan (Iterable[Buffer]): Potongan payload referensi
+        kanal (Kanal): Model kanal
+        seed (int, optional): Seed generator acak
+
+    Yields:
+        bytes: Potongan payload diterima
+    """
+    rng = np.random.default_rng(seed)
+    for data in potongan:
+        yield kanal.kirim_bytes(data, rng)
+
+
+# ===== PENGUKURAN =====
+
+def _histogram_padat(xor, awal_byte: int, panjang_frame: int):
+    """
+    Hitungan kesalahan per posisi bit frame untuk potongan dengan banyak byte salah
+
+    Setiap bit (MSB dulu) dijumlahkan per kolom frame, sehingga memori
+    sementara sebesar potongan, tidak delapan kali jumlah bit salah.
+    """
+    hitungan = np.zeros((panjang_frame, 8), dtype=np.uint64)
+    posisi = awal_byte % panjang_frame
+    i, n = 0, len(xor)
+    while i < n:
+        if posisi == 0 and n - i >= panjang_frame:
+            # Frame utuh: bentuk ulang menjadi baris per frame lalu jumlahkan per kolom
+            jumlah = (n - i) // panjang_frame * panjang_frame
+            blok = xor[i:i + jumlah].reshape(-1, panjang_frame)
+            for bit in range(8):
+                hitungan[:, bit] += ((blok >> (7 - bit)) & 1).sum(axis=0, dtype=np.uint64)
+        else:
+            # Frame terpotong di awal atau akhir potongan
+            jumlah = min(panjang_frame - posisi, n - i)
+            blok = xor[i:i + jumlah]
+            for bit in range(8):
+                hitungan[posisi:posisi + jumlah, bit] += (blok >> (7 - bit)) & 1
+            posisi = (posisi + jumlah) % panjang_frame
+        i += jumlah
+    return hitungan.reshape(-1)
+
+
+def _hitung_potongan(a: Buffer, b: Buffer, awal_bit: int, histogram: List[int],
+                     panjang_frame_bit: int) -> int:
+    """XOR + popcount satu pasangan potongan; mengisi histogram posisi"""
+    if np is not None:
+        xor = np.frombuffer(a, dtype=np.uint8) ^ np.frombuffer(b, dtype=np.uint8)
+        jumlah_salah = np.count_nonzero(xor)
+        if not jumlah_salah:
+            return 0
+        if jumlah_salah * 64 > len(xor):
+            # Padat: indeks per bit salah akan jauh lebih besar dari potongannya
+            hitungan = _histogram_padat(xor, awal_bit // 8, panjang_frame_bit // 8)
+        else:
+            byte_salah = np.flatnonzero(xor)
+            bit = np.unpackbits(xor[byte_salah]).reshape(-1, 8).astype(bool)
+            posisi = (byte_salah[:, None] * 8 + _URUTAN_BIT)[bit]
+            hitungan = np.bincount((posisi + awal_bit) % panjang_frame_bit,
+                                   minlength=panjang_frame_bit)
+        for i in np.flatnonzero(hitungan):
+            histogram[i] += int(hitungan[i])
+        return int(hitungan.sum())
+
+    xor = int.from_bytes(a, 'big') ^ int.from_bytes(b, 'big')
+    if not xor:
+        return 0
+    xor_bytes = xor.to_bytes(len(a), 'big')
+    for cocok in _BYTE_BUKAN_NOL.finditer(xor_bytes):
+        i = cocok.start()
+        nilai = xor_bytes[i]
+        for j in range(8):
+            if nilai & (0x80 >> j):
+                histogram[(awal_bit + i * 8 + j) % panjang_frame_bit] += 1
+    return _popcount(xor)
+
+
+def ukur_ber(referensi: Iterable[Buffer], diterima: Iterable[Buffer],
+             panjang_frame: int = 1, progres=None,
+             token: Optional[TokenPembatalan] = None,
+             total_byte: Optional[int] = None) -> Dict:
+    """
+    Mengukur BER antara payload referensi dan payload diterima
+
+    Kedua sumber boleh memiliki ukuran potongan berbeda; potongan
+    disejajarkan sebelum dibandingkan. Jika panjang berbeda, hanya bagian
+    yang tumpang tindih yang dibandingkan.
+
+    Args:
+        referensi (Iterable[Buffer]): Potongan payload referensi
+        diterima (Iterable[Buffer]): Potongan payload diterima
+        panjang_frame (int): Panjang frame dalam byte untuk histogram posisi
+        progres (callable, optional): Callback PeristiwaProgres, dalam byte dibandingkan
+        token (TokenPembatalan, optional): Token pembatalan, diperiksa tiap potongan
+        total_byte (int, optional): Perkiraan byte yang dibandingkan (untuk persentase)
+
+    Returns:
+        Dict: 'bit_dibandingkan', 'bit_salah', 'ber', 'panjang_frame',
+            'histogram_posisi' (kesalahan per posisi bit dalam frame, MSB
+            dulu), 'byte_referensi', dan 'byte_diterima'
+    """
+    if panjang_frame <= 0:
+        raise ValueError("Panjang frame harus positif")
+
+    panjang_frame_bit = panjang_frame * 8
+    histogram = [0] * panjang_frame_bit
+    iter_ref, iter_terima = iter(referensi), iter(diterima)
+    buf_ref = buf_terima = memoryview(b'')
+    byte_ref = byte_terima = 0
+    dibandingkan = salah = 0
+    pelacak = PelacakProgres('ber', total_byte, progres, token)
+
+    while True:
+        if not len(buf_ref):
+            data = next(iter_ref, None)
+            if data is None:
+                break
+            buf_ref = memoryview(data)
+            byte_ref += len(buf_ref)
+        if not len(buf_terima):
+            data = next(iter_terima, None)
+            if data is None:
+                break
+            buf_terima = memoryview(data)
+            byte_terima += len(buf_terima)
+
+        n = min(len(buf_ref), len(buf_terima))
+        salah += _hitung_potongan(buf_ref[:n], buf_terima[:n], (dibandingkan * 8) % panjang_frame_bit,
+                                  histogram, panjang_frame_bit)
+        dibandingkan += n
+        buf_ref, buf_terima = buf_ref[n:], buf_terima[n:]
+        pelacak.maju(n)
+
+    # Sisa sumber yang lebih panjang hanya dihitung ukurannya
+    byte_ref += sum(len(data) for data in iter_ref)
+    byte_terima += sum(len(data) for data in iter_terima)
+    pelacak.tuntas()
+
+    return {
+        'bit_dibandingkan': dibandingkan * 8,
+        'bit_salah': salah,
+        'ber': salah / (dibandingkan * 8) if dibandingkan else 0.0,
+        'panjang_frame': panjang_frame,
+        'histogram_posisi': histogram,
+        'byte_referensi': byte_ref,
+        'byte_diterima': byte_terima
+    }
+
+
+def buat_kanal(spesifikasi: str) -> Kanal:
+    """
+    Membuat kanal dari spesifikasi teks
+
+    Args:
+        spesifikasi (str): 'bsc:p' atau 'ge:p_gb,p_bg[,e_baik,e_buruk]'
+
+    Returns:
+        Kanal: Model kanal
+    """
+    jenis, _, parameter = spesifikasi.partition(':')
+    try:
+        nilai = [float(p) for p in parameter.split(',') if p]
+    except ValueError:
+        raise ValueError(f"Parameter kanal tidak valid: {parameter}")
+
+    if jenis == 'bsc' and len(nilai) == 1:
+        return KanalBSC(*nilai)
+    if jenis == 'ge' and len(nilai) in (2, 4):
+        return KanalGilbertElliott(*nilai)
+    raise ValueError("Spesifikasi kanal harus 'bsc:p' atau 'ge:p_gb,p_bg[,e_baik,e_buruk]'")
+
+
+def tulis_laporan(hasil: Dict, keluaran=None, tampilkan_histogram: bool = True):
+    """Menulis laporan BER dalam format teks (default ke stdout)"""
+    keluaran = keluaran or sys.stdout
+    print(f"Bit dibandingkan : {hasil['bit_dibandingkan']:,}", file=keluaran)
+    print(f"Bit salah        : {hasil['bit_salah']:,}", file=keluaran)
+    print(f"BER              : {hasil['ber']:.6e}", file=keluaran)
+    if hasil['byte_referensi'] != hasil['byte_diterima']:
+        print(f"⚠️  Panjang berbeda: referensi {hasil['byte_referensi']:,} byte, "
+              f"diterima {hasil['byte_diterima']:,} byte", file=keluaran)
+
+    if tampilkan_histogram:
+        print(f"\nKesalahan per posisi bit (frame {hasil['panjang_frame']} byte):", file=keluaran)
+        for posisi, jumlah in enumerate(hasil['histogram_posisi']):
+            if jumlah:
+                print(f"  bit {posisi:>6}: {jumlah:,}", file=keluaran)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command-line: mengukur BER antara dua payload"""
+    parser = argparse.ArgumentParser(description="Pengukuran bit error rate (BER)")
+    parser.add_argument('referensi', help="File payload referensi")
+    parser.add_argument('diterima', nargs='?', help="File payload diterima")
+    parser.add_argument('--format-referensi', choices=FORMAT_INPUT, default=FORMAT_MENTAH)
+    parser.add_argument('--format-diterima', choices=FORMAT_INPUT, default=FORMAT_MENTAH)
+    parser.add_argument('--kanal', help="Bangkitkan payload diterima dari referensi: "
+                                        "'bsc:p' atau 'ge:p_gb,p_bg[,e_baik,e_buruk]'")
+    parser.add_argument('--seed', type=int, help="Seed simulator kanal")
+    parser.add_argument('--frame', type=int, default=1, help="Panjang frame (byte) untuk histogram")
+    parser.add_argument('--potong', type=int, default=UKURAN_POTONG_DEFAULT,
+                        help="Ukuran potongan (byte)")
+    parser.add_argument('--tanpa-histogram', action='store_true')
+    parser.add_argument('--tanpa-progres', action='store_true',
+                        help="Jangan tampilkan bilah progres di stderr")
+    args = parser.parse_args(argv)
+
+    if (args.diterima is None) == (args.kanal is None):
+        parser.error("Berikan file diterima atau --kanal (salah satu)")
+
+    try:
+        referensi = baca_payload(args.referensi, args.format_referensi, args.potong)
+        if args.kanal:
+            if np is None:
+                parser.error("NumPy diperlukan untuk --kanal (pip install numpy)")
+            diterima = lewat_kanal(baca_payload(args.referensi, args.format_referensi, args.potong),
+                                   buat_kanal(args.kanal), args.seed)
+        else:
+            diterima = baca_payload(args.diterima, args.format_diterima, args.potong)
+
+        # Persentase hanya diketahui untuk file mentah (ukuran file = ukuran payload)
+        total = os.path.getsize(args.referensi) if args.format_referensi == FORMAT_MENTAH else None
+        bilah = None if args.tanpa_progres or not sys.stderr.isatty() else BilahProgresTeks()
+        with tangkap_ctrl_c(TokenPembatalan()) as token:
+            hasil = ukur_ber(referensi, diterima, args.frame, bilah, token, total)
+    except OperasiDibatalkan:
+        if bilah is not None:
+            bilah.akhiri()
+        print("⚠️  Pengukuran dibatalkan", file=sys.stderr)
+        return 130
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+
+    tulis_laporan(hasil, tampilkan_histogram=not args.tanpa_histogram)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
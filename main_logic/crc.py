@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Mesin CRC Berbasis Tabel untuk Deteksi Kesalahan
+================================================
+
+Modul ini menghitung Cyclic Redundancy Check (CRC) untuk mendeteksi
+kesalahan pada data, termasuk nilai yang dirusak oleh simulasi kesalahan.
+
+Fitur:
+- Preset CRC-8, CRC-16/CCITT, CRC-32, dan CRC-32C
+- Polinom, nilai awal, refleksi, dan XOR akhir yang dapat diatur
+- Tabel 256 entri (satu byte per iterasi)
+- Perhitungan inkremental untuk stream dan file
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import zlib
+from typing import BinaryIO, List, NamedTuple, Union
+
+
+class ParameterCRC(NamedTuple):
+    """Parameter CRC (model Rocksoft/Williams)"""
+    nama: str
+    lebar: int
+    polinom: int
+    awal: int
+    refleksi_masuk: bool
+    refleksi_keluar: bool
+    xor_akhir: int
+    cek: int  # CRC dari b"123456789", untuk validasi
+
+
+CRC8 = ParameterCRC('CRC-8', 8, 0x07, 0x00, False, False, 0x00, 0xF4)
+CRC16_CCITT = ParameterCRC('CRC-16/CCITT-FALSE', 16, 0x1021, 0xFFFF, False, False, 0x0000, 0x29B1)
+CRC32 = ParameterCRC('CRC-32', 32, 0x04C11DB7, 0xFFFFFFFF, True, True, 0xFFFFFFFF, 0xCBF43926)
+CRC32C = ParameterCRC('CRC-32C', 32, 0x1EDC6F41, 0xFFFFFFFF, True, True, 0xFFFFFFFF, 0xE3069283)
+
+PRESET_CRC = {p.nama: p for p in (CRC8, CRC16_CCITT, CRC32, CRC32C)}
+
+UKURAN_POTONG_FILE = 1 << 20  # 1 MB per pembacaan
+
+
+def _refleksi(nilai: int, lebar: int) -> int:
+    """Membalik urutan bit sebanyak lebar bit"""
+    hasil = 0
+    for _ in range(lebar):
+        hasil = (hasil << 1) | (nilai & 1)
+        nilai >>= 1
+    return hasil
+
+
+class MesinCRC:
+    """
+    Mesin CRC untuk satu set parameter
+
+    Tabel dihitung sekali di konstruktor. CRC-32 standar memakai implementasi
+    C di zlib yang menghasilkan nilai identik.
+    """
+
+    def __init__(self, parameter: ParameterCRC):
+        """
+        Inisialisasi mesin dan tabel CRC
+
+        Args:
+            parameter (ParameterCRC): Parameter CRC
+
+        Raises:
+            ValueError: Jika lebar CRC tidak didukung
+        """
+        if not 8 <= parameter.lebar <= 64:
+            raise ValueError("Lebar CRC yang didukung adalah 8-64 bit")
+
+        self.parameter = parameter
+        self.mask = (1 << parameter.lebar) - 1
+        self.terefleksi = parameter.refleksi_masuk
+        self.gunakan_zlib = parameter[1:7] == CRC32[1:7]
+        self.tabel = self._buat_tabel()
+
+    def _buat_tabel(self) -> List[int]:
+        """Tabel 256 entri: sisa CRC untuk setiap nilai byte"""
+        lebar = self.parameter.lebar
+        tabel = []
+        if self.terefleksi:
+            polinom = _refleksi(self.parameter.polinom, lebar)
+            for byte in range(256):
+                crc = byte
+                for _ in range(8):
+                    crc = (crc >> 1) ^ polinom if crc & 1 else crc >> 1
+                tabel.append(crc)
+        else:
+            polinom = self.parameter.polinom
+            bit_atas = 1 << (lebar - 1)
+            for byte in range(256):
+                crc = byte << (lebar - 8)
+                for _ in range(8):
+                    crc = ((crc << 1) ^ polinom) if crc & bit_atas else crc << 1
+                tabel.append(crc & self.mask)
+        return tabel
+
+    def awal(self) -> int:
+        """Register CRC awal (sudah direfleksi bila perlu)"""
+        if self.gunakan_zlib:
+            return 0
+        if self.terefleksi:
+            return _refleksi(self.parameter.awal, self.parameter.lebar)
+        return self.parameter.awal
+
+    def perbarui(self, register: int, data: Union[bytes, bytearray, memoryview]) -> int:
+        """
+        Memproses data tambahan ke register CRC
+
+        Args:
+            register (int): Register dari awal() atau perbarui() sebelumnya
+            data (bytes | bytearray | memoryview): Data berikutnya
+
+        Returns:
+            int: Register baru
+        """
+        if self.gunakan_zlib:
+            return zlib.crc32(data, register)
+
+        tabel = self.tabel
+        if self.terefleksi:
+            for byte in data:
+                register = (register >> 8) ^ tabel[(register ^ byte) & 0xFF]
+        else:
+            geser = self.parameter.lebar - 8
+            mask = self.mask
+            for byte in data:
+                register = ((register << 8) & mask) ^ tabel[((register >> geser) ^ byte) & 0xFF]
+        return register
+
+    def selesai(self, register: int) -> int:
+        """
+        Menghasilkan nilai CRC akhir dari register
+
+        Args:
+            register (int): Register setelah semua data diproses
+
+        Returns:
+            int: Nilai CRC
+        """
+        if self.gunakan_zlib:
+            return register
+        if self.terefleksi != self.parameter.refleksi_keluar:
+            register = _refleksi(register, self.parameter.lebar)
+        return (register ^ self.parameter.xor_akhir) & self.mask
+
+    def hitung(self, data: Union[bytes, bytearray, memoryview]) -> int:
+        """
+        Menghitung CRC dari seluruh data sekaligus
+
+        Args:
+            data (bytes | bytearray | memoryview): Data
+
+        Returns:
+            int: Nilai CRC
+        """
+        return self.selesai(self.perbarui(self.awal(), data))
+
+    def penghitung(self) -> 'PenghitungCRC':
+        """Membuat penghitung inkremental untuk stream"""
+        return PenghitungCRC(self)
+
+    def hitung_stream(self, stream: BinaryIO, ukuran_potong: int = UKURAN_POTONG_FILE) -> int:
+        """
+        Menghitung CRC dari stream biner secara bertahap
+
+        Args:
+            stream (BinaryIO): Stream yang dibuka dalam mode biner
+            ukuran_potong (int): Jumlah byte per pembacaan
+
+        Returns:
+            int: Nilai CRC
+        """
+        register = self.awal()
+        penampung = bytearray(ukuran_potong)
+        tampilan = memoryview(penampung)
+        while True:
+            jumlah = stream.readinto(penampung)
+            if not jumlah:
+                break
+            register = self.perbarui(register, tampilan[:jumlah])
+        return self.selesai(register)
+
+    def hitung_file(self, path: str, ukuran_potong: int = UKURAN_POTONG_FILE) -> int:
+        """
+        Menghitung CRC dari file secara bertahap dengan memori terbatas
+
+        Args:
+            path (str): Lokasi file
+            ukuran_potong (int): Jumlah byte per pembacaan
+
+        Returns:
+            int: Nilai CRC
+        """
+        with open(path, 'rb') as berkas:
+            return self.hitung_stream(berkas, ukuran_potong)
+
+
+class PenghitungCRC:
+    """Penghitung CRC inkremental (gaya hashlib: update lalu nilai)"""
+
+    def __init__(self, mesin: MesinCRC):
+        self.mesin = mesin
+        self.register = mesin.awal()
+
+    def update(self, data: Union[bytes, bytearray, memoryview]):
+        """Menambahkan data ke perhitungan"""
+        self.register = self.mesin.perbarui(self.register, data)
+
+    def nilai(self) -> int:
+        """Nilai CRC untuk data yang sudah diproses"""
+        return self.mesin.selesai(self.register)
+
+
+_cache_mesin = {}
+
+
+def mesin_crc(parameter: ParameterCRC = CRC32) -> MesinCRC:
+    """
+    Mengembalikan mesin CRC (ter-cache) untuk parameter tertentu
+
+    Args:
+        parameter (ParameterCRC): Parameter CRC
+
+    Returns:
+        MesinCRC: Mesin dengan tabel yang sudah dihitung
+    """
+    mesin = _cache_mesin.get(parameter)
+    if mesin is None:
+        mesin = _cache_mesin[parameter] = MesinCRC(parameter)
+    return mesin
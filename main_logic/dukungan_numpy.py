@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Dukungan NumPy Opsional
+=======================
+
+NumPy hanya diperlukan untuk mode batch (array besar). Modul lain mengimpor
+`np` dari sini dan memanggil `pastikan_numpy()` di awal fungsi batch,
+sehingga fitur non-batch tetap berjalan tanpa NumPy.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional
+    np = None
+
+
+def pastikan_numpy(fitur: str = "mode batch"):
+    """
+    Memastikan NumPy tersedia
+
+    Args:
+        fitur (str): Nama fitur untuk pesan kesalahan
+
+    Raises:
+        ImportError: Jika NumPy tidak terinstall
+    """
+    if np is None:
+        raise ImportError(f"NumPy diperlukan untuk {fitur} (pip install numpy)")
@@ -0,0 +1,463 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fuzzing Diferensial Mesin Konversi
+==================================
+
+Membangkitkan numeral acak (valid dan tidak valid) untuk setiap sistem
+bilangan dan kelas ukuran, lalu membandingkan konversi,
+tampilkan_tabel_konversi, dan operasi_aritmatika milik
+KonverterSistemBilangan dengan dua pembanding:
+
+- Oracle Python: int()/format() dengan alfabet ASCII yang eksplisit
+  (int() sendiri menerima '_' dan digit Unicode, jadi validitas diperiksa
+  terpisah)
+- simple_number_simulator.py: implementasi referensi sederhana; hasilnya
+  harus identik termasuk pesan error
+
+Numeral kelas 'raksasa' lebih panjang dari batas konversi int/str CPython
+(sys.get_int_max_str_digits(), default 4300 digit desimal). Batas itu
+dinonaktifkan selama kasus diperiksa agar konversi desimal raksasa
+benar-benar diuji, bukan hanya jalur error-nya.
+
+Pekerjaan dibagi ke shard yang dijalankan di process pool. Setiap kasus
+dibangkitkan dari seed kasus 64-bit sendiri sehingga kegagalan dapat
+diulang persis dengan --ulang <seed_kasus>.
+
+Penggunaan:
+    python fuzz_diferensial.py --kasus 1000000 --proses 8 --seed 1
+    python fuzz_diferensial.py --ulang 1234567890123456789
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import argparse
+import os
+import random
+import signal
+import sys
+import time
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    from .number_system_simulator import KonverterSistemBilangan, SistemBilangan, DESKRIPTOR_SISTEM
+    from . import simple_number_simulator as sederhana
+    from .progres import (PelacakProgres, TokenPembatalan, OperasiDibatalkan,
+                          BilahProgresTeks, tangkap_ctrl_c)
+except ImportError:
+    from number_system_simulator import KonverterSistemBilangan, SistemBilangan, DESKRIPTOR_SISTEM
+    import simple_number_simulator as sederhana
+    from progres import (PelacakProgres, TokenPembatalan, OperasiDibatalkan,
+                         BilahProgresTeks, tangkap_ctrl_c)
+
+JENIS_UJI = ('konversi', 'tabel', 'aritmatika')
+
+# Kelas ukuran: (nama, panjang minimum, panjang maksimum, bobot)
+KELAS_UKURAN = (
+    ('kecil', 1, 8, 50),
+    ('sedang', 9, 64, 30),
+    ('besar', 65, 512, 15),
+    ('raksasa', 513, 5000, 5),
+)
+
+OPERASI = ('+', '-', '*', '/', '%', '**')
+
+# Karakter sisipan untuk numeral tidak valid (termasuk yang diterima int())
+KARAKTER_ASING = '_-+.,xXoObBgGzZ# \t' + '١²Ⅷ߁ß１ﬀ'
+
+_KODE_FORMAT = {2: 'b', 8: 'o', 10: 'd', 16: 'X'}
+_DIGIT = '0123456789ABCDEF'
+_BASIS = {sistem: DESKRIPTOR_SISTEM[sistem]['base'] for sistem in SistemBilangan}
+_DIGIT_VALID = {
+    basis: frozenset(_DIGIT[:basis] + _DIGIT[:basis].lower()) for basis in _BASIS.values()
+}
+_SISTEM_SEDERHANA = {sistem: sederhana.SistemBilangan(sistem.value) for sistem in SistemBilangan}
+_DAFTAR_SISTEM = list(SistemBilangan)
+_BOBOT_KELAS = [kelas[3] for kelas in KELAS_UKURAN]
+
+# Batas kegagalan yang dilaporkan per shard
+MAKS_KEGAGALAN_SHARD = 20
+
+
+def _numeral(rng: random.Random, basis: int, valid: bool, kelas: Optional[str] = None) -> str:
+    """Membangkitkan numeral acak untuk basis tertentu"""
+    if kelas is None:
+        _, minimum, maksimum, _ = rng.choices(KELAS_UKURAN, _BOBOT_KELAS)[0]
+    else:
+        _, minimum, maksimum, _ = next(k for k in KELAS_UKURAN if k[0] == kelas)
+    panjang = rng.randint(minimum, maksimum)
+    nilai = ''.join(rng.choices(_DIGIT[:basis], k=panjang))
+    if basis == 16 and rng.random() < 0.3:
+        nilai = ''.join(c.lower() if rng.random() < 0.5 else c for c in nilai)
+    if rng.random() < 0.05:
+        nilai = rng.choice((' ', '\t', '\n')) + nilai + rng.choice(('', ' ', '\r\n'))
+
+    if valid:
+        return nilai
+
+    mutasi = rng.randrange(5)
+    if mutasi == 0:
+        return rng.choice(('', ' ', '\n'))
+    if mutasi == 1 and basis < 16:
+        # Digit tepat di luar basis
+        posisi = rng.randrange(len(nilai))
+        return nilai[:posisi] + _DIGIT[basis] + nilai[posisi + 1:]
+    if mutasi == 2:
+        return rng.choice(('0x', '0b', '0o', '-', '+')) + nilai
+    posisi = rng.randrange(len(nilai) + 1)
+    return nilai[:posisi] + rng.choice(KARAKTER_ASING) + nilai[posisi:]
+
+
+def _oracle_ke_int(nilai: str, basis: int) -> int:
+    """Oracle: alfabet ASCII eksplisit, lalu int()"""
+    teks = nilai.strip()
+    digit_valid = _DIGIT_VALID[basis]
+    if not teks or any(c not in digit_valid for c in teks):
+        raise ValueError("numeral tidak valid")
+    return int(teks, basis)
+
+
+def _oracle_format(nilai: int, basis: int) -> str:
+    """Oracle: format() dengan huruf kapital untuk heksadesimal"""
+    return format(nilai, _KODE_FORMAT[basis])
+
+
+def _oracle_operasi(a: int, b: int, operasi: str) -> int:
+    if operasi == '+':
+        return a + b
+    if operasi == '-':
+        return a - b
+    if operasi == '*':
+        return a * b
+    if operasi in ('/', '%'):
+        if b == 0:
+            raise ValueError("pembagi nol")
+        return a // b if operasi == '/' else a % b
+    if b > 20:
+        raise ValueError("eksponen terlalu besar")
+    return a ** b
+
+
+def _hasil_atau_error(fungsi, *argumen) -> Tuple[str, object]:
+    """('ok', hasil) atau ('error', pesan) untuk ValueError"""
+    try:
+        return 'ok', fungsi(*argumen)
+    except ValueError as e:
+        return 'error', str(e)
+
+
+def bangkitkan_kasus(seed_kasus: int) -> Dict:
+    """
+    Membangkitkan satu kasus uji secara deterministik dari seed kasus
+
+    Args:
+        seed_kasus (int): Seed 64-bit
+
+    Returns:
+        Dict: 'seed_kasus', 'jenis', dan masukan kasus
+    """
+    rng = random.Random(seed_kasus)
+    jenis = JENIS_UJI[seed_kasus % len(JENIS_UJI)]
+    kasus = {'seed_kasus': seed_kasus, 'jenis': jenis}
+
+    sistem_asal = rng.choice(_DAFTAR_SISTEM)
+    basis = _BASIS[sistem_asal]
+    kasus['sistem_asal'] = sistem_asal
+    if jenis == 'aritmatika':
+        operasi = rng.choice(OPERASI)
+        # Eksponen dan basis pangkat dibatasi ukurannya agar hasil tidak meledak
+        kelas = 'kecil' if operasi == '**' else None
+        kasus['operasi'] = operasi
+        kasus['nilai1'] = _numeral(rng, basis, rng.random() < 0.9, kelas)
+        kasus['nilai2'] = _numeral(rng, basis, rng.random() < 0.9, kelas)
+    else:
+        kasus['nilai'] = _numeral(rng, basis, rng.random() < 0.8)
+        if jenis == 'konversi':
+            kasus['sistem_tujuan'] = rng.choice(_DAFTAR_SISTEM)
+    return kasus
+
+
+def _cek_konversi(kasus: Dict, konverter, pembanding) -> Optional[Tuple]:
+    nilai, asal, tujuan = kasus['nilai'], kasus['sistem_asal'], kasus['sistem_tujuan']
+    aktual = _hasil_atau_error(konverter.konversi, nilai, asal, tujuan)
+
+    try:
+        diharapkan = ('ok', _oracle_format(_oracle_ke_int(nilai, _BASIS[asal]), _BASIS[tujuan]))
+    except ValueError:
+        diharapkan = ('error', None)
+    if aktual[0] != diharapkan[0] or (aktual[0] == 'ok' and aktual[1] != diharapkan[1]):
+        return 'oracle', diharapkan, aktual
+
+    sederhana_hasil = _hasil_atau_error(pembanding.konversi, nilai, _SISTEM_SEDERHANA[asal],
+                                        _SISTEM_SEDERHANA[tujuan])
+    if aktual != sederhana_hasil:
+        return 'sederhana', sederhana_hasil, aktual
+    return None
+
+
+def _cek_tabel(kasus: Dict, konverter, pembanding) -> Optional[Tuple]:
+    nilai, asal = kasus['nilai'], kasus['sistem_asal']
+    aktual = konverter.tampilkan_tabel_konversi(nilai, asal)
+
+    try:
+        desimal = _oracle_ke_int(nilai, _BASIS[asal])
+        diharapkan = {
+            sistem.value: nilai if sistem == asal else _oracle_format(desimal, _BASIS[sistem])
+            for sistem in SistemBilangan
+        }
+        cocok = aktual == diharapkan
+    except ValueError:
+        diharapkan = {'error': '<apa pun>'}
+        cocok = 'error' in aktual
+    if not cocok:
+        return 'oracle', diharapkan, aktual
+
+    sederhana_hasil = pembanding.tampilkan_tabel_konversi(nilai, _SISTEM_SEDERHANA[asal])
+    if aktual != sederhana_hasil:
+        return 'sederhana', sederhana_hasil, aktual
+    return None
+
+
+def _cek_aritmatika(kasus: Dict, konverter, pembanding) -> Optional[Tuple]:
+    nilai1, nilai2, operasi, sistem = (kasus['nilai1'], kasus['nilai2'], kasus['operasi'],
+                                       kasus['sistem_asal'])
+    basis = _BASIS[sistem]
+    aktual = konverter.operasi_aritmatika(nilai1, nilai2, operasi, sistem)
+
+    try:
+        hasil = _oracle_operasi(_oracle_ke_int(nilai1, basis), _oracle_ke_int(nilai2, basis),
+                                operasi)
+        if hasil < 0:
+            raise ValueError("hasil negatif")
+        diharapkan = {'berhasil': True, 'hasil_desimal': hasil,
+                      'hasil_sistem': _oracle_format(hasil, basis)}
+    except ValueError:
+        diharapkan = {'berhasil': False}
+    if any(aktual.get(kunci) != nilai for kunci, nilai in diharapkan.items()):
+        return 'oracle', diharapkan, aktual
+
+    sederhana_hasil = pembanding.operasi_aritmatika(nilai1, nilai2, operasi,
+                                                    _SISTEM_SEDERHANA[sistem])
+    if aktual != sederhana_hasil:
+        return 'sederhana', sederhana_hasil, aktual
+    return None
+
+
+_PEMERIKSA = {'konversi': _cek_konversi, 'tabel': _cek_tabel, 'aritmatika': _cek_aritmatika}
+
+
+@contextmanager
+def _tanpa_batas_digit():
+    """Menonaktifkan batas digit konversi int/str (Python 3.11+) selama blok berjalan"""
+    if not hasattr(sys, 'set_int_max_str_digits'):
+        yield
+        return
+    batas = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(0)
+    try:
+        yield
+    finally:
+        sys.set_int_max_str_digits(batas)
+
+
+def periksa_kasus(kasus: Dict, konverter=None, pembanding=None) -> Optional[Dict]:
+    """
+    Menjalankan satu kasus dan membandingkan dengan oracle dan simulator sederhana
+
+    Returns:
+        Dict | None: Detail kegagalan ('pembanding', 'diharapkan', 'aktual'),
+            atau None jika cocok
+    """
+    if konverter is None:
+        konverter = KonverterSistemBilangan()
+    if pembanding is None:
+        pembanding = sederhana.KonverterSistemBilangan()
+    try:
+        with _tanpa_batas_digit():
+            selisih = _PEMERIKSA[kasus['jenis']](kasus, konverter, pembanding)
+    except Exception as e:
+        # Selain ValueError dianggap crash
+        selisih = 'exception', None, f"{type(e).__name__}: {e}"
+    finally:
+        # Riwayat tidak relevan untuk fuzzing dan akan tumbuh tanpa batas
+        konverter.riwayat_konversi.clear()
+        pembanding.riwayat_konversi.clear()
+    if selisih is None:
+        return None
+    sumber, diharapkan, aktual = selisih
+    kegagalan = dict(kasus)
+    kegagalan['sistem_asal'] = kasus['sistem_asal'].value
+    if 'sistem_tujuan' in kasus:
+        kegagalan['sistem_tujuan'] = kasus['sistem_tujuan'].value
+    kegagalan.update({'pembanding': sumber, 'diharapkan': diharapkan, 'aktual': aktual})
+    return kegagalan
+
+
+def seed_kasus_shard(seed: int, indeks_shard: int, jumlah: int) -> Iterator[int]:
+    """Seed kasus untuk satu shard (deterministik dari seed run dan indeks shard)"""
+    rng = random.Random(f"{seed}/{indeks_shard}")
+    for _ in range(jumlah):
+        yield rng.getrandbits(64)
+
+
+def jalankan_shard(seed: int, indeks_shard: int, jumlah: int,
+                   jenis: Sequence[str] = JENIS_UJI) -> Tuple[int, List[Dict]]:
+    """
+    Menjalankan satu shard kasus (fungsi pekerja process pool)
+
+    Returns:
+        Tuple[int, List[Dict]]: (jumlah kasus dijalankan, kegagalan pertama)
+    """
+    konverter = KonverterSistemBilangan()
+    pembanding = sederhana.KonverterSistemBilangan()
+    dijalankan = 0
+    kegagalan = []
+    for seed_kasus in seed_kasus_shard(seed, indeks_shard, jumlah):
+        if JENIS_UJI[seed_kasus % len(JENIS_UJI)] not in jenis:
+            continue
+        dijalankan += 1
+        hasil = periksa_kasus(bangkitkan_kasus(seed_kasus), konverter, pembanding)
+        if hasil is not None and len(kegagalan) < MAKS_KEGAGALAN_SHARD:
+            kegagalan.append(hasil)
+    return dijalankan, kegagalan
+
+
+def _abaikan_sigint():
+    """Initializer pekerja: Ctrl-C ditangani proses utama lewat token pembatalan"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def jalankan_fuzz(jumlah_kasus: int, seed: int = 0, proses: Optional[int] = None,
+                  ukuran_shard: int = 5000, jenis: Sequence[str] = JENIS_UJI,
+                  progres=None, token: Optional[TokenPembatalan] = None) -> Dict:
+    """
+    Menjalankan fuzzing diferensial di process pool
+
+    Args:
+        jumlah_kasus (int): Jumlah seed kasus yang dibangkitkan
+        seed (int): Seed run
+        proses (int, optional): Jumlah proses (default os.cpu_count()); 1 = tanpa pool
+        ukuran_shard (int): Kasus per shard
+        jenis (Sequence[str]): Jenis uji yang dijalankan
+        progres (callable, optional): Callback PeristiwaProgres, dalam seed kasus
+            (dilaporkan per shard selesai)
+        token (TokenPembatalan, optional): Token pembatalan; shard yang belum
+            mulai dibatalkan dan OperasiDibatalkan dilempar
+
+    Returns:
+        Dict: 'kasus', 'kegagalan', 'waktu', dan 'kasus_per_detik'
+    """
+    if jumlah_kasus <= 0 or ukuran_shard <= 0:
+        raise ValueError("Jumlah kasus dan ukuran shard harus positif")
+    tidak_dikenal = set(jenis) - set(JENIS_UJI)
+    if tidak_dikenal:
+        raise ValueError(f"Jenis uji tidak dikenal: {', '.join(sorted(tidak_dikenal))}")
+
+    jumlah_shard = -(-jumlah_kasus // ukuran_shard)
+    argumen = [
+        (seed, indeks, min(ukuran_shard, jumlah_kasus - indeks * ukuran_shard), tuple(jenis))
+        for indeks in range(jumlah_shard)
+    ]
+
+    pelacak = PelacakProgres('fuzz', jumlah_kasus, progres, token)
+    mulai = time.perf_counter()
+    if proses == 1:
+        hasil_shard = []
+        for arg in argumen:
+            hasil_shard.append(jalankan_shard(*arg))
+            pelacak.maju(arg[2])
+    else:
+        hasil_shard = [None] * jumlah_shard
+        with ProcessPoolExecutor(max_workers=proses, initializer=_abaikan_sigint) as pool:
+            tertunda = {pool.submit(jalankan_shard, *arg): i for i, arg in enumerate(argumen)}
+            try:
+                while tertunda:
+                    # Timeout pendek agar token tetap diperiksa saat shard berjalan lama
+                    selesai, _ = wait(tertunda, timeout=0.2, return_when=FIRST_COMPLETED)
+                    for future in selesai:
+                        indeks = tertunda.pop(future)
+                        hasil_shard[indeks] = future.result()
+                        pelacak.maju(argumen[indeks][2])
+                    if not selesai and token is not None:
+                        token.periksa()
+            except BaseException:
+                pool.shutdown(wait=True, cancel_futures=True)
+                raise
+    pelacak.tuntas()
+    waktu = time.perf_counter() - mulai
+
+    dijalankan = sum(jumlah for jumlah, _ in hasil_shard)
+    return {
+        'kasus': dijalankan,
+        'kegagalan': [gagal for _, daftar in hasil_shard for gagal in daftar],
+        'waktu': waktu,
+        'kasus_per_detik': dijalankan / waktu if waktu > 0 else float('inf')
+    }
+
+
+def _ringkas(nilai, batas: int = 120) -> str:
+    teks = repr(nilai)
+    return teks if len(teks) <= batas else teks[:batas] + f'... ({len(teks)} karakter)'
+
+
+def _cetak_kegagalan(kegagalan: Dict):
+    print(f"❌ {kegagalan['jenis']} (seed_kasus={kegagalan['seed_kasus']}, "
+          f"pembanding={kegagalan['pembanding']})")
+    for kunci in ('sistem_asal', 'sistem_tujuan', 'operasi', 'nilai', 'nilai1', 'nilai2',
+                  'diharapkan', 'aktual'):
+        if kunci in kegagalan:
+            print(f"   {kunci}: {_ringkas(kegagalan[kunci])}")
+    print(f"   Ulangi: python fuzz_diferensial.py --ulang {kegagalan['seed_kasus']}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Fuzzing diferensial mesin konversi")
+    parser.add_argument('--kasus', type=int, default=100000, help="Jumlah kasus (default: 100000)")
+    parser.add_argument('--seed', type=int, default=None, help="Seed run (default: acak)")
+    parser.add_argument('--proses', type=int, default=None,
+                        help="Jumlah proses (default: jumlah CPU)")
+    parser.add_argument('--ukuran-shard', type=int, default=5000, help="Kasus per shard")
+    parser.add_argument('--jenis', nargs='+', choices=JENIS_UJI, default=list(JENIS_UJI),
+                        help="Jenis uji yang dijalankan")
+    parser.add_argument('--ulang', type=int, metavar='SEED_KASUS',
+                        help="Ulangi satu kasus dari seed kasus yang dilaporkan")
+    parser.add_argument('--tanpa-progres', action='store_true',
+                        help="Jangan tampilkan bilah progres di stderr")
+    args = parser.parse_args(argv)
+
+    if args.ulang is not None:
+        kegagalan = periksa_kasus(bangkitkan_kasus(args.ulang))
+        if kegagalan is None:
+            print(f"✅ Kasus {args.ulang} cocok")
+            return 0
+        _cetak_kegagalan(kegagalan)
+        return 1
+
+    seed = args.seed if args.seed is not None else random.getrandbits(32)
+    print(f"Fuzzing {args.kasus} kasus, seed={seed}, proses={args.proses or os.cpu_count()}")
+    bilah = None if args.tanpa_progres or not sys.stderr.isatty() else BilahProgresTeks()
+    try:
+        with tangkap_ctrl_c(TokenPembatalan()) as token:
+            hasil = jalankan_fuzz(args.kasus, seed, args.proses, args.ukuran_shard, args.jenis,
+                                  bilah, token)
+    except OperasiDibatalkan:
+        if bilah is not None:
+            bilah.akhiri()
+        print(f"⚠️  Fuzzing dibatalkan (seed={seed})", file=sys.stderr)
+        return 130
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    for kegagalan in hasil['kegagalan']:
+        _cetak_kegagalan(kegagalan)
+    print(f"{hasil['kasus']} kasus dalam {hasil['waktu']:.1f} s "
+          f"({hasil['kasus_per_detik']:.0f} kasus/s), {len(hasil['kegagalan'])} kegagalan")
+    return 1 if hasil['kegagalan'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
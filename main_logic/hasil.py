@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tipe Hasil Berslot
+==================
+
+Objek hasil dengan __slots__ untuk riwayat konversi, operasi aritmatika,
+deteksi kesalahan, dan tabel konversi. Dibanding dict per hasil, objek
+berslot tidak membawa tabel hash per instance sehingga lebih hemat memori
+dan alokasi pada mode batch.
+
+Untuk kompatibilitas, objek dapat dibaca seperti dict (hasil['kunci'],
+hasil.get('kunci'), 'kunci' in hasil) dan diubah dengan to_dict(). Field
+bernilai None dianggap tidak ada, sama seperti kunci opsional pada dict
+lama (misal 'error' hanya ada jika operasi gagal).
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class HasilBerslot:
+    """Kelas dasar: akses gaya dict di atas __slots__"""
+
+    __slots__ = ()
+
+    def __init__(self, **nilai):
+        for nama in self.__slots__:
+            setattr(self, nama, nilai.pop(nama, None))
+        if nilai:
+            raise TypeError(f"Field tidak dikenal untuk {type(self).__name__}: {', '.join(nilai)}")
+
+    def keys(self) -> Iterator[str]:
+        """Nama field yang bernilai (bukan None)"""
+        return (nama for nama in self.__slots__ if getattr(self, nama) is not None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Mengubah hasil menjadi dict dengan kunci yang sama seperti API lama"""
+        return {nama: getattr(self, nama) for nama in self.keys()}
+
+    def __getitem__(self, kunci: str) -> Any:
+        nilai = getattr(self, kunci, None) if kunci in self.__slots__ else None
+        if nilai is None:
+            raise KeyError(kunci)
+        return nilai
+
+    def get(self, kunci: str, default: Any = None) -> Any:
+        try:
+            return self[kunci]
+        except KeyError:
+            return default
+
+    def __contains__(self, kunci: str) -> bool:
+        return kunci in self.__slots__ and getattr(self, kunci) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return self.keys()
+
+    def __eq__(self, lain) -> bool:
+        if isinstance(lain, HasilBerslot):
+            return type(self) is type(lain) and self.to_dict() == lain.to_dict()
+        if isinstance(lain, dict):
+            return self.to_dict() == lain
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        isi = ', '.join(f"{nama}={getattr(self, nama)!r}" for nama in self.keys())
+        return f"{type(self).__name__}({isi})"
+
+
+class EntriRiwayat(HasilBerslot):
+    """Satu entri riwayat konversi"""
+
+    __slots__ = ('nilai_asal', 'sistem_asal', 'sistem_tujuan', 'hasil', 'nilai_desimal')
+
+    def __init__(self, nilai_asal: str, sistem_asal: str, sistem_tujuan: str,
+                 hasil: str, nilai_desimal: int):
+        self.nilai_asal = nilai_asal
+        self.sistem_asal = sistem_asal
+        self.sistem_tujuan = sistem_tujuan
+        self.hasil = hasil
+        self.nilai_desimal = nilai_desimal
+
+
+class HasilOperasi(HasilBerslot):
+    """
+    Hasil operasi_aritmatika
+
+    'waktu_habis' True jika dihentikan batas waktu, 'dibatalkan' True jika
+    dihentikan token pembatalan.
+    """
+
+    __slots__ = ('berhasil', 'hasil_desimal', 'hasil_sistem', 'error', 'operasi', 'sistem',
+                 'representasi', 'waktu_habis', 'dibatalkan')
+
+
+class HasilKonversi(HasilBerslot):
+    """Hasil konversi berbatas waktu (lihat batas_waktu.PelaksanaBatasWaktu)"""
+
+    __slots__ = ('berhasil', 'hasil', 'nilai_desimal', 'error', 'waktu_habis', 'dibatalkan')
+
+
+class HasilDeteksi(HasilBerslot):
+    """Hasil deteksi_kesalahan_konversi"""
+
+    __slots__ = ('ada_kesalahan', 'hasil_benar', 'hasil_input', 'jenis_kesalahan',
+                 'tingkat_kepercayaan')
+
+    def __init__(self, ada_kesalahan: bool, hasil_benar: str, hasil_input: str,
+                 jenis_kesalahan: Optional[List[str]] = None, tingkat_kepercayaan: float = 0.0):
+        self.ada_kesalahan = ada_kesalahan
+        self.hasil_benar = hasil_benar
+        self.hasil_input = hasil_input
+        self.jenis_kesalahan = jenis_kesalahan if jenis_kesalahan is not None else []
+        self.tingkat_kepercayaan = tingkat_kepercayaan
+
+
+class BarisTabel(HasilBerslot):
+    """
+    Satu baris tabel konversi (hasil tampilkan_tabel_konversi)
+
+    Field sistem memakai nama SistemBilangan.value; 'error' diisi jika
+    konversi gagal di tengah jalan.
+    """
+
+    __slots__ = ('biner', 'desimal', 'heksadesimal', 'oktal', 'error')
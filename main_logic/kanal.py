@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Simulator Kanal dengan Kesalahan Burst
+======================================
+
+simulasi_bit_flip membalik tepat satu bit acak. Kanal nyata menghasilkan
+kesalahan yang berkorelasi (burst). Modul ini menyediakan dua model kanal
+yang tervektorisasi dengan NumPy untuk array bit besar:
+
+- BSC (Binary Symmetric Channel): setiap bit dibalik secara independen
+  dengan probabilitas p
+- Gilbert–Elliott: rantai Markov dua keadaan (baik/buruk) dengan
+  probabilitas kesalahan berbeda di setiap keadaan, menghasilkan burst
+
+Array bit berupa uint8 berisi 0/1 (satu bit per elemen).
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+from typing import Dict, Union
+
+try:
+    from .dukungan_numpy import np, pastikan_numpy
+except ImportError:
+    from dukungan_numpy import np, pastikan_numpy
+
+
+def _rng(seed):
+    """Generator acak NumPy dari seed, atau generator itu sendiri"""
+    pastikan_numpy("simulasi kanal")
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(seed)
+
+
+def _cek_probabilitas(**probabilitas):
+    """Memastikan semua probabilitas berada di [0, 1]"""
+    for nama, nilai in probabilitas.items():
+        if not 0.0 <= nilai <= 1.0:
+            raise ValueError(f"Probabilitas {nama} harus antara 0 dan 1")
+
+
+class Kanal:
+    """Kelas dasar kanal: subclass mengimplementasikan pola_kesalahan()"""
+
+    nama = "kanal"
+
+    def pola_kesalahan(self, jumlah_bit: int, seed=None):
+        """
+        Membuat pola kesalahan (1 = bit dibalik)
+
+        Args:
+            jumlah_bit (int): Panjang pola
+            seed (int | np.random.Generator, optional): Seed atau generator acak
+
+        Returns:
+            np.ndarray: Pola kesalahan uint8
+        """
+        raise NotImplementedError
+
+    def kirim(self, bit, seed=None):
+        """
+        Mengirim array bit melalui kanal
+
+        Args:
+            bit (np.ndarray): Array bit uint8 (0/1)
+            seed (int | np.random.Generator, optional): Seed atau generator acak
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (bit diterima, pola kesalahan)
+        """
+        bit = np.asarray(bit, dtype=np.uint8)
+        pola = self.pola_kesalahan(bit.size, seed).reshape(bit.shape)
+        return bit ^ pola, pola
+
+    def kirim_bytes(self, payload: Union[bytes, bytearray, memoryview], seed=None) -> bytes:
+        """
+        Mengirim payload bytes melalui kanal (bit MSB dulu)
+
+        Args:
+            payload (bytes | bytearray | memoryview): Payload
+            seed (int | np.random.Generator, optional): Seed atau generator acak
+
+        Returns:
+            bytes: Payload diterima
+        """
+        pastikan_numpy("simulasi kanal")
+        bit = np.unpackbits(np.frombuffer(payload, dtype=np.uint8))
+        diterima, _ = self.kirim(bit, seed)
+        return np.packbits(diterima).tobytes()
+
+
+class KanalBSC(Kanal):
+    """Binary Symmetric Channel: kesalahan independen dengan probabilitas p"""
+
+    def __init__(self, probabilitas: float):
+        """
+        Args:
+            probabilitas (float): Probabilitas bit dibalik
+        """
+        _cek_probabilitas(probabilitas=probabilitas)
+        self.probabilitas = probabilitas
+        self.nama = f"BSC(p={probabilitas})"
+
+    def pola_kesalahan(self, jumlah_bit: int, seed=None):
+        rng = _rng(seed)
+        return (rng.random(jumlah_bit) < self.probabilitas).astype(np.uint8)
+
+
+class KanalGilbertElliott(Kanal):
+    """
+    Kanal Gilbert–Elliott dua keadaan
+
+    Lama tinggal di setiap keadaan berdistribusi geometrik, sehingga urutan
+    keadaan dibuat per run (bukan per bit) lalu diperluas dengan np.repeat.
+    """
+
+    def __init__(self, p_baik_ke_buruk: float, p_buruk_ke_baik: float,
+                 kesalahan_baik: float = 0.0, kesalahan_buruk: float = 0.5):
+        """
+        Args:
+            p_baik_ke_buruk (float): Probabilitas transisi baik → buruk per bit
+            p_buruk_ke_baik (float): Probabilitas transisi buruk → baik per bit
+            kesalahan_baik (float): Probabilitas kesalahan di keadaan baik
+            kesalahan_buruk (float): Probabilitas kesalahan di keadaan buruk
+        """
+        _cek_probabilitas(p_baik_ke_buruk=p_baik_ke_buruk, p_buruk_ke_baik=p_buruk_ke_baik,
+                          kesalahan_baik=kesalahan_baik, kesalahan_buruk=kesalahan_buruk)
+        if p_baik_ke_buruk == 0 or p_buruk_ke_baik == 0:
+            raise ValueError("Probabilitas transisi harus lebih dari 0")
+
+        self.p_baik_ke_buruk = p_baik_ke_buruk
+        self.p_buruk_ke_baik = p_buruk_ke_baik
+        self.kesalahan_baik = kesalahan_baik
+        self.kesalahan_buruk = kesalahan_buruk
+        self.nama = (f"Gilbert-Elliott(p_gb={p_baik_ke_buruk}, p_bg={p_buruk_ke_baik}, "
+                     f"e_g={kesalahan_baik}, e_b={kesalahan_buruk})")
+
+    def proporsi_buruk(self) -> float:
+        """Proporsi waktu stasioner di keadaan buruk"""
+        return self.p_baik_ke_buruk / (self.p_baik_ke_buruk + self.p_buruk_ke_baik)
+
+    def ber_teoretis(self) -> float:
+        """BER jangka panjang yang diharapkan"""
+        buruk = self.proporsi_buruk()
+        return (1 - buruk) * self.kesalahan_baik + buruk * self.kesalahan_buruk
+
+    def keadaan(self, jumlah_bit: int, seed=None):
+        """
+        Membuat urutan keadaan (1 = buruk) sepanjang jumlah_bit
+
+        Keadaan awal diambil dari distribusi stasioner.
+        """
+        rng = _rng(seed)
+        mulai_buruk = rng.random() < self.proporsi_buruk()
+        keadaan = np.empty(jumlah_bit, dtype=np.uint8)
+        terisi = 0
+        buruk = mulai_buruk
+        while terisi < jumlah_bit:
+            # Perkiraan jumlah pasangan run yang dibutuhkan untuk sisa bit
+            rata_pasangan = 1 / self.p_baik_ke_buruk + 1 / self.p_buruk_ke_baik
+            jumlah_pasangan = int((jumlah_bit - terisi) / rata_pasangan) + 16
+            run_baik = rng.geometric(self.p_baik_ke_buruk, jumlah_pasangan)
+            run_buruk = rng.geometric(self.p_buruk_ke_baik, jumlah_pasangan)
+            if buruk:
+                panjang = np.column_stack([run_buruk, run_baik]).ravel()
+                nilai = np.tile(np.array([1, 0], dtype=np.uint8), jumlah_pasangan)
+            else:
+                panjang = np.column_stack([run_baik, run_buruk]).ravel()
+                nilai = np.tile(np.array([0, 1], dtype=np.uint8), jumlah_pasangan)
+            potong = np.repeat(nilai, panjang)[:jumlah_bit - terisi]
+            keadaan[terisi:terisi + potong.size] = potong
+            terisi += potong.size
+        return keadaan
+
+    def pola_kesalahan(self, jumlah_bit: int, seed=None):
+        rng = _rng(seed)
+        keadaan = self.keadaan(jumlah_bit, rng)
+        probabilitas = np.where(keadaan == 1, self.kesalahan_buruk, self.kesalahan_baik)
+        return (rng.random(jumlah_bit) < probabilitas).astype(np.uint8)
+
+
+def statistik_kesalahan(pola) -> Dict:
+    """
+    Menghitung BER dan distribusi panjang burst dari pola kesalahan
+
+    Burst adalah run bit salah yang berurutan.
+
+    Args:
+        pola (np.ndarray): Pola kesalahan (1 = bit salah)
+
+    Returns:
+        Dict: 'jumlah_bit', 'jumlah_kesalahan', 'ber', 'jumlah_burst',
+            'panjang_burst_rata_rata', 'panjang_burst_maksimum', dan
+            'distribusi_burst' ({panjang: jumlah burst})
+    """
+    pastikan_numpy("statistik kesalahan")
+    pola = np.asarray(pola, dtype=np.uint8).ravel()
+    jumlah_bit = pola.size
+    jumlah_kesalahan = int(np.count_nonzero(pola))
+
+    # Batas run: transisi 0→1 (mulai) dan 1→0 (selesai)
+    tepi = np.diff(np.concatenate([[0], pola.astype(np.int8), [0]]))
+    mulai = np.flatnonzero(tepi == 1)
+    selesai = np.flatnonzero(tepi == -1)
+    panjang = selesai - mulai
+
+    distribusi = {}
+    if panjang.size:
+        nilai, jumlah = np.unique(panjang, return_counts=True)
+        distribusi = dict(zip(map(int, nilai), map(int, jumlah)))
+
+    return {
+        'jumlah_bit': jumlah_bit,
+        'jumlah_kesalahan': jumlah_kesalahan,
+        'ber': jumlah_kesalahan / jumlah_bit if jumlah_bit else 0.0,
+        'jumlah_burst': int(panjang.size),
+        'panjang_burst_rata_rata': float(panjang.mean()) if panjang.size else 0.0,
+        'panjang_burst_maksimum': int(panjang.max()) if panjang.size else 0,
+        'distribusi_burst': distribusi
+    }
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Konversi Berbasis Buffer (bytes/bytearray/memoryview)
+=====================================================
+
+Modul ini menyediakan entry point konversi yang menerima data mentah dari
+socket atau file (bytes, bytearray, memoryview) tanpa decode ke str,
+upper-case, dan encode ulang.
+
+Fitur:
+- Validasi dan parsing numeral ASCII langsung dari buffer
+- Penulisan hasil ke buffer milik pemanggil (bytearray/memoryview)
+- Heksadesimal ↔ bytes lewat binascii
+- Payload biner ↔ int lewat int.from_bytes/int.to_bytes
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import binascii
+import weakref
+from typing import Optional, Union
+
+try:
+    from .mesin_basis import MesinBasis, ALFABET_STANDAR
+except ImportError:
+    from mesin_basis import MesinBasis, ALFABET_STANDAR
+
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+_SPASI = b' \t\r\n\x0b\x0c'
+
+
+class _TabelBuffer:
+    """Tabel byte untuk satu mesin: byte digit valid dan translasi ke alfabet standar"""
+
+    def __init__(self, mesin: MesinBasis):
+        valid = set()
+        ke_standar = bytearray(range(256))
+        standar = ALFABET_STANDAR[:mesin.basis]
+        for karakter, nilai in mesin.nilai_digit.items():
+            varian = {karakter, karakter.lower()} if mesin.abaikan_kapital else {karakter}
+            for c in varian:
+                if ord(c) < 128:
+                    valid.add(ord(c))
+                    ke_standar[ord(c)] = ord(standar[nilai])
+
+        self.digit_valid = bytes(sorted(valid))
+        self.ke_standar = None if mesin.standar else bytes(ke_standar)
+        self.dari_standar = bytes.maketrans(standar.encode('ascii'), mesin.digit.encode('ascii'))
+
+
+_cache_tabel: "weakref.WeakKeyDictionary[MesinBasis, _TabelBuffer]" = weakref.WeakKeyDictionary()
+
+
+def _tabel(mesin: MesinBasis) -> _TabelBuffer:
+    """Tabel byte (ter-cache per mesin)"""
+    tabel = _cache_tabel.get(mesin)
+    if tabel is None:
+        tabel = _cache_tabel[mesin] = _TabelBuffer(mesin)
+    return tabel
+
+
+def _sebagai_bytes(data: Buffer) -> Union[bytes, bytearray]:
+    """
+    bytes/bytearray dipakai apa adanya; memoryview disalin sekali karena
+    int() dan bytes.translate tidak menerima memoryview
+    """
+    if isinstance(data, memoryview):
+        return data.tobytes()
+    return data
+
+
+def validasi_buffer(data: Buffer, mesin: MesinBasis) -> bool:
+    """
+    Memvalidasi numeral ASCII dalam buffer
+
+    Args:
+        data (Buffer): Numeral ASCII (huruf kecil diterima)
+        mesin (MesinBasis): Mesin basis sistem asal
+
+    Returns:
+        bool: True jika valid, False jika tidak valid
+    """
+    data = _sebagai_bytes(data).strip(_SPASI)
+    return bool(data) and not data.translate(None, _tabel(mesin).digit_valid)
+
+
+def ke_int_buffer(data: Buffer, mesin: MesinBasis) -> int:
+    """
+    Membaca numeral ASCII dari buffer menjadi int
+
+    Args:
+        data (Buffer): Numeral ASCII
+        mesin (MesinBasis): Mesin basis sistem asal
+
+    Returns:
+        int: Nilai desimal
+
+    Raises:
+        ValueError: Jika numeral tidak valid
+    """
+    data = _sebagai_bytes(data).strip(_SPASI)
+    tabel = _tabel(mesin)
+    if not data or data.translate(None, tabel.digit_valid):
+        raise ValueError(f"Input {bytes(data[:32])!r} tidak valid untuk sistem {mesin.nama}")
+
+    if tabel.ke_standar is not None:
+        data = data.translate(tabel.ke_standar)
+    return int(data, mesin.basis)
+
+
+def _tulis(hasil: bytes, keluaran: Optional[Buffer], offset: int) -> Union[bytes, int]:
+    """Menulis hasil ke buffer keluaran, atau mengembalikan hasil jika tidak ada"""
+    if keluaran is None:
+        return hasil
+
+    tujuan = memoryview(keluaran)
+    if offset + len(hasil) > len(tujuan):
+        raise ValueError(f"Buffer keluaran terlalu kecil ({len(tujuan) - offset} byte, "
+                         f"dibutuhkan {len(hasil)} byte)")
+    tujuan[offset:offset + len(hasil)] = hasil
+    return len(hasil)
+
+
+def dari_int_ke_buffer(nilai: int, mesin: MesinBasis, keluaran: Optional[Buffer] = None,
+                       offset: int = 0) -> Union[bytes, int]:
+    """
+    Menulis nilai sebagai numeral ASCII ke buffer
+
+    Heksadesimal diformat lewat int.to_bytes + binascii.hexlify sehingga tidak
+    membuat string perantara.
+
+    Args:
+        nilai (int): Nilai desimal (tidak negatif)
+        mesin (MesinBasis): Mesin basis sistem tujuan
+        keluaran (Buffer, optional): Buffer tujuan yang dapat ditulis
+        offset (int): Posisi awal penulisan di buffer tujuan
+
+    Returns:
+        bytes | int: Numeral ASCII jika keluaran None, selain itu jumlah byte ditulis
+    """
+    if nilai < 0:
+        raise ValueError("Program ini hanya mendukung bilangan positif")
+
+    if mesin.basis == 16:
+        heks = binascii.hexlify(nilai.to_bytes(max(1, -(-nilai.bit_length() // 8)), 'big')).upper()
+        if len(heks) > 1 and heks[0] == 0x30:  # Buang nibble nol di depan
+            heks = heks[1:]
+        hasil = heks if mesin.standar else heks.translate(_tabel(mesin).dari_standar)
+    else:
+        hasil = mesin.dari_int(nilai).encode('ascii')
+
+    return _tulis(hasil, keluaran, offset)
+
+
+def konversi_buffer(data: Buffer, mesin_asal: MesinBasis, mesin_tujuan: MesinBasis,
+                    keluaran: Optional[Buffer] = None, offset: int = 0) -> Union[bytes, int]:
+    """
+    Mengkonversi numeral ASCII dari buffer ke buffer
+
+    Args:
+        data (Buffer): Numeral ASCII dalam sistem asal
+        mesin_asal (MesinBasis): Mesin basis sistem asal
+        mesin_tujuan (MesinBasis): Mesin basis sistem tujuan
+        keluaran (Buffer, optional): Buffer tujuan yang dapat ditulis
+        offset (int): Posisi awal penulisan di buffer tujuan
+
+    Returns:
+        bytes | int: Numeral ASCII jika keluaran None, selain itu jumlah byte ditulis
+    """
+    return dari_int_ke_buffer(ke_int_buffer(data, mesin_asal), mesin_tujuan, keluaran, offset)
+
+
+def heks_ke_bytes(data: Buffer, keluaran: Optional[Buffer] = None,
+                  offset: int = 0) -> Union[bytes, int]:
+    """
+    Mengubah teks heksadesimal ASCII menjadi bytes mentah lewat binascii
+
+    Args:
+        data (Buffer): Teks heksadesimal (jumlah digit genap, huruf kecil/besar)
+        keluaran (Buffer, optional): Buffer tujuan yang dapat ditulis
+        offset (int): Posisi awal penulisan di buffer tujuan
+
+    Returns:
+        bytes | int: Bytes mentah jika keluaran None, selain itu jumlah byte ditulis
+    """
+    try:
+        hasil = binascii.unhexlify(data)
+    except binascii.Error as e:
+        raise ValueError(f"Teks heksadesimal tidak valid: {e}")
+    return _tulis(hasil, keluaran, offset)
+
+
+def bytes_ke_heks(data: Buffer, keluaran: Optional[Buffer] = None,
+                  offset: int = 0) -> Union[bytes, int]:
+    """
+    Mengubah bytes mentah menjadi teks heksadesimal ASCII kapital lewat binascii
+
+    Args:
+        data (Buffer): Bytes mentah
+        keluaran (Buffer, optional): Buffer tujuan yang dapat ditulis
+        offset (int): Posisi awal penulisan di buffer tujuan
+
+    Returns:
+        bytes | int: Teks heksadesimal jika keluaran None, selain itu jumlah byte ditulis
+    """
+    return _tulis(binascii.hexlify(data).upper(), keluaran, offset)
+
+
+def payload_ke_int(data: Buffer, urutan_byte: str = 'big', bertanda: bool = False) -> int:
+    """
+    Membaca payload biner mentah sebagai int (int.from_bytes, tanpa salinan)
+
+    Args:
+        data (Buffer): Payload biner
+        urutan_byte (str): 'big' atau 'little'
+        bertanda (bool): Baca sebagai komplemen dua
+
+    Returns:
+        int: Nilai desimal
+    """
+    return int.from_bytes(data, urutan_byte, signed=bertanda)
+
+
+def int_ke_payload(nilai: int, panjang: int, keluaran: Optional[Buffer] = None,
+                   offset: int = 0, urutan_byte: str = 'big',
+                   bertanda: bool = False) -> Union[bytes, int]:
+    """
+    Menulis int sebagai payload biner mentah dengan panjang tetap
+
+    Args:
+        nilai (int): Nilai desimal
+        panjang (int): Panjang payload dalam byte
+        keluaran (Buffer, optional): Buffer tujuan yang dapat ditulis
+        offset (int): Posisi awal penulisan di buffer tujuan
+        urutan_byte (str): 'big' atau 'little'
+        bertanda (bool): Tulis sebagai komplemen dua
+
+    Returns:
+        bytes | int: Payload jika keluaran None, selain itu jumlah byte ditulis
+    """
+    try:
+        hasil = nilai.to_bytes(panjang, urutan_byte, signed=bertanda)
+    except OverflowError:
+        raise ValueError(f"Nilai {nilai} tidak muat dalam {panjang} byte")
+    return _tulis(hasil, keluaran, offset)
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Konversi Bilangan Pecahan Antar Basis
+=====================================
+
+Modul ini mengkonversi bilangan pecahan (misal 0.1 desimal ke biner) dengan
+presisi digit yang dapat diatur.
+
+Fitur:
+- Aritmatika eksak dengan Fraction, tanpa galat pembulatan float
+- Deteksi pecahan berulang secara eksak dengan pelacakan siklus sisa bagi
+- Laporan galat akibat pemotongan pada presisi yang dipilih
+- Mode batch float64 (NumPy) yang membaca pola bit IEEE-754 lewat view
+  tanpa salinan
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+from fractions import Fraction
+from math import gcd
+from typing import Dict, Union
+
+try:
+    from .mesin_basis import MesinBasis, mesin_untuk_basis
+    from .dukungan_numpy import np, pastikan_numpy
+except ImportError:
+    from mesin_basis import MesinBasis, mesin_untuk_basis
+    from dukungan_numpy import np, pastikan_numpy
+
+
+PRESISI_DEFAULT = 32
+BATAS_SIKLUS_DEFAULT = 4096
+
+
+def _mesin(basis: Union[int, MesinBasis]) -> MesinBasis:
+    """Mengembalikan mesin untuk basis (int) atau mesin itu sendiri"""
+    return mesin_untuk_basis(basis) if isinstance(basis, int) else basis
+
+
+def baca_pecahan(nilai: str, basis_asal: Union[int, MesinBasis]) -> Fraction:
+    """
+    Membaca string pecahan (misal '101.011') menjadi Fraction eksak
+
+    Args:
+        nilai (str): Nilai dengan titik sebagai pemisah pecahan
+        basis_asal (int | MesinBasis): Basis asal
+
+    Returns:
+        Fraction: Nilai eksak
+
+    Raises:
+        ValueError: Jika format nilai tidak valid
+    """
+    mesin = _mesin(basis_asal)
+    nilai = nilai.strip()
+    bagian_bulat, titik, bagian_pecahan = nilai.partition('.')
+
+    if titik and not bagian_pecahan:
+        bagian_pecahan = '0'
+    if not bagian_bulat:
+        bagian_bulat = '0'
+    if not mesin.validasi(bagian_bulat) or (titik and not mesin.validasi(bagian_pecahan)):
+        raise ValueError(f"Input '{nilai}' tidak valid untuk sistem {mesin.nama}")
+
+    hasil = Fraction(mesin.ke_int(bagian_bulat))
+    if titik:
+        hasil += Fraction(mesin.ke_int(bagian_pecahan), mesin.basis ** len(bagian_pecahan))
+    return hasil
+
+
+def _panjang_praperiode(penyebut: int, basis: int) -> int:
+    """
+    Panjang bagian tidak berulang: k terkecil sehingga faktor penyebut yang
+    sama dengan faktor basis habis membagi basis^k
+    """
+    k = 0
+    faktor = gcd(penyebut, basis)
+    while faktor > 1:
+        penyebut //= faktor
+        k += 1
+        faktor = gcd(penyebut, basis)
+    return k
+
+
+def konversi_pecahan(nilai: str, basis_asal: Union[int, MesinBasis],
+                     basis_tujuan: Union[int, MesinBasis],
+                     presisi: int = PRESISI_DEFAULT,
+                     batas_siklus: int = BATAS_SIKLUS_DEFAULT) -> Dict:
+    """
+    Mengkonversi bilangan pecahan antar basis
+
+    Digit pecahan dihasilkan dengan perkalian berulang terhadap sisa bagi
+    eksak. Bagian berulang dimulai tepat setelah praperiode, sehingga siklus
+    terdeteksi ketika sisa bagi kembali ke sisa pada awal periode.
+
+    Args:
+        nilai (str): Nilai pecahan dalam basis asal (misal '0.1')
+        basis_asal (int | MesinBasis): Basis asal
+        basis_tujuan (int | MesinBasis): Basis tujuan
+        presisi (int): Jumlah maksimum digit pecahan pada hasil
+        batas_siklus (int): Jumlah maksimum digit yang dilacak untuk
+            mendeteksi periode (boleh melebihi presisi)
+
+    Returns:
+        Dict: Hasil konversi dengan kunci:
+            'hasil' (str): Hasil terpotong pada presisi
+            'eksak' (bool): True jika hasil tidak terpotong
+            'periode' (str | None): Digit berulang jika terdeteksi
+            'notasi' (str): Hasil dengan periode dalam kurung, misal '0.0(0011)'
+            'galat' (float): Galat pemotongan absolut (nilai asli - hasil)
+            'galat_eksak' (Fraction): Galat pemotongan eksak
+    """
+    if presisi < 0:
+        raise ValueError("Presisi tidak boleh negatif")
+
+    mesin_tujuan = _mesin(basis_tujuan)
+    basis = mesin_tujuan.basis
+    digit = mesin_tujuan.digit
+
+    nilai_eksak = baca_pecahan(nilai, basis_asal)
+    bulat = nilai_eksak.numerator // nilai_eksak.denominator
+    sisa = nilai_eksak.numerator % nilai_eksak.denominator
+    penyebut = nilai_eksak.denominator
+
+    praperiode = _panjang_praperiode(penyebut, basis)
+    digit_pecahan = []
+    sisa_awal_periode = None
+    panjang_periode = None
+
+    while sisa and len(digit_pecahan) < max(presisi, batas_siklus):
+        if len(digit_pecahan) == praperiode:
+            sisa_awal_periode = sisa
+        d, sisa = divmod(sisa * basis, penyebut)
+        digit_pecahan.append(digit[d])
+        if sisa == sisa_awal_periode:
+            panjang_periode = len(digit_pecahan) - praperiode
+            break
+
+    # Periode sudah diketahui: lanjutkan digit dengan mengulang periode
+    if panjang_periode is not None:
+        while len(digit_pecahan) < presisi:
+            digit_pecahan.append(digit_pecahan[len(digit_pecahan) - panjang_periode])
+
+    teks_bulat = mesin_tujuan.dari_int(bulat)
+    terpotong = ''.join(digit_pecahan[:presisi])
+    hasil = f"{teks_bulat}.{terpotong}" if terpotong else teks_bulat
+
+    # Nilai hasil terpotong dan galat eksaknya
+    nilai_hasil = Fraction(bulat)
+    if terpotong:
+        nilai_hasil += Fraction(mesin_tujuan.ke_int(terpotong), basis ** len(terpotong))
+    galat_eksak = nilai_eksak - nilai_hasil
+
+    periode = None
+    notasi = hasil
+    if panjang_periode is not None:
+        periode = ''.join(digit_pecahan[praperiode:praperiode + panjang_periode])
+        notasi = f"{teks_bulat}.{''.join(digit_pecahan[:praperiode])}({periode})"
+
+    return {
+        'hasil': hasil,
+        'eksak': galat_eksak == 0,
+        'periode': periode,
+        'periode_mulai': praperiode if periode is not None else None,
+        'notasi': notasi,
+        'galat': float(galat_eksak),
+        'galat_eksak': galat_eksak,
+        'presisi': presisi
+    }
+
+
+def batch_float_ke_digit(nilai, basis_tujuan: int = 2, presisi: int = PRESISI_DEFAULT) -> Dict:
+    """
+    Mengkonversi array float64 ke digit basis 2/8/16 secara tervektorisasi
+
+    Pola bit IEEE-754 dibaca lewat view uint64 (tanpa salinan) untuk
+    menentukan jumlah digit pecahan yang dibutuhkan agar hasil eksak.
+    Perkalian float dengan basis pangkat dua bersifat eksak, sehingga digit
+    yang dihasilkan juga eksak.
+
+    Args:
+        nilai (np.ndarray): Array float64 berhingga dengan |nilai| < 2^64
+        basis_tujuan (int): 2, 8, atau 16
+        presisi (int): Jumlah digit pecahan
+
+    Returns:
+        Dict: Kunci 'negatif' (bool), 'bulat' (uint64), 'digit' (uint8, bentuk
+            (n, presisi)), 'digit_eksak' (int64, digit pecahan yang dibutuhkan
+            agar eksak), 'galat' (float64, galat pemotongan absolut)
+    """
+    pastikan_numpy("batch konversi pecahan")
+    if basis_tujuan not in (2, 8, 16):
+        raise ValueError("Mode batch float hanya mendukung basis 2, 8, dan 16")
+
+    nilai = np.ascontiguousarray(nilai, dtype=np.float64)
+    if not np.isfinite(nilai).all():
+        raise ValueError("Nilai harus berhingga (bukan NaN/inf)")
+
+    # View zero-copy ke pola bit IEEE-754
+    pola = nilai.view(np.uint64)
+    negatif = (pola >> np.uint64(63)).astype(bool)
+    eksponen = ((pola >> np.uint64(52)) & np.uint64(0x7FF)).astype(np.int64)
+    mantisa = pola & np.uint64((1 << 52) - 1)
+    mantisa = np.where(eksponen > 0, mantisa | np.uint64(1 << 52), mantisa)
+
+    # nilai = mantisa * 2^(e - 1075); bit pecahan signifikan = 1075 - e - tz(mantisa)
+    bit_rendah = mantisa & (~mantisa + np.uint64(1))
+    nol_belakang = np.log2(np.maximum(bit_rendah, np.uint64(1)).astype(np.float64)).astype(np.int64)
+    eksponen_efektif = np.maximum(eksponen, 1) - 1075
+    bit_pecahan = np.where(mantisa > 0, np.maximum(0, -(eksponen_efektif + nol_belakang)), 0)
+    bit_per_digit = basis_tujuan.bit_length() - 1
+    digit_eksak = -(-bit_pecahan // bit_per_digit)
+
+    besaran = np.abs(nilai)
+    if (besaran >= 2.0 ** 64).any():
+        raise ValueError("Bagian bulat harus kurang dari 2^64")
+    bulat_float = np.floor(besaran)
+    pecahan = besaran - bulat_float
+
+    digit = np.empty((nilai.size, presisi), dtype=np.uint8)
+    for i in range(presisi):
+        pecahan = pecahan * basis_tujuan
+        d = np.floor(pecahan)
+        digit[:, i] = d
+        pecahan -= d
+
+    return {
+        'negatif': negatif,
+        'bulat': bulat_float.astype(np.uint64),
+        'digit': digit,
+        'digit_eksak': digit_eksak,
+        'galat': np.ldexp(pecahan, -bit_per_digit * presisi)
+    }
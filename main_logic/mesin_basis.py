@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Mesin Konversi Basis Umum
+=========================
+
+Modul ini menyediakan mesin konversi yang digerakkan oleh deskriptor basis
+(basis dan alfabet digit), seperti NUMBER_SYSTEM_CONFIG di gui/config_gui.py.
+
+Fitur:
+- Basis 2 sampai 36 dengan alfabet standar (0-9, A-Z)
+- Alfabet kustom, misal Base-32 Crockford (dengan alias I/L → 1, O → 0)
+- Tabel nilai digit yang dihitung sekali saat mesin dibuat
+- Jalur cepat otomatis untuk basis pangkat dua (2, 4, 8, 16, 32)
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+from functools import lru_cache
+from typing import Dict, Optional
+
+try:
+    from .format_digit import AMBANG_BIT, format_digit
+except ImportError:
+    from format_digit import AMBANG_BIT, format_digit
+
+
+ALFABET_STANDAR = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+ALFABET_CROCKFORD = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+
+# Kode format bawaan Python untuk basis standar yang didukung langsung
+FORMAT_BAWAAN = {2: 'b', 8: 'o', 10: 'd', 16: 'X'}
+
+
+class MesinBasis:
+    """
+    Mesin konversi untuk satu basis bilangan
+
+    Semua tabel (nilai digit, tabel translasi, tabel grup bit) dihitung sekali
+    di konstruktor sehingga validasi, parsing, dan format tidak memerlukan
+    percabangan per sistem.
+    """
+
+    def __init__(self, basis: int, digit: Optional[str] = None, nama: Optional[str] = None,
+                 abaikan_kapital: bool = True, alias: Optional[Dict[str, str]] = None):
+        """
+        Inisialisasi mesin basis
+
+        Args:
+            basis (int): Basis bilangan (2-36)
+            digit (str, optional): Alfabet digit; default alfabet standar
+            nama (str, optional): Nama sistem untuk pesan kesalahan
+            abaikan_kapital (bool): Terima huruf kecil sebagai huruf kapital
+            alias (Dict[str, str], optional): Karakter tambahan yang dibaca sebagai
+                digit lain, misal {'O': '0'} pada Crockford
+
+        Raises:
+            ValueError: Jika basis atau alfabet tidak valid
+        """
+        if not 2 <= basis <= 36:
+            raise ValueError(f"Basis {basis} tidak didukung (harus 2-36)")
+
+        digit = ALFABET_STANDAR[:basis] if digit is None else digit
+        if len(digit) != basis or len(set(digit)) != basis:
+            raise ValueError(f"Alfabet '{digit}' harus berisi {basis} digit unik")
+
+        self.basis = basis
+        self.digit = digit
+        self.nama = nama or f"basis-{basis}"
+        self.abaikan_kapital = abaikan_kapital
+
+        # Tabel nilai digit: karakter → nilai (termasuk alias)
+        self.nilai_digit: Dict[str, int] = {c: i for i, c in enumerate(digit)}
+        for karakter, target in (alias or {}).items():
+            self.nilai_digit[karakter] = self.nilai_digit[target]
+        if abaikan_kapital:
+            for karakter, nilai in list(self.nilai_digit.items()):
+                self.nilai_digit.setdefault(karakter.upper(), nilai)
+
+        # Tabel translasi ke alfabet standar (dipakai int(s, basis)) dan tabel
+        # penghapus digit valid (sisa translasi = karakter tidak valid)
+        standar = ALFABET_STANDAR[:basis]
+        self.standar = digit == standar and not alias
+        self._ke_standar = str.maketrans({c: standar[v] for c, v in self.nilai_digit.items()})
+        self._hapus_valid = str.maketrans(dict.fromkeys(self.nilai_digit))
+        self._dari_standar = str.maketrans(standar, digit)
+
+        # Jalur cepat basis pangkat dua: tabel grup bit → digit
+        self.bit_per_digit = basis.bit_length() - 1 if basis & (basis - 1) == 0 else 0
+        if self.bit_per_digit:
+            k = self.bit_per_digit
+            self._grup_bit = {format(i, f'0{k}b'): digit[i] for i in range(basis)}
+
+        # Ukuran potongan untuk basis umum: digit per potongan agar basis^m < 2^60
+        self._digit_per_potong = 1
+        while basis ** (self._digit_per_potong + 1) < 2 ** 60:
+            self._digit_per_potong += 1
+
+    @classmethod
+    def dari_deskriptor(cls, deskriptor: Dict, nama: Optional[str] = None) -> 'MesinBasis':
+        """
+        Membuat mesin dari deskriptor seperti NUMBER_SYSTEM_CONFIG
+
+        Args:
+            deskriptor (Dict): Dictionary dengan kunci 'base' dan 'digits'
+                (opsional 'name' dan 'aliases')
+            nama (str, optional): Nama sistem; default deskriptor['name']
+
+        Returns:
+            MesinBasis: Mesin untuk deskriptor tersebut
+        """
+        return cls(deskriptor['base'], deskriptor.get('digits'),
+                   nama=nama or deskriptor.get('name'),
+                   alias=deskriptor.get('aliases'))
+
+    def normalisasi(self, nilai: str) -> str:
+        """Menghapus spasi di tepi dan menyeragamkan huruf kapital"""
+        nilai = nilai.strip()
+        # Hanya ASCII: upper() Unicode mengubah 'ﬀ' menjadi 'FF' dan 'ı' menjadi 'I'
+        return nilai.upper() if self.abaikan_kapital and nilai.isascii() else nilai
+
+    def validasi(self, nilai: str) -> bool:
+        """
+        Memvalidasi bahwa nilai hanya berisi digit dari alfabet mesin
+
+        Args:
+            nilai (str): Nilai yang akan divalidasi
+
+        Returns:
+            bool: True jika valid, False jika tidak valid
+        """
+        nilai = self.normalisasi(nilai)
+        return bool(nilai) and not nilai.translate(self._hapus_valid)
+
+    def ke_int(self, nilai: str) -> int:
+        """
+        Mengkonversi nilai ke bilangan bulat
+
+        Args:
+            nilai (str): Nilai dalam basis mesin
+
+        Returns:
+            int: Nilai desimal
+
+        Raises:
+            ValueError: Jika nilai tidak valid
+        """
+        if not self.validasi(nilai):
+            raise ValueError(f"Input '{nilai}' tidak valid untuk sistem {self.nama}")
+
+        nilai = self.normalisasi(nilai)
+        if not self.standar:
+            nilai = nilai.translate(self._ke_standar)
+        return int(nilai, self.basis)
+
+    def dari_int(self, nilai: int) -> str:
+        """
+        Mengkonversi bilangan bulat ke string dalam basis mesin
+
+        Args:
+            nilai (int): Nilai desimal (tidak negatif)
+
+        Returns:
+            str: Representasi dalam basis mesin
+        """
+        if nilai < 0:
+            raise ValueError("Program ini hanya mendukung bilangan positif")
+
+        kode = FORMAT_BAWAAN.get(self.basis)
+        if kode is not None:
+            if kode == 'X' and nilai.bit_length() >= AMBANG_BIT:
+                hasil = format_digit(nilai, 16)  # to_bytes + hexlify, ~2x format()
+            else:
+                hasil = format(nilai, kode)
+            return hasil if self.standar else hasil.translate(self._dari_standar)
+
+        if self.bit_per_digit:
+            return self._dari_int_pangkat_dua(nilai)
+
+        return self._dari_int_umum(nilai)
+
+    def _dari_int_pangkat_dua(self, nilai: int) -> str:
+        """Format basis 2^k dengan memetakan grup k bit lewat tabel"""
+        k = self.bit_per_digit
+        bit = format(nilai, 'b')
+        bit = bit.zfill(-(-len(bit) // k) * k)
+        grup = self._grup_bit
+        return ''.join([grup[bit[i:i + k]] for i in range(0, len(bit), k)])
+
+    def _dari_int_umum(self, nilai: int) -> str:
+        """Format basis umum dengan membagi per potongan beberapa digit"""
+        if nilai == 0:
+            return self.digit[0]
+
+        m = self._digit_per_potong
+        pembagi = self.basis ** m
+        potongan = []
+        while nilai:
+            nilai, sisa = divmod(nilai, pembagi)
+            potongan.append(sisa)
+
+        digit = self.digit
+        basis = self.basis
+        karakter = []
+        for indeks, sisa in enumerate(potongan):
+            teratas = indeks == len(potongan) - 1
+            for _ in range(m):
+                sisa, d = divmod(sisa, basis)
+                karakter.append(digit[d])
+                if teratas and sisa == 0:
+                    break
+        return ''.join(reversed(karakter))
+
+
+@lru_cache(maxsize=None)
+def mesin_untuk_basis(basis: int) -> MesinBasis:
+    """
+    Mengembalikan mesin (ter-cache) untuk basis dengan alfabet standar
+
+    Args:
+        basis (int): Basis bilangan (2-36)
+
+    Returns:
+        MesinBasis: Mesin untuk basis tersebut
+    """
+    return MesinBasis(basis)
+
+
+# Base-32 Crockford: tanpa I, L, O, U; I/L dibaca 1 dan O dibaca 0
+MESIN_CROCKFORD = MesinBasis(32, ALFABET_CROCKFORD, nama='base32-crockford',
+                             alias={'I': '1', 'L': '1', 'O': '0'})
@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Metrik Konverter (Format Teks Prometheus)
+=========================================
+
+Registri metrik opsional untuk KonverterSistemBilangan. Metrik diekspor
+dalam format teks eksposisi Prometheus (versi 0.0.4) melalui endpoint
+HTTP lokal kecil atau ditulis ke file (misal untuk textfile collector
+node_exporter).
+
+Penghitung dan histogram tidak memakai kunci di jalur panas: setiap thread
+menulis ke shard (dict) miliknya sendiri, dan shard dijumlahkan saat
+ekspor. Kunci hanya dipakai saat thread pertama kali mendaftarkan shard;
+saat itu pula shard milik thread yang sudah berakhir dijumlahkan ke satu
+shard arsip, sehingga jumlah shard (dan biaya ekspor) tidak bertambah
+terus pada server satu-thread-per-permintaan. Nilai yang cukup dibaca
+saat ekspor didaftarkan sebagai fungsi sehingga tidak menambah biaya sama
+sekali.
+
+Fitur:
+- Penghitung berlabel dan histogram dengan batas bucket tetap
+- Metrik berbasis fungsi yang dievaluasi saat ekspor
+- Ekspor ke string, file (atomik), atau HTTP (/metrics)
+- MetrikKonverter: metrik standar konverter (konversi per pasangan
+  sistem, hit/miss dan rasio hit tabel prakomputasi, simulasi per jenis
+  kesalahan, verdict deteksi, dan histogram latensi)
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import bisect
+import os
+import re
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+TIPE_KONTEN = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Batas bucket latensi (detik): 1 µs sampai 1 s
+BATAS_LATENSI = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0)
+
+_POLA_NAMA = re.compile(r'^[a-zA-Z_:][a-zA-Z0-9_:]*$')
+_POLA_LABEL = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
+# Shard thread yang berakhir digabung setelah jumlah shard mencapai ambang
+# ini (lalu dua kali jumlah shard tersisa) agar biayanya teramortisasi
+_AMBANG_PANGKAS_MINIMUM = 8
+
+
+def _escape_bantuan(teks: str) -> str:
+    """Escape teks HELP sesuai format eksposisi"""
+    return teks.replace('\\', '\\\\').replace('\n', '\\n')
+
+
+def _escape_label(nilai: str) -> str:
+    """Escape nilai label sesuai format eksposisi"""
+    return _escape_bantuan(nilai).replace('"', '\\"')
+
+
+def _format_nilai(nilai: float) -> str:
+    """Format angka: bilangan bulat tanpa desimal, +Inf untuk tak hingga"""
+    if nilai == float('inf'):
+        return '+Inf'
+    if isinstance(nilai, int) or float(nilai).is_integer():
+        return str(int(nilai))
+    return repr(float(nilai))
+
+
+def _format_label(nama_label: Sequence[str], nilai_label: Sequence[str],
+                  tambahan: Tuple[Tuple[str, str], ...] = ()) -> str:
+    pasangan = list(zip(nama_label, nilai_label)) + list(tambahan)
+    if not pasangan:
+        return ''
+    return '{' + ','.join(f'{nama}="{_escape_label(str(nilai))}"' for nama, nilai in pasangan) + '}'
+
+
+class Metrik:
+    """Kelas dasar metrik berlabel dengan shard per thread"""
+
+    jenis = 'untyped'
+
+    def __init__(self, nama: str, bantuan: str, label: Sequence[str] = ()):
+        if not _POLA_NAMA.match(nama):
+            raise ValueError(f"Nama metrik tidak valid: '{nama}'")
+        for nama_label in label:
+            if not _POLA_LABEL.match(nama_label) or nama_label.startswith('__'):
+                raise ValueError(f"Nama label tidak valid: '{nama_label}'")
+        self.nama = nama
+        self.bantuan = bantuan
+        self.label = tuple(label)
+        self._lokal = threading.local()
+        self._kunci = threading.Lock()
+        # Pasangan (thread pemilik, shard); pemilik None untuk shard arsip
+        self._daftar_shard: List[Tuple[Optional[threading.Thread], Dict]] = []
+        self._ambang_pangkas = _AMBANG_PANGKAS_MINIMUM
+
+    def _shard(self) -> Dict:
+        """Shard milik thread pemanggil (dibuat saat pertama dipakai)"""
+        try:
+            return self._lokal.shard
+        except AttributeError:
+            shard = {}
+            with self._kunci:
+                if len(self._daftar_shard) >= self._ambang_pangkas:
+                    self._pangkas_tanpa_kunci()
+                self._daftar_shard.append((threading.current_thread(), shard))
+            self._lokal.shard = shard
+            return shard
+
+    def _gabung_isi(self, a, b):
+        """Menjumlahkan nilai dua shard untuk kombinasi label yang sama"""
+        return a + b
+
+    def _pangkas_tanpa_kunci(self):
+        """Menjumlahkan shard thread yang sudah berakhir ke shard arsip (pemanggil memegang kunci)"""
+        arsip, hidup, mati = {}, [], []
+        for pemilik, shard in self._daftar_shard:
+            if pemilik is None:
+                arsip = shard
+            elif pemilik.is_alive():
+                hidup.append((pemilik, shard))
+            else:
+                mati.append(shard)
+        if not mati:
+            return
+        # Arsip baru dibuat (bukan diubah) agar salinan yang sedang diekspor
+        # tidak menghitung shard mati dua kali
+        arsip = dict(arsip)
+        for shard in mati:
+            for kunci, isi in shard.items():
+                arsip[kunci] = self._gabung_isi(arsip[kunci], isi) if kunci in arsip else isi
+        self._daftar_shard = [(None, arsip)] + hidup
+        self._ambang_pangkas = max(_AMBANG_PANGKAS_MINIMUM, 2 * len(self._daftar_shard))
+
+    def jumlah_shard(self) -> int:
+        """Jumlah shard yang disimpan (thread penulis, ditambah shard arsip)"""
+        with self._kunci:
+            return len(self._daftar_shard)
+
+    def _kunci_label(self, nilai_label: Sequence[str]) -> Tuple[str, ...]:
+        if len(nilai_label) != len(self.label):
+            raise ValueError(f"Metrik {self.nama} membutuhkan {len(self.label)} nilai label")
+        return tuple(nilai_label)
+
+    def _salinan_shard(self) -> List[Dict]:
+        with self._kunci:
+            daftar_shard = [shard for _, shard in self._daftar_shard]
+        # dict.copy() atomik terhadap penulisan thread pemilik shard
+        return [shard.copy() for shard in daftar_shard]
+
+    def sampel(self) -> Iterable[Tuple[str, Tuple[str, ...], Tuple[Tuple[str, str], ...], float]]:
+        """Sampel (akhiran nama, nilai label, label tambahan, nilai) untuk ekspor"""
+        raise NotImplementedError
+
+    def ekspor(self) -> str:
+        """Baris teks Prometheus untuk metrik ini"""
+        baris = [f"# HELP {self.nama} {_escape_bantuan(self.bantuan)}",
+                 f"# TYPE {self.nama} {self.jenis}"]
+        for akhiran, nilai_label, tambahan, nilai in self.sampel():
+            baris.append(f"{self.nama}{akhiran}{_format_label(self.label, nilai_label, tambahan)} "
+                         f"{_format_nilai(nilai)}")
+        return '\n'.join(baris) + '\n'
+
+
+class Penghitung(Metrik):
+    """Penghitung monoton berlabel"""
+
+    jenis = 'counter'
+
+    def __init__(self, nama: str, bantuan: str, label: Sequence[str] = ()):
+        if not nama.endswith('_total'):
+            raise ValueError(f"Nama penghitung harus berakhiran _total: '{nama}'")
+        super().__init__(nama, bantuan, label)
+
+    def tambah(self, *nilai_label: str, jumlah: float = 1):
+        """
+        Menambah penghitung untuk kombinasi label tertentu
+
+        Args:
+            *nilai_label (str): Nilai label sesuai urutan label metrik
+            jumlah (float): Penambahan (tidak boleh negatif)
+        """
+        if jumlah < 0:
+            raise ValueError("Penghitung hanya dapat bertambah")
+        shard = self._shard()
+        kunci = self._kunci_label(nilai_label)
+        shard[kunci] = shard.get(kunci, 0) + jumlah
+
+    def nilai(self, *nilai_label: str) -> float:
+        """Total penghitung untuk kombinasi label tertentu"""
+        kunci = self._kunci_label(nilai_label)
+        return sum(shard.get(kunci, 0) for shard in self._salinan_shard())
+
+    def total(self) -> Dict[Tuple[str, ...], float]:
+        """Total per kombinasi label dari semua thread"""
+        hasil = {}
+        for shard in self._salinan_shard():
+            for kunci, nilai in shard.items():
+                hasil[kunci] = hasil.get(kunci, 0) + nilai
+        return hasil
+
+    def sampel(self):
+        for kunci, nilai in sorted(self.total().items()):
+            yield '', kunci, (), nilai
+
+
+class Histogram(Metrik):
+    """Histogram berlabel dengan batas bucket tetap"""
+
+    jenis = 'histogram'
+
+    def __init__(self, nama: str, bantuan: str, label: Sequence[str] = (),
+                 batas: Sequence[float] = BATAS_LATENSI):
+        if 'le' in label:
+            raise ValueError("Label 'le' dicadangkan untuk histogram")
+        batas = tuple(float(b) for b in batas)
+        if not batas or list(batas) != sorted(set(batas)):
+            raise ValueError("Batas bucket harus naik dan tidak kosong")
+        super().__init__(nama, bantuan, label)
+        self.batas = batas
+
+    def amati(self, nilai: float, *nilai_label: str):
+        """
+        Mencatat satu pengamatan
+
+        Args:
+            nilai (float): Nilai pengamatan (misal durasi dalam detik)
+            *nilai_label (str): Nilai label sesuai urutan label metrik
+        """
+        shard = self._shard()
+        kunci = self._kunci_label(nilai_label)
+        isi = shard.get(kunci)
+        if isi is None:
+            # [bucket non-kumulatif..., bucket +Inf, jumlah nilai]
+            isi = shard[kunci] = [0] * (len(self.batas) + 1) + [0.0]
+        isi[bisect.bisect_left(self.batas, nilai)] += 1
+        isi[-1] += nilai
+
+    def _gabung_isi(self, a, b):
+        return [x + y for x, y in zip(a, b)]
+
+    def total(self) -> Dict[Tuple[str, ...], List[float]]:
+        """Bucket non-kumulatif dan jumlah nilai per kombinasi label"""
+        hasil = {}
+        for shard in self._salinan_shard():
+            for kunci, isi in shard.items():
+                isi = list(isi)
+                gabungan = hasil.get(kunci)
+                hasil[kunci] = isi if gabungan is None else self._gabung_isi(gabungan, isi)
+        return hasil
+
+    def sampel(self):
+        for kunci, isi in sorted(self.total().items()):
+            kumulatif = 0
+            for batas, jumlah in zip(self.batas + (float('inf'),), isi):
+                kumulatif += jumlah
+                yield '_bucket', kunci, (('le', _format_nilai(batas)),), kumulatif
+            yield '_sum', kunci, (), isi[-1]
+            yield '_count', kunci, (), kumulatif
+
+
+class MetrikFungsi(Metrik):
+    """Metrik yang nilainya diambil dari fungsi saat ekspor"""
+
+    def __init__(self, nama: str, bantuan: str,
+                 fungsi: Callable[[], Iterable[Tuple[Sequence[str], float]]],
+                 label: Sequence[str] = (), jenis: str = 'gauge'):
+        """
+        Args:
+            fungsi (Callable): Mengembalikan iterable (nilai label, nilai)
+            jenis (str): 'gauge' atau 'counter'
+        """
+        if jenis not in ('gauge', 'counter'):
+            raise ValueError(f"Jenis metrik fungsi tidak didukung: {jenis}")
+        super().__init__(nama, bantuan, label)
+        self.jenis = jenis
+        self.fungsi = fungsi
+
+    def sampel(self):
+        for nilai_label, nilai in self.fungsi():
+            yield '', self._kunci_label(tuple(nilai_label)), (), nilai
+
+
+class RegistriMetrik:
+    """Kumpulan metrik yang diekspor bersama"""
+
+    def __init__(self):
+        self._kunci = threading.Lock()
+        self._metrik: Dict[str, Metrik] = {}
+
+    def daftarkan(self, metrik: Metrik) -> Metrik:
+        """Mendaftarkan metrik; nama harus unik dalam registri"""
+        with self._kunci:
+            if metrik.nama in self._metrik:
+                raise ValueError(f"Metrik '{metrik.nama}' sudah terdaftar")
+            self._metrik[metrik.nama] = metrik
+        return metrik
+
+    def penghitung(self, nama: str, bantuan: str, label: Sequence[str] = ()) -> Penghitung:
+        """Membuat dan mendaftarkan penghitung"""
+        return self.daftarkan(Penghitung(nama, bantuan, label))
+
+    def histogram(self, nama: str, bantuan: str, label: Sequence[str] = (),
+                  batas: Sequence[float] = BATAS_LATENSI) -> Histogram:
+        """Membuat dan mendaftarkan histogram"""
+        return self.daftarkan(Histogram(nama, bantuan, label, batas))
+
+    def fungsi(self, nama: str, bantuan: str,
+               fungsi: Callable[[], Iterable[Tuple[Sequence[str], float]]],
+               label: Sequence[str] = (), jenis: str = 'gauge') -> MetrikFungsi:
+        """Membuat dan mendaftarkan metrik berbasis fungsi"""
+        return self.daftarkan(MetrikFungsi(nama, bantuan, fungsi, label, jenis))
+
+    def ekspor(self) -> str:
+        """Semua metrik dalam format teks eksposisi Prometheus"""
+        with self._kunci:
+            daftar_metrik = list(self._metrik.values())
+        return ''.join(metrik.ekspor() for metrik in daftar_metrik)
+
+    def tulis_file(self, path: str):
+        """
+        Menulis ekspor ke file secara atomik (file sementara lalu os.replace)
+
+        Args:
+            path (str): Path file tujuan (misal *.prom untuk node_exporter)
+        """
+        direktori = os.path.dirname(os.path.abspath(path))
+        fd, path_sementara = tempfile.mkstemp(dir=direktori, prefix='.metrik-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='\n') as berkas:
+                berkas.write(self.ekspor())
+            os.replace(path_sementara, path)
+        except BaseException:
+            os.unlink(path_sementara)
+            raise
+
+    def layani_http(self, port: int = 0, host: str = '127.0.0.1') -> 'ServerMetrik':
+        """
+        Menjalankan endpoint HTTP /metrics di thread latar belakang
+
+        Args:
+            port (int): Port (0 = dipilih sistem, lihat ServerMetrik.port)
+            host (str): Alamat bind (default hanya lokal)
+
+        Returns:
+            ServerMetrik: Server yang berjalan; panggil tutup() untuk berhenti
+        """
+        server = ServerMetrik(self, host, port)
+        server.mulai()
+        return server
+
+
+class _PenanganMetrik(BaseHTTPRequestHandler):
+    """Handler HTTP: GET /metrics mengembalikan ekspor registri"""
+
+    def do_GET(self):
+        if self.path.split('?', 1)[0] not in ('/metrics', '/'):
+            self.send_error(404, "Gunakan /metrics")
+            return
+        isi = self.server.registri.ekspor().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', TIPE_KONTEN)
+        self.send_header('Content-Length', str(len(isi)))
+        self.end_headers()
+        self.wfile.write(isi)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ServerMetrik(ThreadingHTTPServer):
+    """Server HTTP kecil untuk endpoint /metrics"""
+
+    daemon_threads = True
+
+    def __init__(self, registri: RegistriMetrik, host: str = '127.0.0.1', port: int = 0):
+        super().__init__((host, port), _PenanganMetrik)
+        self.registri = registri
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def mulai(self):
+        """Menjalankan server di thread daemon"""
+        self._thread = threading.Thread(target=self.serve_forever, name='server-metrik',
+                                        daemon=True)
+        self._thread.start()
+
+    def tutup(self):
+        """Menghentikan server dan menutup socket"""
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+class MetrikKonverter:
+    """
+    Metrik standar KonverterSistemBilangan
+
+    Berikan instance ke KonverterSistemBilangan(metrik=...) untuk mengaktifkan.
+    Konverter tanpa metrik tidak membayar biaya apa pun selain satu
+    pemeriksaan None.
+    """
+
+    def __init__(self, registri: Optional[RegistriMetrik] = None):
+        self.registri = registri if registri is not None else RegistriMetrik()
+        self.konversi = self.registri.penghitung(
+            'konverter_konversi_total', "Jumlah konversi berhasil per pasangan sistem",
+            ('asal', 'tujuan'))
+        self.simulasi = self.registri.penghitung(
+            'konverter_simulasi_total', "Jumlah simulasi kesalahan per jenis", ('jenis',))
+        self.deteksi = self.registri.penghitung(
+            'konverter_deteksi_total', "Jumlah deteksi kesalahan per verdict", ('verdict',))
+        self.latensi = self.registri.histogram(
+            'konverter_latensi_detik', "Latensi operasi konverter dalam detik", ('operasi',))
+        self.cache = self.registri.penghitung(
+            'konverter_cache_tabel_total',
+            "Jumlah lookup tabel prakomputasi per hasil (hit/miss)", ('hasil',))
+        self.registri.fungsi(
+            'konverter_cache_tabel_rasio_hit',
+            "Rasio hit lookup tabel prakomputasi (0-1)", self._sampel_rasio_hit)
+
+    def _sampel_rasio_hit(self):
+        """Rasio hit dari penghitung cache; tanpa sampel sebelum ada lookup"""
+        hit = self.cache.nilai('hit')
+        total = hit + self.cache.nilai('miss')
+        if total:
+            yield (), hit / total
+
+    def rasio_hit_cache(self) -> Optional[float]:
+        """Rasio hit tabel prakomputasi, atau None jika belum ada lookup"""
+        return next((rasio for _, rasio in self._sampel_rasio_hit()), None)
+
+    def catat_cache(self, hit: bool):
+        """Mencatat satu lookup tabel prakomputasi (hit jika nilai ada di tabel)"""
+        self.cache.tambah('hit' if hit else 'miss')
+
+    def catat_konversi(self, sistem_asal: str, sistem_tujuan: str, durasi: float):
+        """Mencatat satu konversi berhasil dan latensinya"""
+        self.konversi.tambah(sistem_asal, sistem_tujuan)
+        self.latensi.amati(durasi, 'konversi')
+
+    def catat_simulasi(self, jenis: str, durasi: float):
+        """Mencatat satu simulasi kesalahan dan latensinya"""
+        self.simulasi.tambah(jenis)
+        self.latensi.amati(durasi, 'simulasi')
+
+    def catat_deteksi(self, verdict: str, durasi: float):
+        """Mencatat satu verdict deteksi ('benar', 'salah', 'tidak_valid') dan latensinya"""
+        self.deteksi.tambah(verdict)
+        self.latensi.amati(durasi, 'deteksi')
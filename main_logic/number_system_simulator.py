@@ -19,11 +19,53 @@ Penulis: Kelompok 1
 Tanggal: 5/9/2025
 """
 
+import itertools
 import random
-import re
-from typing import Dict, List, Tuple, Optional, Union
+import sys
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, TextIO, Tuple, Optional, Union
 from enum import Enum
 
+try:
+    from .tabel_rentang import generator_tabel_rentang, tulis_csv
+    from .mesin_basis import MesinBasis, mesin_untuk_basis
+    from .representasi_bertanda import RepresentasiBertanda, enkode_bertanda, dekode_bertanda
+    from .konversi_pecahan import konversi_pecahan, PRESISI_DEFAULT
+    from . import konversi_buffer
+    from .crc import ParameterCRC, CRC32, mesin_crc
+    from .hamming import KodeHamming, HAMMING_7_4
+    from .kanal import Kanal, statistik_kesalahan
+    from .dukungan_numpy import np, pastikan_numpy
+    from .aritmatika_lebar_tetap import RegisterLebarTetap, ModeLuapan, hitung_operasi
+    from .hasil import EntriRiwayat, HasilOperasi, HasilDeteksi, BarisTabel
+    from .riwayat_terbagi import RiwayatTerbagi
+    from .metrik import MetrikKonverter
+    from .tabel_prakomputasi import TabelPrakomputasi
+    from .format_digit import format_digit
+    from .progres import (PelacakProgres, TokenPembatalan, OperasiDibatalkan, iterasi_terlacak,
+                          BilahProgresTeks, tangkap_ctrl_c)
+    from .operasi_bitwise import hitung_bitwise
+except ImportError:
+    from tabel_rentang import generator_tabel_rentang, tulis_csv
+    from mesin_basis import MesinBasis, mesin_untuk_basis
+    from representasi_bertanda import RepresentasiBertanda, enkode_bertanda, dekode_bertanda
+    from konversi_pecahan import konversi_pecahan, PRESISI_DEFAULT
+    import konversi_buffer
+    from crc import ParameterCRC, CRC32, mesin_crc
+    from hamming import KodeHamming, HAMMING_7_4
+    from kanal import Kanal, statistik_kesalahan
+    from dukungan_numpy import np, pastikan_numpy
+    from aritmatika_lebar_tetap import RegisterLebarTetap, ModeLuapan, hitung_operasi
+    from hasil import EntriRiwayat, HasilOperasi, HasilDeteksi, BarisTabel
+    from riwayat_terbagi import RiwayatTerbagi
+    from metrik import MetrikKonverter
+    from tabel_prakomputasi import TabelPrakomputasi
+    from format_digit import format_digit
+    from progres import (PelacakProgres, TokenPembatalan, OperasiDibatalkan, iterasi_terlacak,
+                         BilahProgresTeks, tangkap_ctrl_c)
+    from operasi_bitwise import hitung_bitwise
+
 
 class SistemBilangan(Enum):
     """Enumerasi untuk berbagai sistem bilangan yang didukung"""
@@ -42,6 +84,32 @@ class JenisKesalahan(Enum):
     UNDERFLOW = "underflow"
 
 
+# Deskriptor setiap sistem bilangan (format sama dengan NUMBER_SYSTEM_CONFIG)
+DESKRIPTOR_SISTEM = {
+    SistemBilangan.BINER: {'base': 2, 'digits': '01'},
+    SistemBilangan.DESIMAL: {'base': 10, 'digits': '0123456789'},
+    SistemBilangan.HEKSADESIMAL: {'base': 16, 'digits': '0123456789ABCDEF'},
+    SistemBilangan.OKTAL: {'base': 8, 'digits': '01234567'},
+}
+
+# Jumlah entri riwayat di memori untuk CLI; sama dengan default
+# validation.max_history_entries di konfigurasi GUI
+BATAS_RIWAYAT_DEFAULT = 100
+
+# Mesin konversi per sistem; dispatch lewat tabel, bukan rantai if/elif
+MESIN_SISTEM = {
+    sistem: MesinBasis.dari_deskriptor(deskriptor, nama=sistem.value)
+    for sistem, deskriptor in DESKRIPTOR_SISTEM.items()
+}
+
+# Nama sistem yang diterima mode skrip
+ALIAS_SISTEM = {sistem.value: sistem for sistem in SistemBilangan}
+ALIAS_SISTEM.update({
+    'bin': SistemBilangan.BINER, 'dec': SistemBilangan.DESIMAL,
+    'oct': SistemBilangan.OKTAL, 'hex': SistemBilangan.HEKSADESIMAL,
+})
+
+
 class KonverterSistemBilangan:
     """
     Kelas utama untuk konversi antar sistem bilangan dengan kemampuan simulasi kesalahan
@@ -51,13 +119,53 @@ class KonverterSistemBilangan:
     - Simulasi kesalahan umum
     - Validasi input
     - Deteksi kesalahan
+
+    Satu instance aman dipakai bersama oleh banyak thread: riwayat konversi
+    dipecah per thread (RiwayatTerbagi) dan setiap thread memakai generator
+    acak sendiri (atribut rng).
     """
     
-    def __init__(self):
-        """Inisialisasi konverter dengan konfigurasi default"""
-        self.riwayat_konversi: List[Dict] = []
+    def __init__(self, riwayat_persisten=None, seed: Optional[int] = None,
+                 metrik: Optional[MetrikKonverter] = None, batas_riwayat: Optional[int] = None,
+                 tabel: Optional[TabelPrakomputasi] = None):
+        """
+        Inisialisasi konverter dengan konfigurasi default
+
+        Args:
+            riwayat_persisten (RiwayatSQLite, optional): Penyimpanan riwayat persisten.
+                Jika diberikan, setiap konversi juga dicatat ke basis data.
+            seed (int, optional): Seed generator acak simulasi. Setiap thread
+                mendapat seed turunan (seed, nomor urut thread) sehingga hasil
+                dapat diulang; None memakai entropi sistem.
+            metrik (MetrikKonverter, optional): Metrik Prometheus. Jika diberikan,
+                konversi, simulasi, dan deteksi dicatat beserta latensinya.
+            batas_riwayat (int, optional): Jumlah entri riwayat terbaru yang disimpan
+                di memori; None = tanpa batas
+            tabel (TabelPrakomputasi, optional): Tabel memory-mapped; nilai di
+                dalam jangkauannya (default < 2^16) diformat dengan satu slice
+        """
+        self.riwayat_konversi: RiwayatTerbagi = RiwayatTerbagi(batas=batas_riwayat)
+        self.seed = seed
+        self._lokal = threading.local()
+        self._nomor_thread = itertools.count()
+        self.metrik = metrik
+        self.tabel = tabel
+        self.riwayat_persisten = riwayat_persisten
         self.probabilitas_kesalahan = 0.1  # 10% kemungkinan kesalahan saat simulasi
-        
+        self.presisi_pecahan = PRESISI_DEFAULT  # Digit pecahan untuk konversi pecahan
+        
+    @property
+    def rng(self) -> random.Random:
+        """Generator acak milik thread pemanggil (dibuat saat pertama dipakai)"""
+        rng = getattr(self._lokal, 'rng', None)
+        if rng is None:
+            if self.seed is None:
+                rng = random.Random()
+            else:
+                rng = random.Random(f"{self.seed}:{next(self._nomor_thread)}")
+            self._lokal.rng = rng
+        return rng
+
     def validasi_input(self, nilai: str, sistem: SistemBilangan) -> bool:
         """
         Memvalidasi apakah input sesuai dengan sistem bilangan yang dipilih
@@ -70,18 +178,7 @@ class KonverterSistemBilangan:
             bool: True jika valid, False jika tidak valid
         """
         try:
-            nilai = nilai.strip().upper()
-            
-            if sistem == SistemBilangan.BINER:
-                return bool(re.match(r'^[01]+$', nilai))
-            elif sistem == SistemBilangan.DESIMAL:
-                return bool(re.match(r'^[0-9]+$', nilai))
-            elif sistem == SistemBilangan.OKTAL:
-                return bool(re.match(r'^[0-7]+$', nilai))
-            elif sistem == SistemBilangan.HEKSADESIMAL:
-                return bool(re.match(r'^[0-9A-F]+$', nilai))
-            
-            return False
+            return MESIN_SISTEM[sistem].validasi(nilai)
         except Exception:
             return False
     
@@ -102,26 +199,19 @@ class KonverterSistemBilangan:
         if not self.validasi_input(nilai, sistem_asal):
             raise ValueError(f"Input '{nilai}' tidak valid untuk sistem {sistem_asal.value}")
         
-        nilai = nilai.strip().upper()
-        
-        if sistem_asal == SistemBilangan.BINER:
-            return int(nilai, 2)
-        elif sistem_asal == SistemBilangan.DESIMAL:
-            return int(nilai, 10)
-        elif sistem_asal == SistemBilangan.OKTAL:
-            return int(nilai, 8)
-        elif sistem_asal == SistemBilangan.HEKSADESIMAL:
-            return int(nilai, 16)
-        
-        raise ValueError(f"Sistem bilangan {sistem_asal} tidak didukung")
+        return MESIN_SISTEM[sistem_asal].ke_int(nilai)
     
-    def dari_desimal(self, nilai_desimal: int, sistem_tujuan: SistemBilangan) -> str:
+    def dari_desimal(self, nilai_desimal: int, sistem_tujuan: SistemBilangan,
+                     lebar: int = 0, grup: int = 0, pemisah: str = ' ') -> str:
         """
         Mengkonversi nilai desimal ke sistem bilangan tertentu
         
         Args:
             nilai_desimal (int): Nilai dalam sistem desimal
             sistem_tujuan (SistemBilangan): Sistem bilangan tujuan
+            lebar (int): Jumlah digit minimal, diisi nol di depan
+            grup (int): Jumlah digit per grup dari kanan; 0 = tanpa pengelompokan
+            pemisah (str): Pemisah antar grup
             
         Returns:
             str: Nilai dalam sistem bilangan tujuan
@@ -129,16 +219,45 @@ class KonverterSistemBilangan:
         if nilai_desimal < 0:
             raise ValueError("Program ini hanya mendukung bilangan positif")
         
-        if sistem_tujuan == SistemBilangan.BINER:
-            return bin(nilai_desimal)[2:]  # Menghilangkan prefix '0b'
-        elif sistem_tujuan == SistemBilangan.DESIMAL:
-            return str(nilai_desimal)
-        elif sistem_tujuan == SistemBilangan.OKTAL:
-            return oct(nilai_desimal)[2:]  # Menghilangkan prefix '0o'
-        elif sistem_tujuan == SistemBilangan.HEKSADESIMAL:
-            return hex(nilai_desimal)[2:].upper()  # Menghilangkan prefix '0x' dan uppercase
+        if lebar or grup:
+            deskriptor = DESKRIPTOR_SISTEM.get(sistem_tujuan)
+            if deskriptor is None:
+                raise ValueError(f"Sistem bilangan {sistem_tujuan} tidak didukung")
+            return format_digit(nilai_desimal, deskriptor['base'], lebar, grup, pemisah)
+        
+        tabel = self.tabel
+        if tabel is not None:
+            hit = nilai_desimal < tabel.jumlah
+            if self.metrik is not None:
+                self.metrik.catat_cache(hit)
+            if hit:
+                return tabel.format(nilai_desimal, sistem_tujuan)
+        
+        mesin = MESIN_SISTEM.get(sistem_tujuan)
+        if mesin is None:
+            raise ValueError(f"Sistem bilangan {sistem_tujuan} tidak didukung")
+        
+        return mesin.dari_int(nilai_desimal)
+    
+    def konversi_basis(self, nilai: str, basis_asal: Union[int, MesinBasis],
+                       basis_tujuan: Union[int, MesinBasis]) -> str:
+        """
+        Melakukan konversi antar basis sembarang (2-36 atau alfabet kustom)
+        
+        Args:
+            nilai (str): Nilai yang akan dikonversi
+            basis_asal (int | MesinBasis): Basis asal atau mesin dengan alfabet kustom
+            basis_tujuan (int | MesinBasis): Basis tujuan atau mesin dengan alfabet kustom
+            
+        Returns:
+            str: Hasil konversi
+        """
+        if isinstance(basis_asal, int):
+            basis_asal = mesin_untuk_basis(basis_asal)
+        if isinstance(basis_tujuan, int):
+            basis_tujuan = mesin_untuk_basis(basis_tujuan)
         
-        raise ValueError(f"Sistem bilangan {sistem_tujuan} tidak didukung")
+        return basis_tujuan.dari_int(basis_asal.ke_int(nilai))
     
     def konversi(self, nilai: str, sistem_asal: SistemBilangan, 
                 sistem_tujuan: SistemBilangan) -> str:
@@ -153,21 +272,88 @@ class KonverterSistemBilangan:
         Returns:
             str: Hasil konversi
         """
+        metrik = self.metrik
+        mulai = time.perf_counter() if metrik is not None else 0.0
+        
         # Konversi ke desimal terlebih dahulu, kemudian ke sistem tujuan
         nilai_desimal = self.ke_desimal(nilai, sistem_asal)
         hasil = self.dari_desimal(nilai_desimal, sistem_tujuan)
         
-        # Simpan riwayat konversi
-        self.riwayat_konversi.append({
-            'nilai_asal': nilai,
-            'sistem_asal': sistem_asal.value,
-            'sistem_tujuan': sistem_tujuan.value,
-            'hasil': hasil,
-            'nilai_desimal': nilai_desimal
-        })
-        
+        self.catat_konversi(nilai, sistem_asal, sistem_tujuan, hasil, nilai_desimal,
+                            time.perf_counter() - mulai if metrik is not None else 0.0)
         return hasil
     
+    def catat_konversi(self, nilai: str, sistem_asal: SistemBilangan,
+                       sistem_tujuan: SistemBilangan, hasil: str, nilai_desimal: int,
+                       durasi: float = 0.0):
+        """
+        Mencatat konversi ke riwayat (dan metrik) tanpa menghitung ulang
+
+        Dipakai konversi() dan oleh pelaksana yang menghitung konversi di
+        proses lain (batas_waktu.PelaksanaBatasWaktu).
+        """
+        entri = EntriRiwayat(nilai, sistem_asal.value, sistem_tujuan.value, hasil, nilai_desimal)
+        self.riwayat_konversi.append(entri)
+        if self.riwayat_persisten is not None:
+            self.riwayat_persisten.tambah(entri)
+        if self.metrik is not None:
+            self.metrik.catat_konversi(sistem_asal.value, sistem_tujuan.value, durasi)
+    
+    def ke_desimal_buffer(self, data: Union[bytes, bytearray, memoryview],
+                          sistem_asal: SistemBilangan) -> int:
+        """
+        Mengkonversi numeral ASCII dari bytes/bytearray/memoryview ke desimal
+        
+        Args:
+            data (bytes | bytearray | memoryview): Numeral ASCII (huruf kecil diterima)
+            sistem_asal (SistemBilangan): Sistem bilangan asal
+            
+        Returns:
+            int: Nilai dalam sistem desimal
+        """
+        return konversi_buffer.ke_int_buffer(data, MESIN_SISTEM[sistem_asal])
+    
+    def konversi_buffer(self, data: Union[bytes, bytearray, memoryview],
+                        sistem_asal: SistemBilangan, sistem_tujuan: SistemBilangan,
+                        keluaran: Optional[Union[bytearray, memoryview]] = None,
+                        offset: int = 0) -> Union[bytes, int]:
+        """
+        Melakukan konversi numeral ASCII dari buffer ke buffer tanpa str perantara
+        
+        Konversi buffer tidak dicatat ke riwayat konversi.
+        
+        Args:
+            data (bytes | bytearray | memoryview): Numeral ASCII dalam sistem asal
+            sistem_asal (SistemBilangan): Sistem bilangan asal
+            sistem_tujuan (SistemBilangan): Sistem bilangan tujuan
+            keluaran (bytearray | memoryview, optional): Buffer tujuan milik pemanggil
+            offset (int): Posisi awal penulisan di buffer tujuan
+            
+        Returns:
+            bytes | int: Hasil ASCII jika keluaran None, selain itu jumlah byte ditulis
+        """
+        return konversi_buffer.konversi_buffer(data, MESIN_SISTEM[sistem_asal],
+                                               MESIN_SISTEM[sistem_tujuan], keluaran, offset)
+    
+    def konversi_pecahan(self, nilai: str, sistem_asal: SistemBilangan,
+                         sistem_tujuan: SistemBilangan, presisi: Optional[int] = None) -> Dict:
+        """
+        Melakukan konversi bilangan pecahan (misal '0.1' desimal ke biner)
+        
+        Args:
+            nilai (str): Nilai pecahan dengan titik sebagai pemisah
+            sistem_asal (SistemBilangan): Sistem bilangan asal
+            sistem_tujuan (SistemBilangan): Sistem bilangan tujuan
+            presisi (int, optional): Jumlah digit pecahan; default self.presisi_pecahan
+            
+        Returns:
+            Dict: Hasil terpotong, notasi periode berulang, dan galat pemotongan
+        """
+        if presisi is None:
+            presisi = self.presisi_pecahan
+        
+        return konversi_pecahan(nilai, MESIN_SISTEM[sistem_asal], MESIN_SISTEM[sistem_tujuan], presisi)
+    
     def simulasi_bit_flip(self, nilai_biner: str) -> str:
         """
         Mensimulasikan kesalahan bit flip pada nilai biner
@@ -182,7 +368,7 @@ class KonverterSistemBilangan:
             return nilai_biner
             
         # Pilih posisi bit secara acak untuk di-flip
-        posisi = random.randint(0, len(nilai_biner) - 1)
+        posisi = self.rng.randint(0, len(nilai_biner) - 1)
         bit_list = list(nilai_biner)
         
         # Flip bit (0 menjadi 1, 1 menjadi 0)
@@ -218,7 +404,7 @@ class KonverterSistemBilangan:
             kesalahan_umum.extend(kesalahan_hex)
         
         # Pilih jenis kesalahan secara acak
-        kesalahan_terpilih = random.choice(kesalahan_umum)
+        kesalahan_terpilih = self.rng.choice(kesalahan_umum)
         return kesalahan_terpilih(nilai)
     
     def simulasi_salah_interpretasi(self, nilai: str) -> Tuple[str, str]:
@@ -239,7 +425,7 @@ class KonverterSistemBilangan:
             ("Mengabaikan digit yang tidak valid", "truncated"),
         ]
         
-        kesalahan_terpilih = random.choice(interpretasi_salah)
+        kesalahan_terpilih = self.rng.choice(interpretasi_salah)
         return kesalahan_terpilih[1], kesalahan_terpilih[0]
     
     def deteksi_kesalahan_konversi(self, nilai_asal: str, hasil_konversi: str, 
@@ -257,43 +443,67 @@ class KonverterSistemBilangan:
         Returns:
             Dict: Informasi tentang kesalahan yang terdeteksi
         """
+        return self._deteksi(nilai_asal, hasil_konversi, sistem_asal, sistem_tujuan).to_dict()
+    
+    def _deteksi(self, nilai_asal: str, hasil_konversi: str,
+                 sistem_asal: SistemBilangan, sistem_tujuan: SistemBilangan) -> HasilDeteksi:
+        """Inti deteksi_kesalahan_konversi, menghasilkan HasilDeteksi"""
+        metrik = self.metrik
+        mulai = time.perf_counter() if metrik is not None else 0.0
         try:
             # Lakukan konversi yang benar untuk perbandingan
             hasil_benar = self.konversi(nilai_asal, sistem_asal, sistem_tujuan)
             
-            kesalahan_terdeteksi = {
-                'ada_kesalahan': hasil_konversi != hasil_benar,
-                'hasil_benar': hasil_benar,
-                'hasil_input': hasil_konversi,
-                'jenis_kesalahan': [],
-                'tingkat_kepercayaan': 0.0
-            }
+            kesalahan_terdeteksi = HasilDeteksi(hasil_konversi != hasil_benar, hasil_benar,
+                                                hasil_konversi)
             
-            if kesalahan_terdeteksi['ada_kesalahan']:
+            if kesalahan_terdeteksi.ada_kesalahan:
                 # Analisis jenis kesalahan
                 if len(hasil_konversi) != len(hasil_benar):
-                    kesalahan_terdeteksi['jenis_kesalahan'].append("Panjang hasil tidak sesuai")
+                    kesalahan_terdeteksi.jenis_kesalahan.append("Panjang hasil tidak sesuai")
                 
                 # Hitung perbedaan karakter
                 perbedaan = sum(1 for a, b in zip(hasil_konversi, hasil_benar) if a != b)
                 if perbedaan == 1:
-                    kesalahan_terdeteksi['jenis_kesalahan'].append("Kemungkinan kesalahan satu digit")
+                    kesalahan_terdeteksi.jenis_kesalahan.append("Kemungkinan kesalahan satu digit")
                 elif perbedaan > len(hasil_benar) * 0.5:
-                    kesalahan_terdeteksi['jenis_kesalahan'].append("Kesalahan sistematis atau salah interpretasi")
+                    kesalahan_terdeteksi.jenis_kesalahan.append("Kesalahan sistematis atau salah interpretasi")
                 
                 # Hitung tingkat kepercayaan deteksi
-                kesalahan_terdeteksi['tingkat_kepercayaan'] = min(1.0, perbedaan / len(hasil_benar))
+                kesalahan_terdeteksi.tingkat_kepercayaan = min(1.0, perbedaan / len(hasil_benar))
             
+            if metrik is not None:
+                metrik.catat_deteksi('salah' if kesalahan_terdeteksi.ada_kesalahan else 'benar',
+                                     time.perf_counter() - mulai)
             return kesalahan_terdeteksi
             
         except Exception as e:
-            return {
-                'ada_kesalahan': True,
-                'hasil_benar': 'Tidak dapat dihitung',
-                'hasil_input': hasil_konversi,
-                'jenis_kesalahan': [f"Kesalahan validasi: {str(e)}"],
-                'tingkat_kepercayaan': 1.0
-            }
+            if metrik is not None:
+                metrik.catat_deteksi('tidak_valid', time.perf_counter() - mulai)
+            return HasilDeteksi(True, 'Tidak dapat dihitung', hasil_konversi,
+                                [f"Kesalahan validasi: {str(e)}"], 1.0)
+    
+    def deteksi_kesalahan_batch(self, pasangan: Iterable[Tuple[str, str]],
+                                sistem_asal: SistemBilangan,
+                                sistem_tujuan: SistemBilangan,
+                                progres=None,
+                                token: Optional[TokenPembatalan] = None) -> Iterator[HasilDeteksi]:
+        """
+        Mendeteksi kesalahan untuk banyak pasangan (nilai_asal, hasil_konversi)
+        
+        Args:
+            pasangan (Iterable[Tuple[str, str]]): Pasangan nilai asal dan hasil
+            sistem_asal (SistemBilangan): Sistem bilangan asal
+            sistem_tujuan (SistemBilangan): Sistem bilangan tujuan
+            progres (callable, optional): Callback PeristiwaProgres
+            token (TokenPembatalan, optional): Token pembatalan
+            
+        Yields:
+            HasilDeteksi: Hasil berslot (gunakan to_dict() untuk dict)
+        """
+        pasangan = iterasi_terlacak(pasangan, 'deteksi_batch', progres, token)
+        for nilai_asal, hasil_konversi in pasangan:
+            yield self._deteksi(nilai_asal, hasil_konversi, sistem_asal, sistem_tujuan)
     
     def simulasi_kesalahan(self, nilai: str, sistem: SistemBilangan, 
                           jenis_kesalahan: JenisKesalahan) -> Tuple[str, str]:
@@ -308,6 +518,16 @@ class KonverterSistemBilangan:
         Returns:
             Tuple[str, str]: (hasil_dengan_kesalahan, penjelasan_kesalahan)
         """
+        if self.metrik is None:
+            return self._simulasi_kesalahan(nilai, sistem, jenis_kesalahan)
+        
+        mulai = time.perf_counter()
+        hasil = self._simulasi_kesalahan(nilai, sistem, jenis_kesalahan)
+        self.metrik.catat_simulasi(jenis_kesalahan.value, time.perf_counter() - mulai)
+        return hasil
+    
+    def _simulasi_kesalahan(self, nilai: str, sistem: SistemBilangan,
+                            jenis_kesalahan: JenisKesalahan) -> Tuple[str, str]:
         if jenis_kesalahan == JenisKesalahan.BIT_FLIP:
             if sistem == SistemBilangan.BINER:
                 hasil_error = self.simulasi_bit_flip(nilai)
@@ -329,7 +549,7 @@ class KonverterSistemBilangan:
         
         elif jenis_kesalahan == JenisKesalahan.OVERFLOW:
             # Simulasi overflow dengan menambah digit
-            hasil_error = nilai + str(random.randint(1, 9))
+            hasil_error = nilai + str(self.rng.randint(1, 9))
             return hasil_error, f"Simulasi overflow: {nilai} → {hasil_error}"
         
         elif jenis_kesalahan == JenisKesalahan.UNDERFLOW:
@@ -342,6 +562,198 @@ class KonverterSistemBilangan:
         
         return nilai, "Tidak ada kesalahan yang disimulasikan"
     
+    def simulasi_kesalahan_crc(self, nilai: str, sistem: SistemBilangan,
+                               jenis_kesalahan: JenisKesalahan,
+                               parameter_crc: ParameterCRC = CRC32) -> Dict:
+        """
+        Mensimulasikan kesalahan lalu memeriksa nilai hasil terhadap CRC tersimpan
+
+        CRC dihitung dari numeral ASCII sebelum kesalahan disimulasikan, seperti
+        checksum yang dikirim bersama data.
+
+        Args:
+            nilai (str): Nilai asal
+            sistem (SistemBilangan): Sistem bilangan
+            jenis_kesalahan (JenisKesalahan): Jenis kesalahan yang akan disimulasikan
+            parameter_crc (ParameterCRC): Parameter CRC (default CRC-32)
+
+        Returns:
+            Dict: Nilai asli/error, CRC tersimpan/diterima, dan status deteksi
+        """
+        mesin = mesin_crc(parameter_crc)
+        crc_tersimpan = mesin.hitung(nilai.encode('ascii'))
+        hasil_error, penjelasan = self.simulasi_kesalahan(nilai, sistem, jenis_kesalahan)
+        crc_diterima = mesin.hitung(hasil_error.encode('ascii'))
+
+        return {
+            'nilai_asli': nilai,
+            'nilai_error': hasil_error,
+            'penjelasan': penjelasan,
+            'crc': parameter_crc.nama,
+            'crc_tersimpan': crc_tersimpan,
+            'crc_diterima': crc_diterima,
+            'berubah': hasil_error != nilai,
+            'terdeteksi': crc_diterima != crc_tersimpan
+        }
+    
+    def ukur_laju_deteksi_crc(self, jumlah_sampel: int = 10000,
+                              sistem: SistemBilangan = SistemBilangan.BINER,
+                              parameter_crc: ParameterCRC = CRC32,
+                              panjang_bit: int = 32,
+                              progres=None,
+                              token: Optional[TokenPembatalan] = None) -> Dict[str, Dict]:
+        """
+        Mengukur laju deteksi CRC untuk setiap jenis kesalahan
+
+        Nilai acak sepanjang panjang_bit dirusak dengan simulasi_kesalahan lalu
+        diperiksa terhadap CRC-nya. Simulasi dijalankan pada konverter terpisah
+        agar riwayat konverter ini tidak terisi.
+
+        Args:
+            jumlah_sampel (int): Jumlah sampel per jenis kesalahan
+            sistem (SistemBilangan): Sistem bilangan nilai sampel
+            parameter_crc (ParameterCRC): Parameter CRC (default CRC-32)
+            panjang_bit (int): Panjang nilai sampel dalam bit
+            progres (callable, optional): Callback PeristiwaProgres
+                (total = jumlah_sampel x jumlah jenis kesalahan)
+            token (TokenPembatalan, optional): Token pembatalan; diperiksa tiap
+                256 sampel, lalu OperasiDibatalkan dilempar
+
+        Returns:
+            Dict[str, Dict]: Per jenis kesalahan: 'sampel', 'berubah',
+                'terdeteksi', 'tidak_terdeteksi', dan 'laju_deteksi' (None jika
+                tidak ada nilai yang berubah)
+        """
+        if jumlah_sampel <= 0 or panjang_bit <= 0:
+            raise ValueError("Jumlah sampel dan panjang bit harus positif")
+
+        mesin = mesin_crc(parameter_crc)
+        mesin_sistem = MESIN_SISTEM[sistem]
+        penguji = KonverterSistemBilangan(seed=self.rng.getrandbits(64))
+        bit_atas = 1 << (panjang_bit - 1)
+        pelacak = PelacakProgres('laju_deteksi_crc', jumlah_sampel * len(JenisKesalahan),
+                                 progres, token)
+        dilacak = progres is not None or token is not None
+        hasil = {}
+
+        for jenis in JenisKesalahan:
+            berubah = terdeteksi = 0
+            for indeks in range(jumlah_sampel):
+                if dilacak and not indeks & 0xFF:
+                    pelacak.maju(min(256, jumlah_sampel - indeks))
+                nilai = mesin_sistem.dari_int(self.rng.getrandbits(panjang_bit) | bit_atas)
+                hasil_error, _ = penguji.simulasi_kesalahan(nilai, sistem, jenis)
+                penguji.riwayat_konversi.clear()
+                if hasil_error == nilai:
+                    continue
+                berubah += 1
+                if mesin.hitung(hasil_error.encode('ascii')) != mesin.hitung(nilai.encode('ascii')):
+                    terdeteksi += 1
+
+            hasil[jenis.value] = {
+                'sampel': jumlah_sampel,
+                'berubah': berubah,
+                'terdeteksi': terdeteksi,
+                'tidak_terdeteksi': berubah - terdeteksi,
+                'laju_deteksi': terdeteksi / berubah if berubah else None
+            }
+
+        pelacak.tuntas()
+        return hasil
+    
+    def simulasi_koreksi_hamming(self, nilai: str, sistem: SistemBilangan,
+                                 kode: KodeHamming = HAMMING_7_4) -> Dict:
+        """
+        Mengenkode nilai dengan kode Hamming, mensimulasikan bit flip pada
+        kode, lalu mendekode dan mengoreksinya
+
+        Nilai dipecah menjadi blok k bit; setiap blok dienkode menjadi n bit
+        dan seluruh kode dirangkai sebagai string biner untuk simulasi_bit_flip.
+
+        Args:
+            nilai (str): Nilai asal
+            sistem (SistemBilangan): Sistem bilangan
+            kode (KodeHamming): Kode koreksi (default Hamming(7,4))
+
+        Returns:
+            Dict: Kode sebelum/sesudah bit flip, nilai hasil dekode, status per
+                blok, dan 'dipulihkan' (True jika nilai kembali benar)
+        """
+        desimal = self.ke_desimal(nilai, sistem)
+        jumlah_blok = max(1, -(-desimal.bit_length() // kode.k))
+
+        kode_biner = ''.join(
+            format(kode.enkode((desimal >> (kode.k * i)) & kode.mask_data), f'0{kode.n}b')
+            for i in reversed(range(jumlah_blok))
+        )
+        kode_error = self.simulasi_bit_flip(kode_biner)
+
+        hasil_desimal = 0
+        status_blok = []
+        for i in range(0, len(kode_error), kode.n):
+            data, status = kode.dekode(int(kode_error[i:i + kode.n], 2))
+            hasil_desimal = (hasil_desimal << kode.k) | data
+            status_blok.append(status)
+
+        return {
+            'nilai_asli': nilai,
+            'kode': kode.nama,
+            'kode_biner': kode_biner,
+            'kode_error': kode_error,
+            'nilai_dekode': self.dari_desimal(hasil_desimal, sistem),
+            'status_blok': status_blok,
+            'dipulihkan': hasil_desimal == desimal
+        }
+    
+    def simulasi_kanal(self, daftar_nilai: List[str], sistem: SistemBilangan,
+                       kanal: Kanal, seed=None) -> Dict:
+        """
+        Mengirim sekumpulan nilai melalui model kanal dan mendekodenya kembali
+
+        Setiap nilai dikonversi ke biner dengan lebar tetap (lebar nilai
+        terbesar), dirangkai menjadi satu array bit, dikirim melalui kanal,
+        lalu dipecah dan dibaca kembali dengan ke_desimal.
+
+        Args:
+            daftar_nilai (List[str]): Nilai yang dikirim
+            sistem (SistemBilangan): Sistem bilangan nilai
+            kanal (Kanal): Model kanal (KanalBSC atau KanalGilbertElliott)
+            seed (int, optional): Seed generator acak
+
+        Returns:
+            Dict: Statistik kesalahan (BER, distribusi burst) ditambah
+                'nilai_diterima', 'nilai_terpengaruh', 'selisih_rata_rata',
+                dan 'selisih_maksimum' (selisih absolut nilai desimal)
+        """
+        pastikan_numpy("simulasi kanal")
+        if not daftar_nilai:
+            raise ValueError("Daftar nilai tidak boleh kosong")
+
+        desimal = [self.ke_desimal(nilai, sistem) for nilai in daftar_nilai]
+        lebar = max(1, max(d.bit_length() for d in desimal))
+        teks_bit = ''.join(format(d, f'0{lebar}b') for d in desimal).encode('ascii')
+
+        bit = np.frombuffer(teks_bit, dtype=np.uint8) - ord('0')
+        diterima, pola = kanal.kirim(bit, seed)
+        teks_diterima = (diterima + ord('0')).astype(np.uint8).tobytes().decode('ascii')
+
+        desimal_diterima = [
+            self.ke_desimal(teks_diterima[i:i + lebar], SistemBilangan.BINER)
+            for i in range(0, len(teks_diterima), lebar)
+        ]
+        selisih = [abs(a - b) for a, b in zip(desimal, desimal_diterima)]
+
+        hasil = statistik_kesalahan(pola)
+        hasil.update({
+            'kanal': kanal.nama,
+            'lebar_bit': lebar,
+            'nilai_diterima': [self.dari_desimal(d, sistem) for d in desimal_diterima],
+            'nilai_terpengaruh': sum(1 for s in selisih if s),
+            'selisih_rata_rata': sum(selisih) / len(selisih),
+            'selisih_maksimum': max(selisih)
+        })
+        return hasil
+    
     def tampilkan_tabel_konversi(self, nilai: str, sistem_asal: SistemBilangan) -> Dict[str, str]:
         """
         Membuat tabel konversi lengkap untuk satu nilai ke semua sistem bilangan
@@ -353,22 +765,129 @@ class KonverterSistemBilangan:
         Returns:
             Dict[str, str]: Dictionary dengan hasil konversi ke semua sistem
         """
-        hasil_konversi = {}
+        return self._baris_tabel(nilai, sistem_asal).to_dict()
+    
+    def _baris_tabel(self, nilai: str, sistem_asal: SistemBilangan) -> BarisTabel:
+        """Inti tampilkan_tabel_konversi, menghasilkan BarisTabel"""
+        baris = BarisTabel()
         
         try:
             for sistem_tujuan in SistemBilangan:
                 if sistem_tujuan == sistem_asal:
-                    hasil_konversi[sistem_tujuan.value] = nilai
+                    setattr(baris, sistem_tujuan.value, nilai)
                 else:
-                    hasil_konversi[sistem_tujuan.value] = self.konversi(nilai, sistem_asal, sistem_tujuan)
+                    setattr(baris, sistem_tujuan.value,
+                            self.konversi(nilai, sistem_asal, sistem_tujuan))
         
         except Exception as e:
-            hasil_konversi['error'] = str(e)
+            baris.error = str(e)
         
-        return hasil_konversi
+        return baris
+    
+    def tabel_konversi_batch(self, daftar_nilai: Iterable[str],
+                             sistem_asal: SistemBilangan,
+                             progres=None,
+                             token: Optional[TokenPembatalan] = None) -> Iterator[BarisTabel]:
+        """
+        Membuat baris tabel konversi untuk banyak nilai
+        
+        Args:
+            daftar_nilai (Iterable[str]): Nilai yang akan dikonversi
+            sistem_asal (SistemBilangan): Sistem bilangan asal
+            progres (callable, optional): Callback PeristiwaProgres
+            token (TokenPembatalan, optional): Token pembatalan
+            
+        Yields:
+            BarisTabel: Hasil berslot (gunakan to_dict() untuk dict)
+        """
+        daftar_nilai = iterasi_terlacak(daftar_nilai, 'tabel_batch', progres, token)
+        for nilai in daftar_nilai:
+            yield self._baris_tabel(nilai, sistem_asal)
+    
+    def tabel_konversi_rentang(self, nilai_awal: str, nilai_akhir: str,
+                               sistem_asal: SistemBilangan,
+                               progres=None,
+                               token: Optional[TokenPembatalan] = None) -> Iterator[Tuple[str, ...]]:
+        """
+        Membuat tabel konversi untuk setiap nilai dalam rentang [nilai_awal, nilai_akhir]
+        
+        Batas rentang hanya di-parse sekali; setiap kolom dihasilkan oleh pencacah
+        digit di basisnya sendiri. Baris tidak dicatat ke riwayat konversi.
+        
+        Args:
+            nilai_awal (str): Nilai awal rentang
+            nilai_akhir (str): Nilai akhir rentang (inklusif)
+            sistem_asal (SistemBilangan): Sistem bilangan kedua batas rentang
+            progres (callable, optional): Callback PeristiwaProgres
+            token (TokenPembatalan, optional): Token pembatalan; diperiksa tiap
+                1024 baris karena baris rentang sangat murah
+            
+        Returns:
+            Iterator[Tuple[str, ...]]: Generator baris (biner, desimal, heksadesimal, oktal)
+        """
+        awal = self.ke_desimal(nilai_awal, sistem_asal)
+        akhir = self.ke_desimal(nilai_akhir, sistem_asal)
+        return iterasi_terlacak(generator_tabel_rentang(awal, akhir), 'tabel_rentang',
+                                progres, token, total=max(akhir - awal + 1, 0), langkah=1024)
+    
+    def dari_desimal_bertanda(self, nilai_desimal: int, sistem_tujuan: SistemBilangan,
+                              lebar: int = 8,
+                              representasi: RepresentasiBertanda = RepresentasiBertanda.KOMPLEMEN_DUA,
+                              bias: Optional[int] = None) -> str:
+        """
+        Mengkonversi nilai desimal bertanda ke pola lebar tetap dalam sistem tujuan
+        
+        Args:
+            nilai_desimal (int): Nilai desimal (boleh negatif)
+            sistem_tujuan (SistemBilangan): Sistem bilangan tujuan
+            lebar (int): Jumlah bit (8/16/32/64 atau sembarang)
+            representasi (RepresentasiBertanda): Representasi bertanda
+            bias (int, optional): Bias K untuk excess-K
+            
+        Returns:
+            str: Pola bit dalam sistem tujuan, diisi nol sampai lebar penuh
+                (kecuali desimal)
+        """
+        pola = enkode_bertanda(nilai_desimal, lebar, representasi, bias)
+        hasil = self.dari_desimal(pola, sistem_tujuan)
+        
+        bit_per_digit = MESIN_SISTEM[sistem_tujuan].bit_per_digit
+        if bit_per_digit:
+            hasil = hasil.zfill(-(-lebar // bit_per_digit))
+        return hasil
+    
+    def ke_desimal_bertanda(self, nilai: str, sistem_asal: SistemBilangan,
+                            lebar: int = 8,
+                            representasi: RepresentasiBertanda = RepresentasiBertanda.KOMPLEMEN_DUA,
+                            bias: Optional[int] = None) -> int:
+        """
+        Membaca pola lebar tetap dalam sistem asal sebagai nilai bertanda
+        
+        Args:
+            nilai (str): Pola bit dalam sistem asal (misal 'FF' heksadesimal)
+            sistem_asal (SistemBilangan): Sistem bilangan asal
+            lebar (int): Jumlah bit
+            representasi (RepresentasiBertanda): Representasi bertanda
+            bias (int, optional): Bias K untuk excess-K
+            
+        Returns:
+            int: Nilai desimal bertanda
+        """
+        return dekode_bertanda(self.ke_desimal(nilai, sistem_asal), lebar, representasi, bias)
+    
+    def _hitung_operasi(self, des1: int, des2: int, operasi: str, bertanda: bool = False) -> int:
+        """
+        Menghitung operasi aritmatika pada dua nilai desimal
+        
+        Pada mode bertanda, pembagian dan modulo mengikuti semantik register
+        (pembulatan ke arah nol, sisa bertanda sama dengan pembilang).
+        """
+        return hitung_operasi(des1, des2, operasi, bertanda)
     
     def operasi_aritmatika(self, nilai1: str, nilai2: str, operasi: str, 
-                          sistem: SistemBilangan) -> Dict:
+                          sistem: SistemBilangan,
+                          representasi: Optional[RepresentasiBertanda] = None,
+                          lebar: int = 8, bias: Optional[int] = None) -> Dict:
         """
         Melakukan operasi aritmatika pada dua nilai dalam sistem bilangan tertentu
         
@@ -377,49 +896,179 @@ class KonverterSistemBilangan:
             nilai2 (str): Nilai kedua
             operasi (str): Jenis operasi (+, -, *, /, %, **)
             sistem (SistemBilangan): Sistem bilangan yang digunakan
+            representasi (RepresentasiBertanda, optional): Jika diberikan, operand dan
+                hasil dibaca sebagai pola bertanda lebar tetap sehingga hasil negatif
+                diperbolehkan
+            lebar (int): Jumlah bit untuk mode bertanda
+            bias (int, optional): Bias K untuk excess-K
             
         Returns:
             Dict: Hasil operasi dan informasi tambahan
         """
+        return self._operasi(nilai1, nilai2, operasi, sistem, representasi, lebar, bias).to_dict()
+    
+    def _operasi(self, nilai1: str, nilai2: str, operasi: str, sistem: SistemBilangan,
+                 representasi: Optional[RepresentasiBertanda] = None,
+                 lebar: int = 8, bias: Optional[int] = None) -> HasilOperasi:
+        """Inti operasi_aritmatika, menghasilkan HasilOperasi"""
         try:
-            # Konversi ke desimal untuk perhitungan
-            des1 = self.ke_desimal(nilai1, sistem)
-            des2 = self.ke_desimal(nilai2, sistem)
-            
-            # Lakukan operasi
-            if operasi == '+':
-                hasil_desimal = des1 + des2
-            elif operasi == '-':
-                hasil_desimal = des1 - des2
-            elif operasi == '*':
-                hasil_desimal = des1 * des2
-            elif operasi == '/':
-                if des2 == 0:
-                    raise ValueError("Pembagian dengan nol tidak diperbolehkan")
-                hasil_desimal = des1 // des2  # Pembagian integer
-            elif operasi == '%':
-                if des2 == 0:
-                    raise ValueError("Modulo dengan nol tidak diperbolehkan")
-                hasil_desimal = des1 % des2
-            elif operasi == '**':
-                if des2 > 20:  # Batasi eksponen untuk mencegah hasil yang terlalu besar
-                    raise ValueError("Eksponen terlalu besar (maksimal 20)")
-                hasil_desimal = des1 ** des2
+            if representasi is None:
+                # Konversi ke desimal untuk perhitungan
+                des1 = self.ke_desimal(nilai1, sistem)
+                des2 = self.ke_desimal(nilai2, sistem)
+                
+                hasil_desimal = self._hitung_operasi(des1, des2, operasi)
+                
+                if hasil_desimal < 0:
+                    raise ValueError("Hasil negatif tidak didukung dalam program ini")
+                
+                # Konversi hasil kembali ke sistem asal
+                hasil_sistem = self.dari_desimal(hasil_desimal, sistem)
             else:
-                raise ValueError(f"Operasi '{operasi}' tidak didukung")
+                des1 = self.ke_desimal_bertanda(nilai1, sistem, lebar, representasi, bias)
+                des2 = self.ke_desimal_bertanda(nilai2, sistem, lebar, representasi, bias)
+                
+                hasil_desimal = self._hitung_operasi(des1, des2, operasi, bertanda=True)
+                hasil_sistem = self.dari_desimal_bertanda(hasil_desimal, sistem, lebar,
+                                                          representasi, bias)
             
-            if hasil_desimal < 0:
-                raise ValueError("Hasil negatif tidak didukung dalam program ini")
+            return HasilOperasi(
+                berhasil=True,
+                hasil_desimal=hasil_desimal,
+                hasil_sistem=hasil_sistem,
+                operasi=f"{nilai1} {operasi} {nilai2}",
+                sistem=sistem.value,
+                representasi=(f"{representasi.value} {lebar} bit"
+                              if representasi is not None else None)
+            )
             
-            # Konversi hasil kembali ke sistem asal
-            hasil_sistem = self.dari_desimal(hasil_desimal, sistem)
+        except Exception as e:
+            return HasilOperasi(
+                berhasil=False,
+                error=str(e),
+                operasi=f"{nilai1} {operasi} {nilai2}",
+                sistem=sistem.value
+            )
+    
+    def operasi_aritmatika_batch(self, pasangan: Iterable[Tuple[str, str]], operasi: str,
+                                 sistem: SistemBilangan,
+                                 representasi: Optional[RepresentasiBertanda] = None,
+                                 lebar: int = 8,
+                                 bias: Optional[int] = None,
+                                 progres=None,
+                                 token: Optional[TokenPembatalan] = None) -> Iterator[HasilOperasi]:
+        """
+        Melakukan operasi aritmatika untuk banyak pasangan operand
+        
+        Args:
+            pasangan (Iterable[Tuple[str, str]]): Pasangan (nilai1, nilai2)
+            operasi (str): Jenis operasi (+, -, *, /, %, **)
+            sistem (SistemBilangan): Sistem bilangan yang digunakan
+            representasi (RepresentasiBertanda, optional): Mode bertanda
+            lebar (int): Jumlah bit untuk mode bertanda
+            bias (int, optional): Bias K untuk excess-K
+            progres (callable, optional): Callback PeristiwaProgres
+            token (TokenPembatalan, optional): Token pembatalan
+            
+        Yields:
+            HasilOperasi: Hasil berslot (gunakan to_dict() untuk dict)
+        """
+        pasangan = iterasi_terlacak(pasangan, 'aritmatika_batch', progres, token)
+        for nilai1, nilai2 in pasangan:
+            yield self._operasi(nilai1, nilai2, operasi, sistem, representasi, lebar, bias)
+    
+    def operasi_bitwise(self, nilai1: str, nilai2: Optional[str], operasi: str,
+                        sistem: SistemBilangan, lebar: Optional[int] = None,
+                        sistem_tujuan: Optional[SistemBilangan] = None) -> Dict:
+        """
+        Melakukan operasi bitwise (&, |, ^, ~, <<, >>, rol, ror) pada dua nilai
+        
+        Untuk operand di file berukuran besar, gunakan operasi_bitwise.bitwise_berkas
+        yang memproses numeral per potongan digit tanpa mem-parse seluruhnya.
+        
+        Args:
+            nilai1 (str): Nilai pertama
+            nilai2 (str, optional): Nilai kedua, atau jumlah geser/rotasi dalam sistem
+                yang sama; diabaikan untuk '~'
+            operasi (str): Jenis operasi bitwise
+            sistem (SistemBilangan): Sistem bilangan operand
+            lebar (int, optional): Lebar register dalam bit; default untuk '~' dan
+                rotasi adalah lebar digit nilai1 (misal 'F0' heksadesimal = 8 bit)
+            sistem_tujuan (SistemBilangan, optional): Sistem hasil (default: sistem)
+            
+        Returns:
+            Dict: Hasil operasi dengan kunci yang sama seperti operasi_aritmatika
+        """
+        sistem_tujuan = sistem_tujuan or sistem
+        teks_operasi = f"{operasi}{nilai1}" if operasi == '~' else f"{nilai1} {operasi} {nilai2}"
+        try:
+            des1 = self.ke_desimal(nilai1, sistem)
+            des2 = 0 if operasi == '~' else self.ke_desimal(nilai2, sistem)
+            if lebar is None and operasi in ('~', 'rol', 'ror'):
+                bit_per_digit = MESIN_SISTEM[sistem].bit_per_digit
+                lebar = (len(nilai1.strip()) * bit_per_digit if bit_per_digit
+                         else max(des1.bit_length(), 1))
+            hasil_desimal = hitung_bitwise(des1, des2, operasi, lebar)
+            return HasilOperasi(
+                berhasil=True,
+                hasil_desimal=hasil_desimal,
+                hasil_sistem=self.dari_desimal(hasil_desimal, sistem_tujuan),
+                operasi=teks_operasi,
+                sistem=sistem_tujuan.value
+            ).to_dict()
+        except Exception as e:
+            return HasilOperasi(berhasil=False, error=str(e), operasi=teks_operasi,
+                                sistem=sistem.value).to_dict()
+    
+    def operasi_lebar_tetap(self, nilai1: str, nilai2: str, operasi: str,
+                            sistem: SistemBilangan, lebar: int = 8, bertanda: bool = False,
+                            mode: ModeLuapan = ModeLuapan.WRAP) -> Dict:
+        """
+        Melakukan operasi aritmatika pada register lebar tetap
+        
+        Berbeda dengan simulasi OVERFLOW/UNDERFLOW yang hanya menambah atau
+        membuang digit, hasil di sini dibungkus atau dijenuhkan seperti register
+        prosesor, disertai flag carry, overflow, dan underflow.
+        
+        Args:
+            nilai1 (str): Pola bit operand pertama dalam sistem
+            nilai2 (str): Pola bit operand kedua dalam sistem
+            operasi (str): Jenis operasi (+, -, *, /, %, **)
+            sistem (SistemBilangan): Sistem bilangan yang digunakan
+            lebar (int): Lebar register (8, 16, 32, atau 64)
+            bertanda (bool): Baca pola sebagai komplemen dua
+            mode (ModeLuapan): Wrap atau saturasi
+            
+        Returns:
+            Dict: Hasil operasi seperti operasi_aritmatika ditambah 'register'
+                dan flag 'carry', 'overflow', 'underflow'
+        """
+        try:
+            register = RegisterLebarTetap(lebar, bertanda, mode)
+            if bertanda:
+                des1 = self.ke_desimal_bertanda(nilai1, sistem, lebar)
+                des2 = self.ke_desimal_bertanda(nilai2, sistem, lebar)
+            else:
+                des1 = self.ke_desimal(nilai1, sistem)
+                des2 = self.ke_desimal(nilai2, sistem)
+            
+            hasil_register = register.hitung(des1, des2, operasi)
+            hasil_sistem = self.dari_desimal(hasil_register['pola'], sistem)
+            bit_per_digit = MESIN_SISTEM[sistem].bit_per_digit
+            if bit_per_digit:
+                hasil_sistem = hasil_sistem.zfill(-(-lebar // bit_per_digit))
             
             return {
                 'berhasil': True,
-                'hasil_desimal': hasil_desimal,
+                'hasil_desimal': hasil_register['hasil'],
                 'hasil_sistem': hasil_sistem,
                 'operasi': f"{nilai1} {operasi} {nilai2}",
-                'sistem': sistem.value
+                'sistem': sistem.value,
+                'register': register.nama,
+                'hasil_tepat': hasil_register['hasil_tepat'],
+                'carry': hasil_register['carry'],
+                'overflow': hasil_register['overflow'],
+                'underflow': hasil_register['underflow']
             }
             
         except Exception as e:
@@ -438,15 +1087,39 @@ class InterfacePengguna:
     Menyediakan menu interaktif dan antarmuka yang user-friendly
     """
     
-    def __init__(self):
-        """Inisialisasi interface dengan konverter"""
-        self.konverter = KonverterSistemBilangan()
+    def __init__(self, metrik: Optional[MetrikKonverter] = None,
+                 tabel: Optional[TabelPrakomputasi] = None,
+                 batas_riwayat: Optional[int] = BATAS_RIWAYAT_DEFAULT):
+        """
+        Inisialisasi interface dengan konverter
+
+        Args:
+            metrik (MetrikKonverter, optional): Metrik yang diteruskan ke konverter
+            tabel (TabelPrakomputasi, optional): Tabel prakomputasi untuk konverter
+            batas_riwayat (int, optional): Jumlah entri riwayat terbaru yang disimpan
+                konverter; None = tanpa batas
+        """
+        self.konverter = KonverterSistemBilangan(metrik=metrik, tabel=tabel,
+                                                 batas_riwayat=batas_riwayat)
         self.sistem_map = {
             '1': SistemBilangan.BINER,
             '2': SistemBilangan.DESIMAL,
             '3': SistemBilangan.OKTAL,
             '4': SistemBilangan.HEKSADESIMAL
         }
+        self.perintah_skrip = {
+            'convert': self._skrip_konversi, 'konversi': self._skrip_konversi,
+            'table': self._skrip_tabel, 'tabel': self._skrip_tabel,
+            'arith': self._skrip_aritmatika, 'aritmatika': self._skrip_aritmatika,
+            'bitwise': self._skrip_bitwise,
+            'simulate': self._skrip_simulasi, 'simulasi': self._skrip_simulasi,
+            'detect': self._skrip_deteksi, 'deteksi': self._skrip_deteksi,
+            'range': self._skrip_rentang, 'rentang': self._skrip_rentang,
+            'crc': self._skrip_crc,
+        }
+        # Progres dan token jalankan_skrip yang sedang berjalan, untuk perintah panjang
+        self._progres_skrip = None
+        self._token_skrip = None
         
     def tampilkan_header(self):
         """Menampilkan header program"""
@@ -834,6 +1507,182 @@ class InterfacePengguna:
         print("   • Tekan Ctrl+C kapan saja untuk kembali ke menu")
         print("   • Masukkan 0 untuk kembali ke menu sebelumnya")
     
+    # ===== MODE SKRIP (NON-INTERAKTIF) =====
+    
+    def _sistem_skrip(self, teks: str) -> SistemBilangan:
+        """Membaca nama sistem di skrip: nama lengkap, singkatan, atau nomor menu"""
+        teks = teks.lower()
+        if teks in self.sistem_map:
+            return self.sistem_map[teks]
+        sistem = ALIAS_SISTEM.get(teks)
+        if sistem is None:
+            raise ValueError(f"Sistem bilangan '{teks}' tidak dikenal")
+        return sistem
+    
+    @staticmethod
+    def _cek_argumen(argumen: List[str], jumlah: int, format_perintah: str):
+        """Memastikan jumlah argumen perintah sesuai"""
+        if len(argumen) != jumlah:
+            raise ValueError(f"Format: {format_perintah}")
+    
+    def _skrip_konversi(self, argumen: List[str]) -> str:
+        """convert <nilai> <sistem_asal> <sistem_tujuan>"""
+        self._cek_argumen(argumen, 3, "convert <nilai> <sistem_asal> <sistem_tujuan>")
+        return self.konverter.konversi(argumen[0], self._sistem_skrip(argumen[1]),
+                                       self._sistem_skrip(argumen[2]))
+    
+    def _skrip_tabel(self, argumen: List[str]) -> str:
+        """table <nilai> <sistem>"""
+        self._cek_argumen(argumen, 2, "table <nilai> <sistem>")
+        tabel = self.konverter.tampilkan_tabel_konversi(argumen[0], self._sistem_skrip(argumen[1]))
+        if 'error' in tabel:
+            raise ValueError(tabel['error'])
+        return ' '.join(f"{sistem}={nilai}" for sistem, nilai in tabel.items())
+    
+    def _skrip_aritmatika(self, argumen: List[str]) -> str:
+        """arith <nilai1> <operasi> <nilai2> <sistem>"""
+        self._cek_argumen(argumen, 4, "arith <nilai1> <operasi> <nilai2> <sistem>")
+        hasil = self.konverter.operasi_aritmatika(argumen[0], argumen[2], argumen[1],
+                                                  self._sistem_skrip(argumen[3]))
+        if not hasil['berhasil']:
+            raise ValueError(hasil['error'])
+        return f"{hasil['hasil_sistem']} (desimal {hasil['hasil_desimal']})"
+    
+    def _skrip_bitwise(self, argumen: List[str]) -> str:
+        """bitwise <nilai1> <operasi> <nilai2|-> <sistem> [sistem_tujuan]"""
+        if len(argumen) not in (4, 5):
+            raise ValueError("Format: bitwise <nilai1> <operasi> <nilai2|-> <sistem> [sistem_tujuan]")
+        sistem = self._sistem_skrip(argumen[3])
+        sistem_tujuan = self._sistem_skrip(argumen[4]) if len(argumen) == 5 else None
+        hasil = self.konverter.operasi_bitwise(argumen[0], None if argumen[2] == '-' else argumen[2],
+                                               argumen[1], sistem, sistem_tujuan=sistem_tujuan)
+        if not hasil['berhasil']:
+            raise ValueError(hasil['error'])
+        return f"{hasil['hasil_sistem']} (desimal {hasil['hasil_desimal']})"
+    
+    def _skrip_simulasi(self, argumen: List[str]) -> str:
+        """simulate <nilai> <sistem> <jenis_kesalahan>"""
+        self._cek_argumen(argumen, 3, "simulate <nilai> <sistem> <jenis_kesalahan>")
+        try:
+            jenis = JenisKesalahan(argumen[2].lower())
+        except ValueError:
+            pilihan = ', '.join(j.value for j in JenisKesalahan)
+            raise ValueError(f"Jenis kesalahan '{argumen[2]}' tidak dikenal ({pilihan})")
+        hasil_error, penjelasan = self.konverter.simulasi_kesalahan(
+            argumen[0], self._sistem_skrip(argumen[1]), jenis)
+        return f"{hasil_error}\t{penjelasan}"
+    
+    def _skrip_deteksi(self, argumen: List[str]) -> str:
+        """detect <nilai_asal> <hasil> <sistem_asal> <sistem_tujuan>"""
+        self._cek_argumen(argumen, 4, "detect <nilai_asal> <hasil> <sistem_asal> <sistem_tujuan>")
+        sistem_tujuan = self._sistem_skrip(argumen[3])
+        hasil_input = argumen[1].upper() if sistem_tujuan == SistemBilangan.HEKSADESIMAL else argumen[1]
+        analisis = self.konverter.deteksi_kesalahan_konversi(
+            argumen[0], hasil_input, self._sistem_skrip(argumen[2]), sistem_tujuan)
+        if not analisis['ada_kesalahan']:
+            return "BENAR"
+        return (f"SALAH (benar: {analisis['hasil_benar']}, "
+                f"kepercayaan {analisis['tingkat_kepercayaan']:.1%})")
+    
+    def _skrip_rentang(self, argumen: List[str]) -> str:
+        """range <awal> <akhir> <sistem> <file_csv>"""
+        self._cek_argumen(argumen, 4, "range <awal> <akhir> <sistem> <file_csv>")
+        baris = self.konverter.tabel_konversi_rentang(argumen[0], argumen[1],
+                                                      self._sistem_skrip(argumen[2]),
+                                                      self._progres_skrip, self._token_skrip)
+        with open(argumen[3], 'w', newline='', encoding='utf-8') as berkas:
+            jumlah = tulis_csv(baris, berkas)
+        return f"{jumlah} baris ditulis ke {argumen[3]}"
+    
+    def _skrip_crc(self, argumen: List[str]) -> str:
+        """crc <jumlah_sampel>"""
+        self._cek_argumen(argumen, 1, "crc <jumlah_sampel>")
+        try:
+            jumlah_sampel = int(argumen[0])
+        except ValueError:
+            raise ValueError(f"Jumlah sampel '{argumen[0]}' bukan bilangan bulat")
+        hasil = self.konverter.ukur_laju_deteksi_crc(jumlah_sampel, progres=self._progres_skrip,
+                                                     token=self._token_skrip)
+        return ' '.join(f"{nama}={statistik['laju_deteksi']:.2%}"
+                        if statistik['laju_deteksi'] is not None else f"{nama}=-"
+                        for nama, statistik in hasil.items())
+    
+    def jalankan_skrip(self, sumber: TextIO, keluaran: Optional[TextIO] = None,
+                       tampilkan_waktu: bool = True, ukuran_buffer: int = 1024,
+                       progres=None, token: Optional[TokenPembatalan] = None) -> Dict:
+        """
+        Menjalankan perintah dari skrip tanpa prompt input()
+        
+        Setiap baris berisi satu perintah (convert, table, arith, bitwise,
+        simulate, detect, range, crc, atau padanan Indonesianya); baris kosong dan
+        baris yang diawali '#' diabaikan. Semua perintah dijalankan pada konverter yang sama dan
+        keluaran ditulis per kelompok baris, bukan per print().
+        
+        Args:
+            sumber (TextIO): File atau stdin berisi perintah
+            keluaran (TextIO, optional): Tujuan keluaran (default stdout)
+            tampilkan_waktu (bool): Tambahkan waktu eksekusi per perintah
+            ukuran_buffer (int): Jumlah baris keluaran sebelum ditulis
+            progres (callable, optional): Callback PeristiwaProgres per perintah;
+                juga diteruskan ke perintah panjang (range, crc)
+            token (TokenPembatalan, optional): Token pembatalan, diperiksa tiap
+                perintah dan di dalam perintah panjang
+            
+        Returns:
+            Dict: 'perintah', 'berhasil', 'gagal', dan 'waktu_total' (detik)
+            
+        Raises:
+            OperasiDibatalkan: Jika token dibatalkan; hasil perintah yang sudah
+                selesai tetap ditulis
+        """
+        keluaran = keluaran or sys.stdout
+        buffer = []
+        ringkasan = {'perintah': 0, 'berhasil': 0, 'gagal': 0, 'waktu_total': 0.0}
+        pelacak = PelacakProgres('skrip', None, progres, token)
+        self._progres_skrip, self._token_skrip = progres, token
+        dibatalkan = False
+        
+        try:
+            for nomor, baris in enumerate(sumber, 1):
+                bagian = baris.split()
+                if not bagian or bagian[0].startswith('#'):
+                    continue
+                
+                ringkasan['perintah'] += 1
+                mulai = time.perf_counter()
+                try:
+                    perintah = self.perintah_skrip.get(bagian[0].lower())
+                    if perintah is None:
+                        raise ValueError(f"Perintah '{bagian[0]}' tidak dikenal")
+                    teks = perintah(bagian[1:])
+                    ringkasan['berhasil'] += 1
+                except OperasiDibatalkan:
+                    ringkasan['perintah'] -= 1
+                    raise
+                except Exception as e:
+                    teks = f"❌ baris {nomor}: {e}"
+                    ringkasan['gagal'] += 1
+                durasi = time.perf_counter() - mulai
+                ringkasan['waktu_total'] += durasi
+                
+                buffer.append(f"{teks}\t[{durasi * 1000:.3f} ms]" if tampilkan_waktu else teks)
+                if len(buffer) >= ukuran_buffer:
+                    keluaran.write('\n'.join(buffer) + '\n')
+                    buffer.clear()
+                pelacak.maju()
+        except OperasiDibatalkan:
+            dibatalkan = True
+            raise
+        finally:
+            self._progres_skrip = self._token_skrip = None
+            buffer.append(f"# {ringkasan['perintah']} perintah, {ringkasan['berhasil']} berhasil, "
+                          f"{ringkasan['gagal']} gagal, {ringkasan['waktu_total'] * 1000:.3f} ms"
+                          + (", dibatalkan" if dibatalkan else ""))
+            keluaran.write('\n'.join(buffer) + '\n')
+            keluaran.flush()
+        pelacak.tuntas()
+        return ringkasan
+    
     def jalankan(self):
         """Menjalankan program utama"""
         self.tampilkan_header()
@@ -930,10 +1779,80 @@ if __name__ == "__main__":
     """
     Fungsi main untuk menjalankan program
     
-    Program dapat dijalankan dalam dua mode:
+    Program dapat dijalankan dalam tiga mode:
     1. Mode interaktif (default): Interface pengguna lengkap
     2. Mode demo: Demonstrasi otomatis fitur-fitur program
+    3. Mode skrip: --skrip <file> (atau --skrip - untuk stdin) menjalankan
+       perintah tanpa prompt
+    
+    --metrik-port dan --metrik-file mengaktifkan metrik Prometheus (endpoint
+    HTTP lokal /metrics atau file yang ditulis saat program selesai).
+    --tabel memakai tabel prakomputasi memory-mapped untuk nilai < 2^16
+    (dibangun otomatis jika belum ada). --batas-riwayat membatasi riwayat
+    konversi di memori (0 = tanpa batas) agar skrip panjang tidak menumpuk
+    entri tanpa batas.
     """
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Simulator Sistem Bilangan")
+    parser.add_argument('--skrip', metavar='FILE',
+                        help="Jalankan perintah dari file ('-' untuk stdin) tanpa prompt")
+    parser.add_argument('--tanpa-waktu', action='store_true',
+                        help="Jangan tampilkan waktu per perintah di mode skrip")
+    parser.add_argument('--tanpa-progres', action='store_true',
+                        help="Jangan tampilkan bilah progres di stderr di mode skrip")
+    parser.add_argument('--metrik-port', type=int, metavar='PORT',
+                        help="Layani metrik Prometheus di http://127.0.0.1:PORT/metrics")
+    parser.add_argument('--metrik-file', metavar='FILE',
+                        help="Tulis metrik Prometheus ke FILE saat program selesai")
+    parser.add_argument('--tabel', metavar='FILE', nargs='?', const='',
+                        help="Pakai tabel prakomputasi 16 bit (default di folder data aplikasi)")
+    parser.add_argument('--batas-riwayat', type=int, default=BATAS_RIWAYAT_DEFAULT, metavar='N',
+                        help=f"Jumlah entri riwayat di memori (default {BATAS_RIWAYAT_DEFAULT}, "
+                             "0 = tanpa batas)")
+    args = parser.parse_args()
+    if args.batas_riwayat < 0:
+        parser.error("--batas-riwayat tidak boleh negatif")
+    batas_riwayat = args.batas_riwayat or None
+    
+    tabel = None
+    if args.tabel is not None:
+        try:
+            tabel = TabelPrakomputasi.buka_atau_bangun(args.tabel or None)
+        except (OSError, ValueError) as e:
+            print(f"❌ Tabel prakomputasi tidak dapat dibuka: {e}", file=sys.stderr)
+            sys.exit(1)
+    
+    metrik = None
+    if args.metrik_port is not None or args.metrik_file:
+        import atexit
+        metrik = MetrikKonverter()
+        if args.metrik_port is not None:
+            server_metrik = metrik.registri.layani_http(args.metrik_port)
+            print(f"📈 Metrik tersedia di http://127.0.0.1:{server_metrik.port}/metrics",
+                  file=sys.stderr)
+        if args.metrik_file:
+            atexit.register(metrik.registri.tulis_file, args.metrik_file)
+    
+    if args.skrip:
+        interface = InterfacePengguna(metrik, tabel, batas_riwayat)
+        bilah = None if args.tanpa_progres or not sys.stderr.isatty() else BilahProgresTeks()
+        try:
+            with tangkap_ctrl_c(TokenPembatalan()) as token:
+                if args.skrip == '-':
+                    ringkasan = interface.jalankan_skrip(sys.stdin, tampilkan_waktu=not args.tanpa_waktu,
+                                                         progres=bilah, token=token)
+                else:
+                    with open(args.skrip, encoding='utf-8') as berkas_skrip:
+                        ringkasan = interface.jalankan_skrip(berkas_skrip,
+                                                             tampilkan_waktu=not args.tanpa_waktu,
+                                                             progres=bilah, token=token)
+        except OperasiDibatalkan:
+            if bilah is not None:
+                bilah.akhiri()
+            print("⚠️  Skrip dibatalkan", file=sys.stderr)
+            sys.exit(130)
+        sys.exit(1 if ringkasan['gagal'] else 0)
     
     print("🚀 Memulai Simulator Sistem Bilangan...")
     
@@ -948,7 +1867,7 @@ if __name__ == "__main__":
             input("Tekan Enter untuk melanjutkan...")
         
         # Jalankan mode interaktif
-        interface = InterfacePengguna()
+        interface = InterfacePengguna(metrik, tabel, batas_riwayat)
         interface.jalankan()
         
     except KeyboardInterrupt:
@@ -0,0 +1,498 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Mesin Operasi Bitwise pada Numeral
+==================================
+
+Operasi AND, OR, XOR, NOT, geser, dan rotasi pada numeral biner, oktal, dan
+heksadesimal. Setiap digit basis pangkat dua mewakili grup bit yang tetap,
+sehingga rentang bit mana pun dapat dibaca langsung dari potongan digitnya
+tanpa mem-parse seluruh numeral. Mesin aliran memproses operand per
+potongan bit dari digit paling signifikan, dalam waktu linear dan memori
+sebesar satu potongan, termasuk untuk operand file yang dibuka lewat mmap.
+
+Geser dan rotasi tidak menggeser data: hasilnya disusun sebagai susunan
+rentang operand (dan rentang nol) yang dibaca per potongan. Hasil ditulis
+ulang ke basis pangkat dua tujuan dengan batas digit yang disejajarkan dari
+kanan.
+
+Basis lain (desimal) memakai operasi int biasa lewat hitung_bitwise().
+
+Lebar (jumlah bit) menentukan register untuk NOT dan rotasi; jika tidak
+diberikan, lebarnya adalah lebar digit operand (misal 'F0' heksadesimal =
+8 bit). Jika diberikan, operand dan hasil semua operasi dipotong ke lebar itu.
+
+Penggunaan:
+    python operasi_bitwise.py a.hex '^' b.hex -o hasil.hex
+    python operasi_bitwise.py a.hex rol --geser 12 --lebar 4096 -o hasil.bin --ke biner
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import argparse
+import mmap
+import os
+import sys
+import tempfile
+from contextlib import ExitStack, contextmanager
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    from .progres import (PelacakProgres, TokenPembatalan, OperasiDibatalkan,
+                          BilahProgresTeks, tangkap_ctrl_c)
+except ImportError:
+    from progres import (PelacakProgres, TokenPembatalan, OperasiDibatalkan,
+                         BilahProgresTeks, tangkap_ctrl_c)
+
+Buffer = Union[bytes, bytearray, mmap.mmap]
+
+OPERASI_BINER = {'&': int.__and__, '|': int.__or__, '^': int.__xor__}
+OPERASI_GESER = ('<<', '>>', 'rol', 'ror')
+OPERASI_BITWISE = tuple(OPERASI_BINER) + ('~',) + OPERASI_GESER
+
+# Basis pangkat dua yang diproses per potongan digit
+BIT_PER_DIGIT = {2: 1, 8: 3, 16: 4}
+KODE_FORMAT = {2: 'b', 8: 'o', 10: 'd', 16: 'X'}
+
+# Bit per potongan aliran (kelipatan 24 = KPK grup bit 1, 3, dan 4)
+UKURAN_POTONG_BIT = 3 << 20
+
+_DIGIT = b'0123456789ABCDEF'
+_SPASI = b' \t\r\n\x0b\x0c'
+
+
+def _periksa_operasi(operasi: str, lebar: Optional[int], geser: int):
+    if operasi not in OPERASI_BITWISE:
+        raise ValueError(f"Operasi bitwise '{operasi}' tidak dikenal "
+                         f"(pilihan: {', '.join(OPERASI_BITWISE)})")
+    if lebar is not None and lebar <= 0:
+        raise ValueError("Lebar harus positif")
+    if geser < 0:
+        raise ValueError("Jumlah geser tidak boleh negatif")
+
+
+def _periksa_jumlah_operand(operasi: str, ada_operand2: bool):
+    if ada_operand2 != (operasi in OPERASI_BINER):
+        raise ValueError(f"Operasi '{operasi}' membutuhkan "
+                         f"{'dua operand' if operasi in OPERASI_BINER else 'satu operand'}")
+
+
+def hitung_bitwise(nilai1: int, nilai2: int, operasi: str, lebar: Optional[int] = None) -> int:
+    """
+    Operasi bitwise pada int (jalur untuk basis selain pangkat dua)
+
+    Args:
+        nilai1 (int): Operand pertama (tidak negatif)
+        nilai2 (int): Operand kedua, atau jumlah geser/rotasi; diabaikan untuk '~'
+        operasi (str): '&', '|', '^', '~', '<<', '>>', 'rol', atau 'ror'
+        lebar (int, optional): Lebar register; wajib untuk '~', 'rol', dan 'ror'
+
+    Returns:
+        int: Hasil operasi
+    """
+    geser = nilai2 if operasi in OPERASI_GESER else 0
+    _periksa_operasi(operasi, lebar, geser)
+    if lebar is None and operasi in ('~', 'rol', 'ror'):
+        raise ValueError(f"Operasi '{operasi}' membutuhkan lebar")
+    topeng = (1 << lebar) - 1 if lebar is not None else -1
+    nilai1 &= topeng
+
+    if operasi in OPERASI_BINER:
+        return OPERASI_BINER[operasi](nilai1, nilai2 & topeng)
+    if operasi == '~':
+        return nilai1 ^ topeng
+    if operasi == '<<':
+        return (nilai1 << geser) & topeng
+    if operasi == '>>':
+        return nilai1 >> geser
+    geser %= lebar
+    if operasi == 'ror':
+        geser = (lebar - geser) % lebar
+    return ((nilai1 << geser) | (nilai1 >> (lebar - geser))) & topeng
+
+
+class OperandDigit:
+    """Numeral basis 2/8/16 di buffer (bytes atau mmap) yang dibaca per rentang bit"""
+
+    def __init__(self, data: Buffer, basis: int):
+        """
+        Args:
+            data (Buffer): Digit ASCII (huruf kecil/kapital); spasi di tepi diabaikan
+            basis (int): 2, 8, atau 16
+
+        Raises:
+            ValueError: Jika basis bukan pangkat dua yang didukung atau numeral kosong
+        """
+        if basis not in BIT_PER_DIGIT:
+            raise ValueError(f"Basis {basis} tidak dapat diproses per potongan (harus 2, 8, atau 16)")
+        awal, akhir = 0, len(data)
+        # Hanya tepi yang diperiksa; spasi di tengah numeral ditolak saat dibaca
+        while awal < akhir and data[awal:awal + 1] in _SPASI:
+            awal += 1
+        while akhir > awal and data[akhir - 1:akhir] in _SPASI:
+            akhir -= 1
+        if awal == akhir:
+            raise ValueError("Numeral kosong")
+        self.data = data
+        self.basis = basis
+        self.bit_per_digit = BIT_PER_DIGIT[basis]
+        self._awal = awal
+        self.jumlah_digit = akhir - awal
+        self.panjang_bit = self.jumlah_digit * self.bit_per_digit
+        self._digit_valid = _DIGIT[:basis] + _DIGIT[10:basis].lower()
+
+    def validasi(self, digit_per_potong: int = UKURAN_POTONG_BIT):
+        """
+        Memeriksa seluruh digit per potongan tanpa menghitung nilainya
+
+        Raises:
+            ValueError: Jika ada karakter yang bukan digit basis ini
+        """
+        for awal in range(0, self.jumlah_digit, digit_per_potong):
+            akhir = min(awal + digit_per_potong, self.jumlah_digit)
+            if bytes(self.data[self._awal + awal:self._awal + akhir]).translate(None, self._digit_valid):
+                raise ValueError(f"Digit tidak valid untuk basis {self.basis} "
+                                 f"pada digit {awal + 1}-{akhir}")
+
+    def baca(self, awal_bit: int, akhir_bit: int) -> int:
+        """
+        Nilai bit [awal_bit, akhir_bit), dihitung dari bit paling signifikan
+
+        Raises:
+            ValueError: Jika potongan berisi karakter yang bukan digit basis ini
+        """
+        if awal_bit >= akhir_bit:
+            return 0
+        k = self.bit_per_digit
+        digit_awal = awal_bit // k
+        digit_akhir = -(-akhir_bit // k)
+        potong = bytes(self.data[self._awal + digit_awal:self._awal + digit_akhir])
+        if potong.translate(None, self._digit_valid):
+            raise ValueError(f"Digit tidak valid untuk basis {self.basis} "
+                             f"pada digit {digit_awal + 1}-{digit_akhir}")
+        nilai = int(potong, self.basis) >> (digit_akhir * k - akhir_bit)
+        return nilai & ((1 << (akhir_bit - awal_bit)) - 1)
+
+
+class _Susunan:
+    """Rangkaian rentang bit operand (atau nol) yang dibaca seolah satu numeral"""
+
+    def __init__(self, segmen: List[Tuple[Optional[OperandDigit], int, int]]):
+        # Segmen: (operand atau None untuk nol, bit awal, bit akhir)
+        self.segmen = [s for s in segmen if s[2] > s[1]]
+        self.panjang_bit = sum(akhir - awal for _, awal, akhir in self.segmen)
+
+    @classmethod
+    def dari(cls, operand: OperandDigit) -> '_Susunan':
+        return cls([(operand, 0, operand.panjang_bit)])
+
+    @classmethod
+    def nol(cls, panjang_bit: int) -> '_Susunan':
+        return cls([(None, 0, panjang_bit)])
+
+    def __add__(self, lain: '_Susunan') -> '_Susunan':
+        return _Susunan(self.segmen + lain.segmen)
+
+    def iris(self, awal: int, akhir: int) -> '_Susunan':
+        """Sub-rentang bit [awal, akhir) susunan ini"""
+        hasil = []
+        posisi = 0
+        for operand, seg_awal, seg_akhir in self.segmen:
+            panjang = seg_akhir - seg_awal
+            dari, sampai = max(awal - posisi, 0), min(akhir - posisi, panjang)
+            if dari < sampai:
+                hasil.append((operand, seg_awal + dari, seg_awal + sampai))
+            posisi += panjang
+        return _Susunan(hasil)
+
+    def sesuaikan(self, lebar: int) -> '_Susunan':
+        """Lebar tepat 'lebar' bit: tambah nol di kiri, atau ambil bit paling kanan"""
+        if lebar >= self.panjang_bit:
+            return _Susunan.nol(lebar - self.panjang_bit) + self
+        return self.iris(self.panjang_bit - lebar, self.panjang_bit)
+
+    def baca(self, awal: int, akhir: int) -> int:
+        """Nilai bit [awal, akhir) susunan ini"""
+        nilai = 0
+        for operand, seg_awal, seg_akhir in self.iris(awal, akhir).segmen:
+            nilai <<= seg_akhir - seg_awal
+            if operand is not None:
+                nilai |= operand.baca(seg_awal, seg_akhir)
+        return nilai
+
+
+def alirkan_bitwise(operand1: OperandDigit, operasi: str, operand2: Optional[OperandDigit] = None,
+                    geser: int = 0, lebar: Optional[int] = None,
+                    ukuran_potong: int = UKURAN_POTONG_BIT) -> Tuple[int, Iterator[Tuple[int, int]]]:
+    """
+    Menyusun operasi bitwise sebagai aliran potongan bit
+
+    Args:
+        operand1 (OperandDigit): Operand pertama
+        operasi (str): '&', '|', '^', '~', '<<', '>>', 'rol', atau 'ror'
+        operand2 (OperandDigit, optional): Operand kedua untuk '&', '|', '^'
+        geser (int): Jumlah bit untuk geser dan rotasi
+        lebar (int, optional): Lebar register (lihat docstring modul)
+        ukuran_potong (int): Bit per potongan
+
+    Returns:
+        Tuple: (jumlah bit hasil, iterator (nilai, jumlah bit) dari bit paling signifikan)
+    """
+    _periksa_operasi(operasi, lebar, geser)
+    _periksa_jumlah_operand(operasi, operand2 is not None)
+    if ukuran_potong <= 0:
+        raise ValueError("Ukuran potongan harus positif")
+
+    susunan = _Susunan.dari(operand1)
+    if operasi in OPERASI_BINER:
+        lebar = lebar or max(operand1.panjang_bit, operand2.panjang_bit)
+        kiri, kanan = susunan.sesuaikan(lebar), _Susunan.dari(operand2).sesuaikan(lebar)
+        fungsi = OPERASI_BINER[operasi]
+
+        def potongan():
+            for awal in range(0, lebar, ukuran_potong):
+                akhir = min(awal + ukuran_potong, lebar)
+                yield fungsi(kiri.baca(awal, akhir), kanan.baca(awal, akhir)), akhir - awal
+
+        return lebar, potongan()
+
+    if lebar is not None or operasi in ('~', 'rol', 'ror'):
+        susunan = susunan.sesuaikan(lebar or operand1.panjang_bit)
+    panjang = susunan.panjang_bit
+    balik = operasi == '~'
+    if operasi == '<<':
+        susunan = susunan + _Susunan.nol(geser)
+        if lebar is not None:
+            susunan = susunan.sesuaikan(lebar)
+    elif operasi == '>>':
+        susunan = susunan.iris(0, max(panjang - geser, 0))
+    elif operasi in ('rol', 'ror'):
+        putar = geser % panjang
+        if operasi == 'ror':
+            putar = (panjang - putar) % panjang
+        susunan = susunan.iris(putar, panjang) + susunan.iris(0, putar)
+
+    def potongan():
+        total = susunan.panjang_bit
+        for awal in range(0, total, ukuran_potong):
+            akhir = min(awal + ukuran_potong, total)
+            nilai = susunan.baca(awal, akhir)
+            yield (nilai ^ ((1 << (akhir - awal)) - 1) if balik else nilai), akhir - awal
+
+    return susunan.panjang_bit, potongan()
+
+
+class PenulisDigit:
+    """Menulis aliran potongan bit sebagai digit basis 2/8/16 tanpa nol di depan"""
+
+    def __init__(self, keluaran: BinaryIO, panjang_bit: int, basis: int):
+        """
+        Args:
+            keluaran (BinaryIO): Tujuan tulis (file biner atau BytesIO)
+            panjang_bit (int): Jumlah bit total aliran
+            basis (int): Basis tujuan (2, 8, atau 16)
+        """
+        if basis not in BIT_PER_DIGIT:
+            raise ValueError(f"Basis {basis} tidak dapat ditulis per potongan (harus 2, 8, atau 16)")
+        self.keluaran = keluaran
+        self.panjang_bit = panjang_bit
+        self.basis = basis
+        self.jumlah_digit = 0
+        self._k = BIT_PER_DIGIT[basis]
+        self._kode = KODE_FORMAT[basis]
+        self._posisi = 0
+        self._akumulator = 0
+        self._bit_akumulator = 0
+
+    def tulis(self, nilai: int, bit: int):
+        """Menambahkan potongan 'bit' bit (urutan dari bit paling signifikan)"""
+        self._akumulator = (self._akumulator << bit) | nilai
+        self._bit_akumulator += bit
+        self._posisi += bit
+        # Digit disejajarkan dari kanan: bit setelah batas digit terakhir ditahan
+        tahan = (self._k - (self.panjang_bit - self._posisi) % self._k) % self._k
+        keluar = self._bit_akumulator - tahan
+        if keluar <= 0:
+            return
+        nilai = self._akumulator >> tahan
+        self._akumulator &= (1 << tahan) - 1
+        self._bit_akumulator = tahan
+        digit = format(nilai, f'0{-(-keluar // self._k)}{self._kode}')
+        if not self.jumlah_digit:
+            digit = digit.lstrip('0')
+        if digit:
+            self.keluaran.write(digit.encode('ascii'))
+            self.jumlah_digit += len(digit)
+
+    def selesai(self) -> int:
+        """Menutup aliran; hasil nol ditulis sebagai '0'. Mengembalikan jumlah digit"""
+        if self._posisi != self.panjang_bit:
+            raise ValueError(f"Aliran berisi {self._posisi} bit, seharusnya {self.panjang_bit}")
+        if not self.jumlah_digit:
+            self.keluaran.write(b'0')
+            self.jumlah_digit = 1
+        return self.jumlah_digit
+
+
+def _nilai_int(data: Buffer, basis: int) -> int:
+    """Jalur int: seluruh numeral di-parse (untuk basis selain pangkat dua)"""
+    teks = bytes(data).strip()
+    if not teks or teks.translate(None, _DIGIT[:basis] + _DIGIT[10:basis].lower()):
+        raise ValueError(f"Numeral tidak valid untuk basis {basis}")
+    return int(teks, basis)
+
+
+def bitwise_buffer(data1: Buffer, operasi: str, keluaran: BinaryIO,
+                   data2: Optional[Buffer] = None, geser: int = 0, basis: int = 16,
+                   basis_tujuan: Optional[int] = None, lebar: Optional[int] = None,
+                   ukuran_potong: int = UKURAN_POTONG_BIT, progres=None,
+                   token: Optional[TokenPembatalan] = None) -> Dict:
+    """
+    Operasi bitwise pada numeral di buffer, hasil ditulis ke keluaran
+
+    Basis asal dan tujuan pangkat dua diproses per potongan; selain itu
+    numeral di-parse menjadi int (dan dibatasi batas digit int() Python).
+
+    Args:
+        data1 (Buffer): Numeral pertama
+        operasi (str): '&', '|', '^', '~', '<<', '>>', 'rol', atau 'ror'
+        keluaran (BinaryIO): Tujuan digit hasil (ASCII, heksadesimal kapital)
+        data2 (Buffer, optional): Numeral kedua untuk '&', '|', '^'
+        geser (int): Jumlah bit untuk geser dan rotasi
+        basis (int): Basis kedua numeral (2, 8, 10, atau 16)
+        basis_tujuan (int, optional): Basis hasil (default sama dengan basis)
+        lebar (int, optional): Lebar register
+        ukuran_potong (int): Bit per potongan
+        progres (callable, optional): Callback PeristiwaProgres, dalam bit hasil
+        token (TokenPembatalan, optional): Token pembatalan, diperiksa tiap potongan
+
+    Returns:
+        Dict: 'bit_hasil', 'digit', dan 'basis'
+    """
+    basis_tujuan = basis_tujuan or basis
+    if basis not in KODE_FORMAT or basis_tujuan not in KODE_FORMAT:
+        raise ValueError("Basis harus 2, 8, 10, atau 16")
+
+    if basis in BIT_PER_DIGIT and basis_tujuan in BIT_PER_DIGIT:
+        operand2 = OperandDigit(data2, basis) if data2 is not None else None
+        panjang, potongan = alirkan_bitwise(OperandDigit(data1, basis), operasi, operand2,
+                                            geser, lebar, ukuran_potong)
+        penulis = PenulisDigit(keluaran, panjang, basis_tujuan)
+        pelacak = PelacakProgres('bitwise', panjang, progres, token)
+        for nilai, bit in potongan:
+            penulis.tulis(nilai, bit)
+            pelacak.maju(bit)
+        pelacak.tuntas()
+        return {'bit_hasil': panjang, 'digit': penulis.selesai(), 'basis': basis_tujuan}
+
+    _periksa_operasi(operasi, lebar, geser)
+    _periksa_jumlah_operand(operasi, data2 is not None)
+    nilai1 = _nilai_int(data1, basis)
+    if lebar is None and operasi in ('~', 'rol', 'ror'):
+        teks = bytes(data1).strip()
+        lebar = len(teks) * BIT_PER_DIGIT[basis] if basis in BIT_PER_DIGIT else max(nilai1.bit_length(), 1)
+    nilai2 = _nilai_int(data2, basis) if data2 is not None else geser
+    hasil = hitung_bitwise(nilai1, nilai2, operasi, lebar)
+    digit = format(hasil, KODE_FORMAT[basis_tujuan]).encode('ascii')
+    keluaran.write(digit)
+    return {'bit_hasil': hasil.bit_length(), 'digit': len(digit), 'basis': basis_tujuan}
+
+
+def _peta_berkas(tumpukan: ExitStack, path: str) -> Buffer:
+    """mmap hanya-baca untuk file (file kosong dibaca sebagai b'')"""
+    berkas = tumpukan.enter_context(open(path, 'rb'))
+    if os.fstat(berkas.fileno()).st_size == 0:
+        return b''
+    return tumpukan.enter_context(mmap.mmap(berkas.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+@contextmanager
+def _keluaran_atomik(path_keluaran: str, *path_operand: Optional[str]) -> Iterator[BinaryIO]:
+    """
+    File hasil yang ditulis ke file sementara lalu os.replace saat selesai
+
+    File hasil yang sama dengan salah satu operand ditolak: operand dibaca
+    lewat mmap, sehingga menimpanya di tengah operasi memutus pemetaan.
+    Jika operasi gagal, file hasil lama tidak tersentuh.
+    """
+    if os.path.exists(path_keluaran):
+        for path in path_operand:
+            if path is not None and os.path.samefile(path, path_keluaran):
+                raise ValueError(f"File hasil '{path_keluaran}' sama dengan file operand '{path}'")
+    direktori = os.path.dirname(os.path.abspath(path_keluaran))
+    fd, sementara = tempfile.mkstemp(dir=direktori, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w+b') as berkas:
+            yield berkas
+        # mkstemp membuat file 0600; hasil dibaca seperti file biasa
+        os.chmod(sementara, 0o644)
+        os.replace(sementara, path_keluaran)
+    except BaseException:
+        os.unlink(sementara)
+        raise
+
+
+def bitwise_berkas(path1: str, operasi: str, path_keluaran: str, path2: Optional[str] = None,
+                   **opsi) -> Dict:
+    """
+    Operasi bitwise pada numeral di file (dibuka lewat mmap), hasil ditulis ke file
+
+    Opsi sama dengan bitwise_buffer (geser, basis, basis_tujuan, lebar,
+    ukuran_potong, progres, token). File hasil diganti hanya jika operasi
+    selesai.
+
+    Returns:
+        Dict: Ringkasan bitwise_buffer ditambah 'path'
+
+    Raises:
+        ValueError: Jika file hasil sama dengan file operand, atau lihat bitwise_buffer
+    """
+    with ExitStack() as tumpukan:
+        keluaran = tumpukan.enter_context(_keluaran_atomik(path_keluaran, path1, path2))
+        data1 = _peta_berkas(tumpukan, path1)
+        data2 = _peta_berkas(tumpukan, path2) if path2 is not None else None
+        ringkasan = bitwise_buffer(data1, operasi, keluaran, data2, **opsi)
+    ringkasan['path'] = path_keluaran
+    return ringkasan
+
+
+_NAMA_BASIS = {'biner': 2, 'oktal': 8, 'desimal': 10, 'heksadesimal': 16}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Operasi bitwise pada numeral di file")
+    parser.add_argument('operand1', help="File numeral pertama")
+    parser.add_argument('operasi', choices=OPERASI_BITWISE)
+    parser.add_argument('operand2', nargs='?', help="File numeral kedua (untuk &, |, ^)")
+    parser.add_argument('-o', '--keluaran', required=True, help="File hasil")
+    parser.add_argument('--basis', choices=_NAMA_BASIS, default='heksadesimal')
+    parser.add_argument('--ke', choices=_NAMA_BASIS, help="Basis hasil (default: sama)")
+    parser.add_argument('--geser', type=int, default=0, help="Jumlah bit geser/rotasi")
+    parser.add_argument('--lebar', type=int, help="Lebar register dalam bit")
+    parser.add_argument('--tanpa-progres', action='store_true',
+                        help="Jangan tampilkan bilah progres di stderr")
+    args = parser.parse_args(argv)
+
+    basis = _NAMA_BASIS[args.basis]
+    bilah = None if args.tanpa_progres or not sys.stderr.isatty() else BilahProgresTeks()
+    try:
+        with tangkap_ctrl_c(TokenPembatalan()) as token:
+            ringkasan = bitwise_berkas(args.operand1, args.operasi, args.keluaran, args.operand2,
+                                       geser=args.geser, basis=basis,
+                                       basis_tujuan=_NAMA_BASIS[args.ke] if args.ke else None,
+                                       lebar=args.lebar, progres=bilah, token=token)
+    except OperasiDibatalkan:
+        if bilah is not None:
+            bilah.akhiri()
+        print("⚠️  Operasi bitwise dibatalkan", file=sys.stderr)
+        return 130
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(f"{ringkasan['digit']:,} digit ({ringkasan['bit_hasil']:,} bit) ditulis ke {ringkasan['path']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Profil Memori Mesin Konversi
+============================
+
+Mengukur alokasi memori per operasi KonverterSistemBilangan dengan
+tracemalloc untuk beberapa ukuran input, dan menjalankan uji kebocoran
+jangka panjang (misal 10^6 konversi dengan riwayat berbatas).
+
+Untuk setiap operasi dan ukuran input dicatat:
+- puncak: alokasi puncak satu panggilan (byte, relatif terhadap sebelum panggilan)
+- tertahan: pertumbuhan memori terlacak per panggilan pada kondisi tunak,
+  setelah riwayat berbatas penuh (seharusnya 0; nilai positif = bocor)
+
+Hasil dapat disimpan sebagai baseline JSON dan dibandingkan pada run
+berikutnya; run gagal jika alokasi per operasi tumbuh melewati toleransi.
+
+Penggunaan:
+    python profil_memori.py
+    python profil_memori.py --tulis-baseline ../tests/baseline_memori.json
+    python profil_memori.py --cek-baseline ../tests/baseline_memori.json
+    python profil_memori.py --kebocoran 1000000
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import argparse
+import gc
+import json
+import random
+import sys
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Sequence
+
+try:
+    from .number_system_simulator import KonverterSistemBilangan, SistemBilangan, JenisKesalahan
+    from .representasi_bertanda import RepresentasiBertanda
+    from .hamming import HAMMING_15_11
+except ImportError:
+    from number_system_simulator import KonverterSistemBilangan, SistemBilangan, JenisKesalahan
+    from representasi_bertanda import RepresentasiBertanda
+    from hamming import HAMMING_15_11
+
+UKURAN_BIT = (8, 64, 1024)
+
+# Riwayat konverter pengukur; pemanasan mengisi riwayat hingga penuh
+BATAS_RIWAYAT_UKUR = 64
+
+# Toleransi pertumbuhan terhadap baseline: relatif dan absolut (byte)
+TOLERANSI_RELATIF = 0.25
+TOLERANSI_PUNCAK = 512
+TOLERANSI_TERTAHAN = 32
+
+BINER = SistemBilangan.BINER
+DESIMAL = SistemBilangan.DESIMAL
+OKTAL = SistemBilangan.OKTAL
+HEKS = SistemBilangan.HEKSADESIMAL
+
+
+def _nilai_uji(bit: int) -> int:
+    """Nilai uji deterministik dengan tepat sejumlah bit"""
+    return random.Random(bit).getrandbits(bit) | (1 << (bit - 1))
+
+
+def daftar_operasi(konverter: KonverterSistemBilangan, bit: int) -> Dict[str, Callable[[], object]]:
+    """
+    Operasi yang diukur untuk satu ukuran input
+
+    Args:
+        konverter (KonverterSistemBilangan): Konverter yang diukur
+        bit (int): Ukuran input dalam bit
+
+    Returns:
+        Dict[str, Callable]: Nama operasi → fungsi tanpa argumen
+    """
+    nilai = _nilai_uji(bit)
+    biner, desimal, heks = format(nilai, 'b'), str(nilai), format(nilai, 'X')
+    lebar_register = min(64, max(8, 1 << (bit - 1).bit_length()))
+    register = format(nilai & ((1 << lebar_register) - 1), 'X')
+    return {
+        'validasi_input': lambda: konverter.validasi_input(heks, HEKS),
+        'ke_desimal': lambda: konverter.ke_desimal(heks, HEKS),
+        'dari_desimal': lambda: konverter.dari_desimal(nilai, OKTAL),
+        'konversi': lambda: konverter.konversi(desimal, DESIMAL, HEKS),
+        'konversi_basis': lambda: konverter.konversi_basis(heks, 16, 36),
+        'ke_desimal_buffer': lambda: konverter.ke_desimal_buffer(heks.encode('ascii'), HEKS),
+        'konversi_buffer': lambda: konverter.konversi_buffer(biner.encode('ascii'), BINER, HEKS),
+        'konversi_pecahan': lambda: konverter.konversi_pecahan(desimal + '.1', DESIMAL, BINER),
+        'simulasi_kesalahan': lambda: konverter.simulasi_kesalahan(biner, BINER,
+                                                                   JenisKesalahan.BIT_FLIP),
+        'deteksi_kesalahan_konversi': lambda: konverter.deteksi_kesalahan_konversi(
+            desimal, heks, DESIMAL, HEKS),
+        'tampilkan_tabel_konversi': lambda: konverter.tampilkan_tabel_konversi(desimal, DESIMAL),
+        'operasi_aritmatika': lambda: konverter.operasi_aritmatika(heks, heks, '*', HEKS),
+        'dari_desimal_bertanda': lambda: konverter.dari_desimal_bertanda(
+            -nilai, BINER, bit + 1, RepresentasiBertanda.KOMPLEMEN_DUA),
+        'operasi_lebar_tetap': lambda: konverter.operasi_lebar_tetap(
+            register, register, '+', HEKS, lebar_register),
+        'simulasi_kesalahan_crc': lambda: konverter.simulasi_kesalahan_crc(
+            heks, HEKS, JenisKesalahan.BIT_FLIP),
+        'simulasi_koreksi_hamming': lambda: konverter.simulasi_koreksi_hamming(
+            heks, HEKS, HAMMING_15_11),
+    }
+
+
+def ukur_operasi(fungsi: Callable[[], object], ulang: int = 256) -> Dict[str, float]:
+    """
+    Mengukur alokasi puncak dan tertahan satu operasi
+
+    tracemalloc harus sudah aktif. Pemanasan dijalankan di bawah tracing agar
+    riwayat berbatas terisi entri yang terlacak; tanpa itu, entri lama yang
+    tidak terlacak digantikan entri baru dan terlihat seperti kebocoran.
+
+    Alokasi tertahan adalah selisih pertumbuhan dua jendela berukuran sama,
+    sehingga alokasi satu kali (misal blok deque baru) saling meniadakan.
+
+    Args:
+        fungsi (Callable): Operasi tanpa argumen
+        ulang (int): Panggilan per jendela; kelipatan 64 menyelaraskan blok deque
+
+    Returns:
+        Dict[str, float]: 'puncak' (byte) dan 'tertahan' (byte per panggilan)
+    """
+    for _ in range(2 * BATAS_RIWAYAT_UKUR):
+        fungsi()
+    gc.collect()
+
+    dasar = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    fungsi()
+    puncak = tracemalloc.get_traced_memory()[1] - dasar
+
+    titik = []
+    for _ in range(2):
+        for _ in range(ulang):
+            fungsi()
+        gc.collect()
+        titik.append(tracemalloc.get_traced_memory()[0])
+    tertahan = (titik[1] - titik[0]) / ulang
+    return {'puncak': puncak, 'tertahan': round(tertahan, 2)}
+
+
+def profil_operasi(ukuran_bit: Sequence[int] = UKURAN_BIT, ulang: int = 256,
+                   operasi: Optional[Sequence[str]] = None) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Mengukur semua operasi untuk setiap ukuran input
+
+    Returns:
+        Dict: {operasi: {str(bit): {'puncak', 'tertahan'}}}
+    """
+    sudah_aktif = tracemalloc.is_tracing()
+    if not sudah_aktif:
+        tracemalloc.start()
+    try:
+        hasil = {}
+        for bit in ukuran_bit:
+            konverter = KonverterSistemBilangan(seed=bit, batas_riwayat=BATAS_RIWAYAT_UKUR)
+            for nama, fungsi in daftar_operasi(konverter, bit).items():
+                if operasi is not None and nama not in operasi:
+                    continue
+                hasil.setdefault(nama, {})[str(bit)] = ukur_operasi(fungsi, ulang)
+        return hasil
+    finally:
+        if not sudah_aktif:
+            tracemalloc.stop()
+
+
+def uji_kebocoran(jumlah: int = 10 ** 6, batas_riwayat: int = 1000,
+                  jumlah_titik: int = 10) -> Dict:
+    """
+    Menjalankan banyak konversi dengan riwayat berbatas dan mencatat memori
+
+    Titik pertama diambil setelah riwayat penuh, sehingga pertumbuhan setelahnya
+    menandakan kebocoran.
+
+    Args:
+        jumlah (int): Jumlah konversi
+        batas_riwayat (int): Batas riwayat konverter
+        jumlah_titik (int): Jumlah titik pengukuran
+
+    Returns:
+        Dict: 'jumlah', 'titik' (memori terlacak per titik, byte),
+            'pertumbuhan' (byte), dan 'per_operasi' (byte per konversi)
+    """
+    if jumlah_titik < 2 or jumlah < jumlah_titik or jumlah // jumlah_titik < batas_riwayat:
+        raise ValueError("Jumlah konversi per titik harus minimal sebesar batas riwayat")
+
+    sudah_aktif = tracemalloc.is_tracing()
+    if not sudah_aktif:
+        tracemalloc.start()
+    try:
+        konverter = KonverterSistemBilangan(batas_riwayat=batas_riwayat)
+        # Himpunan nilai tetap agar ukuran entri riwayat tidak ikut tumbuh
+        daftar_nilai = [format(i * 2654435761 % (1 << 32), 'X') for i in range(4096)]
+        per_titik = jumlah // jumlah_titik
+        titik = []
+        for indeks_titik in range(jumlah_titik):
+            for i in range(indeks_titik * per_titik, (indeks_titik + 1) * per_titik):
+                konverter.konversi(daftar_nilai[i & 4095], HEKS, DESIMAL)
+            gc.collect()
+            titik.append(tracemalloc.get_traced_memory()[0])
+    finally:
+        if not sudah_aktif:
+            tracemalloc.stop()
+
+    pertumbuhan = titik[-1] - titik[0]
+    return {
+        'jumlah': per_titik * jumlah_titik,
+        'titik': titik,
+        'pertumbuhan': pertumbuhan,
+        'per_operasi': pertumbuhan / (per_titik * (jumlah_titik - 1))
+    }
+
+
+def versi_python() -> str:
+    return f"{sys.version_info.major}.{sys.version_info.minor}"
+
+
+def buat_baseline(hasil: Dict) -> Dict:
+    """Membungkus hasil profil_operasi menjadi dokumen baseline"""
+    return {'python': versi_python(), 'operasi': hasil}
+
+
+def bandingkan_baseline(hasil: Dict, baseline: Dict) -> List[str]:
+    """
+    Membandingkan hasil pengukuran dengan baseline
+
+    Returns:
+        List[str]: Pesan regresi (kosong jika tidak ada)
+    """
+    regresi = []
+    for nama, per_ukuran in hasil.items():
+        for bit, ukur in per_ukuran.items():
+            dasar = baseline['operasi'].get(nama, {}).get(bit)
+            if dasar is None:
+                continue
+            for kunci, absolut in (('puncak', TOLERANSI_PUNCAK), ('tertahan', TOLERANSI_TERTAHAN)):
+                batas = max(dasar[kunci], 0) * (1 + TOLERANSI_RELATIF) + absolut
+                if ukur[kunci] > batas:
+                    regresi.append(f"{nama} ({bit} bit): {kunci} {ukur[kunci]:.0f} B "
+                                   f"> batas {batas:.0f} B (baseline {dasar[kunci]:.0f} B)")
+    return regresi
+
+
+def _cetak_profil(hasil: Dict):
+    ukuran = sorted({int(bit) for per_ukuran in hasil.values() for bit in per_ukuran})
+    kepala = ''.join(f"{f'{bit} bit':>22}" for bit in ukuran)
+    print(f"{'Operasi':<28}{kepala}")
+    print(f"{'':<28}" + ''.join(f"{'puncak/tertahan':>22}" for _ in ukuran))
+    for nama, per_ukuran in hasil.items():
+        sel = []
+        for bit in ukuran:
+            ukur = per_ukuran.get(str(bit))
+            sel.append(f"{ukur['puncak']:>12.0f}/{ukur['tertahan']:<9.1f}" if ukur else f"{'-':>22}")
+        print(f"{nama:<28}" + ''.join(sel))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Profil memori mesin konversi")
+    parser.add_argument('--ulang', type=int, default=256,
+                        help="Panggilan per jendela untuk alokasi tertahan")
+    parser.add_argument('--tulis-baseline', metavar='FILE', help="Simpan hasil sebagai baseline")
+    parser.add_argument('--cek-baseline', metavar='FILE',
+                        help="Bandingkan dengan baseline; gagal jika alokasi tumbuh")
+    parser.add_argument('--kebocoran', type=int, metavar='N',
+                        help="Jalankan uji kebocoran N konversi")
+    parser.add_argument('--batas-riwayat', type=int, default=1000,
+                        help="Batas riwayat untuk uji kebocoran (default: 1000)")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.kebocoran:
+            hasil = uji_kebocoran(args.kebocoran, args.batas_riwayat)
+            print(f"{hasil['jumlah']} konversi, pertumbuhan {hasil['pertumbuhan']} B "
+                  f"({hasil['per_operasi']:.4f} B/konversi)")
+            return 0
+
+        hasil = profil_operasi(ulang=args.ulang)
+        _cetak_profil(hasil)
+
+        if args.tulis_baseline:
+            with open(args.tulis_baseline, 'w', encoding='utf-8') as berkas:
+                json.dump(buat_baseline(hasil), berkas, indent=2, sort_keys=True)
+                berkas.write('\n')
+            print(f"Baseline disimpan ke {args.tulis_baseline}")
+
+        if args.cek_baseline:
+            with open(args.cek_baseline, encoding='utf-8') as berkas:
+                baseline = json.load(berkas)
+            if baseline.get('python') != versi_python():
+                print(f"Baseline dibuat dengan Python {baseline.get('python')}, "
+                      f"bukan {versi_python()}; perbandingan dilewati")
+                return 0
+            regresi = bandingkan_baseline(hasil, baseline)
+            for pesan in regresi:
+                print(f"❌ {pesan}")
+            if regresi:
+                return 1
+            print("✅ Tidak ada regresi alokasi")
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Progres dan Pembatalan Operasi Panjang
+======================================
+
+Protokol bersama untuk operasi yang lama (Monte Carlo CRC, batch, tabel
+rentang, pengukuran BER, fuzzing):
+
+- progres: callback(PeristiwaProgres) yang dipanggil berkala (paling sering
+  tiap INTERVAL_DEFAULT detik) dan sekali lagi saat operasi tuntas.
+- token: TokenPembatalan yang diperiksa operasi di antara langkah kerja.
+  Setelah token.batalkan(), operasi melempar OperasiDibatalkan pada
+  pemeriksaan berikutnya (pembatalan kooperatif, aman dari thread lain).
+
+Untuk command-line tersedia BilahProgresTeks (bilah progres di stderr) dan
+tangkap_ctrl_c(), yang mengubah Ctrl-C pertama menjadi pembatalan bersih.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import signal
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, Optional, TextIO, TypeVar
+
+try:
+    from .hasil import HasilBerslot
+except ImportError:
+    from hasil import HasilBerslot
+
+T = TypeVar('T')
+
+# Jeda minimal antar pemanggilan callback progres (detik)
+INTERVAL_DEFAULT = 0.1
+
+
+class OperasiDibatalkan(Exception):
+    """Dilempar operasi panjang saat token pembatalannya dibatalkan"""
+
+
+class TokenPembatalan:
+    """Penanda pembatalan kooperatif yang aman dipakai bersama antar thread"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def batalkan(self):
+        """Meminta operasi yang memakai token ini untuk berhenti"""
+        self._event.set()
+
+    @property
+    def dibatalkan(self) -> bool:
+        """True jika pembatalan sudah diminta"""
+        return self._event.is_set()
+
+    def periksa(self):
+        """Melempar OperasiDibatalkan jika pembatalan sudah diminta"""
+        if self._event.is_set():
+            raise OperasiDibatalkan("Operasi dibatalkan")
+
+    def tunggu(self, timeout: Optional[float] = None) -> bool:
+        """Menunggu sampai dibatalkan atau timeout; True jika dibatalkan"""
+        return self._event.wait(timeout)
+
+
+class PeristiwaProgres(HasilBerslot):
+    """
+    Satu laporan progres
+
+    'total' None jika jumlah langkah tidak diketahui (misal batch dari generator).
+    """
+
+    __slots__ = ('operasi', 'selesai', 'total', 'detik', 'tuntas')
+
+    @property
+    def fraksi(self) -> Optional[float]:
+        """Bagian yang sudah selesai (0-1), atau None jika total tidak diketahui"""
+        if not self.total:
+            return None
+        return min(self.selesai / self.total, 1.0)
+
+
+Callback = Callable[[PeristiwaProgres], None]
+
+
+class PelacakProgres:
+    """Penghitung langkah yang memeriksa token dan memanggil callback berkala"""
+
+    def __init__(self, operasi: str, total: Optional[int] = None,
+                 progres: Optional[Callback] = None, token: Optional[TokenPembatalan] = None,
+                 interval: float = INTERVAL_DEFAULT):
+        """
+        Args:
+            operasi (str): Nama operasi di setiap PeristiwaProgres
+            total (int, optional): Jumlah langkah jika diketahui
+            progres (callable, optional): Callback penerima PeristiwaProgres
+            token (TokenPembatalan, optional): Token pembatalan
+            interval (float): Jeda minimal antar callback (detik)
+        """
+        self.operasi = operasi
+        self.total = total
+        self.progres = progres
+        self.token = token
+        self.interval = interval
+        self.selesai = 0
+        self._mulai = time.monotonic()
+        self._lapor_berikut = self._mulai
+
+    def _lapor(self, tuntas: bool = False):
+        sekarang = time.monotonic()
+        self._lapor_berikut = sekarang + self.interval
+        self.progres(PeristiwaProgres(operasi=self.operasi, selesai=self.selesai,
+                                      total=self.total, detik=sekarang - self._mulai,
+                                      tuntas=tuntas))
+
+    def maju(self, jumlah: int = 1):
+        """Mencatat langkah selesai; melempar OperasiDibatalkan jika token dibatalkan"""
+        self.selesai += jumlah
+        if self.token is not None:
+            self.token.periksa()
+        if self.progres is not None and time.monotonic() >= self._lapor_berikut:
+            self._lapor()
+
+    def tuntas(self):
+        """Laporan terakhir setelah semua langkah selesai"""
+        if self.progres is not None:
+            self._lapor(tuntas=True)
+
+
+def iterasi_terlacak(data: Iterable[T], operasi: str, progres: Optional[Callback] = None,
+                     token: Optional[TokenPembatalan] = None, total: Optional[int] = None,
+                     langkah: int = 1) -> Iterator[T]:
+    """
+    Membungkus iterable agar setiap item dihitung sebagai satu langkah
+
+    Tanpa progres dan token, data dikembalikan apa adanya (tanpa biaya).
+
+    Args:
+        data (Iterable): Sumber item
+        operasi (str): Nama operasi
+        progres (callable, optional): Callback progres
+        token (TokenPembatalan, optional): Token pembatalan
+        total (int, optional): Jumlah item; default len(data) jika tersedia
+        langkah (int): Jumlah item per pemeriksaan token/progres (untuk item yang sangat murah)
+    """
+    if progres is None and token is None:
+        return iter(data)
+    if total is None and hasattr(data, '__len__'):
+        total = len(data)
+    return _iterasi_terlacak(data, PelacakProgres(operasi, total, progres, token), langkah)
+
+
+def _iterasi_terlacak(data: Iterable[T], pelacak: PelacakProgres, langkah: int) -> Iterator[T]:
+    if pelacak.token is not None:
+        pelacak.token.periksa()
+    sisa = langkah
+    for item in data:
+        yield item
+        sisa -= 1
+        if not sisa:
+            pelacak.maju(langkah)
+            sisa = langkah
+    pelacak.selesai += langkah - sisa
+    pelacak.tuntas()
+
+
+class BilahProgresTeks:
+    """Callback progres yang menggambar bilah progres satu baris di stderr"""
+
+    def __init__(self, keluaran: Optional[TextIO] = None, lebar: int = 30):
+        self.keluaran = keluaran or sys.stderr
+        self.lebar = lebar
+
+    def __call__(self, peristiwa: PeristiwaProgres):
+        fraksi = peristiwa.fraksi
+        if fraksi is None:
+            teks = f"{peristiwa.operasi}: {peristiwa.selesai:,} langkah"
+        else:
+            isi = int(fraksi * self.lebar)
+            teks = (f"{peristiwa.operasi}: [{'#' * isi}{'.' * (self.lebar - isi)}] "
+                    f"{fraksi:6.1%} ({peristiwa.selesai:,}/{peristiwa.total:,})")
+        teks += f" {peristiwa.detik:.1f} s"
+        self.keluaran.write(f"\r{teks}" + ("\n" if peristiwa.tuntas else ""))
+        self.keluaran.flush()
+
+    def akhiri(self):
+        """Menutup baris progres yang belum tuntas (misal setelah dibatalkan)"""
+        self.keluaran.write("\n")
+        self.keluaran.flush()
+
+
+@contextmanager
+def tangkap_ctrl_c(token: TokenPembatalan):
+    """
+    Selama blok berjalan, Ctrl-C pertama membatalkan token (berhenti bersih);
+    Ctrl-C kedua menghentikan paksa seperti biasa (KeyboardInterrupt)
+
+    Hanya berlaku di thread utama; di thread lain blok dijalankan tanpa handler.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        yield token
+        return
+
+    def tangani(nomor, frame):
+        if token.dibatalkan:
+            raise KeyboardInterrupt
+        token.batalkan()
+
+    sebelumnya = signal.signal(signal.SIGINT, tangani)
+    try:
+        yield token
+    finally:
+        signal.signal(signal.SIGINT, sebelumnya)
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Representasi Bilangan Bertanda Lebar Tetap
+==========================================
+
+Modul ini mengkodekan bilangan negatif ke pola bit dengan lebar tetap
+(8/16/32/64 bit atau lebar sembarang), seperti isi register.
+
+Representasi yang didukung:
+- Sign-magnitude (bit tanda + besaran)
+- Komplemen satu (one's complement)
+- Komplemen dua (two's complement)
+- Excess-K (bias K, default 2^(lebar-1))
+
+Mode batch mengkonversi array NumPy int64/uint64 ke dan dari array digit
+biner/heksadesimal lebar tetap dengan operasi bit tervektorisasi.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+from enum import Enum
+from typing import Optional, Tuple
+
+try:
+    from .dukungan_numpy import np, pastikan_numpy
+except ImportError:
+    from dukungan_numpy import np, pastikan_numpy
+
+
+class RepresentasiBertanda(Enum):
+    """Enumerasi representasi bilangan bertanda"""
+    SIGN_MAGNITUDE = "sign_magnitude"
+    KOMPLEMEN_SATU = "komplemen_satu"
+    KOMPLEMEN_DUA = "komplemen_dua"
+    EXCESS_K = "excess_k"
+
+
+LEBAR_STANDAR = (8, 16, 32, 64)
+
+
+def _bias(lebar: int, representasi: RepresentasiBertanda, bias: Optional[int]) -> int:
+    """Bias K untuk excess-K (default 2^(lebar-1))"""
+    if representasi != RepresentasiBertanda.EXCESS_K:
+        return 0
+    return 1 << (lebar - 1) if bias is None else bias
+
+
+def rentang_bertanda(lebar: int, representasi: RepresentasiBertanda,
+                     bias: Optional[int] = None) -> Tuple[int, int]:
+    """
+    Menghitung rentang nilai yang dapat direpresentasikan
+
+    Args:
+        lebar (int): Jumlah bit
+        representasi (RepresentasiBertanda): Representasi bertanda
+        bias (int, optional): Bias K untuk excess-K
+
+    Returns:
+        Tuple[int, int]: (nilai minimum, nilai maksimum)
+    """
+    if lebar < 2:
+        raise ValueError("Lebar representasi bertanda minimal 2 bit")
+
+    if representasi == RepresentasiBertanda.KOMPLEMEN_DUA:
+        return -(1 << (lebar - 1)), (1 << (lebar - 1)) - 1
+    if representasi == RepresentasiBertanda.EXCESS_K:
+        k = _bias(lebar, representasi, bias)
+        return -k, (1 << lebar) - 1 - k
+
+    # Sign-magnitude dan komplemen satu memiliki dua representasi nol
+    return -((1 << (lebar - 1)) - 1), (1 << (lebar - 1)) - 1
+
+
+def enkode_bertanda(nilai: int, lebar: int, representasi: RepresentasiBertanda,
+                    bias: Optional[int] = None) -> int:
+    """
+    Mengkodekan nilai bertanda menjadi pola bit tak bertanda
+
+    Args:
+        nilai (int): Nilai desimal (boleh negatif)
+        lebar (int): Jumlah bit
+        representasi (RepresentasiBertanda): Representasi bertanda
+        bias (int, optional): Bias K untuk excess-K
+
+    Returns:
+        int: Pola bit sebagai bilangan tak bertanda (0 .. 2^lebar - 1)
+
+    Raises:
+        ValueError: Jika nilai di luar rentang representasi
+    """
+    minimum, maksimum = rentang_bertanda(lebar, representasi, bias)
+    if not minimum <= nilai <= maksimum:
+        raise ValueError(f"Nilai {nilai} di luar rentang {representasi.value} "
+                         f"{lebar} bit ({minimum} .. {maksimum})")
+
+    mask = (1 << lebar) - 1
+    if representasi == RepresentasiBertanda.KOMPLEMEN_DUA:
+        return nilai & mask
+    if representasi == RepresentasiBertanda.EXCESS_K:
+        return nilai + _bias(lebar, representasi, bias)
+    if nilai >= 0:
+        return nilai
+    if representasi == RepresentasiBertanda.SIGN_MAGNITUDE:
+        return (1 << (lebar - 1)) | -nilai
+    return ~(-nilai) & mask  # Komplemen satu
+
+
+def dekode_bertanda(pola: int, lebar: int, representasi: RepresentasiBertanda,
+                    bias: Optional[int] = None) -> int:
+    """
+    Mendekodekan pola bit menjadi nilai bertanda
+
+    Args:
+        pola (int): Pola bit tak bertanda
+        lebar (int): Jumlah bit
+        representasi (RepresentasiBertanda): Representasi bertanda
+        bias (int, optional): Bias K untuk excess-K
+
+    Returns:
+        int: Nilai desimal bertanda
+
+    Raises:
+        ValueError: Jika pola lebih lebar dari lebar representasi
+    """
+    if pola < 0 or pola >> lebar:
+        raise ValueError(f"Pola {pola} tidak muat dalam {lebar} bit")
+
+    bit_tanda = pola >> (lebar - 1)
+    if representasi == RepresentasiBertanda.KOMPLEMEN_DUA:
+        return pola - (bit_tanda << lebar)
+    if representasi == RepresentasiBertanda.EXCESS_K:
+        return pola - _bias(lebar, representasi, bias)
+    if not bit_tanda:
+        return pola
+    if representasi == RepresentasiBertanda.SIGN_MAGNITUDE:
+        return -(pola & ((1 << (lebar - 1)) - 1))
+    return -(~pola & ((1 << lebar) - 1))  # Komplemen satu
+
+
+def _mask_numpy(lebar: int):
+    """Mask lebar bit sebagai skalar uint64"""
+    return np.uint64((1 << lebar) - 1)
+
+
+def batch_enkode(nilai, lebar: int, representasi: Optional[RepresentasiBertanda] = None,
+                 bias: Optional[int] = None):
+    """
+    Mengkodekan array nilai menjadi array pola bit uint64 (tervektorisasi)
+
+    Args:
+        nilai (np.ndarray): Array int64 (bertanda) atau uint64 (tak bertanda)
+        lebar (int): Jumlah bit (maksimal 64)
+        representasi (RepresentasiBertanda, optional): None untuk tak bertanda
+        bias (int, optional): Bias K untuk excess-K
+
+    Returns:
+        np.ndarray: Array pola bit uint64
+    """
+    pastikan_numpy("batch representasi bertanda")
+    if not 1 <= lebar <= 64:
+        raise ValueError("Mode batch mendukung lebar 1-64 bit")
+
+    nilai = np.asarray(nilai)
+    mask = _mask_numpy(lebar)
+
+    if representasi is None:
+        if nilai.dtype.kind == 'i' and (nilai < 0).any():
+            raise ValueError("Nilai negatif memerlukan representasi bertanda")
+        pola = nilai.astype(np.uint64)
+        if lebar < 64 and (pola > mask).any():
+            raise ValueError(f"Nilai tidak muat dalam {lebar} bit")
+        return pola
+
+    minimum, maksimum = rentang_bertanda(lebar, representasi, bias)
+    nilai = nilai.astype(np.int64)
+    if (nilai < minimum).any() or (nilai > maksimum).any():
+        raise ValueError(f"Nilai di luar rentang {representasi.value} {lebar} bit "
+                         f"({minimum} .. {maksimum})")
+
+    # astype(uint64) pada int64 negatif menghasilkan komplemen dua 64 bit
+    mentah = nilai.astype(np.uint64)
+    if representasi == RepresentasiBertanda.KOMPLEMEN_DUA:
+        return mentah & mask
+    if representasi == RepresentasiBertanda.EXCESS_K:
+        return (mentah + np.uint64(_bias(lebar, representasi, bias))) & mask
+
+    negatif = nilai < 0
+    besaran = np.abs(nilai).astype(np.uint64)
+    if representasi == RepresentasiBertanda.SIGN_MAGNITUDE:
+        return np.where(negatif, besaran | np.uint64(1 << (lebar - 1)), besaran)
+    return np.where(negatif, ~besaran & mask, besaran)  # Komplemen satu
+
+
+def batch_dekode(pola, lebar: int, representasi: Optional[RepresentasiBertanda] = None,
+                 bias: Optional[int] = None):
+    """
+    Mendekodekan array pola bit uint64 menjadi nilai (tervektorisasi)
+
+    Args:
+        pola (np.ndarray): Array pola bit uint64
+        lebar (int): Jumlah bit (maksimal 64)
+        representasi (RepresentasiBertanda, optional): None untuk tak bertanda
+        bias (int, optional): Bias K untuk excess-K
+
+    Returns:
+        np.ndarray: Array int64 (bertanda) atau uint64 (tak bertanda)
+    """
+    pastikan_numpy("batch representasi bertanda")
+    if not 1 <= lebar <= 64:
+        raise ValueError("Mode batch mendukung lebar 1-64 bit")
+
+    pola = np.asarray(pola, dtype=np.uint64) & _mask_numpy(lebar)
+    if representasi is None:
+        return pola
+
+    bit_tanda = (pola >> np.uint64(lebar - 1)) & np.uint64(1)
+    if representasi == RepresentasiBertanda.KOMPLEMEN_DUA:
+        # Perluasan tanda: isi bit di atas lebar dengan bit tanda
+        perluasan = (np.uint64(0) - bit_tanda) & ~_mask_numpy(lebar)
+        return (pola | perluasan).view(np.int64)
+    if representasi == RepresentasiBertanda.EXCESS_K:
+        return (pola - np.uint64(_bias(lebar, representasi, bias))).view(np.int64)
+
+    if representasi == RepresentasiBertanda.SIGN_MAGNITUDE:
+        besaran = (pola & _mask_numpy(lebar - 1)).view(np.int64)
+    else:
+        besaran = np.where(bit_tanda == 1, ~pola & _mask_numpy(lebar), pola).view(np.int64)
+    return np.where(bit_tanda == 1, -besaran, besaran)
+
+
+def batch_ke_digit(nilai, lebar: int, bit_per_digit: int = 1,
+                   representasi: Optional[RepresentasiBertanda] = None,
+                   bias: Optional[int] = None):
+    """
+    Mengkonversi array nilai ke array digit lebar tetap
+
+    Args:
+        nilai (np.ndarray): Array int64/uint64
+        lebar (int): Jumlah bit (maksimal 64)
+        bit_per_digit (int): 1 untuk biner, 3 untuk oktal, 4 untuk heksadesimal
+        representasi (RepresentasiBertanda, optional): None untuk tak bertanda
+        bias (int, optional): Bias K untuk excess-K
+
+    Returns:
+        np.ndarray: Array uint8 berbentuk (n, jumlah_digit), digit paling signifikan di kolom 0
+    """
+    pola = batch_enkode(nilai, lebar, representasi, bias)
+    jumlah_digit = -(-lebar // bit_per_digit)
+    geser = (np.arange(jumlah_digit - 1, -1, -1, dtype=np.uint64) * np.uint64(bit_per_digit))
+    digit = (pola[..., None] >> geser) & np.uint64((1 << bit_per_digit) - 1)
+    return digit.astype(np.uint8)
+
+
+def batch_dari_digit(digit, lebar: int, bit_per_digit: int = 1,
+                     representasi: Optional[RepresentasiBertanda] = None,
+                     bias: Optional[int] = None):
+    """
+    Mengkonversi array digit lebar tetap kembali ke array nilai
+
+    Args:
+        digit (np.ndarray): Array digit berbentuk (n, jumlah_digit)
+        lebar (int): Jumlah bit (maksimal 64)
+        bit_per_digit (int): 1 untuk biner, 3 untuk oktal, 4 untuk heksadesimal
+        representasi (RepresentasiBertanda, optional): None untuk tak bertanda
+        bias (int, optional): Bias K untuk excess-K
+
+    Returns:
+        np.ndarray: Array int64 (bertanda) atau uint64 (tak bertanda)
+    """
+    pastikan_numpy("batch representasi bertanda")
+    digit = np.asarray(digit, dtype=np.uint64)
+    if (digit >> np.uint64(bit_per_digit)).any():
+        raise ValueError(f"Digit melebihi {bit_per_digit} bit")
+
+    jumlah_digit = digit.shape[-1]
+    geser = (np.arange(jumlah_digit - 1, -1, -1, dtype=np.uint64) * np.uint64(bit_per_digit))
+    pola = np.bitwise_or.reduce(digit << geser, axis=-1)
+    if lebar < 64 and (pola >> np.uint64(lebar)).any():
+        raise ValueError(f"Pola tidak muat dalam {lebar} bit")
+    return batch_dekode(pola, lebar, representasi, bias)
+
+
+def digit_ke_ascii(digit):
+    """
+    Mengubah array digit (0-15) menjadi array string ASCII ('0'-'9', 'A'-'F')
+
+    Args:
+        digit (np.ndarray): Array uint8 berbentuk (n, jumlah_digit)
+
+    Returns:
+        np.ndarray: Array bytes berukuran tetap (dtype S{jumlah_digit})
+    """
+    pastikan_numpy("batch representasi bertanda")
+    alfabet = np.frombuffer(b'0123456789ABCDEF', dtype=np.uint8)
+    ascii_digit = np.ascontiguousarray(alfabet[digit])
+    return ascii_digit.view(f'S{ascii_digit.shape[-1]}')[..., 0]
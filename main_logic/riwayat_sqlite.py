@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Riwayat Konversi Persisten Berbasis SQLite
+==========================================
+
+Modul ini menyimpan riwayat konversi ke basis data SQLite (library standar)
+sehingga riwayat tidak hilang ketika program ditutup.
+
+Fitur:
+- Mode WAL agar beberapa instance GUI/CLI dapat menulis bersamaan
+- Penyimpanan bertahap (batch) berdasarkan interval waktu atau jumlah baris;
+  timer latar menyimpan entri tertunda walaupun tidak ada entri baru
+- Indeks untuk pasangan sistem, waktu, dan nilai asal
+- Query riwayat (N terakhir, per sistem asal, per prefix nilai) lewat indeks
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List
+
+
+SKEMA_RIWAYAT = """
+CREATE TABLE IF NOT EXISTS riwayat_konversi (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    waktu REAL NOT NULL,
+    nilai_asal TEXT NOT NULL,
+    sistem_asal TEXT NOT NULL,
+    sistem_tujuan TEXT NOT NULL,
+    hasil TEXT NOT NULL,
+    nilai_desimal TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_riwayat_pasangan
+    ON riwayat_konversi (sistem_asal, sistem_tujuan, waktu);
+CREATE INDEX IF NOT EXISTS idx_riwayat_sistem_waktu
+    ON riwayat_konversi (sistem_asal, waktu);
+CREATE INDEX IF NOT EXISTS idx_riwayat_waktu
+    ON riwayat_konversi (waktu);
+CREATE INDEX IF NOT EXISTS idx_riwayat_nilai
+    ON riwayat_konversi (nilai_asal);
+"""
+
+KOLOM_RIWAYAT = "waktu, nilai_asal, sistem_asal, sistem_tujuan, hasil, nilai_desimal"
+
+
+class RiwayatSQLite:
+    """
+    Penyimpanan riwayat konversi persisten dengan SQLite dalam mode WAL
+
+    Entri riwayat ditampung di memori dan ditulis sekaligus dalam satu
+    transaksi ketika interval penyimpanan terlewati atau jumlah baris
+    tertunda mencapai ambang batas. Interval dijaga oleh threading.Timer
+    sehingga sesi yang menganggur tetap menyimpan entri terakhirnya.
+    """
+
+    def __init__(self, path_db: str, interval_simpan: float = 300.0,
+                 ambang_baris: int = 100, timeout_kunci: float = 30.0):
+        """
+        Inisialisasi penyimpanan riwayat
+
+        Args:
+            path_db (str): Lokasi file basis data SQLite
+            interval_simpan (float): Interval penyimpanan otomatis dalam detik
+                (lihat PERFORMANCE_CONFIG['auto_save_interval'])
+            ambang_baris (int): Jumlah baris tertunda yang memicu penyimpanan
+            timeout_kunci (float): Lama menunggu kunci tulis dari proses lain (detik)
+        """
+        if ambang_baris < 1:
+            raise ValueError("Ambang baris minimal 1")
+
+        self.path_db = path_db
+        self.interval_simpan = interval_simpan
+        self.ambang_baris = ambang_baris
+        self._tertunda: List[tuple] = []
+        self._terakhir_simpan = time.monotonic()
+        self._kunci = threading.Lock()
+        self._timer = None
+
+        direktori = os.path.dirname(os.path.abspath(path_db))
+        os.makedirs(direktori, exist_ok=True)
+
+        # isolation_level=None: transaksi dikelola manual dengan BEGIN IMMEDIATE
+        self._koneksi = sqlite3.connect(path_db, timeout=timeout_kunci,
+                                        isolation_level=None, check_same_thread=False)
+        self._koneksi.execute("PRAGMA journal_mode=WAL")
+        self._koneksi.execute("PRAGMA synchronous=NORMAL")
+        self._koneksi.execute(f"PRAGMA busy_timeout={int(timeout_kunci * 1000)}")
+        self._koneksi.executescript(SKEMA_RIWAYAT)
+
+    def tambah(self, entri: Dict):
+        """
+        Menambahkan satu entri riwayat ke antrean penyimpanan
+
+        Args:
+            entri (Dict): Entri riwayat dengan kunci nilai_asal, sistem_asal,
+                sistem_tujuan, hasil, dan nilai_desimal
+        """
+        baris = (time.time(), entri['nilai_asal'], entri['sistem_asal'],
+                 entri['sistem_tujuan'], entri['hasil'], str(entri['nilai_desimal']))
+
+        with self._kunci:
+            self._tertunda.append(baris)
+            perlu_simpan = (len(self._tertunda) >= self.ambang_baris or
+                            time.monotonic() - self._terakhir_simpan >= self.interval_simpan)
+            if perlu_simpan:
+                self._simpan_tanpa_kunci()
+            elif self._timer is None:
+                sisa = self.interval_simpan - (time.monotonic() - self._terakhir_simpan)
+                self._timer = threading.Timer(max(sisa, 0.0), self._simpan_terjadwal)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _simpan_terjadwal(self):
+        """Dipanggil timer: menyimpan entri tertunda setelah interval terlewati"""
+        with self._kunci:
+            # Timer yang sudah dibatalkan (antrean sudah disimpan) tidak berbuat apa-apa
+            if self._timer is not threading.current_thread() or self._koneksi is None:
+                return
+            self._timer = None
+            try:
+                self._simpan_tanpa_kunci()
+            except sqlite3.Error:
+                # Entri tetap tertunda dan dicoba lagi pada penyimpanan berikutnya
+                pass
+
+    def simpan(self) -> int:
+        """
+        Menulis semua entri tertunda ke basis data
+
+        Returns:
+            int: Jumlah baris yang ditulis
+        """
+        with self._kunci:
+            return self._simpan_tanpa_kunci()
+
+    def _batalkan_timer_tanpa_kunci(self):
+        """Membatalkan penyimpanan terjadwal yang belum berjalan (pemanggil memegang kunci)"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _simpan_tanpa_kunci(self) -> int:
+        """Menulis antrean dalam satu transaksi (pemanggil memegang kunci)"""
+        self._terakhir_simpan = time.monotonic()
+        self._batalkan_timer_tanpa_kunci()
+        if not self._tertunda:
+            return 0
+
+        baris = self._tertunda
+        # BEGIN IMMEDIATE mengambil kunci tulis di awal sehingga penulis lain
+        # menunggu (busy_timeout) alih-alih gagal di tengah transaksi
+        self._koneksi.execute("BEGIN IMMEDIATE")
+        try:
+            self._koneksi.executemany(
+                f"INSERT INTO riwayat_konversi ({KOLOM_RIWAYAT}) VALUES (?, ?, ?, ?, ?, ?)",
+                baris
+            )
+            self._koneksi.execute("COMMIT")
+        except Exception:
+            self._koneksi.execute("ROLLBACK")
+            raise
+
+        self._tertunda = []
+        return len(baris)
+
+    def _query(self, sql: str, parameter: tuple) -> List[Dict]:
+        """Menjalankan query setelah menyimpan entri tertunda"""
+        with self._kunci:
+            self._simpan_tanpa_kunci()
+            kursor = self._koneksi.execute(sql, parameter)
+            baris = kursor.fetchall()
+
+        return [
+            {
+                'waktu': waktu,
+                'nilai_asal': nilai_asal,
+                'sistem_asal': sistem_asal,
+                'sistem_tujuan': sistem_tujuan,
+                'hasil': hasil,
+                'nilai_desimal': int(nilai_desimal)
+            }
+            for waktu, nilai_asal, sistem_asal, sistem_tujuan, hasil, nilai_desimal in baris
+        ]
+
+    def terakhir(self, jumlah: int = 10) -> List[Dict]:
+        """
+        Mengambil N entri riwayat terakhir (urut dari yang terlama)
+
+        Args:
+            jumlah (int): Jumlah entri yang diambil
+
+        Returns:
+            List[Dict]: Entri riwayat
+        """
+        hasil = self._query(
+            f"SELECT {KOLOM_RIWAYAT} FROM riwayat_konversi "
+            "ORDER BY waktu DESC, id DESC LIMIT ?",
+            (jumlah,)
+        )
+        hasil.reverse()
+        return hasil
+
+    def berdasarkan_sistem_asal(self, sistem_asal: str, jumlah: int = 100) -> List[Dict]:
+        """
+        Mengambil entri terbaru untuk sistem asal tertentu
+
+        Args:
+            sistem_asal (str): Nama sistem asal (misal 'biner')
+            jumlah (int): Batas jumlah entri
+
+        Returns:
+            List[Dict]: Entri riwayat, terbaru lebih dulu
+        """
+        return self._query(
+            f"SELECT {KOLOM_RIWAYAT} FROM riwayat_konversi "
+            "WHERE sistem_asal = ? ORDER BY waktu DESC LIMIT ?",
+            (sistem_asal, jumlah)
+        )
+
+    def berdasarkan_pasangan(self, sistem_asal: str, sistem_tujuan: str,
+                             jumlah: int = 100) -> List[Dict]:
+        """
+        Mengambil entri terbaru untuk pasangan sistem asal dan tujuan
+
+        Args:
+            sistem_asal (str): Nama sistem asal
+            sistem_tujuan (str): Nama sistem tujuan
+            jumlah (int): Batas jumlah entri
+
+        Returns:
+            List[Dict]: Entri riwayat, terbaru lebih dulu
+        """
+        return self._query(
+            f"SELECT {KOLOM_RIWAYAT} FROM riwayat_konversi "
+            "WHERE sistem_asal = ? AND sistem_tujuan = ? ORDER BY waktu DESC LIMIT ?",
+            (sistem_asal, sistem_tujuan, jumlah)
+        )
+
+    def berdasarkan_prefix_nilai(self, prefix: str, jumlah: int = 100) -> List[Dict]:
+        """
+        Mengambil entri yang nilai asalnya diawali prefix tertentu
+
+        Query memakai rentang [prefix, prefix_berikutnya) agar dapat dilayani
+        indeks nilai_asal (LIKE tidak memakai indeks pada kolom case-sensitive).
+
+        Args:
+            prefix (str): Awalan nilai asal
+            jumlah (int): Batas jumlah entri
+
+        Returns:
+            List[Dict]: Entri riwayat urut nilai asal
+        """
+        if not prefix:
+            raise ValueError("Prefix tidak boleh kosong")
+
+        batas_atas = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        return self._query(
+            f"SELECT {KOLOM_RIWAYAT} FROM riwayat_konversi "
+            "WHERE nilai_asal >= ? AND nilai_asal < ? ORDER BY nilai_asal LIMIT ?",
+            (prefix, batas_atas, jumlah)
+        )
+
+    def jumlah(self) -> int:
+        """Mengembalikan jumlah total entri tersimpan (termasuk yang tertunda)"""
+        with self._kunci:
+            self._simpan_tanpa_kunci()
+            return self._koneksi.execute("SELECT COUNT(*) FROM riwayat_konversi").fetchone()[0]
+
+    def hapus_semua(self):
+        """Menghapus seluruh riwayat tersimpan"""
+        with self._kunci:
+            self._tertunda = []
+            self._batalkan_timer_tanpa_kunci()
+            self._koneksi.execute("DELETE FROM riwayat_konversi")
+
+    def tutup(self):
+        """Menyimpan entri tertunda lalu menutup koneksi"""
+        with self._kunci:
+            if self._koneksi is None:
+                return
+            try:
+                self._simpan_tanpa_kunci()
+            finally:
+                # Koneksi tetap ditutup walau penyimpanan gagal (misal basis data terkunci)
+                self._batalkan_timer_tanpa_kunci()
+                self._koneksi.close()
+                self._koneksi = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.tutup()
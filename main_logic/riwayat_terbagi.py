@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Riwayat Terbagi per Thread
+==========================
+
+Riwayat konversi yang aman dipakai bersama oleh banyak thread. Setiap
+thread menulis ke shard (list) miliknya sendiri sehingga append tidak
+berebut kunci; kunci hanya dipakai saat thread pertama kali mendaftarkan
+shard dan saat riwayat dikosongkan.
+
+Saat dibaca, semua shard digabung menurut nomor urut global (heapq.merge)
+sehingga urutan entri sama dengan urutan konversi terjadi. Hasil gabungan
+di-cache selama tidak ada entri baru.
+
+Dengan batas, setiap shard berupa deque(maxlen=batas) dan pembacaan hanya
+mengembalikan batas entri terbaru. Shard milik thread yang sudah berakhir
+digabung ke satu shard arsip saat thread baru mendaftar, dan entri yang
+lebih lama dari batas entri terbaru dibuang dari semua shard, sehingga
+jumlah shard dan entri yang disimpan tetap terbatas walaupun thread
+datang dan pergi (misal satu thread per permintaan).
+
+Objek berperilaku seperti list untuk pemakaian yang sudah ada: len(),
+indeks/slice, iterasi, append, extend, clear, dan perbandingan dengan list.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import heapq
+import itertools
+import threading
+from collections import deque
+from operator import itemgetter
+from typing import Any, Deque, Iterable, Iterator, List, Optional, Tuple
+
+_URUTAN = itemgetter(0)
+# Tanpa batas, shard mati digabung setelah jumlah shard mencapai ambang ini
+# (lalu dua kali jumlah shard tersisa) agar biayanya teramortisasi
+_AMBANG_PANGKAS_MINIMUM = 8
+
+Shard = Deque[Tuple[int, Any]]
+
+
+class RiwayatTerbagi:
+    """List riwayat dengan shard per thread, digabung saat dibaca"""
+
+    def __init__(self, entri: Iterable[Any] = (), batas: Optional[int] = None):
+        """
+        Args:
+            entri (Iterable): Entri awal
+            batas (int, optional): Jumlah entri terbaru yang disimpan; None = tanpa batas
+        """
+        if batas is not None and batas <= 0:
+            raise ValueError("Batas riwayat harus positif")
+        self.batas = batas
+        self._lokal = threading.local()
+        self._kunci = threading.Lock()
+        # Pasangan (thread pemilik, shard); pemilik None untuk shard arsip
+        self._daftar_shard: List[Tuple[Optional[threading.Thread], Shard]] = []
+        self._ambang_pangkas = _AMBANG_PANGKAS_MINIMUM
+        # next() pada itertools.count atomik di CPython, dengan atau tanpa GIL
+        self._urutan = itertools.count()
+        self._generasi = 0
+        self._cache = None
+        for isi in entri:
+            self.append(isi)
+
+    def _shard(self) -> Shard:
+        """Shard milik thread pemanggil (dibuat saat pertama dipakai)"""
+        lokal = self._lokal
+        try:
+            if lokal.generasi == self._generasi:
+                return lokal.shard
+        except AttributeError:
+            pass
+        shard = deque(maxlen=self.batas)
+        with self._kunci:
+            if self.batas is not None or len(self._daftar_shard) >= self._ambang_pangkas:
+                self._pangkas_tanpa_kunci()
+            self._daftar_shard.append((threading.current_thread(), shard))
+            lokal.generasi = self._generasi
+        lokal.shard = shard
+        return shard
+
+    def _pangkas_tanpa_kunci(self):
+        """
+        Menggabung shard thread yang sudah berakhir ke shard arsip dan membuang
+        entri di luar batas dari semua shard (pemanggil memegang kunci)
+        """
+        arsip, hidup, mati = None, [], []
+        for pemilik, shard in self._daftar_shard:
+            if pemilik is None:
+                arsip = shard
+            elif not pemilik.is_alive():
+                if shard:
+                    mati.append(shard)
+            else:
+                hidup.append((pemilik, shard))
+        if arsip is None:
+            arsip = deque(maxlen=self.batas)
+        if mati:
+            # Hanya ekor arsip yang lebih baru dari entri tertua shard mati yang
+            # perlu diurutkan ulang; sisanya cukup ditambah di kanan
+            awal = min(shard[0][0] for shard in mati)
+            ekor = []
+            while arsip and arsip[-1][0] > awal:
+                ekor.append(arsip.pop())
+            ekor.reverse()
+            arsip.extend(heapq.merge(ekor, *mati, key=_URUTAN))
+
+        if self.batas is not None:
+            # Thread hidup hanya menambah di kanan, jadi popleft aman dilakukan di sini
+            semua = [arsip] + [shard for _, shard in hidup]
+            urutan = [u for shard in semua for u, _ in shard.copy()]
+            if len(urutan) > self.batas:
+                tertua = heapq.nlargest(self.batas, urutan)[-1]
+                for shard in semua:
+                    while shard and shard[0][0] < tertua:
+                        shard.popleft()
+
+        self._daftar_shard = ([(None, arsip)] if arsip else []) + hidup
+        self._ambang_pangkas = max(_AMBANG_PANGKAS_MINIMUM, 2 * len(self._daftar_shard))
+        self._cache = None
+
+    def append(self, entri: Any):
+        """Menambah satu entri ke shard thread pemanggil"""
+        self._shard().append((next(self._urutan), entri))
+
+    def extend(self, daftar_entri: Iterable[Any]):
+        """Menambah banyak entri ke shard thread pemanggil"""
+        shard = self._shard()
+        urutan = self._urutan
+        shard.extend((next(urutan), entri) for entri in daftar_entri)
+
+    def clear(self):
+        """Mengosongkan seluruh riwayat dari semua thread"""
+        with self._kunci:
+            # Shard lama ditinggalkan; thread akan mendaftarkan shard baru
+            self._daftar_shard = []
+            self._generasi += 1
+            self._cache = None
+
+    def atur_batas(self, batas: Optional[int]):
+        """
+        Mengubah batas riwayat saat berjalan; entri terbaru dipertahankan.
+
+        Seperti clear(), entri yang ditambah thread lain tepat saat batas
+        diganti dapat hilang.
+        """
+        if batas is not None and batas <= 0:
+            raise ValueError("Batas riwayat harus positif")
+        with self._kunci:
+            gabungan = list(heapq.merge(*[shard.copy() for _, shard in self._daftar_shard],
+                                        key=_URUTAN))
+            if self.batas is not None:
+                # Shard bisa menyimpan lebih dari batas entri secara total
+                del gabungan[:-self.batas]
+            shard = deque(gabungan, maxlen=batas)
+            self.batas = batas
+            # Shard gabungan tidak dimiliki thread mana pun; semua thread
+            # mendaftarkan shard baru dengan maxlen yang baru
+            self._daftar_shard = [(None, shard)] if shard else []
+            self._generasi += 1
+            self._cache = None
+
+    def _gabung(self) -> List[Any]:
+        """Daftar entri semua shard, terurut menurut waktu penambahan"""
+        with self._kunci:
+            daftar_shard = [shard for _, shard in self._daftar_shard]
+            generasi = self._generasi
+            # Versi = nomor urut entri terakhir tiap shard (tetap berubah walau deque
+            # penuh). Dibaca di dalam kunci karena _pangkas_tanpa_kunci dari thread
+            # lain dapat mengosongkan shard di antara pemeriksaan dan shard[-1]
+            terakhir = tuple(shard[-1][0] if shard else -1 for shard in daftar_shard)
+        versi = (generasi,) + terakhir
+        cache = self._cache
+        if cache is not None and cache[0] == versi:
+            return cache[1]
+
+        salinan = []
+        for shard, urutan_terakhir in zip(daftar_shard, terakhir):
+            # deque.copy() atomik; buang entri yang ditambah setelah versi dibaca
+            isi = shard.copy()
+            while isi and isi[-1][0] > urutan_terakhir:
+                isi.pop()
+            salinan.append(isi)
+        if len(salinan) == 1:
+            gabungan = [entri for _, entri in salinan[0]]
+        else:
+            gabungan = [entri for _, entri in heapq.merge(*salinan, key=_URUTAN)]
+        if self.batas is not None and len(gabungan) > self.batas:
+            del gabungan[:-self.batas]
+        self._cache = (versi, gabungan)
+        return gabungan
+
+    def salin(self) -> List[Any]:
+        """Salinan list biasa dari seluruh riwayat"""
+        return list(self._gabung())
+
+    def jumlah_shard(self) -> int:
+        """Jumlah shard yang disimpan (thread penulis, ditambah shard arsip)"""
+        with self._kunci:
+            return len(self._daftar_shard)
+
+    def jumlah_tersimpan(self) -> int:
+        """Jumlah entri yang disimpan semua shard (bisa melebihi len() sebelum dipangkas)"""
+        with self._kunci:
+            daftar_shard = [shard for _, shard in self._daftar_shard]
+        return sum(len(shard) for shard in daftar_shard)
+
+    def __len__(self) -> int:
+        jumlah = self.jumlah_tersimpan()
+        return jumlah if self.batas is None else min(jumlah, self.batas)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __getitem__(self, indeks):
+        return self._gabung()[indeks]
+
+    def __iter__(self) -> Iterator[Any]:
+        # List hasil gabungan tidak pernah diubah, aman diiterasi
+        return iter(self._gabung())
+
+    def __eq__(self, lain) -> bool:
+        if isinstance(lain, RiwayatTerbagi):
+            return self._gabung() == lain._gabung()
+        if isinstance(lain, list):
+            return self._gabung() == lain
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._gabung()!r})"
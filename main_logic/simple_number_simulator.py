@@ -56,7 +56,10 @@ class KonverterSistemBilangan:
             bool: True jika valid, False jika tidak valid
         """
         try:
-            nilai = nilai.strip().upper()
+            nilai = nilai.strip()
+            if not nilai.isascii():
+                return False
+            nilai = nilai.upper()
             
             if sistem == SistemBilangan.BINER:
                 return bool(re.match(r'^[01]+$', nilai))
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tabel Konversi Prakomputasi (Memory-Mapped)
+===========================================
+
+Tabel biner berisi representasi biner, oktal, desimal, dan heksadesimal dari
+setiap nilai 0..2^bit-1 (default 16 bit: port, register, byte). Setiap nilai
+menempati satu record dengan lebar tetap, sehingga representasi sebuah nilai
+dibaca dengan satu slice pada offset header + nilai * stride.
+
+File dibuka dengan mmap hanya-baca. Semua proses yang membuka file yang sama
+berbagi halaman memori yang sama dari page cache sistem operasi; objek tabel
+yang di-pickle ke proses lain (misal ProcessPoolExecutor) membuka ulang file
+tersebut, bukan menyalin isinya.
+
+Format file:
+    Header 64 byte: magic b'NSTP', versi format, jumlah bit, stride,
+    jumlah kolom, CRC-32 isi record, lalu padding nol.
+    Record: untuk setiap kolom, 1 byte panjang diikuti digit ASCII yang
+    dipadatkan dengan nol sampai lebar kolom.
+
+Penggunaan:
+    python tabel_prakomputasi.py --bangun tabel16.bin
+    python tabel_prakomputasi.py --info tabel16.bin --cek
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+
+class TabelUsang(ValueError):
+    """File adalah tabel prakomputasi (magic cocok) tetapi versi atau tata letaknya lama"""
+
+
+MAGIC = b'NSTP'
+VERSI_FORMAT = 1
+BIT_DEFAULT = 16
+BIT_MAKSIMUM = 20
+UKURAN_HEADER = 64
+_HEADER = struct.Struct('<4sHHHHI')
+
+# Kolom record: (nama sistem, kode format bawaan); urutan menentukan offset
+KOLOM = (
+    ('biner', 'b'),
+    ('oktal', 'o'),
+    ('desimal', 'd'),
+    ('heksadesimal', 'X'),
+)
+
+PATH_DEFAULT = os.path.join(os.path.expanduser('~'), '.simulator_sistem_bilangan', 'tabel16.bin')
+
+
+def tata_letak(bit: int) -> Tuple[int, Dict[str, Tuple[int, str]]]:
+    """
+    Menghitung stride record dan offset setiap kolom
+
+    Args:
+        bit (int): Jumlah bit nilai yang dicakup tabel
+
+    Returns:
+        Tuple: (stride, {nama: (offset dalam record, kode format)})
+    """
+    if not 1 <= bit <= BIT_MAKSIMUM:
+        raise ValueError(f"Jumlah bit tabel harus 1-{BIT_MAKSIMUM}")
+    offset = 0
+    kolom = {}
+    for nama, kode in KOLOM:
+        kolom[nama] = (offset, kode)
+        offset += 1 + len(format((1 << bit) - 1, kode))
+    return offset, kolom
+
+
+def bangun_tabel(path: str, bit: int = BIT_DEFAULT) -> str:
+    """
+    Membangun file tabel secara atomik (file sementara lalu os.replace)
+
+    Args:
+        path (str): Lokasi file tabel
+        bit (int): Jumlah bit nilai yang dicakup
+
+    Returns:
+        str: Path file tabel
+    """
+    stride, kolom = tata_letak(bit)
+    lebar = {nama: len(format((1 << bit) - 1, kode)) for nama, kode in KOLOM}
+    isi = bytearray(stride << bit)
+    posisi = 0
+    for nilai in range(1 << bit):
+        for nama, kode in KOLOM:
+            digit = format(nilai, kode).encode('ascii')
+            isi[posisi] = len(digit)
+            isi[posisi + 1:posisi + 1 + len(digit)] = digit
+            posisi += 1 + lebar[nama]
+    header = _HEADER.pack(MAGIC, VERSI_FORMAT, bit, stride, len(KOLOM), zlib.crc32(isi))
+
+    direktori = os.path.dirname(os.path.abspath(path))
+    os.makedirs(direktori, exist_ok=True)
+    fd, sementara = tempfile.mkstemp(dir=direktori, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as berkas:
+            berkas.write(header.ljust(UKURAN_HEADER, b'\0'))
+            berkas.write(isi)
+        # Tabel dibaca bersama oleh proses lain; mkstemp membuat file 0600
+        os.chmod(sementara, 0o644)
+        os.replace(sementara, path)
+    except BaseException:
+        os.unlink(sementara)
+        raise
+    return path
+
+
+class TabelPrakomputasi:
+    """Tabel konversi memory-mapped dengan pembacaan O(1) per nilai"""
+
+    def __init__(self, path: str):
+        """
+        Membuka file tabel dan memeriksa versi serta tata letaknya
+
+        Args:
+            path (str): Lokasi file tabel
+
+        Raises:
+            TabelUsang: Jika file adalah tabel tetapi versi/tata letaknya lama atau terpotong
+            ValueError: Jika file bukan tabel prakomputasi
+        """
+        self.path = path
+        with open(path, 'rb') as berkas:
+            header = berkas.read(UKURAN_HEADER)
+            if header[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"File '{path}' bukan tabel prakomputasi")
+            if len(header) < UKURAN_HEADER:
+                raise TabelUsang(f"File tabel '{path}' terpotong")
+            magic, versi, bit, stride, jumlah_kolom, crc = _HEADER.unpack_from(header)
+            if versi != VERSI_FORMAT:
+                raise TabelUsang(f"Versi tabel {versi} tidak didukung (butuh {VERSI_FORMAT}); "
+                                 "bangun ulang dengan --bangun")
+            try:
+                stride_harap, kolom = tata_letak(bit)
+            except ValueError:
+                raise TabelUsang(f"Tata letak tabel '{path}' tidak cocok; bangun ulang dengan --bangun")
+            if stride != stride_harap or jumlah_kolom != len(KOLOM):
+                raise TabelUsang(f"Tata letak tabel '{path}' tidak cocok; bangun ulang dengan --bangun")
+            if os.fstat(berkas.fileno()).st_size != UKURAN_HEADER + (stride << bit):
+                raise TabelUsang(f"File tabel '{path}' terpotong")
+            self._mm = mmap.mmap(berkas.fileno(), 0, access=mmap.ACCESS_READ)
+        self.bit = bit
+        self.stride = stride
+        self.crc = crc
+        self.jumlah = 1 << bit
+        # Offset kolom sudah termasuk header agar format() cukup satu perkalian
+        self._offset = {nama: UKURAN_HEADER + offset for nama, (offset, _) in kolom.items()}
+
+    @classmethod
+    def buka_atau_bangun(cls, path: Optional[str] = None,
+                         bit: int = BIT_DEFAULT) -> 'TabelPrakomputasi':
+        """
+        Membuka tabel (default PATH_DEFAULT); jika belum ada atau versinya lama, bangun ulang dulu
+
+        File lain yang bukan tabel prakomputasi tidak pernah ditimpa.
+
+        Raises:
+            ValueError: Jika path berisi file yang bukan tabel prakomputasi
+            OSError: Jika file tidak dapat dibaca atau dibangun
+        """
+        path = path or PATH_DEFAULT
+        try:
+            return cls(path)
+        except (FileNotFoundError, TabelUsang):
+            bangun_tabel(path, bit)
+            return cls(path)
+
+    def format(self, nilai: int, sistem) -> Optional[str]:
+        """
+        Representasi nilai dalam sistem tertentu
+
+        Args:
+            nilai (int): Nilai tidak negatif
+            sistem (SistemBilangan | str): Sistem tujuan
+
+        Returns:
+            str: Representasi nilai, atau None jika nilai di luar jangkauan tabel
+        """
+        if not 0 <= nilai < self.jumlah:
+            return None
+        try:
+            offset = self._offset[sistem]
+        except KeyError:
+            # SistemBilangan dicatat sebagai kunci tersendiri agar .value tidak dibaca lagi
+            offset = self._offset[sistem] = self._offset[sistem.value]
+        posisi = offset + nilai * self.stride
+        mm = self._mm
+        return mm[posisi + 1:posisi + 1 + mm[posisi]].decode('ascii')
+
+    def verifikasi(self) -> bool:
+        """Mencocokkan CRC-32 isi record dengan yang tercatat di header"""
+        return zlib.crc32(self._mm[UKURAN_HEADER:]) == self.crc
+
+    def info(self) -> Dict:
+        """Ringkasan versi dan ukuran tabel"""
+        return {
+            'path': self.path,
+            'versi': VERSI_FORMAT,
+            'bit': self.bit,
+            'jumlah': self.jumlah,
+            'stride': self.stride,
+            'ukuran': UKURAN_HEADER + self.stride * self.jumlah,
+            'crc32': f"{self.crc:08x}",
+        }
+
+    def tutup(self):
+        """Melepas memory map"""
+        self._mm.close()
+
+    def __len__(self) -> int:
+        return self.jumlah
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.tutup()
+
+    def __reduce__(self):
+        # Proses lain memetakan file yang sama, bukan menerima salinan isinya
+        return (type(self), (self.path,))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Tabel konversi prakomputasi memory-mapped")
+    parser.add_argument('--bangun', metavar='FILE', nargs='?', const=PATH_DEFAULT,
+                        help=f"Bangun file tabel (default: {PATH_DEFAULT})")
+    parser.add_argument('--bit', type=int, default=BIT_DEFAULT,
+                        help=f"Jumlah bit nilai yang dicakup (default: {BIT_DEFAULT})")
+    parser.add_argument('--info', metavar='FILE', nargs='?', const=PATH_DEFAULT,
+                        help="Tampilkan versi dan ukuran file tabel")
+    parser.add_argument('--cek', action='store_true',
+                        help="Dengan --info, periksa CRC-32 isi tabel")
+    args = parser.parse_args(argv)
+    if args.bangun is None and args.info is None:
+        parser.error("gunakan --bangun dan/atau --info")
+
+    try:
+        if args.bangun is not None:
+            bangun_tabel(args.bangun, args.bit)
+            print(f"Tabel {args.bit} bit ditulis ke {args.bangun}")
+        if args.info is not None:
+            with TabelPrakomputasi(args.info) as tabel:
+                for kunci, nilai in tabel.info().items():
+                    print(f"{kunci:>7}: {nilai}")
+                if args.cek:
+                    if not tabel.verifikasi():
+                        print("CRC-32 tidak cocok: tabel rusak", file=sys.stderr)
+                        return 1
+                    print("    cek: CRC-32 cocok")
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Generator Tabel Konversi Rentang
+================================
+
+Modul ini membuat tabel konversi untuk seluruh rentang nilai (misal 0..N)
+dalam keempat sistem bilangan sekaligus.
+
+Setiap kolom dihasilkan oleh pencacah digit (odometer) di basisnya sendiri:
+nilai berikutnya didapat dengan menaikkan digit terakhir dan meneruskan
+carry, bukan dengan konversi ulang per baris. Output berupa generator dan
+penulis CSV/TSV/Markdown yang streaming sehingga tabel sangat besar
+(misal 10^8 baris) dapat dibuat dengan memori konstan.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import argparse
+import csv
+import sys
+from typing import Iterator, List, Optional, TextIO, Tuple
+
+try:
+    from .progres import (TokenPembatalan, OperasiDibatalkan, iterasi_terlacak,
+                          BilahProgresTeks, tangkap_ctrl_c)
+except ImportError:
+    from progres import (TokenPembatalan, OperasiDibatalkan, iterasi_terlacak,
+                         BilahProgresTeks, tangkap_ctrl_c)
+
+
+# Kolom tabel: (nama sistem, basis, digit), urut seperti SistemBilangan
+KOLOM_TABEL: Tuple[Tuple[str, int, str], ...] = (
+    ('biner', 2, '01'),
+    ('desimal', 10, '0123456789'),
+    ('heksadesimal', 16, '0123456789ABCDEF'),
+    ('oktal', 8, '01234567'),
+)
+
+
+class PencacahDigit:
+    """
+    Pencacah digit (odometer) untuk satu basis bilangan
+
+    Digit disimpan sebagai list karakter (digit paling signifikan di depan).
+    Kenaikan hanya menyentuh digit yang berubah, sehingga biaya rata-rata
+    per kenaikan konstan.
+    """
+
+    def __init__(self, nilai_awal: int, basis: int, digit: str):
+        """
+        Inisialisasi pencacah pada nilai awal
+
+        Args:
+            nilai_awal (int): Nilai awal (desimal, tidak negatif)
+            basis (int): Basis bilangan
+            digit (str): Alfabet digit untuk basis tersebut
+        """
+        if nilai_awal < 0:
+            raise ValueError("Program ini hanya mendukung bilangan positif")
+        if len(digit) != basis:
+            raise ValueError(f"Jumlah digit ({len(digit)}) tidak sesuai basis {basis}")
+
+        self.basis = basis
+        self.digit_nol = digit[0]
+        self.digit_maks = digit[-1]
+        self.digit_satu = digit[1]
+        self.berikutnya = {digit[i]: digit[i + 1] for i in range(basis - 1)}
+
+        # Satu-satunya konversi penuh: menentukan digit nilai awal
+        karakter: List[str] = []
+        while nilai_awal:
+            nilai_awal, sisa = divmod(nilai_awal, basis)
+            karakter.append(digit[sisa])
+        self.karakter = karakter[::-1] or [self.digit_nol]
+
+    def naik(self):
+        """Menaikkan nilai pencacah sebesar satu"""
+        karakter = self.karakter
+        posisi = len(karakter) - 1
+
+        # Digit maksimum berubah menjadi nol dan carry diteruskan ke kiri
+        while posisi >= 0 and karakter[posisi] == self.digit_maks:
+            karakter[posisi] = self.digit_nol
+            posisi -= 1
+
+        if posisi < 0:
+            karakter.insert(0, self.digit_satu)
+        else:
+            karakter[posisi] = self.berikutnya[karakter[posisi]]
+
+    def teks(self) -> str:
+        """Mengembalikan representasi string nilai saat ini"""
+        return ''.join(self.karakter)
+
+
+def generator_tabel_rentang(awal: int, akhir: int) -> Iterator[Tuple[str, ...]]:
+    """
+    Menghasilkan baris tabel konversi untuk setiap nilai dalam rentang [awal, akhir]
+
+    Args:
+        awal (int): Nilai awal rentang (desimal)
+        akhir (int): Nilai akhir rentang (desimal, inklusif)
+
+    Yields:
+        Tuple[str, ...]: Representasi nilai dalam urutan KOLOM_TABEL
+    """
+    if awal < 0 or akhir < 0:
+        raise ValueError("Program ini hanya mendukung bilangan positif")
+    if akhir < awal:
+        return
+
+    pencacah = [PencacahDigit(awal, basis, digit) for _, basis, digit in KOLOM_TABEL]
+
+    for _ in range(akhir - awal):
+        yield tuple(p.teks() for p in pencacah)
+        for p in pencacah:
+            p.naik()
+
+    yield tuple(p.teks() for p in pencacah)
+
+
+def header_tabel() -> List[str]:
+    """Mengembalikan nama kolom tabel"""
+    return [nama for nama, _, _ in KOLOM_TABEL]
+
+
+def tulis_csv(baris_tabel: Iterator[Tuple[str, ...]], berkas: TextIO,
+              pemisah: str = ',') -> int:
+    """
+    Menulis tabel ke berkas CSV secara streaming
+
+    Args:
+        baris_tabel (Iterator): Baris dari generator_tabel_rentang
+        berkas (TextIO): Berkas tujuan (dibuka dengan newline='')
+        pemisah (str): Karakter pemisah kolom
+
+    Returns:
+        int: Jumlah baris data yang ditulis
+    """
+    penulis = csv.writer(berkas, delimiter=pemisah, lineterminator='\n')
+    penulis.writerow(header_tabel())
+
+    jumlah = 0
+    for baris in baris_tabel:
+        penulis.writerow(baris)
+        jumlah += 1
+    return jumlah
+
+
+def tulis_tsv(baris_tabel: Iterator[Tuple[str, ...]], berkas: TextIO) -> int:
+    """
+    Menulis tabel ke berkas TSV secara streaming
+
+    Args:
+        baris_tabel (Iterator): Baris dari generator_tabel_rentang
+        berkas (TextIO): Berkas tujuan
+
+    Returns:
+        int: Jumlah baris data yang ditulis
+    """
+    return tulis_csv(baris_tabel, berkas, pemisah='\t')
+
+
+def tulis_markdown(baris_tabel: Iterator[Tuple[str, ...]], berkas: TextIO) -> int:
+    """
+    Menulis tabel sebagai tabel Markdown secara streaming
+
+    Args:
+        baris_tabel (Iterator): Baris dari generator_tabel_rentang
+        berkas (TextIO): Berkas tujuan
+
+    Returns:
+        int: Jumlah baris data yang ditulis
+    """
+    header = header_tabel()
+    berkas.write('| ' + ' | '.join(nama.capitalize() for nama in header) + ' |\n')
+    berkas.write('|' + '|'.join('---' for _ in header) + '|\n')
+
+    jumlah = 0
+    for baris in baris_tabel:
+        berkas.write('| ' + ' | '.join(baris) + ' |\n')
+        jumlah += 1
+    return jumlah
+
+
+PENULIS_TABEL = {
+    'csv': tulis_csv,
+    'tsv': tulis_tsv,
+    'markdown': tulis_markdown,
+}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line: membuat tabel konversi rentang ke stdout atau berkas"""
+    parser = argparse.ArgumentParser(description="Generator tabel konversi rentang")
+    parser.add_argument('awal', type=int, help="Nilai awal (desimal)")
+    parser.add_argument('akhir', type=int, help="Nilai akhir (desimal, inklusif)")
+    parser.add_argument('--format', choices=sorted(PENULIS_TABEL), default='csv')
+    parser.add_argument('--output', help="Berkas tujuan (default: stdout)")
+    parser.add_argument('--tanpa-progres', action='store_true',
+                        help="Jangan tampilkan bilah progres di stderr")
+    args = parser.parse_args(argv)
+
+    penulis = PENULIS_TABEL[args.format]
+    bilah = None if args.tanpa_progres or not sys.stderr.isatty() else BilahProgresTeks()
+    try:
+        with tangkap_ctrl_c(TokenPembatalan()) as token:
+            # Token diperiksa tiap 1024 baris karena baris rentang sangat murah
+            baris = iterasi_terlacak(generator_tabel_rentang(args.awal, args.akhir), 'tabel_rentang',
+                                     bilah, token, total=max(args.akhir - args.awal + 1, 0),
+                                     langkah=1024)
+            if args.output:
+                with open(args.output, 'w', newline='', encoding='utf-8') as berkas:
+                    jumlah = penulis(baris, berkas)
+                print(f"✅ {jumlah} baris ditulis ke {args.output}")
+            else:
+                penulis(baris, sys.stdout)
+    except OperasiDibatalkan:
+        if bilah is not None:
+            bilah.akhiri()
+        print("⚠️  Pembuatan tabel dibatalkan", file=sys.stderr)
+        return 130
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,22 +11,45 @@ Test yang dijalankan:
 - Test GUI (test_gui.py)
 - Test integrasi
 
+Secara default setiap file test dijalankan berurutan di subprocess sendiri.
+Dengan --paralel, file test (atau setiap metode test dengan --per-kasus)
+dijalankan bersamaan di process pool, hasilnya ditampilkan begitu selesai,
+dan di akhir dicetak laporan test paling lambat.
+
 Penulis: Kelompok 1
 Tanggal: 5/9/2025
 """
 
+import argparse
+import importlib.util
+import io
 import subprocess
 import sys
 import os
 import time
+import unittest
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from datetime import datetime
 
+DIREKTORI_TEST = os.path.dirname(os.path.abspath(__file__))
+DIREKTORI_ROOT = os.path.dirname(DIREKTORI_TEST)
+
+
+def path_test(test_file):
+    """Path lengkap file test; nama tanpa .py dan path relatif dicari di folder tests"""
+    if not test_file.endswith('.py'):
+        test_file += '.py'
+    if os.path.exists(test_file):
+        return test_file
+    return os.path.join(DIREKTORI_TEST, test_file)
+
 
 def run_test_file(test_file, description):
     """Menjalankan file test tertentu"""
     print(f"\n🧪 {description}")
     print("=" * 50)
     
+    test_file = path_test(test_file)
     if not os.path.exists(test_file):
         print(f"❌ File {test_file} tidak ditemukan!")
         return False
@@ -65,6 +88,189 @@ def run_test_file(test_file, description):
         return False
 
 
+class _HasilBerwaktu(unittest.TextTestResult):
+    """TextTestResult yang mencatat durasi setiap test"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.durasi = []
+        self._mulai = {}
+
+    def startTest(self, test):
+        self._mulai[test.id()] = time.perf_counter()
+        super().startTest(test)
+
+    def stopTest(self, test):
+        super().stopTest(test)
+        mulai = self._mulai.pop(test.id(), None)
+        if mulai is not None:
+            self.durasi.append((test.id(), time.perf_counter() - mulai))
+
+
+# Modul test yang sudah dimuat di proses pekerja, agar kasus dari file yang
+# sama tidak mengimpor ulang modulnya
+_modul_termuat = {}
+
+
+def _muat_modul(test_file):
+    """Memuat modul test dari path file di proses pekerja"""
+    path = path_test(test_file)
+    if path not in _modul_termuat:
+        nama = os.path.splitext(os.path.basename(path))[0]
+        spec = importlib.util.spec_from_file_location(nama, path)
+        modul = importlib.util.module_from_spec(spec)
+        sys.modules[nama] = modul
+        spec.loader.exec_module(modul)
+        _modul_termuat[path] = modul
+    return _modul_termuat[path]
+
+
+def _daftar_kasus_test(test_file):
+    """Nama 'Kelas.metode' setiap test di sebuah file"""
+    modul = _muat_modul(test_file)
+    loader = unittest.TestLoader()
+    return [f"{nama}.{metode}" for nama, objek in vars(modul).items()
+            if isinstance(objek, type) and issubclass(objek, unittest.TestCase)
+            and objek.__module__ == modul.__name__
+            for metode in loader.getTestCaseNames(objek)]
+
+
+def _jalankan_unit(test_file, nama_kasus=None):
+    """
+    Menjalankan satu file test, atau satu metode test ('Kelas.metode') di
+    dalamnya, di proses pekerja.
+
+    Returns:
+        Dictionary berisi status, jumlah test, durasi total dan per test, serta output
+    """
+    mulai = time.perf_counter()
+    keluaran = io.StringIO()
+    stdout_asli, stderr_asli = sys.stdout, sys.stderr
+    sys.stdout = sys.stderr = keluaran
+    try:
+        modul = _muat_modul(test_file)
+        loader = unittest.TestLoader()
+        if nama_kasus is None:
+            suite = loader.loadTestsFromModule(modul)
+        else:
+            suite = loader.loadTestsFromName(nama_kasus, modul)
+        runner = unittest.TextTestRunner(stream=keluaran, verbosity=1,
+                                         resultclass=_HasilBerwaktu)
+        hasil = runner.run(suite)
+        status = {
+            'berhasil': hasil.wasSuccessful(),
+            'jumlah': hasil.testsRun,
+            'gagal': len(hasil.failures) + len(hasil.errors),
+            'dilewati': len(hasil.skipped),
+            'durasi_test': hasil.durasi,
+        }
+    except Exception as e:
+        status = {'berhasil': False, 'jumlah': 0, 'gagal': 1, 'dilewati': 0,
+                  'durasi_test': [], 'error': f"{type(e).__name__}: {e}"}
+    finally:
+        sys.stdout, sys.stderr = stdout_asli, stderr_asli
+    status['unit'] = os.path.splitext(os.path.basename(test_file))[0]
+    if nama_kasus is not None:
+        status['unit'] += f".{nama_kasus}"
+    status['durasi'] = time.perf_counter() - mulai
+    status['output'] = keluaran.getvalue()
+    return status
+
+
+def _tampilkan_unit(status):
+    """Mencetak hasil satu unit begitu selesai"""
+    simbol = "✅" if status['berhasil'] else "❌"
+    print(f"{simbol} {status['unit']} ({status['jumlah']} test, "
+          f"{status['durasi']:.2f} detik)", flush=True)
+    if not status['berhasil']:
+        if 'error' in status:
+            print(f"💥 Error: {status['error']}")
+        if status['output']:
+            print(status['output'], flush=True)
+
+
+def laporan_terlambat(daftar_status, jumlah=10):
+    """Daftar (id test, detik) paling lambat dari semua unit, terurut menurun"""
+    semua = [item for status in daftar_status for item in status['durasi_test']]
+    return sorted(semua, key=lambda item: item[1], reverse=True)[:jumlah]
+
+
+def run_parallel(tests, jumlah_proses=None, per_kasus=False, jumlah_terlambat=10):
+    """
+    Menjalankan test bersamaan di process pool.
+
+    Args:
+        tests: Daftar (file test, deskripsi)
+        jumlah_proses: Jumlah proses pekerja (default: jumlah CPU)
+        per_kasus: Pecah setiap file menjadi satu unit per metode test
+        jumlah_terlambat: Jumlah test paling lambat yang dilaporkan
+
+    Returns:
+        True jika semua unit berhasil
+    """
+    files = []
+    for test_file, description in tests:
+        if os.path.exists(path_test(test_file)):
+            files.append(test_file)
+        else:
+            print(f"❌ File {path_test(test_file)} tidak ditemukan!")
+    hilang = len(tests) - len(files)
+
+    mulai = time.perf_counter()
+    daftar_status = []
+    with ProcessPoolExecutor(max_workers=jumlah_proses) as pool:
+        if per_kasus:
+            # Penemuan test juga berjalan di pool; unit dikirim begitu
+            # daftar metode test sebuah file diketahui
+            menunggu = {pool.submit(_daftar_kasus_test, f): f for f in files}
+        else:
+            menunggu = {pool.submit(_jalankan_unit, f): None for f in files}
+        while menunggu:
+            selesai, _ = wait(menunggu, return_when=FIRST_COMPLETED)
+            for future in selesai:
+                test_file = menunggu.pop(future)
+                if test_file is None:
+                    status = future.result()
+                    daftar_status.append(status)
+                    _tampilkan_unit(status)
+                    continue
+                try:
+                    daftar_kasus = future.result()
+                except Exception:
+                    # Modul gagal dimuat: jalankan utuh agar errornya dilaporkan
+                    daftar_kasus = [None]
+                for nama_kasus in daftar_kasus:
+                    menunggu[pool.submit(_jalankan_unit, test_file, nama_kasus)] = None
+    durasi = time.perf_counter() - mulai
+
+    gagal = [status for status in daftar_status if not status['berhasil']]
+    total = sum(status['jumlah'] for status in daftar_status)
+    kumulatif = sum(status['durasi'] for status in daftar_status)
+
+    print("\n" + "=" * 50)
+    print(f"⏱️ {jumlah_terlambat} TEST PALING LAMBAT")
+    print("=" * 50)
+    for test_id, detik in laporan_terlambat(daftar_status, jumlah_terlambat):
+        print(f"  {detik:8.3f} detik  {test_id}")
+
+    print("\n" + "=" * 50)
+    print("📊 RINGKASAN HASIL TEST")
+    print("=" * 50)
+    print(f"  Unit: {len(daftar_status) - len(gagal)}/{len(daftar_status)} berhasil")
+    print(f"  Test: {total} dijalankan, "
+          f"{sum(status['gagal'] for status in daftar_status)} gagal/error, "
+          f"{sum(status['dilewati'] for status in daftar_status)} dilewati")
+    print(f"  Waktu: {durasi:.2f} detik (kumulatif {kumulatif:.2f} detik)")
+    for status in gagal:
+        print(f"  ❌ {status['unit']}")
+
+    if not gagal and not hilang:
+        print("🎉 SEMUA TEST BERHASIL!")
+        return True
+    print("⚠️ BEBERAPA TEST GAGAL!")
+    return False
+
+
 def check_dependencies():
     """Memeriksa dependency yang diperlukan"""
     print("🔍 Memeriksa dependency...")
@@ -87,15 +293,15 @@ def check_dependencies():
     
     # Periksa file yang diperlukan
     required_files = [
-        'number_system_simulator.py',
-        'test_simulator.py',
-        'gui_simulator.py',
-        'test_gui.py'
+        os.path.join('main_logic', 'number_system_simulator.py'),
+        os.path.join('tests', 'test_simulator.py'),
+        os.path.join('gui', 'gui_simulator.py'),
+        os.path.join('tests', 'test_gui.py')
     ]
     
     missing_files = []
     for file in required_files:
-        if not os.path.exists(file):
+        if not os.path.exists(os.path.join(DIREKTORI_ROOT, file)):
             missing_files.append(file)
         else:
             print(f"✅ {file}")
@@ -107,8 +313,8 @@ def check_dependencies():
     return True
 
 
-def run_all_tests():
-    """Menjalankan semua test suite"""
+def run_all_tests(paralel=False, jumlah_proses=None, per_kasus=False, jumlah_terlambat=10):
+    """Menjalankan semua test suite, berurutan atau bersamaan di process pool"""
     print("🚀 MENJALANKAN SEMUA TEST SUITE")
     print("=" * 50)
     print(f"📅 Tanggal: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -124,8 +330,35 @@ def run_all_tests():
     tests = [
         ('test_simulator.py', 'Test Engine Konversi'),
         ('test_gui.py', 'Test GUI Simulator'),
+        ('test_riwayat_sqlite.py', 'Test Riwayat Persisten'),
+        ('test_tabel_rentang.py', 'Test Tabel Konversi Rentang'),
+        ('test_mesin_basis.py', 'Test Mesin Basis'),
+        ('test_representasi_bertanda.py', 'Test Representasi Bertanda'),
+        ('test_konversi_pecahan.py', 'Test Konversi Pecahan'),
+        ('test_konversi_buffer.py', 'Test Konversi Buffer'),
+        ('test_crc', 'Test Mesin CRC'),
+        ('test_hamming', 'Test Kode Hamming dan SECDED'),
+        ('test_kanal', 'Test Simulator Kanal'),
+        ('test_ber', 'Test Pengukuran BER'),
+        ('test_aritmatika_lebar_tetap', 'Test Aritmatika Lebar Tetap'),
+        ('test_mode_skrip', 'Test Mode Skrip'),
+        ('test_hasil', 'Test Tipe Hasil Berslot'),
+        ('test_riwayat_terbagi', 'Riwayat Terbagi per Thread'),
+        ('test_metrik', 'Metrik Prometheus'),
+        ('test_fuzz_diferensial', 'Fuzzing Diferensial'),
+        ('test_memori', 'Regresi Memori'),
+        ('test_config_gui', 'Konfigurasi GUI'),
+        ('test_tabel_prakomputasi', 'Tabel Konversi Prakomputasi'),
+        ('test_format_digit', 'Format Digit Tabel Byte'),
+        ('test_progres', 'Progres dan Pembatalan'),
+        ('test_batas_waktu', 'Batas Waktu Operasi'),
+        ('test_operasi_bitwise', 'Operasi Bitwise'),
+        ('test_aritmatika_aliran', 'Aritmatika Aliran'),
     ]
     
+    if paralel:
+        return run_parallel(tests, jumlah_proses, per_kasus, jumlah_terlambat)
+    
     # Jalankan test
     results = []
     total_tests = len(tests)
@@ -158,10 +391,23 @@ def run_all_tests():
         return False
 
 
-def main():
+def main(argv=None):
     """Fungsi main"""
+    parser = argparse.ArgumentParser(description="Menjalankan semua test suite")
+    parser.add_argument('--paralel', action='store_true',
+                        help="Jalankan test bersamaan di process pool")
+    parser.add_argument('--proses', type=int, default=None,
+                        help="Jumlah proses pekerja (default: jumlah CPU)")
+    parser.add_argument('--per-kasus', action='store_true',
+                        help="Dengan --paralel, jadikan setiap metode test satu unit")
+    parser.add_argument('--terlambat', type=int, default=10,
+                        help="Jumlah test paling lambat di laporan waktu")
+    args = parser.parse_args(argv)
+    if args.proses is not None and args.proses < 1:
+        parser.error("--proses minimal 1")
+    
     try:
-        success = run_all_tests()
+        success = run_all_tests(args.paralel, args.proses, args.per_kasus, args.terlambat)
         
         if success:
             print("\n🎯 REKOMENDASI:")
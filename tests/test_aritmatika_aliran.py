@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite untuk Penjumlahan dan Pengurangan Aliran
+===================================================
+
+Test ini memvalidasi penjumlahan dan pengurangan per potongan dengan carry
+antar potongan (dibandingkan dengan aritmatika int), keluaran ke basis
+pangkat dua lain, pembuangan nol di depan, penolakan hasil negatif, serta
+operand file lewat mmap.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import unittest
+import sys
+import os
+import io
+import random
+import tempfile
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main_logic'))
+
+import aritmatika_aliran
+from aritmatika_aliran import aritmatika_buffer, aritmatika_berkas, bandingkan_operand
+from operasi_bitwise import OperandDigit, KODE_FORMAT
+from progres import TokenPembatalan, OperasiDibatalkan
+
+
+def jalankan(nilai1, operasi, nilai2, **opsi):
+    keluaran = io.BytesIO()
+    aritmatika_buffer(nilai1.encode('ascii'), operasi, nilai2.encode('ascii'), keluaran, **opsi)
+    return keluaran.getvalue().decode('ascii')
+
+
+class TestAritmatikaAliran(unittest.TestCase):
+    """Test class untuk penjumlahan dan pengurangan aliran"""
+
+    def test_acak_vs_int(self):
+        """Test hasil aliran sama dengan aritmatika int untuk basis dan potongan acak"""
+        rng = random.Random(11)
+        for _ in range(500):
+            basis, tujuan = rng.choice([2, 8, 16]), rng.choice([2, 8, 16])
+            digit = '0123456789ABCDEF'[:basis]
+            nilai1, nilai2 = (''.join(rng.choice(digit) for _ in range(rng.randint(1, 40)))
+                              for _ in range(2))
+            a, b = int(nilai1, basis), int(nilai2, basis)
+            operasi = rng.choice('+-')
+            if operasi == '-' and a < b:
+                nilai1, nilai2, a, b = nilai2, nilai1, b, a
+            harapan = format(a + b if operasi == '+' else a - b, KODE_FORMAT[tujuan])
+            with self.subTest(nilai1=nilai1, operasi=operasi, nilai2=nilai2, basis=basis):
+                self.assertEqual(jalankan(nilai1, operasi, nilai2, basis=basis, basis_tujuan=tujuan,
+                                          ukuran_potong=rng.choice([1, 5, 24, 1000])), harapan)
+
+    def test_carry_dan_borrow_antar_potongan(self):
+        """Test carry dan borrow merambat melewati banyak potongan"""
+        self.assertEqual(jalankan('F' * 100, '+', '1', ukuran_potong=8), '1' + '0' * 100)
+        self.assertEqual(jalankan('1' + '0' * 100, '-', '1', ukuran_potong=8), 'F' * 100)
+        self.assertEqual(jalankan('00FF', '-', 'FF'), '0')
+        self.assertEqual(jalankan(' ff\n', '+', '1\n', basis_tujuan=2), '100000000')
+
+    def test_buang_nol_depan_per_blok(self):
+        """Test nol di depan yang melewati beberapa blok salin ikut dibuang"""
+        asli = aritmatika_aliran.UKURAN_BLOK_SALIN
+        aritmatika_aliran.UKURAN_BLOK_SALIN = 3
+        try:
+            self.assertEqual(jalankan('0' * 20 + 'ABCDEF', '+', '1'), 'ABCDF0')
+            self.assertEqual(jalankan('0' * 20, '+', '0'), '0')
+        finally:
+            aritmatika_aliran.UKURAN_BLOK_SALIN = asli
+
+    def test_validasi(self):
+        """Test hasil negatif, operasi, basis, dan digit tidak valid ditolak"""
+        with self.assertRaises(ValueError) as konteks:
+            jalankan('A', '-', 'B')
+        self.assertIn('negatif', str(konteks.exception))
+        with self.assertRaises(ValueError):
+            jalankan('A', '*', 'B')
+        with self.assertRaises(ValueError):
+            jalankan('12', '+', '3', basis=10)
+        with self.assertRaises(ValueError):
+            jalankan('12', '+', '3', basis_tujuan=10)
+        with self.assertRaises(ValueError):
+            jalankan('1G', '+', '3')
+        self.assertEqual(bandingkan_operand(OperandDigit(b'00F', 16), OperandDigit(b'F', 16)), 0)
+        self.assertEqual(bandingkan_operand(OperandDigit(b'10', 2), OperandDigit(b'11', 2), 1), -1)
+
+    def test_berkas(self):
+        """Test operand file dibaca lewat mmap, dengan progres dan pembatalan"""
+        rng = random.Random(5)
+        a, b = rng.getrandbits(5000), rng.getrandbits(4000)
+        with tempfile.TemporaryDirectory() as direktori:
+            path1, path2, path_hasil = (os.path.join(direktori, nama) for nama in ('a', 'b', 'c'))
+            for path, nilai in ((path1, a), (path2, b)):
+                with open(path, 'w') as berkas:
+                    berkas.write(format(nilai, 'X') + '\n')
+            peristiwa = []
+            ringkasan = aritmatika_berkas(path1, '-', path2, path_hasil, basis_tujuan=8,
+                                          ukuran_potong=240, progres=peristiwa.append)
+            with open(path_hasil) as berkas:
+                self.assertEqual(berkas.read(), format(a - b, 'o'))
+            self.assertEqual(ringkasan['digit'], len(format(a - b, 'o')))
+            self.assertEqual(ringkasan['path'], path_hasil)
+            self.assertEqual(peristiwa[-1].selesai, ringkasan['bit_hasil'])
+
+            token = TokenPembatalan()
+            token.batalkan()
+            with self.assertRaises(OperasiDibatalkan):
+                aritmatika_berkas(path1, '+', path2, path_hasil, token=token)
+            # Pengurangan negatif ditolak tanpa menyentuh hasil lama
+            with self.assertRaises(ValueError):
+                aritmatika_berkas(path2, '-', path1, path_hasil)
+            with open(path_hasil) as berkas:
+                self.assertEqual(berkas.read(), format(a - b, 'o'))
+            self.assertEqual(sorted(os.listdir(direktori)), ['a', 'b', 'c'])
+
+    def test_berkas_hasil_sama_dengan_operand(self):
+        """Test file hasil yang sama dengan operand ditolak dan operand tetap utuh"""
+        with tempfile.TemporaryDirectory() as direktori:
+            path1, path2 = os.path.join(direktori, 'a'), os.path.join(direktori, 'b')
+            for path in (path1, path2):
+                with open(path, 'w') as berkas:
+                    berkas.write('F' * 5000)
+            for keluaran in (path1, path2):
+                with self.subTest(keluaran=keluaran), self.assertRaises(ValueError):
+                    aritmatika_berkas(path1, '+', path2, keluaran, ukuran_potong=240)
+            with open(path1) as berkas:
+                self.assertEqual(berkas.read(), 'F' * 5000)
+            self.assertEqual(sorted(os.listdir(direktori)), ['a', 'b'])
+
+    def test_validasi_sebelum_keluaran_disentuh(self):
+        """Test digit tidak valid dan hasil negatif ditolak sebelum keluaran diubah"""
+        for nilai1, operasi, nilai2 in (('1' * 50 + 'G', '+', '1'), ('G' + '1' * 50, '+', '1'),
+                                        ('1', '-', 'F' * 50)):
+            keluaran = io.BytesIO(b'lama')
+            with self.subTest(nilai1=nilai1, operasi=operasi), self.assertRaises(ValueError):
+                aritmatika_buffer(nilai1.encode('ascii'), operasi, nilai2.encode('ascii'), keluaran,
+                                  ukuran_potong=8)
+            self.assertEqual(keluaran.getvalue(), b'lama')
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
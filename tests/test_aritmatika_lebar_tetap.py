@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite untuk Aritmatika Register Lebar Tetap
+================================================
+
+Test ini memvalidasi wraparound dan saturasi, flag carry/overflow/underflow,
+serta kesamaan mode batch NumPy dengan perhitungan skalar.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import unittest
+import sys
+import os
+import random
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main_logic'))
+
+from aritmatika_lebar_tetap import RegisterLebarTetap, ModeLuapan, LEBAR_REGISTER, OPERASI_BATCH
+from dukungan_numpy import np
+from number_system_simulator import KonverterSistemBilangan, SistemBilangan
+
+
+class TestRegisterLebarTetap(unittest.TestCase):
+    """Test class untuk register skalar"""
+
+    def test_wrap_tak_bertanda(self):
+        """Test uint8: 255 + 1 = 0 dengan carry dan overflow"""
+        hasil = RegisterLebarTetap(8).hitung(255, 1, '+')
+        self.assertEqual(hasil['hasil'], 0)
+        self.assertTrue(hasil['carry'] and hasil['overflow'])
+        self.assertFalse(hasil['underflow'])
+
+        hasil = RegisterLebarTetap(8).hitung(0, 1, '-')
+        self.assertEqual(hasil['hasil'], 255)
+        self.assertTrue(hasil['carry'] and hasil['underflow'])
+
+    def test_wrap_bertanda(self):
+        """Test int8: 127 + 1 = -128 dengan overflow tanpa carry"""
+        hasil = RegisterLebarTetap(8, bertanda=True).hitung(127, 1, '+')
+        self.assertEqual(hasil['hasil'], -128)
+        self.assertTrue(hasil['overflow'])
+        self.assertFalse(hasil['carry'])
+
+        hasil = RegisterLebarTetap(8, bertanda=True).hitung(-1, 1, '+')
+        self.assertEqual(hasil['hasil'], 0)
+        self.assertTrue(hasil['carry'])
+        self.assertFalse(hasil['overflow'] or hasil['underflow'])
+
+    def test_saturasi(self):
+        """Test saturasi menjepit hasil ke batas register"""
+        register = RegisterLebarTetap(16, bertanda=True, mode=ModeLuapan.SATURASI)
+        self.assertEqual(register.hitung(30000, 30000, '+')['hasil'], 32767)
+        self.assertEqual(register.hitung(-30000, 30000, '-')['hasil'], -32768)
+        self.assertEqual(register.hitung(-32768, -1, '/')['hasil'], 32767)
+        self.assertEqual(register.hitung(2, 15, '**')['hasil'], 32767)
+
+    def test_pembagian_bertanda(self):
+        """Test pembagian bertanda dibulatkan ke arah nol"""
+        register = RegisterLebarTetap(32, bertanda=True)
+        self.assertEqual(register.hitung(-7, 2, '/')['hasil'], -3)
+        self.assertEqual(register.hitung(-7, 2, '%')['hasil'], -1)
+        self.assertEqual(register.hitung(-2 ** 31, -1, '/')['hasil'], -2 ** 31)
+
+    def test_operand_di_luar_rentang(self):
+        """Test operand yang tidak muat ditolak"""
+        with self.assertRaises(ValueError):
+            RegisterLebarTetap(8).hitung(256, 1, '+')
+        with self.assertRaises(ValueError):
+            RegisterLebarTetap(12)
+
+    def test_konverter(self):
+        """Test operasi lebar tetap pada konverter"""
+        konverter = KonverterSistemBilangan()
+        hasil = konverter.operasi_lebar_tetap("FF", "01", "+", SistemBilangan.HEKSADESIMAL)
+        self.assertTrue(hasil['berhasil'])
+        self.assertEqual(hasil['hasil_sistem'], "00")
+        self.assertTrue(hasil['overflow'])
+
+        hasil = konverter.operasi_lebar_tetap("10000000", "1", "-", SistemBilangan.BINER,
+                                              bertanda=True)
+        self.assertEqual(hasil['hasil_sistem'], "01111111")
+        self.assertTrue(hasil['underflow'])
+        self.assertEqual(hasil['register'], "int8 wrap")
+
+        hasil = konverter.operasi_lebar_tetap("1FF", "1", "+", SistemBilangan.HEKSADESIMAL)
+        self.assertFalse(hasil['berhasil'])
+
+
+@unittest.skipIf(np is None, "NumPy tidak tersedia")
+class TestBatchLebarTetap(unittest.TestCase):
+    """Test class untuk mode batch NumPy"""
+
+    def test_batch_sama_dengan_skalar(self):
+        """Test hasil dan flag batch sama dengan skalar untuk semua lebar dan mode"""
+        rng = random.Random(5)
+        for lebar in LEBAR_REGISTER:
+            for bertanda in (False, True):
+                for mode in ModeLuapan:
+                    register = RegisterLebarTetap(lebar, bertanda, mode)
+                    istimewa = [register.minimum, register.maksimum, 0, 1, register.maksimum // 2]
+                    if bertanda:
+                        istimewa.append(-1)
+                    a = [rng.randint(register.minimum, register.maksimum) for _ in range(150)] + istimewa * 3
+                    b = [rng.randint(register.minimum, register.maksimum) for _ in range(150)] + istimewa[::-1] * 3
+                    b = [x or 1 for x in b]
+                    dtype = np.int64 if bertanda else np.uint64
+                    for operasi in OPERASI_BATCH:
+                        hasil = register.batch_hitung(np.array(a, dtype=dtype),
+                                                      np.array(b, dtype=dtype), operasi)
+                        for i, (x, y) in enumerate(zip(a, b)):
+                            skalar = register.hitung(x, y, operasi)
+                            self.assertEqual(
+                                (int(hasil['hasil'][i]), bool(hasil['carry'][i]),
+                                 bool(hasil['overflow'][i]), bool(hasil['underflow'][i])),
+                                (skalar['hasil'], skalar['carry'], skalar['overflow'],
+                                 skalar['underflow']),
+                                msg=f"{register.nama}: {x} {operasi} {y}")
+
+    def test_jumlah_flag(self):
+        """Test jumlah per flag"""
+        register = RegisterLebarTetap(8)
+        hasil = register.batch_hitung(np.array([200, 100, 0], dtype=np.uint8),
+                                      np.array([100, 100, 1], dtype=np.uint8), '+')
+        self.assertEqual(hasil['hasil'].dtype, np.uint8)
+        self.assertEqual(hasil['hasil'].tolist(), [44, 200, 1])
+        self.assertEqual(hasil['jumlah'], {'operasi': 3, 'carry': 1, 'overflow': 1, 'underflow': 0})
+
+    def test_batch_pembagian_nol(self):
+        """Test pembagian dengan nol ditolak di mode batch"""
+        with self.assertRaises(ValueError):
+            RegisterLebarTetap(8).batch_hitung(np.array([1]), np.array([0]), '/')
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite untuk Pelaksana Operasi Berbatas Waktu
+=================================================
+
+Test ini memvalidasi perkiraan biaya operasi, jalur langsung untuk operasi
+murah, jalur proses pekerja untuk operasi mahal, serta hasil terstruktur
+saat batas waktu habis atau operasi dibatalkan.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import unittest
+import sys
+import os
+import time
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main_logic'))
+
+from batas_waktu import PelaksanaBatasWaktu, perkiraan_bit_operasi, AMBANG_BIT_DEFAULT
+from number_system_simulator import KonverterSistemBilangan, SistemBilangan
+from progres import TokenPembatalan
+
+HEKSA = SistemBilangan.HEKSADESIMAL
+# Memangkatkan numeral ini butuh jauh lebih lama dari batas waktu test
+OPERAND_BESAR = 'F' * 200000
+
+
+class TestBatasWaktu(unittest.TestCase):
+    """Test class untuk PelaksanaBatasWaktu"""
+
+    def setUp(self):
+        self.konverter = KonverterSistemBilangan()
+
+    def test_perkiraan_bit(self):
+        """Test perkiraan bit mengikuti ukuran hasil setiap operasi"""
+        self.assertEqual(perkiraan_bit_operasi('FF', 'F', '+', HEKSA), 8)
+        self.assertEqual(perkiraan_bit_operasi('FF', 'FF', '*', HEKSA), 16)
+        self.assertEqual(perkiraan_bit_operasi('1010', '11', '**', SistemBilangan.BINER), 80)
+        self.assertLess(perkiraan_bit_operasi('9' * 1000, '7', '**', SistemBilangan.DESIMAL),
+                        AMBANG_BIT_DEFAULT)
+
+    def test_operasi_langsung(self):
+        """Test operasi murah memberi hasil sama dengan konverter"""
+        pelaksana = PelaksanaBatasWaktu(self.konverter)
+        self.assertEqual(pelaksana.operasi_aritmatika('A', '3', '*', HEKSA),
+                         self.konverter.operasi_aritmatika('A', '3', '*', HEKSA))
+        with self.assertRaises(ValueError):
+            PelaksanaBatasWaktu(self.konverter, batas_detik=0)
+
+    def test_operasi_di_pekerja(self):
+        """Test operasi di proses pekerja mengembalikan hasil dan error seperti biasa"""
+        pelaksana = PelaksanaBatasWaktu(self.konverter, batas_detik=30, ambang_bit=1)
+        hasil = pelaksana.operasi_aritmatika('FF', '2', '**', HEKSA)
+        self.assertTrue(hasil['berhasil'])
+        self.assertEqual(hasil['hasil_sistem'], 'FE01')
+        hasil = pelaksana.operasi_aritmatika('FF', '0', '/', HEKSA)
+        self.assertFalse(hasil['berhasil'])
+        self.assertNotIn('waktu_habis', hasil)
+
+    def test_operasi_waktu_habis(self):
+        """Test operasi yang melewati batas waktu dihentikan dengan hasil terstruktur"""
+        pelaksana = PelaksanaBatasWaktu(self.konverter, batas_detik=0.2, ambang_bit=1)
+        mulai = time.monotonic()
+        hasil = pelaksana.operasi_aritmatika(OPERAND_BESAR, '14', '**', HEKSA)
+        self.assertLess(time.monotonic() - mulai, 5)
+        self.assertFalse(hasil['berhasil'])
+        self.assertTrue(hasil['waktu_habis'])
+        self.assertNotIn('dibatalkan', hasil)
+        self.assertIn('batas waktu', hasil['error'])
+
+    def test_operasi_dibatalkan(self):
+        """Test token pembatalan menghentikan proses pekerja"""
+        pelaksana = PelaksanaBatasWaktu(self.konverter, batas_detik=30, ambang_bit=1)
+        token = TokenPembatalan()
+        token.batalkan()
+        hasil = pelaksana.operasi_aritmatika(OPERAND_BESAR, '14', '**', HEKSA, token=token)
+        self.assertFalse(hasil['berhasil'])
+        self.assertTrue(hasil['dibatalkan'])
+        self.assertNotIn('waktu_habis', hasil)
+        self.assertEqual(hasil['error'], "Operasi dibatalkan")
+        hasil = pelaksana.konversi(OPERAND_BESAR, HEKSA, SistemBilangan.DESIMAL, token=token)
+        self.assertTrue(hasil['dibatalkan'])
+        self.assertNotIn('waktu_habis', hasil)
+
+    def test_konversi(self):
+        """Test konversi langsung dan di pekerja dicatat ke riwayat"""
+        for ambang in (AMBANG_BIT_DEFAULT, 1):
+            konverter = KonverterSistemBilangan()
+            pelaksana = PelaksanaBatasWaktu(konverter, ambang_bit=ambang)
+            hasil = pelaksana.konversi('FF', HEKSA, SistemBilangan.BINER)
+            self.assertEqual(hasil, {'berhasil': True, 'hasil': '11111111', 'nilai_desimal': 255})
+            self.assertEqual(konverter.riwayat_konversi[-1]['hasil'], '11111111')
+            hasil = pelaksana.konversi('G', HEKSA, SistemBilangan.BINER)
+            self.assertFalse(hasil['berhasil'])
+            self.assertIn('tidak valid', hasil['error'])
+            self.assertEqual(len(konverter.riwayat_konversi), 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite untuk Pengukuran BER
+===============================
+
+Test ini memvalidasi perhitungan BER dan histogram posisi untuk file biner
+mentah, file teks numeral, payload dari simulator kanal, dan command-line.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import unittest
+import sys
+import os
+import io
+import shutil
+import tempfile
+import binascii
+import random
+import tracemalloc
+from contextlib import redirect_stdout
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main_logic'))
+
+import ber
+from ber import baca_biner, baca_teks, ukur_ber, buat_kanal, lewat_kanal
+from dukungan_numpy import np
+from kanal import KanalBSC
+from number_system_simulator import SistemBilangan
+
+
+class TestBER(unittest.TestCase):
+    """Test class untuk pengukuran BER"""
+
+    def setUp(self):
+        """Setup payload referensi dan payload dengan kesalahan yang diketahui"""
+        self.folder = tempfile.mkdtemp()
+        self.referensi = os.urandom(10000)
+        diterima = bytearray(self.referensi)
+        diterima[0] ^= 0x81   # bit 0 dan 7 pada frame pertama
+        diterima[5] ^= 0x10   # bit 3 pada byte ke-5
+        self.diterima = bytes(diterima)
+        self.path_ref = self._tulis('ref.bin', self.referensi)
+        self.path_terima = self._tulis('terima.bin', self.diterima)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def _tulis(self, nama, data):
+        path = os.path.join(self.folder, nama)
+        with open(path, 'wb') as berkas:
+            berkas.write(data)
+        return path
+
+    def test_ber_file_biner(self):
+        """Test BER dan histogram dengan ukuran potongan berbeda"""
+        hasil = ukur_ber(baca_biner(self.path_ref, 4096), baca_biner(self.path_terima, 999),
+                         panjang_frame=4)
+        self.assertEqual(hasil['bit_salah'], 3)
+        self.assertEqual(hasil['bit_dibandingkan'], 80000)
+        self.assertEqual(hasil['histogram_posisi'][0], 1)
+        self.assertEqual(hasil['histogram_posisi'][7], 1)
+        self.assertEqual(hasil['histogram_posisi'][8 + 3], 1)
+
+    def test_tanpa_numpy(self):
+        """Test jalur Python murni menghasilkan hasil yang sama"""
+        np_asli, ber.np = ber.np, None
+        try:
+            hasil = ukur_ber(baca_biner(self.path_ref, 777), baca_biner(self.path_terima), 4)
+        finally:
+            ber.np = np_asli
+        self.assertEqual(hasil['bit_salah'], 3)
+        self.assertEqual(sum(hasil['histogram_posisi']), 3)
+
+    @unittest.skipIf(np is None, "NumPy tidak tersedia")
+    def test_kesalahan_padat(self):
+        """Test BER tinggi: histogram sama dengan jalur Python dan memori sebatas potongan"""
+        rng = random.Random(9)
+        for panjang_frame in (1, 3, 64, 5000):
+            acak = bytes(rng.getrandbits(8) for _ in range(10000))
+            potong = lambda data: [data[i:i + 999] for i in range(0, len(data), 999)]
+            hasil = ukur_ber(potong(self.referensi), potong(acak), panjang_frame)
+            np_asli, ber.np = ber.np, None
+            try:
+                acuan = ukur_ber(potong(self.referensi), potong(acak), panjang_frame)
+            finally:
+                ber.np = np_asli
+            self.assertEqual(hasil, acuan)
+
+        ukuran = 1 << 22
+        tracemalloc.start()
+        try:
+            ukur_ber([bytes(ukuran)], [b'\xff' * ukuran], panjang_frame=64)
+            puncak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertLess(puncak, ukuran * 6)
+
+    def test_panjang_berbeda(self):
+        """Test hanya bagian tumpang tindih yang dibandingkan"""
+        path = self._tulis('pendek.bin', self.diterima[:100])
+        hasil = ukur_ber(baca_biner(self.path_ref), baca_biner(path))
+        self.assertEqual(hasil['bit_dibandingkan'], 800)
+        self.assertEqual(hasil['byte_referensi'], 10000)
+        self.assertEqual(hasil['byte_diterima'], 100)
+
+    def test_file_teks(self):
+        """Test file teks heksadesimal, biner, oktal, dan desimal"""
+        data = self.referensi[:300]
+        heks = self._tulis('ref.hex', binascii.hexlify(data) + b'\n')
+        biner = self._tulis('ref.txt', ''.join(format(b, '08b') for b in data).encode())
+        oktal = self._tulis('ref.oct', format(int.from_bytes(data, 'big'), '0800o').encode())
+
+        for path, sistem in [(heks, SistemBilangan.HEKSADESIMAL), (biner, SistemBilangan.BINER),
+                             (oktal, SistemBilangan.OKTAL)]:
+            self.assertEqual(b''.join(baca_teks(path, sistem, 101)), data)
+
+        desimal = self._tulis('ref.dec', b'65535')
+        self.assertEqual(b''.join(baca_teks(desimal, SistemBilangan.DESIMAL)), b'\xff\xff')
+
+    def test_teks_tidak_valid(self):
+        """Test digit yang tidak valid atau tidak membentuk byte utuh"""
+        with self.assertRaises(ValueError):
+            list(baca_teks(self._tulis('a.hex', b'ABCG'), SistemBilangan.HEKSADESIMAL))
+        with self.assertRaises(ValueError):
+            list(baca_teks(self._tulis('b.hex', b'ABC'), SistemBilangan.HEKSADESIMAL))
+
+    @unittest.skipIf(np is None, "NumPy tidak tersedia")
+    def test_payload_dari_kanal(self):
+        """Test payload diterima dibangkitkan oleh simulator kanal"""
+        hasil = ukur_ber(baca_biner(self.path_ref),
+                         lewat_kanal(baca_biner(self.path_ref, 1000), KanalBSC(0.05), seed=1))
+        self.assertAlmostEqual(hasil['ber'], 0.05, delta=0.01)
+        with self.assertRaises(ValueError):
+            buat_kanal('xyz:1')
+
+    def test_command_line(self):
+        """Test command-line menulis laporan"""
+        keluaran = io.StringIO()
+        with redirect_stdout(keluaran):
+            kode = ber.main([self.path_ref, self.path_terima, '--frame', '2'])
+        self.assertEqual(kode, 0)
+        self.assertIn("Bit salah        : 3", keluaran.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
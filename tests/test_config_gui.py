@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite untuk Konfigurasi GUI
+================================
+
+Test ini memvalidasi snapshot konfigurasi beku, penggabungan file override
+JSON/TOML dengan default, validasi, dan pemuatan ulang saat file berubah.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+from unittest.mock import patch
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'gui'))
+
+import config_gui
+from config_gui import (KonfigurasiBeku, PengelolaKonfigurasi, compile_config, validate_config,
+                        get_config, PERFORMANCE_CONFIG, VALIDATION_CONFIG, tomllib)
+
+
+class TestKonfigurasiBeku(unittest.TestCase):
+    """Test class untuk snapshot dan kompilasi konfigurasi"""
+
+    def test_akses_atribut_dan_item(self):
+        """Test snapshot dapat dibaca sebagai atribut maupun item"""
+        konfig = compile_config()
+        self.assertEqual(konfig.performance.cache_size, PERFORMANCE_CONFIG['cache_size'])
+        self.assertEqual(konfig['validation']['max_history_entries'],
+                         VALIDATION_CONFIG['max_history_entries'])
+        self.assertEqual(konfig.arithmetic['**'].name, 'Pangkat')
+        with self.assertRaises(AttributeError):
+            konfig.tidak_ada
+
+    def test_tidak_dapat_diubah(self):
+        """Test snapshot dan section di dalamnya tidak dapat diubah"""
+        konfig = KonfigurasiBeku({'a': {'b': [1, 2]}})
+        self.assertEqual(konfig.a.b, (1, 2))
+        with self.assertRaises(AttributeError):
+            konfig.a = 1
+        with self.assertRaises(TypeError):
+            konfig['a'] = 1
+        self.assertEqual(konfig.ke_dict(), {'a': {'b': (1, 2)}})
+
+    def test_override(self):
+        """Test override menimpa default tanpa mengubah konstanta modul"""
+        konfig = compile_config({'performance': {'cache_size': 50},
+                                 'layout': {'tab_padding': [4, 2]}})
+        self.assertEqual(konfig.performance.cache_size, 50)
+        self.assertEqual(konfig.performance.max_concurrent_operations,
+                         PERFORMANCE_CONFIG['max_concurrent_operations'])
+        self.assertEqual(konfig.layout.tab_padding, (4, 2))
+        self.assertEqual(PERFORMANCE_CONFIG['cache_size'], 1000)
+
+    def test_override_tidak_valid(self):
+        """Test key asing, tipe salah, dan batas tidak positif ditolak"""
+        salah = [
+            {'performance': {'ukuran_cache': 5}},
+            {'tidak_ada': {}},
+            {'performance': {'cache_size': '50'}},
+            {'performance': {'cache_size': 0}},
+            {'validation': {'max_display_history': 500}},
+            {'performance': 5},
+        ]
+        for override in salah:
+            with self.assertRaises(ValueError, msg=override):
+                compile_config(override)
+
+    def test_validate_config(self):
+        """Test validate_config untuk konfigurasi bawaan dan get_config"""
+        self.assertTrue(validate_config())
+        # get_config memakai pengelola bersama; arahkan ke file yang tidak ada agar
+        # override milik pengguna tidak ikut dimuat
+        with tempfile.TemporaryDirectory() as direktori, \
+                patch.dict(os.environ, {'SIMULATOR_CONFIG': os.path.join(direktori, 'config.json')}), \
+                patch.object(config_gui, '_pengelola', None):
+            self.assertEqual(get_config('theme', 'primary_color', theme='dark'), '#3B82F6')
+            self.assertEqual(get_config('performance', 'max_concurrent_operations'),
+                             PERFORMANCE_CONFIG['max_concurrent_operations'])
+            with self.assertRaises(ValueError):
+                get_config('tidak_ada')
+
+
+class TestPengelolaKonfigurasi(unittest.TestCase):
+    """Test class untuk pemuatan ulang konfigurasi"""
+
+    def setUp(self):
+        """Setup folder sementara untuk file override"""
+        self.direktori = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.direktori.name, 'config.json')
+        self.mtime = 1_000_000_000
+
+    def tearDown(self):
+        """Hapus folder sementara"""
+        self.direktori.cleanup()
+
+    def tulis(self, data, path=None, teks=None):
+        """Menulis file override dengan mtime yang selalu maju"""
+        path = path or self.path
+        with open(path, 'w', encoding='utf-8') as berkas:
+            berkas.write(teks if teks is not None else json.dumps(data))
+        self.mtime += 1
+        os.utime(path, (self.mtime, self.mtime))
+
+    def test_tanpa_file(self):
+        """Test tanpa file override snapshot berisi default"""
+        pengelola = PengelolaKonfigurasi(self.path)
+        self.assertEqual(pengelola.snapshot(), compile_config())
+        self.assertIsNone(pengelola.galat_terakhir)
+
+    def test_muat_ulang_saat_berubah(self):
+        """Test snapshot diganti saat mtime file berubah dan pemantau dipanggil"""
+        self.tulis({'validation': {'max_history_entries': 200}})
+        pengelola = PengelolaKonfigurasi(self.path, interval_cek=0)
+        self.assertEqual(pengelola.snapshot().validation.max_history_entries, 200)
+        diterima = []
+        pengelola.pantau(diterima.append)
+
+        lama = pengelola.snapshot()
+        self.assertIs(pengelola.snapshot(), lama)  # file tidak berubah
+        self.tulis({'validation': {'max_history_entries': 300}})
+        baru = pengelola.snapshot()
+        self.assertEqual(baru.validation.max_history_entries, 300)
+        self.assertEqual(diterima, [baru])
+
+        os.remove(self.path)
+        self.assertEqual(pengelola.snapshot(), compile_config())
+
+    def test_file_tidak_valid(self):
+        """Test file rusak tidak mengganti snapshot aktif"""
+        self.tulis({'performance': {'cache_size': 10}})
+        pengelola = PengelolaKonfigurasi(self.path, interval_cek=0)
+        self.tulis(None, teks='{bukan json')
+        self.assertEqual(pengelola.snapshot().performance.cache_size, 10)
+        self.assertIn(self.path, pengelola.galat_terakhir)
+        self.tulis({'performance': {'cache_size': -1}})
+        self.assertEqual(pengelola.snapshot().performance.cache_size, 10)
+        self.tulis({'performance': {'cache_size': 20}})
+        self.assertEqual(pengelola.snapshot().performance.cache_size, 20)
+        self.assertIsNone(pengelola.galat_terakhir)
+
+    def test_interval_cek(self):
+        """Test file tidak diperiksa ulang sebelum interval berlalu"""
+        pengelola = PengelolaKonfigurasi(self.path, interval_cek=3600)
+        self.tulis({'performance': {'cache_size': 10}})
+        self.assertEqual(pengelola.snapshot().performance.cache_size, 1000)
+        self.assertTrue(pengelola.muat_ulang())
+        self.assertEqual(pengelola.snapshot().performance.cache_size, 10)
+
+    @unittest.skipIf(tomllib is None, "tomllib/tomli tidak tersedia")
+    def test_toml(self):
+        """Test file override TOML"""
+        path = os.path.join(self.direktori.name, 'config.toml')
+        self.tulis(None, path=path, teks='[performance]\nmax_concurrent_operations = 8\n')
+        pengelola = PengelolaKonfigurasi(path)
+        self.assertEqual(pengelola.snapshot().performance.max_concurrent_operations, 8)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite untuk Mesin CRC
+==========================
+
+Test ini memvalidasi nilai cek preset CRC, kesamaan jalur tabel dengan
+perhitungan bit per bit, perhitungan inkremental, dan integrasi dengan
+simulasi kesalahan.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import unittest
+import sys
+import os
+import io
+import zlib
+import tempfile
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main_logic'))
+
+from crc import MesinCRC, ParameterCRC, PRESET_CRC, CRC8, CRC16_CCITT, CRC32, CRC32C, mesin_crc
+from number_system_simulator import KonverterSistemBilangan, SistemBilangan, JenisKesalahan
+
+
+class TestMesinCRC(unittest.TestCase):
+    """Test class untuk mesin CRC"""
+
+    def test_nilai_cek_preset(self):
+        """Test CRC dari '123456789' sesuai nilai cek standar"""
+        for parameter in PRESET_CRC.values():
+            with self.subTest(crc=parameter.nama):
+                self.assertEqual(MesinCRC(parameter).hitung(b"123456789"), parameter.cek)
+
+    def test_crc32_sama_dengan_zlib(self):
+        """Test CRC-32 sama dengan zlib untuk data acak"""
+        data = os.urandom(4099)
+        self.assertEqual(mesin_crc(CRC32).hitung(data), zlib.crc32(data))
+
+    def test_tabel_sama_dengan_bit_per_bit(self):
+        """Test jalur tabel menghasilkan nilai yang sama dengan perhitungan bit per bit"""
+        mesin = MesinCRC(CRC32C)
+        polinom = 0x82F63B78  # polinom CRC-32C terefleksi
+        for panjang in (0, 1, 7, 8, 9, 63, 1000):
+            data = os.urandom(panjang)
+            crc = 0xFFFFFFFF
+            for byte in data:
+                crc ^= byte
+                for _ in range(8):
+                    crc = (crc >> 1) ^ polinom if crc & 1 else crc >> 1
+            self.assertEqual(mesin.hitung(data), crc ^ 0xFFFFFFFF)
+
+    def test_polinom_kustom(self):
+        """Test polinom kustom (CRC-16/ARC terefleksi, CRC-16/XMODEM)"""
+        arc = ParameterCRC('CRC-16/ARC', 16, 0x8005, 0x0000, True, True, 0x0000, 0xBB3D)
+        xmodem = ParameterCRC('CRC-16/XMODEM', 16, 0x1021, 0x0000, False, False, 0x0000, 0x31C3)
+        for parameter in (arc, xmodem):
+            self.assertEqual(MesinCRC(parameter).hitung(b"123456789"), parameter.cek)
+
+    def test_lebar_tidak_didukung(self):
+        """Test lebar CRC di luar 8-64 bit ditolak"""
+        with self.assertRaises(ValueError):
+            MesinCRC(ParameterCRC('CRC-4', 4, 0x3, 0, False, False, 0, 0))
+
+    def test_inkremental(self):
+        """Test perhitungan bertahap sama dengan perhitungan sekaligus"""
+        data = os.urandom(10000)
+        for parameter in (CRC8, CRC16_CCITT, CRC32, CRC32C):
+            mesin = mesin_crc(parameter)
+            penghitung = mesin.penghitung()
+            for i in range(0, len(data), 333):
+                penghitung.update(data[i:i + 333])
+            self.assertEqual(penghitung.nilai(), mesin.hitung(data))
+            self.assertEqual(mesin.hitung_stream(io.BytesIO(data), ukuran_potong=1000),
+                             mesin.hitung(data))
+
+    def test_file(self):
+        """Test CRC file dibaca bertahap"""
+        data = os.urandom(50000)
+        with tempfile.NamedTemporaryFile(delete=False) as berkas:
+            berkas.write(data)
+        try:
+            mesin = mesin_crc(CRC32C)
+            self.assertEqual(mesin.hitung_file(berkas.name, ukuran_potong=4096), mesin.hitung(data))
+        finally:
+            os.remove(berkas.name)
+
+
+class TestIntegrasiCRC(unittest.TestCase):
+    """Test class untuk integrasi CRC dengan simulasi kesalahan"""
+
+    def setUp(self):
+        """Setup konverter"""
+        self.konverter = KonverterSistemBilangan()
+
+    def test_simulasi_kesalahan_crc(self):
+        """Test nilai yang dirusak terdeteksi oleh CRC tersimpan"""
+        hasil = self.konverter.simulasi_kesalahan_crc("101010", SistemBilangan.BINER,
+                                                      JenisKesalahan.BIT_FLIP)
+        self.assertTrue(hasil['berubah'])
+        self.assertTrue(hasil['terdeteksi'])
+        self.assertEqual(hasil['crc_tersimpan'], zlib.crc32(b"101010"))
+
+        hasil = self.konverter.simulasi_kesalahan_crc("777", SistemBilangan.OKTAL,
+                                                      JenisKesalahan.SALAH_INTERPRETASI, CRC8)
+        self.assertFalse(hasil['berubah'])
+        self.assertFalse(hasil['terdeteksi'])
+        self.assertEqual(hasil['crc'], 'CRC-8')
+
+    def test_laju_deteksi(self):
+        """Test laju deteksi per jenis kesalahan tanpa mengisi riwayat"""
+        hasil = self.konverter.ukur_laju_deteksi_crc(200, SistemBilangan.HEKSADESIMAL)
+        self.assertEqual(set(hasil), {jenis.value for jenis in JenisKesalahan})
+        # Bit flip tunggal selalu terdeteksi oleh CRC-32
+        self.assertEqual(hasil['bit_flip']['laju_deteksi'], 1.0)
+        self.assertIsNone(hasil['salah_interpretasi']['laju_deteksi'])
+        for data in hasil.values():
+            self.assertEqual(data['terdeteksi'] + data['tidak_terdeteksi'], data['berubah'])
+        self.assertEqual(self.konverter.riwayat_konversi, [])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite untuk Format Digit Lewat Tabel Byte
+==============================================
+
+Test ini memvalidasi format biner/oktal/desimal/heksadesimal dengan
+zero-padding dan pengelompokan digit, baik jalur tabel byte untuk nilai besar
+maupun jalur format() bawaan, serta penulisan ke buffer milik pemanggil.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import unittest
+import sys
+import os
+import random
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main_logic'))
+
+from format_digit import format_digit, format_digit_bytes, tulis_digit, AMBANG_BIT, KODE_FORMAT
+from mesin_basis import MesinBasis, mesin_untuk_basis
+from number_system_simulator import KonverterSistemBilangan, SistemBilangan
+
+
+def referensi(nilai, basis, lebar=0, grup=0, pemisah=' '):
+    """Format acuan: format() lalu pengelompokan dari kanan satu per satu"""
+    teks = format(nilai, KODE_FORMAT[basis]).rjust(lebar, '0')
+    if not grup:
+        return teks
+    daftar_grup = []
+    while teks:
+        daftar_grup.append(teks[-grup:])
+        teks = teks[:-grup]
+    return pemisah.join(reversed(daftar_grup))
+
+
+class TestFormatDigit(unittest.TestCase):
+    """Test class untuk format_digit"""
+
+    def test_sama_dengan_referensi(self):
+        """Test kombinasi nilai, basis, lebar, grup, dan pemisah"""
+        rng = random.Random(45)
+        nilai_uji = [0, 1, 255, 256, 0xDEADBEEF] + [rng.getrandbits(b) for b in (63, 65, 200)]
+        for nilai in nilai_uji:
+            for basis in (2, 8, 10, 16):
+                for lebar in (0, 1, 7, 9, 40):
+                    for grup in (0, 1, 2, 3, 4, 6, 8, 16):
+                        for pemisah in (' ', '_', '::'):
+                            harapan = referensi(nilai, basis, lebar, grup, pemisah)
+                            self.assertEqual(format_digit(nilai, basis, lebar, grup, pemisah),
+                                             harapan, (nilai, basis, lebar, grup, pemisah))
+                            self.assertEqual(bytes(format_digit_bytes(nilai, basis, lebar, grup,
+                                                                      pemisah)),
+                                             harapan.encode('ascii'))
+
+    def test_nilai_besar(self):
+        """Test jalur tabel byte untuk nilai di atas ambang"""
+        nilai = random.Random(7).getrandbits(AMBANG_BIT * 4) | 1
+        for lebar in (0, AMBANG_BIT + 3):
+            for grup in (0, 2, 4, 8):
+                for basis in (2, 16):
+                    self.assertEqual(format_digit(nilai, basis, lebar, grup),
+                                     referensi(nilai, basis, lebar, grup))
+        self.assertEqual(format_digit(nilai, 16), format(nilai, 'X'))
+        self.assertEqual(format_digit(nilai, 16, grup=2, pemisah='é'),
+                         referensi(nilai, 16, grup=2, pemisah='é'))
+
+    def test_tulis_buffer(self):
+        """Test penulisan ke buffer pada offset"""
+        buffer = bytearray(12)
+        self.assertEqual(tulis_digit(0xBEEF, 16, buffer, offset=2, grup=2, pemisah=b':'), 5)
+        self.assertEqual(bytes(buffer[2:7]), b'BE:EF')
+        with self.assertRaises(ValueError):
+            tulis_digit(1 << 100, 2, buffer)
+
+    def test_argumen_tidak_valid(self):
+        """Test nilai negatif, basis, lebar, dan grup tidak valid"""
+        for argumen in ((-1, 2), (5, 3), (5, 2, -1), (5, 2, 0, -4)):
+            with self.assertRaises(ValueError):
+                format_digit(*argumen)
+
+
+class TestIntegrasiFormatDigit(unittest.TestCase):
+    """Test class untuk pemakaian format digit oleh mesin dan konverter"""
+
+    def test_mesin_heksadesimal_besar(self):
+        """Test mesin basis 16 (standar dan alfabet kustom) untuk nilai besar"""
+        nilai = (1 << (AMBANG_BIT * 2)) - 12345
+        self.assertEqual(mesin_untuk_basis(16).dari_int(nilai), format(nilai, 'X'))
+        kecil = MesinBasis(16, '0123456789abcdef', abaikan_kapital=False)
+        self.assertEqual(kecil.dari_int(nilai), format(nilai, 'x'))
+
+    def test_dari_desimal_lebar_grup(self):
+        """Test opsi lebar dan grup pada dari_desimal"""
+        konverter = KonverterSistemBilangan()
+        self.assertEqual(konverter.dari_desimal(0xDEADBEEF, SistemBilangan.BINER, grup=8),
+                         '11011110 10101101 10111110 11101111')
+        self.assertEqual(konverter.dari_desimal(42, SistemBilangan.HEKSADESIMAL, lebar=8,
+                                                grup=4, pemisah='_'), '0000_002A')
+        self.assertEqual(konverter.dari_desimal(1234567, SistemBilangan.DESIMAL, grup=3,
+                                                pemisah='.'), '1.234.567')
+        self.assertEqual(konverter.dari_desimal(8, SistemBilangan.OKTAL, lebar=4), '0010')
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
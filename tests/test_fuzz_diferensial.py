@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite untuk Fuzzing Diferensial
+====================================
+
+Test ini menjalankan harness fuzzing dengan anggaran kecil dan memeriksa
+bahwa kasus dapat diulang dari seed kasus.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import unittest
+import sys
+import os
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main_logic'))
+
+from fuzz_diferensial import (bangkitkan_kasus, periksa_kasus, jalankan_fuzz, jalankan_shard,
+                              seed_kasus_shard, JENIS_UJI)
+from number_system_simulator import SistemBilangan
+
+
+class TestFuzzDiferensial(unittest.TestCase):
+    """Test class untuk harness fuzzing diferensial"""
+
+    def test_kasus_deterministik(self):
+        """Test kasus yang sama dibangkitkan dari seed kasus yang sama"""
+        daftar_seed = list(seed_kasus_shard(5, 0, 50))
+        self.assertEqual(daftar_seed, list(seed_kasus_shard(5, 0, 50)))
+        self.assertNotEqual(daftar_seed, list(seed_kasus_shard(5, 1, 50)))
+        for seed_kasus in daftar_seed:
+            self.assertEqual(bangkitkan_kasus(seed_kasus), bangkitkan_kasus(seed_kasus))
+        self.assertEqual({bangkitkan_kasus(s)['jenis'] for s in daftar_seed}, set(JENIS_UJI))
+
+    def test_tanpa_kegagalan(self):
+        """Test sejumlah kecil kasus acak cocok dengan oracle dan simulator sederhana"""
+        hasil = jalankan_fuzz(3000, seed=2025, proses=1, ukuran_shard=1000)
+        self.assertEqual(hasil['kasus'], 3000)
+        self.assertEqual(hasil['kegagalan'], [])
+
+    def test_process_pool(self):
+        """Test shard di process pool menghasilkan jumlah kasus yang sama"""
+        hasil = jalankan_fuzz(400, seed=3, proses=2, ukuran_shard=100, jenis=('konversi',))
+        dijalankan = sum(jalankan_shard(3, indeks, 100, ('konversi',))[0] for indeks in range(4))
+        self.assertEqual(hasil['kasus'], dijalankan)
+        self.assertEqual(hasil['kegagalan'], [])
+
+    def test_kegagalan_terdeteksi(self):
+        """Test selisih dengan oracle dilaporkan"""
+        kasus = {'seed_kasus': 0, 'jenis': 'konversi', 'nilai': 'ﬀ',
+                 'sistem_asal': SistemBilangan.HEKSADESIMAL, 'sistem_tujuan': SistemBilangan.DESIMAL}
+        self.assertIsNone(periksa_kasus(kasus))
+
+        class KonverterRusak:
+            riwayat_konversi = []
+
+            def konversi(self, nilai, asal, tujuan):
+                return "0"
+
+        kasus['nilai'] = 'FF'
+        kegagalan = periksa_kasus(kasus, KonverterRusak())
+        self.assertEqual(kegagalan['pembanding'], 'oracle')
+        self.assertEqual(kegagalan['diharapkan'], ('ok', '255'))
+        self.assertEqual(kegagalan['aktual'], ('ok', '0'))
+
+    def test_desimal_raksasa(self):
+        """Test numeral desimal di atas batas digit int/str CPython diuji di jalur hasil"""
+        nilai = '9' * 5000
+        kasus = {'seed_kasus': 0, 'jenis': 'konversi', 'nilai': nilai,
+                 'sistem_asal': SistemBilangan.DESIMAL, 'sistem_tujuan': SistemBilangan.HEKSADESIMAL}
+        batas = sys.get_int_max_str_digits() if hasattr(sys, 'get_int_max_str_digits') else None
+        self.assertIsNone(periksa_kasus(kasus))
+
+        class KonverterRusak:
+            riwayat_konversi = []
+
+            def konversi(self, nilai, asal, tujuan):
+                return "0"
+
+        kegagalan = periksa_kasus(kasus, KonverterRusak())
+        self.assertEqual(kegagalan['diharapkan'][0], 'ok')
+        self.assertEqual(len(kegagalan['diharapkan'][1]), 4153)
+        if batas is not None:
+            self.assertEqual(sys.get_int_max_str_digits(), batas)
+
+    def test_jenis_tidak_dikenal(self):
+        """Test validasi parameter"""
+        with self.assertRaises(ValueError):
+            jalankan_fuzz(10, jenis=('bitwise',))
+        with self.assertRaises(ValueError):
+            jalankan_fuzz(0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -15,27 +15,51 @@ import tkinter as tk
 from unittest.mock import patch, MagicMock
 import sys
 import os
+import json
+import time
+import tempfile
 
 # Tambahkan path untuk import module
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'gui'))
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main_logic'))
 
 from gui_simulator import GUISimulatorSistemBilangan
+from config_gui import PengelolaKonfigurasi
 from number_system_simulator import KonverterSistemBilangan, SistemBilangan, JenisKesalahan
 
 
+def buat_app(direktori, **performance):
+    """GUI dengan riwayat persisten di direktori sementara, bukan di folder data pengguna"""
+    path_config = os.path.join(direktori, 'config.json')
+    performance['history_db_path'] = os.path.join(direktori, 'riwayat.db')
+    with open(path_config, 'w') as berkas:
+        json.dump({'performance': performance}, berkas)
+    return GUISimulatorSistemBilangan(PengelolaKonfigurasi(path_config))
+
+
 class TestGUISimulator(unittest.TestCase):
     """Test class untuk GUI Simulator"""
     
     def setUp(self):
         """Setup untuk setiap test"""
+        self.direktori = tempfile.TemporaryDirectory()
         self.root = tk.Tk()
         self.root.withdraw()  # Sembunyikan window untuk test
-        self.app = GUISimulatorSistemBilangan()
+        self.app = buat_app(self.direktori.name)
         
     def tearDown(self):
         """Cleanup setelah setiap test"""
+        self.app.on_close()
         self.root.destroy()
+        self.direktori.cleanup()
+        
+    def tunggu_operasi(self, batas_detik=10.0):
+        """Menjalankan event loop sampai konversi/operasi di thread latar selesai"""
+        tenggat = time.monotonic() + batas_detik
+        while self.app.token_operasi is not None:
+            self.assertLess(time.monotonic(), tenggat, "Operasi latar tidak selesai")
+            self.app.root.update()
+            time.sleep(0.01)
         
     def test_gui_initialization(self):
         """Test inisialisasi GUI"""
@@ -61,6 +85,7 @@ class TestGUISimulator(unittest.TestCase):
         
         # Test konversi
         self.app.perform_conversion()
+        self.tunggu_operasi()
         
         # Verifikasi hasil ada di result_text
         result = self.app.result_text.get('1.0', tk.END)
@@ -76,11 +101,83 @@ class TestGUISimulator(unittest.TestCase):
         
         # Test operasi
         self.app.perform_arithmetic()
+        self.tunggu_operasi()
         
         # Verifikasi hasil ada di arithmetic_result_text
         result = self.app.arithmetic_result_text.get('1.0', tk.END)
         self.assertIn("10000", result)  # 1010 + 110 = 10000
         
+    def test_operation_runs_off_main_thread(self):
+        """Test konversi berjalan di thread latar dan tombol dikembalikan setelahnya"""
+        self.app.from_system_var.set("desimal")
+        self.app.input_value_var.set("255")
+        self.app.to_system_var.set("heksadesimal")
+        
+        self.app.perform_conversion()
+        self.assertIsNotNone(self.app.token_operasi)
+        self.assertEqual(str(self.app.convert_btn['state']), 'disabled')
+        self.assertEqual(str(self.app.arithmetic_cancel_btn['state']), 'normal')
+        self.tunggu_operasi()
+        self.assertEqual(str(self.app.convert_btn['state']), 'normal')
+        self.assertEqual(str(self.app.convert_cancel_btn['state']), 'disabled')
+        self.assertIn("FF", self.app.result_text.get('1.0', tk.END))
+        
+    def test_cancel_operation(self):
+        """Test tombol batal membatalkan token operasi yang sedang berjalan"""
+        self.app.arithmetic_system_var.set("desimal")
+        self.app.value1_var.set("12")
+        self.app.value2_var.set("30")
+        self.app.operation_var.set("+")
+        
+        self.app.perform_arithmetic()
+        token = self.app.token_operasi
+        self.app.cancel_operation()
+        self.assertTrue(token.dibatalkan)
+        self.tunggu_operasi()
+        self.assertEqual(str(self.app.arithmetic_btn['state']), 'normal')
+        
+    def test_cancel_not_reported_as_timeout(self):
+        """Test pembatalan operasi di proses pekerja tidak dilaporkan sebagai batas waktu"""
+        self.app.pelaksana.ambang_bit = 1
+        self.app.arithmetic_system_var.set("heksadesimal")
+        self.app.value1_var.set("F" * 200000)
+        self.app.value2_var.set("14")
+        self.app.operation_var.set("**")
+        
+        self.app.perform_arithmetic()
+        self.app.cancel_operation()
+        self.tunggu_operasi()
+        result = self.app.arithmetic_result_text.get('1.0', tk.END)
+        self.assertIn("DIBATALKAN", result)
+        self.assertNotIn("BATAS WAKTU", result)
+        
+    def test_max_concurrent_operations(self):
+        """Test operasi latar baru ditolak saat batas konkurensi tercapai"""
+        self.app.on_close()
+        self.app = buat_app(self.direktori.name, max_concurrent_operations=1)
+        self.app.crc_samples_var.set("100000000")
+        self.app.start_crc_test()
+        self.assertEqual(self.app.operasi_aktif, 1)
+        
+        self.app.from_system_var.set("desimal")
+        self.app.input_value_var.set("42")
+        self.app.to_system_var.set("biner")
+        with patch('gui_simulator.messagebox.showwarning') as peringatan:
+            self.app.perform_conversion()
+        peringatan.assert_called_once()
+        self.assertIsNone(self.app.token_operasi)
+        
+        self.app.cancel_crc_test()
+        tenggat = time.monotonic() + 10
+        while self.app.token_crc is not None:
+            self.assertLess(time.monotonic(), tenggat, "Uji CRC tidak berhenti")
+            self.app.root.update()
+            time.sleep(0.01)
+        self.assertEqual(self.app.operasi_aktif, 0)
+        self.app.perform_conversion()
+        self.tunggu_operasi()
+        self.assertIn("101010", self.app.result_text.get('1.0', tk.END))
+        
     def test_error_simulation_functionality(self):
         """Test fungsi simulasi kesalahan"""
         # Set test data
@@ -172,6 +269,10 @@ class TestGUISimulator(unittest.TestCase):
             
         # Verifikasi riwayat kosong
         self.assertEqual(len(self.app.konverter.riwayat_konversi), 0)
+        # Yang dihapus adalah basis data sementara test, bukan riwayat pengguna
+        self.assertEqual(os.path.dirname(self.app.konverter.riwayat_persisten.path_db),
+                         self.direktori.name)
+        self.assertEqual(self.app.konverter.riwayat_persisten.jumlah(), 0)
 
 
 class TestGUIIntegration(unittest.TestCase):
@@ -214,21 +315,26 @@ class TestGUIPerformance(unittest.TestCase):
     
     def setUp(self):
         """Setup untuk test performa"""
+        self.direktori = tempfile.TemporaryDirectory()
         self.root = tk.Tk()
         self.root.withdraw()
-        self.app = GUISimulatorSistemBilangan()
+        self.app = buat_app(self.direktori.name)
         
     def tearDown(self):
         """Cleanup"""
+        self.app.on_close()
         self.root.destroy()
+        self.direktori.cleanup()
         
     def test_gui_startup_time(self):
         """Test waktu startup GUI"""
         import time
         
-        start_time = time.time()
-        app = GUISimulatorSistemBilangan()
-        end_time = time.time()
+        with tempfile.TemporaryDirectory() as direktori:
+            start_time = time.time()
+            app = buat_app(direktori)
+            end_time = time.time()
+            app.on_close()
         
         startup_time = end_time - start_time
         self.assertLess(startup_time, 5.0)  # Harus kurang dari 5 detik
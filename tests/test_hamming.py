@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite untuk Kode Hamming dan SECDED
+========================================
+
+Test ini memvalidasi enkode, koreksi satu bit, deteksi dua bit (SECDED),
+mode batch NumPy, dan simulasi koreksi pada konverter.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import unittest
+import sys
+import os
+import random
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main_logic'))
+
+from hamming import (HAMMING_7_4, HAMMING_15_11, SECDED_72_64, KODE_HAMMING,
+                     STATUS_BENAR, STATUS_DIKOREKSI, STATUS_TERDETEKSI)
+from dukungan_numpy import np
+from number_system_simulator import KonverterSistemBilangan, SistemBilangan
+
+
+class TestKodeHamming(unittest.TestCase):
+    """Test class untuk kode Hamming skalar"""
+
+    def test_ukuran_kode(self):
+        """Test panjang kode dan jumlah bit cek"""
+        self.assertEqual((HAMMING_7_4.n, HAMMING_7_4.jumlah_cek), (7, 3))
+        self.assertEqual((HAMMING_15_11.n, HAMMING_15_11.jumlah_cek), (15, 4))
+        self.assertEqual((SECDED_72_64.n, SECDED_72_64.jumlah_cek), (72, 8))
+
+    def test_hamming_7_4_lengkap(self):
+        """Test semua data dan semua posisi flip untuk Hamming(7,4)"""
+        for data in range(16):
+            kode = HAMMING_7_4.enkode(data)
+            self.assertEqual(HAMMING_7_4.dekode(kode), (data, STATUS_BENAR))
+            for posisi in range(7):
+                self.assertEqual(HAMMING_7_4.dekode(kode ^ (1 << posisi)), (data, STATUS_DIKOREKSI))
+
+    def test_koreksi_satu_bit(self):
+        """Test koreksi satu bit pada data acak untuk semua kode"""
+        rng = random.Random(7)
+        for kode in KODE_HAMMING.values():
+            for _ in range(300):
+                data = rng.getrandbits(kode.k)
+                posisi = rng.randrange(kode.n)
+                self.assertEqual(kode.dekode(kode.enkode(data) ^ (1 << posisi)),
+                                 (data, STATUS_DIKOREKSI))
+
+    def test_secded_deteksi_dua_bit(self):
+        """Test SECDED mendeteksi semua kesalahan dua bit"""
+        rng = random.Random(11)
+        for _ in range(500):
+            data = rng.getrandbits(64)
+            p1, p2 = rng.sample(range(72), 2)
+            _, status = SECDED_72_64.dekode(SECDED_72_64.enkode(data) ^ (1 << p1) ^ (1 << p2))
+            self.assertEqual(status, STATUS_TERDETEKSI)
+
+    def test_data_terlalu_besar(self):
+        """Test data di luar k bit ditolak"""
+        with self.assertRaises(ValueError):
+            HAMMING_7_4.enkode(16)
+
+
+@unittest.skipIf(np is None, "NumPy tidak tersedia")
+class TestBatchHamming(unittest.TestCase):
+    """Test class untuk mode batch NumPy"""
+
+    def test_batch_sama_dengan_skalar(self):
+        """Test bit cek batch sama dengan perhitungan skalar"""
+        rng = random.Random(3)
+        for kode in KODE_HAMMING.values():
+            data = [rng.getrandbits(kode.k) for _ in range(200)]
+            cek = kode.batch_hitung_cek(np.array(data, dtype=np.uint64))
+            self.assertEqual(cek.tolist(), [kode.hitung_cek(d) for d in data])
+
+    def test_payload_bytes(self):
+        """Test payload bytes dienkode, dirusak satu bit per kata, dan dipulihkan"""
+        payload = os.urandom(999)
+        for kode in KODE_HAMMING.values():
+            kata, cek = kode.enkode_bytes(payload)
+            kata_rusak = kata ^ np.uint64(1)
+            hasil, jumlah = kode.dekode_bytes(kata_rusak, cek, len(payload))
+            self.assertEqual(hasil, payload)
+            self.assertEqual(jumlah[STATUS_DIKOREKSI], len(kata))
+
+    def test_cakupan_koreksi(self):
+        """Test cakupan koreksi untuk satu dan dua bit flip"""
+        hasil = SECDED_72_64.ukur_cakupan_koreksi(20000, jumlah_flip=1, seed=1)
+        self.assertEqual(hasil['cakupan'], 1.0)
+        hasil = SECDED_72_64.ukur_cakupan_koreksi(20000, jumlah_flip=2, seed=1)
+        self.assertEqual(hasil['terdeteksi'], 20000)
+        hasil = HAMMING_15_11.ukur_cakupan_koreksi(20000, jumlah_flip=2, seed=1)
+        self.assertEqual(hasil['salah_koreksi'], 20000)
+
+
+class TestSimulasiKoreksi(unittest.TestCase):
+    """Test class untuk simulasi koreksi pada konverter"""
+
+    def test_bit_flip_dikoreksi(self):
+        """Test bit flip pada kode selalu dipulihkan"""
+        konverter = KonverterSistemBilangan()
+        for nilai, sistem in [("2A", SistemBilangan.HEKSADESIMAL), ("777", SistemBilangan.OKTAL),
+                              ("0", SistemBilangan.BINER), ("123456789", SistemBilangan.DESIMAL)]:
+            for kode in KODE_HAMMING.values():
+                hasil = konverter.simulasi_koreksi_hamming(nilai, sistem, kode)
+                self.assertTrue(hasil['dipulihkan'])
+                self.assertEqual(hasil['nilai_dekode'], nilai)
+                self.assertEqual(hasil['status_blok'].count(STATUS_DIKOREKSI), 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
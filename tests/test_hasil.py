@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite untuk Tipe Hasil Berslot
+===================================
+
+Test ini memvalidasi objek hasil berslot, kompatibilitas akses gaya dict,
+to_dict(), dan API batch yang mengembalikan objek berslot.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import unittest
+import sys
+import os
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main_logic'))
+
+from hasil import EntriRiwayat, HasilOperasi, HasilDeteksi, BarisTabel
+from number_system_simulator import KonverterSistemBilangan, SistemBilangan
+
+
+class TestHasilBerslot(unittest.TestCase):
+    """Test class untuk tipe hasil berslot"""
+
+    def setUp(self):
+        """Setup konverter"""
+        self.konverter = KonverterSistemBilangan()
+
+    def test_tanpa_dict_per_instance(self):
+        """Test objek hasil tidak memiliki __dict__"""
+        for hasil in (EntriRiwayat('1', 'biner', 'desimal', '1', 1), HasilOperasi(berhasil=True),
+                      HasilDeteksi(False, '1', '1'), BarisTabel()):
+            self.assertFalse(hasattr(hasil, '__dict__'))
+
+    def test_akses_gaya_dict(self):
+        """Test akses kunci, get, in, dan KeyError untuk field kosong"""
+        hasil = HasilOperasi(berhasil=False, error="gagal", operasi="1 / 0", sistem="desimal")
+        self.assertEqual(hasil['error'], "gagal")
+        self.assertFalse(hasil['berhasil'])
+        self.assertIn('error', hasil)
+        self.assertNotIn('hasil_sistem', hasil)
+        self.assertIsNone(hasil.get('hasil_sistem'))
+        with self.assertRaises(KeyError):
+            hasil['hasil_sistem']
+        with self.assertRaises(KeyError):
+            hasil['tidak_ada']
+
+    def test_riwayat_berslot(self):
+        """Test riwayat konversi berisi EntriRiwayat yang tetap terbaca seperti dict"""
+        self.konverter.konversi("2A", SistemBilangan.HEKSADESIMAL, SistemBilangan.BINER)
+        entri = self.konverter.riwayat_konversi[0]
+        self.assertIsInstance(entri, EntriRiwayat)
+        self.assertEqual(entri['hasil'], "101010")
+        self.assertEqual(entri, {'nilai_asal': "2A", 'sistem_asal': "heksadesimal",
+                                 'sistem_tujuan': "biner", 'hasil': "101010", 'nilai_desimal': 42})
+
+    def test_metode_dict_tetap_dict(self):
+        """Test metode lama tetap mengembalikan dict dengan kunci yang sama"""
+        hasil = self.konverter.operasi_aritmatika("1010", "110", "+", SistemBilangan.BINER)
+        self.assertIs(type(hasil), dict)
+        self.assertEqual(set(hasil), {'berhasil', 'hasil_desimal', 'hasil_sistem', 'operasi', 'sistem'})
+
+        hasil = self.konverter.operasi_aritmatika("1", "10", "-", SistemBilangan.BINER)
+        self.assertEqual(set(hasil), {'berhasil', 'error', 'operasi', 'sistem'})
+
+        deteksi = self.konverter.deteksi_kesalahan_konversi("42", "101011", SistemBilangan.DESIMAL,
+                                                             SistemBilangan.BINER)
+        self.assertIs(type(deteksi), dict)
+        self.assertTrue(deteksi['ada_kesalahan'])
+        self.assertEqual(deteksi['jenis_kesalahan'], ["Kemungkinan kesalahan satu digit"])
+
+        tabel = self.konverter.tampilkan_tabel_konversi("42", SistemBilangan.DESIMAL)
+        self.assertEqual(tabel, {'biner': "101010", 'desimal': "42", 'heksadesimal': "2A", 'oktal': "52"})
+        tabel = self.konverter.tampilkan_tabel_konversi("4G", SistemBilangan.DESIMAL)
+        self.assertIn('error', tabel)
+
+    def test_api_batch(self):
+        """Test API batch mengembalikan objek berslot"""
+        hasil = list(self.konverter.operasi_aritmatika_batch([("1", "2"), ("7", "7")], "*",
+                                                             SistemBilangan.OKTAL))
+        self.assertTrue(all(isinstance(h, HasilOperasi) for h in hasil))
+        self.assertEqual([h.hasil_sistem for h in hasil], ["2", "61"])
+
+        deteksi = list(self.konverter.deteksi_kesalahan_batch(
+            [("10", "A"), ("10", "B")], SistemBilangan.DESIMAL, SistemBilangan.HEKSADESIMAL))
+        self.assertEqual([d.ada_kesalahan for d in deteksi], [False, True])
+
+        tabel = list(self.konverter.tabel_konversi_batch(["1", "10"], SistemBilangan.BINER))
+        self.assertEqual([b.desimal for b in tabel], ["1", "2"])
+        self.assertEqual(tabel[1].to_dict()['oktal'], "2")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite untuk Simulator Kanal
+================================
+
+Test ini memvalidasi model kanal BSC dan Gilbert–Elliott, statistik burst,
+dan efek kanal pada nilai yang dibaca kembali dengan ke_desimal.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import unittest
+import sys
+import os
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main_logic'))
+
+from dukungan_numpy import np
+from kanal import KanalBSC, KanalGilbertElliott, statistik_kesalahan
+from number_system_simulator import KonverterSistemBilangan, SistemBilangan
+
+
+@unittest.skipIf(np is None, "NumPy tidak tersedia")
+class TestKanal(unittest.TestCase):
+    """Test class untuk model kanal"""
+
+    def test_statistik_burst(self):
+        """Test deteksi burst pada pola yang diketahui"""
+        pola = np.array([1, 1, 0, 0, 1, 0, 1, 1, 1, 0], dtype=np.uint8)
+        statistik = statistik_kesalahan(pola)
+        self.assertEqual(statistik['jumlah_kesalahan'], 6)
+        self.assertAlmostEqual(statistik['ber'], 0.6)
+        self.assertEqual(statistik['distribusi_burst'], {1: 1, 2: 1, 3: 1})
+        self.assertEqual(statistik['panjang_burst_maksimum'], 3)
+
+    def test_bsc(self):
+        """Test BER kanal BSC mendekati p"""
+        statistik = statistik_kesalahan(KanalBSC(0.01).pola_kesalahan(1_000_000, seed=1))
+        self.assertAlmostEqual(statistik['ber'], 0.01, delta=0.001)
+
+    def test_gilbert_elliott_bursty(self):
+        """Test BER Gilbert–Elliott mendekati teori dan burst lebih panjang dari BSC"""
+        kanal = KanalGilbertElliott(0.001, 0.1, 0.0, 0.5)
+        statistik = statistik_kesalahan(kanal.pola_kesalahan(2_000_000, seed=2))
+        self.assertAlmostEqual(statistik['ber'], kanal.ber_teoretis(), delta=0.001)
+
+        bsc = statistik_kesalahan(KanalBSC(kanal.ber_teoretis()).pola_kesalahan(2_000_000, seed=2))
+        self.assertGreater(statistik['panjang_burst_rata_rata'], bsc['panjang_burst_rata_rata'])
+
+    def test_seed_reproduksi(self):
+        """Test seed yang sama menghasilkan pola yang sama"""
+        kanal = KanalGilbertElliott(0.01, 0.2)
+        self.assertTrue(np.array_equal(kanal.pola_kesalahan(10000, seed=5),
+                                       kanal.pola_kesalahan(10000, seed=5)))
+
+    def test_kirim_bytes(self):
+        """Test kanal tanpa kesalahan dan kanal yang selalu membalik bit"""
+        payload = os.urandom(100)
+        self.assertEqual(KanalBSC(0.0).kirim_bytes(payload), payload)
+        self.assertEqual(KanalBSC(1.0).kirim_bytes(payload), bytes(b ^ 0xFF for b in payload))
+
+    def test_probabilitas_tidak_valid(self):
+        """Test probabilitas di luar [0, 1] ditolak"""
+        with self.assertRaises(ValueError):
+            KanalBSC(1.5)
+        with self.assertRaises(ValueError):
+            KanalGilbertElliott(0.0, 0.1)
+
+    def test_simulasi_kanal_konverter(self):
+        """Test efek kanal pada nilai yang didekode"""
+        konverter = KonverterSistemBilangan()
+        nilai = ["FF", "1A", "0", "7"]
+        hasil = konverter.simulasi_kanal(nilai, SistemBilangan.HEKSADESIMAL, KanalBSC(0.0))
+        self.assertEqual(hasil['nilai_diterima'], nilai)
+        self.assertEqual(hasil['nilai_terpengaruh'], 0)
+        self.assertEqual(hasil['lebar_bit'], 8)
+
+        hasil = konverter.simulasi_kanal(nilai, SistemBilangan.HEKSADESIMAL, KanalBSC(1.0))
+        self.assertEqual(hasil['nilai_diterima'], ["0", "E5", "FF", "F8"])
+        self.assertEqual(hasil['selisih_maksimum'], 255)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite untuk Konversi Berbasis Buffer
+=========================================
+
+Test ini memvalidasi konversi dari bytes/bytearray/memoryview, penulisan
+ke buffer milik pemanggil, dan konversi heksadesimal ↔ bytes.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import unittest
+import sys
+import os
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main_logic'))
+
+from konversi_buffer import (validasi_buffer, ke_int_buffer, heks_ke_bytes, bytes_ke_heks,
+                             payload_ke_int, int_ke_payload, dari_int_ke_buffer)
+from mesin_basis import MESIN_CROCKFORD
+from number_system_simulator import KonverterSistemBilangan, SistemBilangan, MESIN_SISTEM
+
+
+class TestKonversiBuffer(unittest.TestCase):
+    """Test class untuk konversi buffer"""
+
+    def setUp(self):
+        """Setup konverter"""
+        self.konverter = KonverterSistemBilangan()
+
+    def test_jenis_buffer(self):
+        """Test bytes, bytearray, dan memoryview sebagai input"""
+        for data in (b"2a", bytearray(b" 2A\n"), memoryview(b"xx2Axx")[2:4]):
+            self.assertEqual(self.konverter.ke_desimal_buffer(data, SistemBilangan.HEKSADESIMAL), 42)
+
+    def test_validasi(self):
+        """Test validasi sama dengan validasi string"""
+        for teks in ["101", "102", "", " 7 ", "1_0", "ff", "FG"]:
+            for sistem in SistemBilangan:
+                self.assertEqual(validasi_buffer(teks.encode(), MESIN_SISTEM[sistem]),
+                                 self.konverter.validasi_input(teks, sistem), (teks, sistem))
+        self.assertRaises(ValueError, ke_int_buffer, b"1_0", MESIN_SISTEM[SistemBilangan.DESIMAL])
+
+    def test_tulis_ke_buffer_pemanggil(self):
+        """Test hasil ditulis ke buffer milik pemanggil"""
+        keluaran = bytearray(b"........")
+        jumlah = self.konverter.konversi_buffer(b"255", SistemBilangan.DESIMAL, SistemBilangan.HEKSADESIMAL,
+                                                keluaran, offset=2)
+        self.assertEqual(jumlah, 2)
+        self.assertEqual(keluaran, bytearray(b"..FF...."))
+        self.assertRaises(ValueError, self.konverter.konversi_buffer, b"255", SistemBilangan.DESIMAL,
+                          SistemBilangan.BINER, bytearray(4))
+
+    def test_format_heks_sama_dengan_string(self):
+        """Test format heksadesimal buffer sama dengan dari_desimal"""
+        mesin = MESIN_SISTEM[SistemBilangan.HEKSADESIMAL]
+        for nilai in [0, 1, 15, 16, 255, 256, 4095, 2 ** 100 + 7]:
+            self.assertEqual(dari_int_ke_buffer(nilai, mesin).decode(),
+                             self.konverter.dari_desimal(nilai, SistemBilangan.HEKSADESIMAL))
+        self.assertEqual(ke_int_buffer(b"zz", MESIN_CROCKFORD), 1023)
+
+    def test_heks_dan_payload(self):
+        """Test heksadesimal ↔ bytes dan payload ↔ int"""
+        self.assertEqual(heks_ke_bytes(b"00ff10"), b"\x00\xff\x10")
+        self.assertEqual(bytes_ke_heks(memoryview(b"\x00\xff\x10")), b"00FF10")
+        self.assertRaises(ValueError, heks_ke_bytes, b"0")
+
+        keluaran = bytearray(4)
+        self.assertEqual(int_ke_payload(-2, 2, keluaran, offset=1, bertanda=True), 2)
+        self.assertEqual(keluaran, bytearray(b"\x00\xff\xfe\x00"))
+        self.assertEqual(payload_ke_int(memoryview(keluaran)[1:3], bertanda=True), -2)
+        self.assertRaises(ValueError, int_ke_payload, 256, 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
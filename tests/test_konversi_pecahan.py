@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite untuk Konversi Bilangan Pecahan
+==========================================
+
+Test ini memvalidasi konversi pecahan eksak, deteksi periode berulang,
+laporan galat pemotongan, dan mode batch float64.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import unittest
+import random
+from fractions import Fraction
+import sys
+import os
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main_logic'))
+
+from konversi_pecahan import konversi_pecahan, baca_pecahan, batch_float_ke_digit
+from dukungan_numpy import np
+from number_system_simulator import KonverterSistemBilangan, SistemBilangan
+
+
+class TestKonversiPecahan(unittest.TestCase):
+    """Test class untuk konversi pecahan"""
+
+    def test_desimal_ke_biner(self):
+        """Test 0.1 desimal ke biner berulang"""
+        konverter = KonverterSistemBilangan()
+        hasil = konverter.konversi_pecahan("0.1", SistemBilangan.DESIMAL, SistemBilangan.BINER, presisi=10)
+        self.assertEqual(hasil['hasil'], "0.0001100110")
+        self.assertEqual(hasil['notasi'], "0.0(0011)")
+        self.assertFalse(hasil['eksak'])
+        self.assertEqual(hasil['galat_eksak'], Fraction(1, 10) - Fraction(0b0001100110, 2 ** 10))
+
+    def test_pecahan_berhenti(self):
+        """Test pecahan yang berhenti dikonversi eksak"""
+        hasil = konversi_pecahan("A.8", 16, 2)
+        self.assertEqual(hasil['hasil'], "1010.1")
+        self.assertTrue(hasil['eksak'])
+        self.assertIsNone(hasil['periode'])
+        self.assertEqual(hasil['galat'], 0.0)
+
+    def test_galat_acak(self):
+        """Test galat pemotongan sesuai nilai eksak untuk input acak"""
+        acak = random.Random(30)
+        for _ in range(200):
+            bulat, pecahan = acak.randint(0, 500), acak.randint(0, 10 ** 12)
+            teks = f"{bulat}.{pecahan:012d}"
+            nilai = Fraction(teks)
+            for basis in (2, 3, 8, 10, 16):
+                hasil = konversi_pecahan(teks, 10, basis, presisi=20)
+                self.assertGreaterEqual(hasil['galat_eksak'], 0)
+                self.assertLess(hasil['galat_eksak'], Fraction(1, basis ** 20))
+                self.assertEqual(baca_pecahan(hasil['hasil'], basis) + hasil['galat_eksak'], nilai)
+
+    def test_periode_pertiga(self):
+        """Test 1/3 dalam basis 3 dan basis 10"""
+        self.assertEqual(konversi_pecahan("0.1", 3, 10, presisi=5)['notasi'], "0.(3)")
+        self.assertEqual(konversi_pecahan("0.1", 3, 10, presisi=5)['hasil'], "0.33333")
+        self.assertEqual(konversi_pecahan("0.1", 10, 16, presisi=4)['notasi'], "0.1(9)")
+
+    def test_input_tidak_valid(self):
+        """Test input pecahan tidak valid"""
+        self.assertRaises(ValueError, baca_pecahan, "0.2", 2)
+        self.assertRaises(ValueError, baca_pecahan, "1.2.3", 10)
+
+
+@unittest.skipIf(np is None, "NumPy tidak tersedia")
+class TestBatchFloat(unittest.TestCase):
+    """Test class untuk mode batch float64"""
+
+    def test_batch_sama_dengan_eksak(self):
+        """Test digit batch sama dengan konversi eksak dari nilai float"""
+        nilai = np.array([0.1, 0.5, -3.75, 1234.0625, 0.0, 1e-5])
+        for basis in (2, 8, 16):
+            hasil = batch_float_ke_digit(nilai, basis, presisi=12)
+            for i, x in enumerate(nilai.tolist()):
+                eksak = Fraction(abs(x))
+                bulat = eksak.numerator // eksak.denominator
+                self.assertEqual(int(hasil['bulat'][i]), bulat)
+                digit = hasil['digit'][i].tolist()
+                terpotong = bulat + sum(Fraction(d, basis ** (j + 1)) for j, d in enumerate(digit))
+                self.assertEqual(Fraction(float(hasil['galat'][i])), eksak - terpotong)
+        self.assertEqual(hasil['negatif'].tolist(), [False, False, True, False, False, False])
+
+    def test_digit_eksak_dari_pola_bit(self):
+        """Test jumlah digit eksak dibaca dari pola bit IEEE-754"""
+        hasil = batch_float_ke_digit(np.array([0.5, 0.75, 3.0, 0.1]), 2, presisi=4)
+        self.assertEqual(hasil['digit_eksak'].tolist(), [1, 2, 0, 55])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite Regresi Memori
+=========================
+
+Test ini mengukur alokasi per operasi KonverterSistemBilangan dengan
+tracemalloc, membandingkannya dengan baseline tersimpan
+(baseline_memori.json), dan menjalankan uji kebocoran jangka panjang
+dengan riwayat berbatas.
+
+Jumlah konversi uji kebocoran dapat dinaikkan dengan variabel lingkungan
+UJI_MEMORI_JUMLAH (misal 1000000). Baseline diperbarui dengan:
+    python main_logic/profil_memori.py --tulis-baseline tests/baseline_memori.json
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import unittest
+import sys
+import os
+import json
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main_logic'))
+
+from profil_memori import (profil_operasi, uji_kebocoran, bandingkan_baseline, buat_baseline,
+                           versi_python)
+from number_system_simulator import KonverterSistemBilangan, SistemBilangan
+
+PATH_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline_memori.json')
+
+
+class TestRegresiMemori(unittest.TestCase):
+    """Test class untuk alokasi per operasi"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Profil diukur sekali untuk semua test"""
+        cls.hasil = profil_operasi()
+
+    def test_tanpa_kebocoran_per_operasi(self):
+        """Test tidak ada operasi yang menahan memori pada kondisi tunak"""
+        for nama, per_ukuran in self.hasil.items():
+            for bit, ukur in per_ukuran.items():
+                self.assertLess(ukur['tertahan'], 8, f"{nama} ({bit} bit) menahan memori")
+
+    def test_baseline(self):
+        """Test alokasi per operasi tidak tumbuh melewati baseline"""
+        with open(PATH_BASELINE, encoding='utf-8') as berkas:
+            baseline = json.load(berkas)
+        if baseline['python'] != versi_python():
+            self.skipTest(f"Baseline dibuat dengan Python {baseline['python']}")
+        self.assertEqual(set(self.hasil), set(baseline['operasi']))
+        self.assertEqual(bandingkan_baseline(self.hasil, baseline), [])
+
+    def test_regresi_terdeteksi(self):
+        """Test pertumbuhan alokasi dilaporkan sebagai regresi"""
+        baseline = buat_baseline({'konversi': {'8': {'puncak': 100, 'tertahan': 0.0}}})
+        self.assertEqual(bandingkan_baseline({'konversi': {'8': {'puncak': 600, 'tertahan': 0.0}}},
+                                             baseline), [])
+        regresi = bandingkan_baseline({'konversi': {'8': {'puncak': 5000, 'tertahan': 40.0}}},
+                                      baseline)
+        self.assertEqual(len(regresi), 2)
+
+
+class TestKebocoranJangkaPanjang(unittest.TestCase):
+    """Test class untuk uji kebocoran dengan riwayat berbatas"""
+
+    def test_konversi_berulang(self):
+        """Test memori tidak tumbuh setelah riwayat berbatas penuh"""
+        jumlah = int(os.environ.get('UJI_MEMORI_JUMLAH', 100000))
+        hasil = uji_kebocoran(jumlah, batas_riwayat=1000)
+        self.assertEqual(hasil['jumlah'], jumlah)
+        self.assertLess(hasil['pertumbuhan'], 16 * 1024)
+
+    def test_riwayat_berbatas(self):
+        """Test konverter menyimpan hanya entri riwayat terbaru"""
+        konverter = KonverterSistemBilangan(batas_riwayat=3)
+        for nilai in range(10):
+            konverter.konversi(str(nilai), SistemBilangan.DESIMAL, SistemBilangan.BINER)
+        self.assertEqual(len(konverter.riwayat_konversi), 3)
+        self.assertEqual([entri['nilai_asal'] for entri in konverter.riwayat_konversi],
+                         ['7', '8', '9'])
+
+    def test_parameter_tidak_valid(self):
+        """Test validasi parameter uji kebocoran"""
+        with self.assertRaises(ValueError):
+            uji_kebocoran(100, batas_riwayat=1000)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite untuk Mesin Konversi Basis Umum
+==========================================
+
+Test ini membandingkan MesinBasis dengan int()/format() bawaan Python
+untuk basis 2-36 dan memeriksa alfabet kustom Base-32 Crockford.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import unittest
+import random
+import sys
+import os
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main_logic'))
+
+from mesin_basis import MesinBasis, MESIN_CROCKFORD, ALFABET_STANDAR, mesin_untuk_basis
+from number_system_simulator import KonverterSistemBilangan, SistemBilangan, MESIN_SISTEM
+
+
+def format_referensi(nilai, basis):
+    """Format referensi sederhana dengan pembagian berulang"""
+    if nilai == 0:
+        return '0'
+    digit = []
+    while nilai:
+        nilai, sisa = divmod(nilai, basis)
+        digit.append(ALFABET_STANDAR[sisa])
+    return ''.join(reversed(digit))
+
+
+class TestMesinBasis(unittest.TestCase):
+    """Test class untuk MesinBasis"""
+
+    def test_semua_basis_bolak_balik(self):
+        """Test konversi bolak-balik untuk basis 2-36"""
+        acak = random.Random(28)
+        for basis in range(2, 37):
+            mesin = mesin_untuk_basis(basis)
+            for nilai in [0, 1, basis - 1, basis, basis ** 20 - 1] + [acak.getrandbits(200) for _ in range(20)]:
+                teks = mesin.dari_int(nilai)
+                self.assertEqual(teks, format_referensi(nilai, basis))
+                self.assertEqual(mesin.ke_int(teks), nilai)
+                self.assertEqual(mesin.ke_int(teks.lower()), nilai)
+
+    def test_validasi(self):
+        """Test validasi karakter di luar alfabet"""
+        mesin = mesin_untuk_basis(36)
+        self.assertTrue(mesin.validasi(" zz9 "))
+        self.assertFalse(mesin.validasi(""))
+        self.assertFalse(mesin.validasi("Z_9"))
+        self.assertRaises(ValueError, mesin.ke_int, "1-2")
+        # Huruf Unicode yang upper()-nya menjadi digit ASCII tetap ditolak
+        for nilai in ("\ufb00", "\u0131", "\u017f", "1\u00df"):
+            self.assertFalse(mesin.validasi(nilai))
+        self.assertRaises(ValueError, MesinBasis, 37)
+        self.assertRaises(ValueError, MesinBasis, 4, "0112")
+
+    def test_crockford(self):
+        """Test Base-32 Crockford dengan alias I/L/O"""
+        self.assertEqual(MESIN_CROCKFORD.dari_int(0xFFFFF), "ZZZZ")
+        self.assertEqual(MESIN_CROCKFORD.dari_int(32 * 18 + 22), "JP")
+        self.assertEqual(MESIN_CROCKFORD.ke_int("jp"), 32 * 18 + 22)
+        self.assertEqual(MESIN_CROCKFORD.ke_int("1O"), MESIN_CROCKFORD.ke_int("I0"))
+        self.assertEqual(MESIN_CROCKFORD.ke_int("L"), 1)
+        self.assertFalse(MESIN_CROCKFORD.validasi("U"))
+
+    def test_deskriptor(self):
+        """Test mesin dibuat dari deskriptor gaya NUMBER_SYSTEM_CONFIG"""
+        mesin = MesinBasis.dari_deskriptor({'name': 'Terner', 'base': 3, 'digits': '012'})
+        self.assertEqual(mesin.dari_int(5), "12")
+        self.assertEqual(mesin.nama, 'Terner')
+
+    def test_sistem_bawaan(self):
+        """Test empat sistem bawaan memakai mesin dari tabel"""
+        self.assertEqual(set(MESIN_SISTEM), set(SistemBilangan))
+        konverter = KonverterSistemBilangan()
+        self.assertEqual(konverter.konversi("ff", SistemBilangan.HEKSADESIMAL, SistemBilangan.OKTAL), "377")
+        self.assertEqual(konverter.konversi_basis("ZZ", 36, 2), format(35 * 36 + 35, 'b'))
+        self.assertEqual(konverter.konversi_basis("255", 10, MESIN_CROCKFORD), "7Z")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite untuk Metrik Prometheus
+==================================
+
+Test ini memvalidasi penghitung dan histogram per thread, format teks
+eksposisi Prometheus, ekspor ke file dan HTTP, serta metrik yang dicatat
+oleh KonverterSistemBilangan.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+import urllib.request
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main_logic'))
+
+from metrik import RegistriMetrik, Penghitung, Histogram, MetrikKonverter
+from number_system_simulator import KonverterSistemBilangan, SistemBilangan, JenisKesalahan
+from tabel_prakomputasi import TabelPrakomputasi
+
+
+class TestMetrik(unittest.TestCase):
+    """Test class untuk registri, penghitung, dan histogram"""
+
+    def setUp(self):
+        """Setup registri kosong"""
+        self.registri = RegistriMetrik()
+
+    def test_penghitung_berlabel(self):
+        """Test penghitung per kombinasi label dan validasi"""
+        penghitung = self.registri.penghitung('uji_total', "Uji", ('a',))
+        penghitung.tambah('x')
+        penghitung.tambah('x', jumlah=2)
+        penghitung.tambah('y')
+        self.assertEqual(penghitung.nilai('x'), 3)
+        self.assertEqual(penghitung.total(), {('x',): 3, ('y',): 1})
+        with self.assertRaises(ValueError):
+            penghitung.tambah('x', jumlah=-1)
+        with self.assertRaises(ValueError):
+            penghitung.tambah()
+        with self.assertRaises(ValueError):
+            Penghitung('uji', "tanpa akhiran _total")
+        with self.assertRaises(ValueError):
+            self.registri.penghitung('uji_total', "Duplikat")
+
+    def test_penghitung_banyak_thread(self):
+        """Test tidak ada penambahan hilang dari banyak thread"""
+        penghitung = self.registri.penghitung('paralel_total', "Uji paralel")
+
+        def pekerja():
+            for _ in range(5000):
+                penghitung.tambah()
+
+        daftar_thread = [threading.Thread(target=pekerja) for _ in range(8)]
+        for thread in daftar_thread:
+            thread.start()
+        for thread in daftar_thread:
+            thread.join()
+        self.assertEqual(penghitung.nilai(), 40000)
+
+    def test_thread_berganti(self):
+        """Test shard thread yang berakhir dijumlahkan sehingga jumlah shard terbatas"""
+        penghitung = self.registri.penghitung('churn_total', "Uji", ('a',))
+        histogram = self.registri.histogram('churn_detik', "Uji", batas=(1.0,))
+        for i in range(500):
+            thread = threading.Thread(target=lambda: (penghitung.tambah('x'),
+                                                      histogram.amati(0.5 if i % 2 else 2.0)))
+            thread.start()
+            thread.join()
+        self.assertLessEqual(penghitung.jumlah_shard(), 8)
+        self.assertLessEqual(histogram.jumlah_shard(), 8)
+        self.assertEqual(penghitung.nilai('x'), 500)
+        self.assertEqual(histogram.total(), {(): [250, 250, 625.0]})
+
+    def test_histogram(self):
+        """Test bucket kumulatif, sum, dan count"""
+        histogram = self.registri.histogram('durasi_detik', "Uji", batas=(0.1, 1.0))
+        for nilai in (0.05, 0.1, 0.5, 2.0):
+            histogram.amati(nilai)
+        teks = histogram.ekspor()
+        self.assertIn('durasi_detik_bucket{le="0.1"} 2', teks)
+        self.assertIn('durasi_detik_bucket{le="1"} 3', teks)
+        self.assertIn('durasi_detik_bucket{le="+Inf"} 4', teks)
+        self.assertIn('durasi_detik_sum 2.65', teks)
+        self.assertIn('durasi_detik_count 4', teks)
+        with self.assertRaises(ValueError):
+            Histogram('salah', "Uji", batas=(1.0, 0.5))
+
+    def test_format_eksposisi(self):
+        """Test HELP/TYPE dan escape nilai label"""
+        penghitung = self.registri.penghitung('escape_total', "Baris\nbaru", ('nilai',))
+        penghitung.tambah('a"b\\c')
+        self.registri.fungsi('suhu', "Gauge", lambda: [((), 1.5)])
+        teks = self.registri.ekspor()
+        self.assertIn('# HELP escape_total Baris\\nbaru\n', teks)
+        self.assertIn('# TYPE escape_total counter\n', teks)
+        self.assertIn('escape_total{nilai="a\\"b\\\\c"} 1\n', teks)
+        self.assertIn('# TYPE suhu gauge\nsuhu 1.5\n', teks)
+
+    def test_tulis_file(self):
+        """Test ekspor ke file"""
+        self.registri.penghitung('file_total', "Uji").tambah()
+        with tempfile.TemporaryDirectory() as direktori:
+            path = os.path.join(direktori, 'metrik.prom')
+            self.registri.tulis_file(path)
+            with open(path, encoding='utf-8') as berkas:
+                self.assertEqual(berkas.read(), self.registri.ekspor())
+            self.assertEqual(os.listdir(direktori), ['metrik.prom'])
+
+    def test_layani_http(self):
+        """Test endpoint HTTP /metrics"""
+        self.registri.penghitung('http_total', "Uji").tambah()
+        server = self.registri.layani_http()
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics") as respons:
+                self.assertTrue(respons.headers['Content-Type'].startswith('text/plain'))
+                self.assertIn('http_total 1', respons.read().decode('utf-8'))
+        finally:
+            server.tutup()
+
+
+class TestMetrikKonverter(unittest.TestCase):
+    """Test class untuk metrik yang dicatat konverter"""
+
+    def setUp(self):
+        """Setup konverter dengan metrik"""
+        self.metrik = MetrikKonverter()
+        self.konverter = KonverterSistemBilangan(metrik=self.metrik)
+
+    def test_konversi_per_pasangan(self):
+        """Test konversi dicatat per pasangan sistem dengan latensi"""
+        self.konverter.konversi("42", SistemBilangan.DESIMAL, SistemBilangan.BINER)
+        self.konverter.konversi("2A", SistemBilangan.HEKSADESIMAL, SistemBilangan.BINER)
+        self.assertEqual(self.metrik.konversi.nilai('desimal', 'biner'), 1)
+        self.assertEqual(self.metrik.konversi.nilai('heksadesimal', 'biner'), 1)
+        self.assertGreater(self.metrik.latensi.total()[('konversi',)][-1], 0)
+
+    def test_simulasi_dan_deteksi(self):
+        """Test simulasi per jenis dan verdict deteksi"""
+        self.konverter.simulasi_kesalahan("1010", SistemBilangan.BINER, JenisKesalahan.OVERFLOW)
+        self.konverter.deteksi_kesalahan_konversi("42", "101010", SistemBilangan.DESIMAL,
+                                                  SistemBilangan.BINER)
+        self.konverter.deteksi_kesalahan_konversi("42", "101011", SistemBilangan.DESIMAL,
+                                                  SistemBilangan.BINER)
+        self.konverter.deteksi_kesalahan_konversi("4G", "1", SistemBilangan.DESIMAL,
+                                                  SistemBilangan.BINER)
+        self.assertEqual(self.metrik.simulasi.total(), {('overflow',): 1})
+        self.assertEqual(self.metrik.deteksi.total(),
+                         {('benar',): 1, ('salah',): 1, ('tidak_valid',): 1})
+
+    def test_cache_tabel(self):
+        """Test hit/miss tabel prakomputasi dan rasio hit yang diekspor"""
+        self.assertIsNone(self.metrik.rasio_hit_cache())
+        self.assertNotIn('\nkonverter_cache_tabel_rasio_hit ', self.metrik.registri.ekspor())
+        with tempfile.TemporaryDirectory() as direktori:
+            with TabelPrakomputasi.buka_atau_bangun(os.path.join(direktori, 't.bin'), bit=8) as tabel:
+                konverter = KonverterSistemBilangan(metrik=self.metrik, tabel=tabel)
+                for nilai in ("42", "255", "7", "256"):
+                    konverter.konversi(nilai, SistemBilangan.DESIMAL, SistemBilangan.BINER)
+        self.assertEqual(self.metrik.cache.total(), {('hit',): 3, ('miss',): 1})
+        self.assertEqual(self.metrik.rasio_hit_cache(), 0.75)
+        self.assertIn('konverter_cache_tabel_rasio_hit 0.75', self.metrik.registri.ekspor())
+
+    def test_tanpa_metrik(self):
+        """Test konverter tanpa metrik tetap berfungsi"""
+        konverter = KonverterSistemBilangan()
+        self.assertIsNone(konverter.metrik)
+        self.assertEqual(konverter.konversi("42", SistemBilangan.DESIMAL, SistemBilangan.BINER),
+                         "101010")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite untuk Mode Skrip InterfacePengguna
+=============================================
+
+Test ini memvalidasi eksekusi perintah skrip tanpa prompt, penanganan
+kesalahan per baris, keluaran ber-buffer, dan ringkasan waktu.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import unittest
+import sys
+import os
+import io
+import tempfile
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main_logic'))
+
+from number_system_simulator import InterfacePengguna, BATAS_RIWAYAT_DEFAULT
+from progres import TokenPembatalan, OperasiDibatalkan
+
+
+class TestModeSkrip(unittest.TestCase):
+    """Test class untuk mode skrip"""
+
+    def setUp(self):
+        """Setup interface"""
+        self.interface = InterfacePengguna()
+
+    def _jalankan(self, teks, **kwargs):
+        keluaran = io.StringIO()
+        ringkasan = self.interface.jalankan_skrip(io.StringIO(teks), keluaran, **kwargs)
+        return keluaran.getvalue().splitlines(), ringkasan
+
+    def test_semua_perintah(self):
+        """Test setiap jenis perintah"""
+        baris, ringkasan = self._jalankan(
+            "# komentar\n"
+            "\n"
+            "convert 2A heksadesimal biner\n"
+            "table 42 desimal\n"
+            "arith 1010 + 110 bin\n"
+            "simulate 1010 biner underflow\n"
+            "detect 42 101010 desimal biner\n"
+            "deteksi 42 101011 2 1\n",
+            tampilkan_waktu=False)
+
+        self.assertEqual(baris[0], "101010")
+        self.assertEqual(baris[1], "biner=101010 desimal=42 heksadesimal=2A oktal=52")
+        self.assertEqual(baris[2], "10000 (desimal 16)")
+        self.assertTrue(baris[3].startswith("101\t"))
+        self.assertEqual(baris[4], "BENAR")
+        self.assertTrue(baris[5].startswith("SALAH"))
+        self.assertEqual(ringkasan['perintah'], 6)
+        self.assertEqual(ringkasan['gagal'], 0)
+
+    def test_kesalahan_per_baris(self):
+        """Test perintah gagal tidak menghentikan skrip"""
+        baris, ringkasan = self._jalankan("bogus\nconvert 2 biner desimal\nconvert 1 bin\n"
+                                          "convert 11 bin dec\n", tampilkan_waktu=False)
+        self.assertIn("baris 1", baris[0])
+        self.assertIn("tidak valid", baris[1])
+        self.assertIn("Format", baris[2])
+        self.assertEqual(baris[3], "3")
+        self.assertEqual((ringkasan['berhasil'], ringkasan['gagal']), (1, 3))
+
+    def test_waktu_dan_buffer(self):
+        """Test waktu per perintah dan penulisan per kelompok baris"""
+        skrip = "convert FF hex dec\n" * 50
+        baris, ringkasan = self._jalankan(skrip, ukuran_buffer=7)
+        self.assertEqual(len(baris), 51)
+        self.assertTrue(all(b.startswith("255\t[") and b.endswith("ms]") for b in baris[:50]))
+        self.assertTrue(baris[-1].startswith("# 50 perintah"))
+        self.assertGreater(ringkasan['waktu_total'], 0)
+
+    def test_perintah_panjang_dengan_progres(self):
+        """Test perintah range dan crc meneruskan progres, dan progres per perintah"""
+        peristiwa = []
+        with tempfile.TemporaryDirectory() as direktori:
+            path = os.path.join(direktori, 'tabel.csv')
+            baris, ringkasan = self._jalankan(f"range 0 FF hex {path}\ncrc 300\n",
+                                              tampilkan_waktu=False, progres=peristiwa.append,
+                                              token=TokenPembatalan())
+            with open(path) as berkas:
+                self.assertEqual(berkas.read().splitlines()[-1], "11111111,255,FF,377")
+        self.assertEqual(baris[0], f"256 baris ditulis ke {path}")
+        self.assertTrue(baris[1].startswith("bit_flip="))
+        self.assertEqual(ringkasan['gagal'], 0)
+        operasi = {p.operasi for p in peristiwa}
+        self.assertTrue({'tabel_rentang', 'laju_deteksi_crc', 'skrip'} <= operasi)
+        self.assertEqual(peristiwa[-1].operasi, 'skrip')
+        self.assertEqual(peristiwa[-1].selesai, 2)
+
+    def test_pembatalan(self):
+        """Test token yang dibatalkan menghentikan skrip setelah hasil yang ada ditulis"""
+        token = TokenPembatalan()
+        keluaran = io.StringIO()
+
+        def sumber():
+            yield "convert 1 bin dec\n"
+            token.batalkan()
+            yield "crc 100000\n"
+            yield "convert 7 oct bin\n"
+
+        with self.assertRaises(OperasiDibatalkan):
+            self.interface.jalankan_skrip(sumber(), keluaran, tampilkan_waktu=False, token=token)
+        baris = keluaran.getvalue().splitlines()
+        self.assertEqual(baris[0], "1")
+        self.assertTrue(baris[-1].startswith("# 1 perintah, 1 berhasil, 0 gagal"))
+        self.assertTrue(baris[-1].endswith(", dibatalkan"))
+        self.assertIsNone(self.interface._token_skrip)
+
+    def test_riwayat_terbatas(self):
+        """Test skrip panjang tidak menumpuk riwayat melebihi batas default"""
+        self.assertEqual(self.interface.konverter.riwayat_konversi.batas, BATAS_RIWAYAT_DEFAULT)
+        self._jalankan("convert 5 dec bin\n" * (BATAS_RIWAYAT_DEFAULT + 50), tampilkan_waktu=False)
+        self.assertEqual(len(self.interface.konverter.riwayat_konversi), BATAS_RIWAYAT_DEFAULT)
+        self.assertIsNone(InterfacePengguna(batas_riwayat=None).konverter.riwayat_konversi.batas)
+
+    def test_satu_konverter(self):
+        """Test semua perintah memakai konverter yang sama (riwayat terkumpul)"""
+        self._jalankan("convert 1 bin dec\nconvert 7 oct bin\n")
+        self.assertEqual(len(self.interface.konverter.riwayat_konversi), 2)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite untuk Mesin Operasi Bitwise
+======================================
+
+Test ini memvalidasi operasi bitwise pada int, mesin aliran per potongan
+digit (dibandingkan dengan operasi int untuk ukuran potongan yang acak),
+operand file lewat mmap, serta API konverter dan perintah skrip bitwise.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import unittest
+import sys
+import os
+import io
+import random
+import tempfile
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main_logic'))
+
+from operasi_bitwise import (hitung_bitwise, bitwise_buffer, bitwise_berkas, OperandDigit,
+                             OPERASI_BITWISE, OPERASI_BINER, BIT_PER_DIGIT, KODE_FORMAT)
+from number_system_simulator import KonverterSistemBilangan, SistemBilangan, InterfacePengguna
+from progres import TokenPembatalan, OperasiDibatalkan
+
+
+def referensi(nilai1, nilai2, operasi, basis, geser=0, lebar=None, basis_tujuan=None):
+    """Hasil acuan lewat int: lebar default = lebar digit nilai1"""
+    if lebar is None and operasi in ('~', 'rol', 'ror'):
+        lebar = len(nilai1) * BIT_PER_DIGIT[basis]
+    kedua = int(nilai2, basis) if nilai2 is not None else geser
+    hasil = hitung_bitwise(int(nilai1, basis), kedua, operasi, lebar)
+    return format(hasil, KODE_FORMAT[basis_tujuan or basis])
+
+
+def jalankan(nilai1, operasi, nilai2=None, **opsi):
+    keluaran = io.BytesIO()
+    bitwise_buffer(nilai1.encode('ascii'), operasi, keluaran,
+                   nilai2.encode('ascii') if nilai2 is not None else None, **opsi)
+    return keluaran.getvalue().decode('ascii')
+
+
+class TestHitungBitwise(unittest.TestCase):
+    """Test class untuk operasi bitwise pada int"""
+
+    def test_operasi(self):
+        """Test setiap operasi dengan dan tanpa lebar register"""
+        self.assertEqual(hitung_bitwise(0b1100, 0b1010, '&'), 0b1000)
+        self.assertEqual(hitung_bitwise(0b1100, 0b1010, '|'), 0b1110)
+        self.assertEqual(hitung_bitwise(0b1100, 0b1010, '^'), 0b0110)
+        self.assertEqual(hitung_bitwise(0b1100, 0, '~', 4), 0b0011)
+        self.assertEqual(hitung_bitwise(0b1100, 2, '<<'), 0b110000)
+        self.assertEqual(hitung_bitwise(0b1100, 2, '<<', 4), 0)
+        self.assertEqual(hitung_bitwise(0b1100, 2, '>>'), 0b11)
+        self.assertEqual(hitung_bitwise(0b1001, 1, 'rol', 4), 0b0011)
+        self.assertEqual(hitung_bitwise(0b1001, 5, 'ror', 4), 0b1100)
+
+    def test_validasi(self):
+        """Test operasi tidak dikenal, lebar wajib, dan geser negatif ditolak"""
+        with self.assertRaises(ValueError):
+            hitung_bitwise(1, 1, '+')
+        with self.assertRaises(ValueError):
+            hitung_bitwise(1, 0, '~')
+        with self.assertRaises(ValueError):
+            hitung_bitwise(1, -1, '<<')
+
+
+class TestAliranBitwise(unittest.TestCase):
+    """Test class untuk mesin aliran per potongan digit"""
+
+    def test_acak_vs_int(self):
+        """Test hasil aliran sama dengan operasi int untuk basis dan potongan acak"""
+        rng = random.Random(7)
+        for _ in range(500):
+            basis, tujuan = rng.choice([2, 8, 16]), rng.choice([2, 8, 16])
+            digit = '0123456789ABCDEF'[:basis]
+            nilai1 = ''.join(rng.choice(digit) for _ in range(rng.randint(1, 30)))
+            operasi = rng.choice(OPERASI_BITWISE)
+            nilai2 = (''.join(rng.choice(digit) for _ in range(rng.randint(1, 30)))
+                      if operasi in OPERASI_BINER else None)
+            opsi = {'geser': rng.randint(0, 100), 'lebar': rng.choice([None, rng.randint(1, 150)])}
+            with self.subTest(nilai1=nilai1, operasi=operasi, nilai2=nilai2, basis=basis, **opsi):
+                self.assertEqual(
+                    jalankan(nilai1, operasi, nilai2, basis=basis, basis_tujuan=tujuan,
+                             ukuran_potong=rng.choice([1, 7, 24, 1000]), **opsi),
+                    referensi(nilai1, nilai2, operasi, basis, basis_tujuan=tujuan, **opsi))
+
+    def test_spasi_dan_huruf_kecil(self):
+        """Test spasi di tepi diabaikan, huruf kecil diterima, nol di depan dibuang"""
+        self.assertEqual(jalankan(' 00ff\n', '&', '0F0\n'), 'F0')
+        self.assertEqual(jalankan('FF', '^', 'FF'), '0')
+        self.assertEqual(jalankan('1', '>>', geser=5, basis=2), '0')
+
+    def test_digit_tidak_valid(self):
+        """Test digit asing di tengah numeral ditolak"""
+        with self.assertRaises(ValueError):
+            jalankan('12 34', '|', '1')
+        with self.assertRaises(ValueError):
+            jalankan('102', '~', basis=2)
+        with self.assertRaises(ValueError):
+            OperandDigit(b'  \n', 16)
+        with self.assertRaises(ValueError):
+            jalankan('FF', '&')
+
+    def test_jumlah_operand_jalur_int(self):
+        """Test jalur int menolak jumlah operand yang salah seperti jalur aliran"""
+        with self.assertRaises(ValueError):
+            jalankan('12', '&', basis=10)
+        with self.assertRaises(ValueError):
+            jalankan('12', '<<', '3', basis=10, geser=1)
+        with self.assertRaises(ValueError):
+            jalankan('12', '~', '3', basis=10)
+        with self.assertRaises(ValueError):
+            jalankan('12', '<<', basis=10, geser=-1)
+
+    def test_desimal_lewat_int(self):
+        """Test basis desimal memakai jalur int, termasuk hasil ke basis lain"""
+        self.assertEqual(jalankan('12', '|', '3', basis=10), '15')
+        self.assertEqual(jalankan('255', '~', basis=10, basis_tujuan=16), '0')
+        self.assertEqual(jalankan('F0', '>>', geser=4, basis=16, basis_tujuan=10), '15')
+
+    def test_berkas(self):
+        """Test operand file dibaca lewat mmap dan progres/pembatalan per potongan"""
+        rng = random.Random(3)
+        nilai1, nilai2 = (format(rng.getrandbits(4000), 'X') for _ in range(2))
+        with tempfile.TemporaryDirectory() as direktori:
+            path1, path2, path_hasil = (os.path.join(direktori, nama) for nama in ('a', 'b', 'c'))
+            for path, nilai in ((path1, nilai1), (path2, nilai2)):
+                with open(path, 'w') as berkas:
+                    berkas.write(nilai + '\n')
+            peristiwa = []
+            ringkasan = bitwise_berkas(path1, '^', path_hasil, path2, basis_tujuan=2,
+                                       ukuran_potong=240, progres=peristiwa.append)
+            with open(path_hasil) as berkas:
+                self.assertEqual(berkas.read(), referensi(nilai1, nilai2, '^', 16, basis_tujuan=2))
+            self.assertEqual(ringkasan['path'], path_hasil)
+            self.assertEqual(peristiwa[-1].selesai, ringkasan['bit_hasil'])
+
+            token = TokenPembatalan()
+            token.batalkan()
+            with self.assertRaises(OperasiDibatalkan):
+                bitwise_berkas(path1, 'rol', path_hasil, geser=3, token=token)
+            # Hasil lama tetap utuh dan tidak ada file sementara tertinggal
+            with open(path_hasil) as berkas:
+                self.assertEqual(berkas.read(), referensi(nilai1, nilai2, '^', 16, basis_tujuan=2))
+            self.assertEqual(sorted(os.listdir(direktori)), ['a', 'b', 'c'])
+
+    def test_berkas_hasil_sama_dengan_operand(self):
+        """Test file hasil yang sama dengan operand (termasuk hard link) ditolak tanpa diubah"""
+        with tempfile.TemporaryDirectory() as direktori:
+            path1, path2, tautan = (os.path.join(direktori, nama) for nama in ('a', 'b', 'c'))
+            for path in (path1, path2):
+                with open(path, 'w') as berkas:
+                    berkas.write('F0' * 1000)
+            os.link(path2, tautan)
+            for keluaran in (path1, path2, tautan):
+                with self.subTest(keluaran=keluaran), self.assertRaises(ValueError):
+                    bitwise_berkas(path1, '^', keluaran, path2)
+            with open(path1) as berkas:
+                self.assertEqual(berkas.read(), 'F0' * 1000)
+            self.assertEqual(sorted(os.listdir(direktori)), ['a', 'b', 'c'])
+
+
+class TestKonverterBitwise(unittest.TestCase):
+    """Test class untuk operasi_bitwise konverter dan perintah skrip"""
+
+    def test_operasi_bitwise(self):
+        """Test hasil tersedia di semua sistem tujuan dan error dilaporkan"""
+        konverter = KonverterSistemBilangan()
+        hasil = konverter.operasi_bitwise('F0', '3C', '^', SistemBilangan.HEKSADESIMAL)
+        self.assertEqual((hasil['hasil_sistem'], hasil['hasil_desimal']), ('CC', 204))
+        for sistem in SistemBilangan:
+            hasil = konverter.operasi_bitwise('F0', None, '~', SistemBilangan.HEKSADESIMAL,
+                                              sistem_tujuan=sistem)
+            self.assertEqual(hasil['hasil_desimal'], 0x0F)
+            self.assertEqual(hasil['sistem'], sistem.value)
+        hasil = konverter.operasi_bitwise('1011', '1', 'rol', SistemBilangan.BINER)
+        self.assertEqual(hasil['hasil_sistem'], '111')
+        hasil = konverter.operasi_bitwise('12', '1', 'xx', SistemBilangan.DESIMAL)
+        self.assertFalse(hasil['berhasil'])
+        self.assertIn('tidak dikenal', hasil['error'])
+
+    def test_skrip(self):
+        """Test perintah skrip bitwise"""
+        keluaran = io.StringIO()
+        ringkasan = InterfacePengguna().jalankan_skrip(
+            io.StringIO("bitwise F0 ^ 3C hex\nbitwise F0 ~ - hex bin\n"), keluaran,
+            tampilkan_waktu=False)
+        self.assertEqual(ringkasan['gagal'], 0)
+        self.assertEqual(keluaran.getvalue().splitlines()[:2],
+                         ['CC (desimal 204)', '1111 (desimal 15)'])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
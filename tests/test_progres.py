@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite untuk Progres dan Pembatalan Operasi Panjang
+=======================================================
+
+Test ini memvalidasi token pembatalan, pelacak progres, bilah progres teks,
+serta progres dan pembatalan pada laju deteksi CRC, API batch, tabel
+rentang, pengukuran BER, dan fuzzing.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import unittest
+import sys
+import os
+import io
+import threading
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main_logic'))
+
+from progres import (TokenPembatalan, OperasiDibatalkan, PeristiwaProgres, PelacakProgres,
+                     BilahProgresTeks, iterasi_terlacak, tangkap_ctrl_c)
+from number_system_simulator import KonverterSistemBilangan, SistemBilangan
+from ber import ukur_ber
+from fuzz_diferensial import jalankan_fuzz
+
+
+class TestProgres(unittest.TestCase):
+    """Test class untuk protokol progres dan pembatalan"""
+
+    def test_token(self):
+        """Test token dapat dibatalkan dari thread lain"""
+        token = TokenPembatalan()
+        self.assertFalse(token.dibatalkan)
+        token.periksa()
+        thread = threading.Thread(target=token.batalkan)
+        thread.start()
+        self.assertTrue(token.tunggu(5))
+        thread.join()
+        self.assertTrue(token.dibatalkan)
+        with self.assertRaises(OperasiDibatalkan):
+            token.periksa()
+
+    def test_pelacak(self):
+        """Test callback dibatasi interval dan laporan akhir selalu dikirim"""
+        peristiwa = []
+        pelacak = PelacakProgres('uji', 10, peristiwa.append, interval=3600)
+        for _ in range(10):
+            pelacak.maju()
+        pelacak.tuntas()
+        # Laporan pertama langsung, berikutnya ditahan interval, lalu laporan akhir
+        self.assertEqual(len(peristiwa), 2)
+        self.assertEqual(peristiwa[0].selesai, 1)
+        terakhir = peristiwa[-1]
+        self.assertTrue(terakhir.tuntas)
+        self.assertEqual((terakhir.operasi, terakhir.selesai, terakhir.total), ('uji', 10, 10))
+        self.assertEqual(terakhir.fraksi, 1.0)
+        self.assertIsNone(PeristiwaProgres(operasi='uji', selesai=3, total=None).fraksi)
+
+    def test_iterasi_terlacak(self):
+        """Test pembungkus iterable menghitung langkah dan berhenti saat dibatalkan"""
+        data = list(range(10))
+        self.assertEqual(list(iterasi_terlacak(data, 'uji')), data)
+
+        peristiwa = []
+        self.assertEqual(list(iterasi_terlacak(data, 'uji', peristiwa.append, langkah=4)), data)
+        self.assertEqual((peristiwa[-1].selesai, peristiwa[-1].total), (10, 10))
+
+        token = TokenPembatalan()
+        diambil = []
+        with self.assertRaises(OperasiDibatalkan):
+            for item in iterasi_terlacak(iter(data), 'uji', token=token):
+                diambil.append(item)
+                if item == 2:
+                    token.batalkan()
+        self.assertEqual(diambil, [0, 1, 2])
+
+    def test_bilah_teks(self):
+        """Test bilah progres menulis persentase, atau jumlah langkah tanpa total"""
+        keluaran = io.StringIO()
+        bilah = BilahProgresTeks(keluaran, lebar=10)
+        bilah(PeristiwaProgres(operasi='uji', selesai=5, total=10, detik=1.0, tuntas=False))
+        bilah(PeristiwaProgres(operasi='uji', selesai=7, total=None, detik=2.0, tuntas=True))
+        teks = keluaran.getvalue()
+        self.assertIn('[#####.....]', teks)
+        self.assertIn('50.0%', teks)
+        self.assertIn('7 langkah', teks)
+        self.assertTrue(teks.endswith('\n'))
+
+    def test_tangkap_ctrl_c(self):
+        """Test handler SIGINT dipulihkan setelah blok selesai"""
+        import signal
+        sebelumnya = signal.getsignal(signal.SIGINT)
+        with tangkap_ctrl_c(TokenPembatalan()) as token:
+            self.assertIsNot(signal.getsignal(signal.SIGINT), sebelumnya)
+            signal.getsignal(signal.SIGINT)(signal.SIGINT, None)
+            self.assertTrue(token.dibatalkan)
+            with self.assertRaises(KeyboardInterrupt):
+                signal.getsignal(signal.SIGINT)(signal.SIGINT, None)
+        self.assertIs(signal.getsignal(signal.SIGINT), sebelumnya)
+
+
+class TestOperasiPanjang(unittest.TestCase):
+    """Test class untuk progres dan pembatalan operasi konverter dan CLI"""
+
+    def test_laju_deteksi_crc(self):
+        """Test progres laju deteksi CRC mencapai total dan hasil tidak berubah"""
+        peristiwa = []
+        hasil = KonverterSistemBilangan(seed=3).ukur_laju_deteksi_crc(300, progres=peristiwa.append)
+        self.assertEqual(hasil, KonverterSistemBilangan(seed=3).ukur_laju_deteksi_crc(300))
+        self.assertTrue(peristiwa[-1].tuntas)
+        self.assertEqual(peristiwa[-1].selesai, peristiwa[-1].total)
+
+    def test_laju_deteksi_crc_dibatalkan(self):
+        """Test laju deteksi CRC berhenti saat token dibatalkan dari callback"""
+        token = TokenPembatalan()
+
+        def progres(peristiwa):
+            if peristiwa.selesai >= 512:
+                token.batalkan()
+
+        with self.assertRaises(OperasiDibatalkan):
+            KonverterSistemBilangan().ukur_laju_deteksi_crc(100000, progres=progres, token=token)
+
+    def test_batch(self):
+        """Test API batch melaporkan progres dan dapat dibatalkan"""
+        konverter = KonverterSistemBilangan()
+        peristiwa = []
+        baris = list(konverter.tabel_konversi_batch(['1', '2', '3'], SistemBilangan.DESIMAL,
+                                                    progres=peristiwa.append))
+        self.assertEqual(len(baris), 3)
+        self.assertEqual(peristiwa[-1].selesai, 3)
+
+        token = TokenPembatalan()
+        token.batalkan()
+        with self.assertRaises(OperasiDibatalkan):
+            list(konverter.operasi_aritmatika_batch([('1', '1')], '+', SistemBilangan.DESIMAL,
+                                                    token=token))
+        with self.assertRaises(OperasiDibatalkan):
+            list(konverter.deteksi_kesalahan_batch([('10', 'A')], SistemBilangan.DESIMAL,
+                                                   SistemBilangan.HEKSADESIMAL, token=token))
+
+    def test_tabel_rentang(self):
+        """Test tabel rentang melaporkan total baris dan berhenti saat dibatalkan"""
+        konverter = KonverterSistemBilangan()
+        peristiwa = []
+        baris = list(konverter.tabel_konversi_rentang('0', '2999', SistemBilangan.DESIMAL,
+                                                      progres=peristiwa.append))
+        self.assertEqual(len(baris), 3000)
+        self.assertEqual((peristiwa[-1].selesai, peristiwa[-1].total), (3000, 3000))
+
+        token = TokenPembatalan()
+        diambil = 0
+        with self.assertRaises(OperasiDibatalkan):
+            for _ in konverter.tabel_konversi_rentang('0', '999999', SistemBilangan.DESIMAL,
+                                                      token=token):
+                diambil += 1
+                token.batalkan()
+        self.assertLessEqual(diambil, 1024)
+
+    def test_ber(self):
+        """Test pengukuran BER melaporkan byte dibandingkan dan dapat dibatalkan"""
+        referensi = [bytes(100)] * 5
+        diterima = [b'\x01' * 100] * 5
+        peristiwa = []
+        hasil = ukur_ber(referensi, diterima, progres=peristiwa.append, total_byte=500)
+        self.assertEqual(hasil['bit_salah'], 500)
+        self.assertEqual((peristiwa[-1].selesai, peristiwa[-1].fraksi), (500, 1.0))
+
+        token = TokenPembatalan()
+        token.batalkan()
+        with self.assertRaises(OperasiDibatalkan):
+            ukur_ber(referensi, diterima, token=token)
+
+    def test_fuzz(self):
+        """Test fuzzing melaporkan progres per shard dan dapat dibatalkan"""
+        peristiwa = []
+        hasil = jalankan_fuzz(40, seed=1, proses=1, ukuran_shard=10, progres=peristiwa.append)
+        self.assertEqual(hasil['kegagalan'], [])
+        self.assertEqual((peristiwa[-1].selesai, peristiwa[-1].total), (40, 40))
+
+        token = TokenPembatalan()
+        token.batalkan()
+        with self.assertRaises(OperasiDibatalkan):
+            jalankan_fuzz(40, seed=1, proses=1, ukuran_shard=10, token=token)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
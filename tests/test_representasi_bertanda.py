@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite untuk Representasi Bilangan Bertanda
+===============================================
+
+Test ini memvalidasi sign-magnitude, komplemen satu, komplemen dua, dan
+excess-K pada lebar 8/16/32/64 bit, mode batch NumPy, serta aritmatika
+dengan hasil negatif.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import unittest
+import random
+import sys
+import os
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main_logic'))
+
+from representasi_bertanda import (RepresentasiBertanda, LEBAR_STANDAR, rentang_bertanda,
+                                   enkode_bertanda, dekode_bertanda, batch_ke_digit,
+                                   batch_dari_digit, digit_ke_ascii)
+from dukungan_numpy import np
+from number_system_simulator import KonverterSistemBilangan, SistemBilangan
+
+
+class TestRepresentasiBertanda(unittest.TestCase):
+    """Test class untuk enkode/dekode skalar"""
+
+    def test_contoh_8_bit(self):
+        """Test pola -5 pada 8 bit untuk setiap representasi"""
+        harapan = {
+            RepresentasiBertanda.SIGN_MAGNITUDE: 0b10000101,
+            RepresentasiBertanda.KOMPLEMEN_SATU: 0b11111010,
+            RepresentasiBertanda.KOMPLEMEN_DUA: 0b11111011,
+            RepresentasiBertanda.EXCESS_K: 123,
+        }
+        for representasi, pola in harapan.items():
+            self.assertEqual(enkode_bertanda(-5, 8, representasi), pola)
+            self.assertEqual(dekode_bertanda(pola, 8, representasi), -5)
+
+    def test_bolak_balik_batas_rentang(self):
+        """Test nilai batas dan acak pada lebar standar dan lebar sembarang"""
+        acak = random.Random(29)
+        for lebar in LEBAR_STANDAR + (5, 100):
+            for representasi in RepresentasiBertanda:
+                minimum, maksimum = rentang_bertanda(lebar, representasi)
+                for nilai in [minimum, maksimum, 0, -1 if minimum < 0 else 0] + \
+                        [acak.randint(minimum, maksimum) for _ in range(50)]:
+                    pola = enkode_bertanda(nilai, lebar, representasi)
+                    self.assertLess(pola, 1 << lebar)
+                    self.assertEqual(dekode_bertanda(pola, lebar, representasi), nilai)
+                self.assertRaises(ValueError, enkode_bertanda, maksimum + 1, lebar, representasi)
+
+    def test_nol_negatif(self):
+        """Test nol negatif pada sign-magnitude dan komplemen satu"""
+        self.assertEqual(dekode_bertanda(0x80, 8, RepresentasiBertanda.SIGN_MAGNITUDE), 0)
+        self.assertEqual(dekode_bertanda(0xFF, 8, RepresentasiBertanda.KOMPLEMEN_SATU), 0)
+
+    def test_konverter_dan_aritmatika(self):
+        """Test konverter dan aritmatika dengan hasil negatif"""
+        konverter = KonverterSistemBilangan()
+        self.assertEqual(konverter.dari_desimal_bertanda(-1, SistemBilangan.HEKSADESIMAL, 16), "FFFF")
+        self.assertEqual(konverter.ke_desimal_bertanda("80", SistemBilangan.HEKSADESIMAL), -128)
+
+        hasil = konverter.operasi_aritmatika("00000011", "00000101", "-", SistemBilangan.BINER,
+                                             representasi=RepresentasiBertanda.KOMPLEMEN_DUA)
+        self.assertTrue(hasil['berhasil'])
+        self.assertEqual(hasil['hasil_desimal'], -2)
+        self.assertEqual(hasil['hasil_sistem'], "11111110")
+
+        hasil = konverter.operasi_aritmatika("F9", "2", "/", SistemBilangan.HEKSADESIMAL,
+                                             representasi=RepresentasiBertanda.KOMPLEMEN_DUA)
+        self.assertEqual(hasil['hasil_desimal'], -3)  # -7 / 2 dibulatkan ke arah nol
+
+        hasil = konverter.operasi_aritmatika("7F", "1", "+", SistemBilangan.HEKSADESIMAL,
+                                             representasi=RepresentasiBertanda.KOMPLEMEN_DUA)
+        self.assertFalse(hasil['berhasil'])
+
+        hasil = konverter.operasi_aritmatika("11", "101", "-", SistemBilangan.BINER)
+        self.assertFalse(hasil['berhasil'])
+
+
+@unittest.skipIf(np is None, "NumPy tidak tersedia")
+class TestBatchBertanda(unittest.TestCase):
+    """Test class untuk mode batch NumPy"""
+
+    def test_batch_sama_dengan_skalar(self):
+        """Test hasil batch sama dengan enkode skalar"""
+        acak = np.random.default_rng(29)
+        for lebar in LEBAR_STANDAR:
+            for representasi in RepresentasiBertanda:
+                minimum, maksimum = rentang_bertanda(lebar, representasi)
+                nilai = acak.integers(minimum, maksimum, size=200, dtype=np.int64, endpoint=True)
+                nilai[:2] = [minimum, maksimum]
+                for bit_per_digit in (1, 4):
+                    digit = batch_ke_digit(nilai, lebar, bit_per_digit, representasi)
+                    kembali = batch_dari_digit(digit, lebar, bit_per_digit, representasi)
+                    self.assertTrue((kembali == nilai).all())
+
+                teks = digit_ke_ascii(batch_ke_digit(nilai[:5], lebar, 4, representasi))
+                for n, t in zip(nilai[:5].tolist(), teks):
+                    pola = enkode_bertanda(n, lebar, representasi)
+                    self.assertEqual(t.decode(), format(pola, 'X').zfill(lebar // 4))
+
+    def test_batch_uint64(self):
+        """Test array uint64 tak bertanda"""
+        nilai = np.array([0, 1, 2 ** 64 - 1], dtype=np.uint64)
+        digit = batch_ke_digit(nilai, 64, 4)
+        self.assertEqual(digit_ke_ascii(digit)[2], b'F' * 16)
+        self.assertTrue((batch_dari_digit(digit, 64, 4) == nilai).all())
+
+    def test_batch_di_luar_rentang(self):
+        """Test nilai di luar rentang ditolak"""
+        self.assertRaises(ValueError, batch_ke_digit, np.array([128]), 8, 1,
+                          RepresentasiBertanda.KOMPLEMEN_DUA)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite untuk Riwayat Persisten SQLite
+=========================================
+
+Test ini memvalidasi penyimpanan batch, query berindeks, dan penulisan
+bersamaan dari beberapa instance.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import unittest
+import sqlite3
+import tempfile
+import threading
+import time
+import sys
+import os
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main_logic'))
+
+from riwayat_sqlite import RiwayatSQLite
+from number_system_simulator import KonverterSistemBilangan, SistemBilangan
+
+
+class TestRiwayatSQLite(unittest.TestCase):
+    """Test class untuk RiwayatSQLite"""
+
+    def setUp(self):
+        """Setup direktori sementara untuk basis data"""
+        self.direktori = tempfile.TemporaryDirectory()
+        self.path_db = os.path.join(self.direktori.name, 'riwayat.db')
+
+    def tearDown(self):
+        """Cleanup direktori sementara"""
+        self.direktori.cleanup()
+
+    def test_batch_berdasarkan_ambang(self):
+        """Test entri baru ditulis setelah ambang baris tercapai"""
+        riwayat = RiwayatSQLite(self.path_db, interval_simpan=3600, ambang_baris=3)
+        pembaca = RiwayatSQLite(self.path_db)
+        konverter = KonverterSistemBilangan(riwayat_persisten=riwayat)
+
+        konverter.konversi("1", SistemBilangan.DESIMAL, SistemBilangan.BINER)
+        konverter.konversi("2", SistemBilangan.DESIMAL, SistemBilangan.BINER)
+        self.assertEqual(pembaca.jumlah(), 0)
+
+        konverter.konversi("3", SistemBilangan.DESIMAL, SistemBilangan.BINER)
+        self.assertEqual(pembaca.jumlah(), 3)
+
+        riwayat.tutup()
+        pembaca.tutup()
+
+    def test_timer_menyimpan_sesi_menganggur(self):
+        """Test entri tertunda disimpan timer setelah interval tanpa tambah() berikutnya"""
+        riwayat = RiwayatSQLite(self.path_db, interval_simpan=0.2, ambang_baris=1000)
+        pembaca = RiwayatSQLite(self.path_db)
+        konverter = KonverterSistemBilangan(riwayat_persisten=riwayat)
+        konverter.konversi("7", SistemBilangan.DESIMAL, SistemBilangan.BINER)
+        self.assertEqual(pembaca.jumlah(), 0)
+
+        batas = time.monotonic() + 5
+        while pembaca.jumlah() == 0 and time.monotonic() < batas:
+            time.sleep(0.05)
+        self.assertEqual(pembaca.jumlah(), 1)
+        self.assertIsNone(riwayat._timer)
+
+        riwayat.tutup()
+        pembaca.tutup()
+
+    def test_hapus_semua_membatalkan_timer(self):
+        """Test hapus_semua membuang entri tertunda beserta timer penyimpanannya"""
+        riwayat = RiwayatSQLite(self.path_db, interval_simpan=60, ambang_baris=1000)
+        konverter = KonverterSistemBilangan(riwayat_persisten=riwayat)
+        konverter.konversi("7", SistemBilangan.DESIMAL, SistemBilangan.BINER)
+        timer = riwayat._timer
+        self.assertIsNotNone(timer)
+        riwayat.hapus_semua()
+        self.assertIsNone(riwayat._timer)
+        timer.join(1)
+        self.assertFalse(timer.is_alive())
+        riwayat.tutup()
+
+    def test_tutup_saat_basis_data_terkunci(self):
+        """Test koneksi tetap ditutup walau penyimpanan terakhir gagal"""
+        riwayat = RiwayatSQLite(self.path_db, ambang_baris=1000, timeout_kunci=0.1)
+        konverter = KonverterSistemBilangan(riwayat_persisten=riwayat)
+        konverter.konversi("7", SistemBilangan.DESIMAL, SistemBilangan.BINER)
+        pengunci = sqlite3.connect(self.path_db, isolation_level=None)
+        pengunci.execute("BEGIN EXCLUSIVE")
+        try:
+            with self.assertRaises(sqlite3.OperationalError):
+                riwayat.tutup()
+            self.assertIsNone(riwayat._koneksi)
+            self.assertIsNone(riwayat._timer)
+            riwayat.tutup()
+        finally:
+            pengunci.rollback()
+            pengunci.close()
+
+    def test_persisten_setelah_ditutup(self):
+        """Test riwayat tetap ada setelah koneksi ditutup dan dibuka kembali"""
+        with RiwayatSQLite(self.path_db, ambang_baris=1000) as riwayat:
+            konverter = KonverterSistemBilangan(riwayat_persisten=riwayat)
+            konverter.konversi("42", SistemBilangan.DESIMAL, SistemBilangan.HEKSADESIMAL)
+
+        with RiwayatSQLite(self.path_db) as riwayat:
+            entri = riwayat.terakhir(1)
+
+        self.assertEqual(len(entri), 1)
+        self.assertEqual(entri[0]['hasil'], "2A")
+        self.assertEqual(entri[0]['nilai_desimal'], 42)
+
+    def test_query_berindeks(self):
+        """Test query N terakhir, sistem asal, dan prefix nilai"""
+        with RiwayatSQLite(self.path_db) as riwayat:
+            konverter = KonverterSistemBilangan(riwayat_persisten=riwayat)
+            konverter.konversi("101", SistemBilangan.BINER, SistemBilangan.DESIMAL)
+            konverter.konversi("110", SistemBilangan.BINER, SistemBilangan.OKTAL)
+            konverter.konversi("10", SistemBilangan.DESIMAL, SistemBilangan.BINER)
+            konverter.konversi("2A", SistemBilangan.HEKSADESIMAL, SistemBilangan.DESIMAL)
+
+            terakhir = riwayat.terakhir(2)
+            self.assertEqual([e['nilai_asal'] for e in terakhir], ["10", "2A"])
+
+            biner = riwayat.berdasarkan_sistem_asal('biner')
+            self.assertEqual(sorted(e['nilai_asal'] for e in biner), ["101", "110"])
+
+            pasangan = riwayat.berdasarkan_pasangan('biner', 'oktal')
+            self.assertEqual([e['hasil'] for e in pasangan], ["6"])
+
+            prefix = riwayat.berdasarkan_prefix_nilai("10")
+            self.assertEqual([e['nilai_asal'] for e in prefix], ["10", "101"])
+
+    def test_rencana_query_sistem_asal(self):
+        """Test query per sistem asal dilayani indeks tanpa pengurutan sementara"""
+        with RiwayatSQLite(self.path_db) as riwayat:
+            rencana = riwayat._koneksi.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM riwayat_konversi "
+                "WHERE sistem_asal = ? ORDER BY waktu DESC LIMIT ?", ('biner', 10)).fetchall()
+        detail = ' '.join(baris[-1] for baris in rencana)
+        self.assertIn('idx_riwayat_sistem_waktu', detail)
+        self.assertNotIn('TEMP B-TREE', detail)
+
+    def test_penulis_bersamaan(self):
+        """Test beberapa instance menulis ke file yang sama secara bersamaan"""
+        def tulis(offset):
+            with RiwayatSQLite(self.path_db, ambang_baris=7) as riwayat:
+                konverter = KonverterSistemBilangan(riwayat_persisten=riwayat)
+                for i in range(50):
+                    konverter.konversi(str(offset + i), SistemBilangan.DESIMAL, SistemBilangan.BINER)
+
+        threads = [threading.Thread(target=tulis, args=(n * 1000,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with RiwayatSQLite(self.path_db) as riwayat:
+            self.assertEqual(riwayat.jumlah(), 200)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite untuk Riwayat Terbagi dan Konverter Bersama
+======================================================
+
+Test ini memvalidasi riwayat yang dipecah per thread, penggabungan saat
+dibaca, generator acak per thread, dan pemakaian satu konverter oleh
+banyak thread.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import unittest
+import sys
+import os
+import threading
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main_logic'))
+
+from riwayat_terbagi import RiwayatTerbagi
+from number_system_simulator import KonverterSistemBilangan, SistemBilangan, JenisKesalahan
+from benchmark_konkurensi import ukur_throughput
+
+
+def _jalankan_thread(jumlah, target):
+    """Menjalankan target(indeks) di beberapa thread dan menunggu selesai"""
+    daftar_thread = [threading.Thread(target=target, args=(i,)) for i in range(jumlah)]
+    for thread in daftar_thread:
+        thread.start()
+    for thread in daftar_thread:
+        thread.join()
+
+
+class TestRiwayatTerbagi(unittest.TestCase):
+    """Test class untuk RiwayatTerbagi"""
+
+    def test_perilaku_list(self):
+        """Test append, extend, indeks, slice, iterasi, dan perbandingan"""
+        riwayat = RiwayatTerbagi()
+        self.assertFalse(riwayat)
+        self.assertEqual(riwayat, [])
+        riwayat.append('a')
+        riwayat.extend(['b', 'c'])
+        self.assertTrue(riwayat)
+        self.assertEqual(len(riwayat), 3)
+        self.assertEqual(riwayat[0], 'a')
+        self.assertEqual(riwayat[-2:], ['b', 'c'])
+        self.assertEqual(list(riwayat), ['a', 'b', 'c'])
+        self.assertEqual(riwayat, RiwayatTerbagi(['a', 'b', 'c']))
+
+    def test_clear(self):
+        """Test clear mengosongkan semua shard dan riwayat dapat dipakai lagi"""
+        riwayat = RiwayatTerbagi()
+        _jalankan_thread(3, lambda i: riwayat.append(i))
+        riwayat.append('utama')
+        self.assertEqual(riwayat.jumlah_shard(), 4)
+        riwayat.clear()
+        self.assertEqual(riwayat, [])
+        self.assertEqual(riwayat.jumlah_shard(), 0)
+        riwayat.append('baru')
+        self.assertEqual(riwayat, ['baru'])
+
+    def test_batas(self):
+        """Test riwayat berbatas menyimpan entri terbaru dari semua thread"""
+        riwayat = RiwayatTerbagi(batas=4)
+        riwayat.extend(range(3))
+        _jalankan_thread(1, lambda i: riwayat.extend(range(3, 6)))
+        riwayat.extend(range(6, 8))
+        self.assertEqual(len(riwayat), 4)
+        self.assertEqual(riwayat, [4, 5, 6, 7])
+        riwayat.append(8)
+        self.assertEqual(riwayat[-2:], [7, 8])
+        with self.assertRaises(ValueError):
+            RiwayatTerbagi(batas=0)
+
+    def test_atur_batas(self):
+        """Test batas dapat diubah saat berjalan dengan entri terbaru dipertahankan"""
+        riwayat = RiwayatTerbagi(range(5))
+        _jalankan_thread(1, lambda i: riwayat.extend(range(5, 8)))
+        riwayat.atur_batas(3)
+        self.assertEqual(riwayat, [5, 6, 7])
+        riwayat.append(8)
+        self.assertEqual(riwayat, [6, 7, 8])
+        riwayat.atur_batas(None)
+        riwayat.extend(range(9, 12))
+        self.assertEqual(riwayat, list(range(6, 12)))
+        with self.assertRaises(ValueError):
+            riwayat.atur_batas(0)
+
+    def test_thread_berganti(self):
+        """Test shard thread yang berakhir digabung sehingga memori tetap terbatas"""
+        for batas in (10, None):
+            riwayat = RiwayatTerbagi(batas=batas)
+            riwayat.append('utama')
+            for i in range(500):
+                thread = threading.Thread(target=riwayat.extend, args=([i, i],))
+                thread.start()
+                thread.join()
+            self.assertLessEqual(riwayat.jumlah_shard(), 8)
+            if batas is None:
+                self.assertEqual(len(riwayat), 1001)
+                self.assertEqual(riwayat[:3], ['utama', 0, 0])
+                self.assertEqual(riwayat.jumlah_tersimpan(), 1001)
+            else:
+                self.assertEqual(riwayat, [495, 495, 496, 496, 497, 497, 498, 498, 499, 499])
+                # Thread terakhir belum digabung: paling banyak dua entrinya di luar batas
+                self.assertLessEqual(riwayat.jumlah_tersimpan(), batas + 2)
+
+    def test_gabung_shard_mati_berselang(self):
+        """Test shard mati yang entrinya berselang dengan arsip tetap terurut"""
+        riwayat = RiwayatTerbagi(batas=None)
+        mulai, lanjut = threading.Event(), threading.Event()
+
+        def panjang():
+            riwayat.append(0)
+            mulai.set()
+            lanjut.wait()
+            riwayat.append(2)
+
+        thread = threading.Thread(target=panjang)
+        thread.start()
+        mulai.wait()
+        _jalankan_thread(1, lambda i: riwayat.append(1))
+        riwayat._pangkas_tanpa_kunci()
+        lanjut.set()
+        thread.join()
+        _jalankan_thread(1, lambda i: riwayat.append(3))
+        riwayat._pangkas_tanpa_kunci()
+        self.assertEqual(riwayat, [0, 1, 2, 3])
+        self.assertEqual(riwayat.jumlah_shard(), 1)
+
+    def test_gabung_urut_global(self):
+        """Test entri dari banyak thread digabung menurut urutan penambahan"""
+        riwayat = RiwayatTerbagi()
+        giliran = [threading.Event() for _ in range(7)]
+        giliran[0].set()
+
+        def pekerja(indeks):
+            # Thread bergiliran menulis: 0, 1, 2, 0, 1, 2, ...
+            for langkah in range(indeks, 6, 3):
+                giliran[langkah].wait()
+                riwayat.append(langkah)
+                giliran[langkah + 1].set()
+
+        _jalankan_thread(3, pekerja)
+        self.assertEqual(riwayat.jumlah_shard(), 3)
+        self.assertEqual(riwayat, list(range(6)))
+
+    def test_gabung_saat_shard_dipangkas(self):
+        """Test versi dibaca di dalam kunci sehingga pemangkasan thread lain tidak menyela"""
+        riwayat = RiwayatTerbagi()
+        riwayat.append('a')
+        pemangkas = []
+
+        class ShardDipangkas(type(riwayat._daftar_shard[0][1])):
+            def __bool__(shard):
+                # Thread lain mencoba mengosongkan shard (seperti popleft saat
+                # pemangkasan) tepat setelah pemeriksaan isi shard pertama
+                isi = len(shard) > 0
+                if not pemangkas:
+                    def pangkas():
+                        with riwayat._kunci:
+                            shard.clear()
+
+                    pemangkas.append(threading.Thread(target=pangkas))
+                    pemangkas[0].start()
+                    pemangkas[0].join(0.2)
+                return isi
+
+        pemilik, shard = riwayat._daftar_shard[0]
+        riwayat._daftar_shard[0] = (pemilik, ShardDipangkas(shard))
+        # Pemangkas baru berjalan setelah versi dibaca, jadi entri boleh sudah dibuang
+        self.assertIn(riwayat.salin(), (['a'], []))
+        pemangkas[0].join()
+        self.assertEqual(riwayat.salin(), [])
+
+    def test_append_bersamaan(self):
+        """Test tidak ada entri hilang saat banyak thread menulis bersamaan"""
+        riwayat = RiwayatTerbagi()
+        per_thread = 2000
+
+        def pekerja(indeks):
+            for i in range(per_thread):
+                riwayat.append((indeks, i))
+
+        _jalankan_thread(8, pekerja)
+        self.assertEqual(len(riwayat), 8 * per_thread)
+        self.assertEqual(sorted(riwayat), sorted((t, i) for t in range(8) for i in range(per_thread)))
+        # Urutan per thread tetap terjaga setelah digabung
+        for indeks in range(8):
+            self.assertEqual([i for t, i in riwayat if t == indeks], list(range(per_thread)))
+
+
+class TestKonverterBersama(unittest.TestCase):
+    """Test class untuk satu konverter yang dipakai banyak thread"""
+
+    def test_riwayat_konversi_bersamaan(self):
+        """Test semua konversi dari banyak thread tercatat di riwayat"""
+        konverter = KonverterSistemBilangan()
+
+        def pekerja(indeks):
+            for i in range(500):
+                konverter.konversi(str(indeks * 1000 + i), SistemBilangan.DESIMAL,
+                                   SistemBilangan.HEKSADESIMAL)
+
+        _jalankan_thread(4, pekerja)
+        self.assertEqual(len(konverter.riwayat_konversi), 2000)
+        for entri in konverter.riwayat_konversi[-50:]:
+            self.assertEqual(entri['hasil'], format(entri['nilai_desimal'], 'X'))
+
+    def test_rng_per_thread(self):
+        """Test setiap thread mendapat generator acak sendiri"""
+        konverter = KonverterSistemBilangan(seed=1)
+        generator = {}
+
+        def pekerja(indeks):
+            generator[indeks] = konverter.rng
+            self.assertIs(konverter.rng, generator[indeks])
+
+        _jalankan_thread(3, pekerja)
+        self.assertEqual(len({id(rng) for rng in generator.values()}), 3)
+
+    def test_seed_dapat_diulang(self):
+        """Test konverter dengan seed yang sama menghasilkan simulasi yang sama"""
+        def jalankan():
+            konverter = KonverterSistemBilangan(seed=42)
+            return [konverter.simulasi_kesalahan('1011001110', SistemBilangan.BINER,
+                                                 JenisKesalahan.BIT_FLIP)[0] for _ in range(20)]
+
+        self.assertEqual(jalankan(), jalankan())
+
+    def test_benchmark(self):
+        """Test benchmark kontensi mencatat semua operasi konversi"""
+        hasil = ukur_throughput(2, 200)
+        self.assertEqual(hasil['operasi'], 400)
+        self.assertEqual(hasil['riwayat'], 300)  # 1 dari 4 operasi adalah simulasi
+        self.assertGreater(hasil['throughput'], 0)
+        with self.assertRaises(ValueError):
+            ukur_throughput(0, 10)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
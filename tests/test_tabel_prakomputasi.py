@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite untuk Tabel Konversi Prakomputasi
+============================================
+
+Test ini memvalidasi pembangunan file tabel, pembacaan memory-mapped untuk
+setiap nilai 16 bit, pemeriksaan versi dan tata letak file, serta konverter
+yang memakai tabel.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import unittest
+import sys
+import os
+import io
+import pickle
+import struct
+import tempfile
+from contextlib import redirect_stdout
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main_logic'))
+
+from tabel_prakomputasi import (TabelPrakomputasi, bangun_tabel, tata_letak, main,
+                                TabelUsang, UKURAN_HEADER, VERSI_FORMAT)
+from number_system_simulator import KonverterSistemBilangan, SistemBilangan
+
+
+class TestTabelPrakomputasi(unittest.TestCase):
+    """Test class untuk file tabel dan pembacaannya"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Bangun tabel 16 bit sekali untuk semua test"""
+        cls.direktori = tempfile.TemporaryDirectory()
+        cls.path = bangun_tabel(os.path.join(cls.direktori.name, 'tabel16.bin'))
+        cls.tabel = TabelPrakomputasi(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Tutup tabel dan hapus folder sementara"""
+        cls.tabel.tutup()
+        cls.direktori.cleanup()
+
+    def salin_file(self, nama, ubah=None, potong=0):
+        """Salinan file tabel, opsional dengan header diubah atau isi dipotong"""
+        with open(self.path, 'rb') as berkas:
+            isi = bytearray(berkas.read())
+        if ubah is not None:
+            ubah(isi)
+        path = os.path.join(self.direktori.name, nama)
+        with open(path, 'wb') as berkas:
+            berkas.write(isi[:len(isi) - potong])
+        return path
+
+    def test_semua_nilai(self):
+        """Test setiap nilai 16 bit di setiap sistem sama dengan format()"""
+        for sistem, kode in (('biner', 'b'), ('oktal', 'o'), ('desimal', 'd'),
+                             ('heksadesimal', 'X')):
+            hasil = [self.tabel.format(nilai, sistem) for nilai in range(1 << 16)]
+            self.assertEqual(hasil, [format(nilai, kode) for nilai in range(1 << 16)], sistem)
+
+    def test_di_luar_jangkauan(self):
+        """Test nilai di luar jangkauan tabel menghasilkan None"""
+        self.assertIsNone(self.tabel.format(1 << 16, 'biner'))
+        self.assertIsNone(self.tabel.format(-1, 'biner'))
+        self.assertEqual(self.tabel.format(42, SistemBilangan.HEKSADESIMAL), '2A')
+
+    def test_header_dan_versi(self):
+        """Test file asing, versi lain, dan file terpotong ditolak"""
+        self.assertTrue(self.tabel.verifikasi())
+        self.assertEqual(self.tabel.info()['ukuran'], os.path.getsize(self.path))
+
+        def ganti_versi(isi):
+            struct.pack_into('<H', isi, 4, VERSI_FORMAT + 1)
+
+        def ganti_magic(isi):
+            isi[:4] = b'XXXX'
+
+        for path in (self.salin_file('versi.bin', ganti_versi),
+                     self.salin_file('potong.bin', potong=1)):
+            with self.assertRaises(TabelUsang):
+                TabelPrakomputasi(path)
+        with self.assertRaises(ValueError):
+            TabelPrakomputasi(self.salin_file('magic.bin', ganti_magic))
+
+        lama = self.salin_file('lama.bin', ganti_versi)
+        with TabelPrakomputasi.buka_atau_bangun(lama, bit=8) as tabel:
+            self.assertEqual(len(tabel), 256)
+            self.assertEqual(tabel.format(255, 'oktal'), '377')
+
+    def test_file_asing_tidak_ditimpa(self):
+        """Test buka_atau_bangun menolak file yang bukan tabel tanpa mengubahnya"""
+        for isi in (b'catatan penting\n', b'', b'NST'):
+            path = os.path.join(self.direktori.name, 'catatan.txt')
+            with open(path, 'wb') as berkas:
+                berkas.write(isi)
+            with self.assertRaises(ValueError) as konteks:
+                TabelPrakomputasi.buka_atau_bangun(path, bit=8)
+            self.assertNotIsInstance(konteks.exception, TabelUsang)
+            with open(path, 'rb') as berkas:
+                self.assertEqual(berkas.read(), isi)
+
+    def test_crc_rusak(self):
+        """Test isi record yang rusak terdeteksi lewat CRC-32"""
+        def rusak(isi):
+            isi[UKURAN_HEADER + 1] ^= 1
+
+        with TabelPrakomputasi(self.salin_file('rusak.bin', rusak)) as tabel:
+            self.assertFalse(tabel.verifikasi())
+
+    def test_pickle_membuka_file_sama(self):
+        """Test pickle membuka ulang file yang sama, bukan menyalin isi"""
+        data = pickle.dumps(self.tabel)
+        self.assertLess(len(data), 1024)
+        with pickle.loads(data) as salinan:
+            self.assertEqual(salinan.path, self.path)
+            self.assertEqual(salinan.format(65535, 'biner'), '1' * 16)
+
+    def test_tata_letak(self):
+        """Test stride dan batas jumlah bit"""
+        stride, _ = tata_letak(16)
+        self.assertEqual(stride, 35)
+        for bit in (0, 21):
+            with self.assertRaises(ValueError):
+                tata_letak(bit)
+
+    def test_cli(self):
+        """Test perintah bangun dan info"""
+        path = os.path.join(self.direktori.name, 'cli.bin')
+        with redirect_stdout(io.StringIO()) as keluaran:
+            self.assertEqual(main(['--bangun', path, '--bit', '8', '--info', path, '--cek']), 0)
+        self.assertIn('CRC-32 cocok', keluaran.getvalue())
+
+
+class TestKonverterDenganTabel(unittest.TestCase):
+    """Test class untuk konverter yang memakai tabel"""
+
+    def test_hasil_sama(self):
+        """Test konversi dengan tabel sama dengan tanpa tabel, di dalam dan di luar jangkauan"""
+        with tempfile.TemporaryDirectory() as direktori:
+            with TabelPrakomputasi.buka_atau_bangun(os.path.join(direktori, 't.bin'), bit=8) as tabel:
+                biasa = KonverterSistemBilangan()
+                cepat = KonverterSistemBilangan(tabel=tabel)
+                for nilai in (0, 7, 255, 256, 65535, 10 ** 12):
+                    for asal in SistemBilangan:
+                        teks = biasa.dari_desimal(nilai, asal)
+                        for tujuan in SistemBilangan:
+                            self.assertEqual(cepat.konversi(teks, asal, tujuan),
+                                             biasa.konversi(teks, asal, tujuan))
+                self.assertEqual(cepat.riwayat_konversi[-1]['nilai_desimal'], 10 ** 12)
+                with self.assertRaises(ValueError):
+                    cepat.dari_desimal(-1, SistemBilangan.BINER)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
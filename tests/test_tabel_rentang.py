@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Suite untuk Generator Tabel Konversi Rentang
+=================================================
+
+Test ini membandingkan hasil pencacah digit (odometer) dengan format()
+bawaan Python dan memeriksa penulis CSV/TSV/Markdown.
+
+Penulis: Kelompok 1
+Tanggal: 5/9/2025
+"""
+
+import unittest
+import io
+import sys
+import os
+import signal
+import tempfile
+import threading
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main_logic'))
+
+from tabel_rentang import (PencacahDigit, generator_tabel_rentang, tulis_csv, tulis_tsv, tulis_markdown,
+                           main)
+from number_system_simulator import KonverterSistemBilangan, SistemBilangan
+
+
+class TestTabelRentang(unittest.TestCase):
+    """Test class untuk generator tabel rentang"""
+
+    def test_pencacah_carry(self):
+        """Test kenaikan dengan carry yang menambah panjang digit"""
+        pencacah = PencacahDigit(0xFF, 16, '0123456789ABCDEF')
+        self.assertEqual(pencacah.teks(), "FF")
+        pencacah.naik()
+        self.assertEqual(pencacah.teks(), "100")
+
+    def test_rentang_sesuai_format(self):
+        """Test setiap baris sama dengan hasil format() bawaan"""
+        for nilai, baris in zip(range(0, 5000), generator_tabel_rentang(0, 4999)):
+            self.assertEqual(baris, (format(nilai, 'b'), str(nilai), format(nilai, 'X'), format(nilai, 'o')))
+
+    def test_rentang_dari_konverter(self):
+        """Test batas rentang dalam sistem heksadesimal"""
+        konverter = KonverterSistemBilangan()
+        baris = list(konverter.tabel_konversi_rentang("FE", "101", SistemBilangan.HEKSADESIMAL))
+        self.assertEqual(len(baris), 4)
+        self.assertEqual(baris[-1], ("100000001", "257", "101", "401"))
+        self.assertEqual(len(konverter.riwayat_konversi), 0)
+
+    def test_rentang_kosong(self):
+        """Test rentang terbalik tidak menghasilkan baris"""
+        self.assertEqual(list(generator_tabel_rentang(5, 4)), [])
+
+    def test_penulis_streaming(self):
+        """Test penulis CSV, TSV, dan Markdown"""
+        berkas = io.StringIO()
+        self.assertEqual(tulis_csv(generator_tabel_rentang(9, 10), berkas), 2)
+        self.assertEqual(berkas.getvalue(), "biner,desimal,heksadesimal,oktal\n1001,9,9,11\n1010,10,A,12\n")
+
+        berkas = io.StringIO()
+        tulis_tsv(generator_tabel_rentang(1, 1), berkas)
+        self.assertEqual(berkas.getvalue().splitlines()[1], "1\t1\t1\t1")
+
+        berkas = io.StringIO()
+        tulis_markdown(generator_tabel_rentang(2, 2), berkas)
+        self.assertEqual(berkas.getvalue().splitlines()[2], "| 10 | 2 | 2 | 2 |")
+
+
+class TestCLITabelRentang(unittest.TestCase):
+    """Test class untuk command-line tabel rentang"""
+
+    def test_tulis_berkas(self):
+        """Test tabel ditulis ke berkas dan rentang negatif dilaporkan sebagai error"""
+        with tempfile.TemporaryDirectory() as direktori:
+            path = os.path.join(direktori, 'tabel.csv')
+            self.assertEqual(main(['0', '15', '--output', path, '--tanpa-progres']), 0)
+            with open(path) as berkas:
+                self.assertEqual(len(berkas.read().splitlines()), 17)
+        self.assertEqual(main(['-1', '5', '--tanpa-progres']), 1)
+
+    @unittest.skipUnless(hasattr(signal, 'SIGINT') and os.name == 'posix', "Butuh SIGINT POSIX")
+    def test_ctrl_c_berhenti_bersih(self):
+        """Test Ctrl-C menghentikan tabel sangat besar dengan kode keluar 130"""
+        pemicu = threading.Timer(0.2, os.kill, (os.getpid(), signal.SIGINT))
+        pemicu.start()
+        try:
+            kode = main(['0', str(10 ** 12), '--output', os.devnull, '--tanpa-progres'])
+        finally:
+            pemicu.cancel()
+        self.assertEqual(kode, 130)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)